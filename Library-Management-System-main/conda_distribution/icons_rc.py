@@ -1,2189 +1,21 @@
 # -*- coding: utf-8 -*-
 
-# Resource object code
+# Resource loader for the modules uic generates from the .ui files.
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.9.6)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
+# The images live in icons.rcc next to this file, built from icons.qrc by
+# python_distribution/convert_qrc_to_py.py; Qt maps it rather than this
+# module embedding every PNG as a bytes literal.
 
-qt_resource_data = b"\
-\x00\x00\x11\x3b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x10\xb8\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x5f\xac\xdf\x75\x7d\xc7\xf1\xcf\x69\x7f\
-\xa5\x6b\x8f\x75\xb4\x5c\xa8\x23\x65\x32\xb3\x0b\xa2\xf2\x67\x40\
-\x0f\x8e\xc5\x0d\x2e\x74\x9a\x4c\xd4\x28\x22\x50\xe8\x02\xc4\x8d\
-\x9b\x4d\xd9\xb2\x5d\x71\x76\xb8\xd8\x1d\x6e\x23\x73\x73\x76\x0b\
-\xce\x42\x01\x83\x0e\x36\xc6\x2a\x26\x5b\x62\x94\x72\xce\xe2\x3a\
-\x20\xc0\xb2\x65\x52\xb1\x89\x6c\xc6\x92\xa0\x80\x4c\xa0\xbb\x58\
-\x7f\x0e\xb1\x94\x73\x7e\xdf\xef\xf7\xf7\xf9\x7e\x7f\xaf\xc7\xe3\
-\xfe\xf7\xf9\xbe\xd3\x73\x4e\xcf\x33\x9f\xe6\xdd\x6f\x29\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x2b\xcd\
-\xb5\x70\xc6\x91\x16\xce\x00\x00\xd6\xa6\xd1\xef\xf0\x75\x6d\x4d\
-\x01\x00\x0c\x87\x00\x00\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\
-\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\x00\x02\x09\x00\x00\
-\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\x00\x02\x09\x00\
-\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\x00\x02\x8d\
-\x6a\x0f\xb0\xb8\xb2\x5c\x7b\x04\x00\x98\xba\xa5\x1d\x0b\x55\x9f\
-\xef\x06\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\
-\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\
-\x00\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\
-\x00\x00\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\
-\xd0\xa8\xf6\x00\x4d\xd5\x7e\x9f\x32\xc3\xb6\xb8\xb2\xdc\xe8\xf3\
-\xbe\xff\x86\xad\xe9\xd7\xbf\x36\xdf\x7f\x75\x0d\xfd\xfb\xc7\x0d\
-\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\
-\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\
-\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\
-\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\xa0\x51\
-\xed\x01\x86\xe4\x17\xcf\x3a\xa5\xec\xdb\xbd\xb3\x6c\x99\xdf\x58\
-\x7b\x14\x8e\x9a\x3b\xed\xfa\xaa\xcf\x1f\xfa\xfb\xc0\xc9\xf6\xad\
-\xc5\x77\xd5\x1e\xa1\xaa\xed\x4b\xf7\xd5\x1e\xa1\x2a\x37\x00\x6b\
-\x70\xff\x81\x27\xca\xaf\x5e\xb3\xa7\x7c\xef\x99\xe7\x6b\x8f\x02\
-\x00\x8d\x08\x80\x35\x12\x01\x00\xcc\x02\x01\x30\x01\x11\x00\xc0\
-\xd0\x09\x80\x09\x89\x00\x00\x86\x4c\x00\x34\x20\x02\x00\x18\x2a\
-\x01\xd0\x90\x08\x00\x60\x88\x04\x40\x0b\x44\x00\x00\x43\x23\x00\
-\x5a\x22\x02\x00\x18\x12\x01\xd0\x22\x11\x00\xc0\x50\x08\x80\x96\
-\x89\x00\x00\x86\x20\x3e\x00\xce\x3d\xe5\xc4\xd6\xcf\xbc\xff\xc0\
-\x13\xe5\xbd\x1f\xbb\xa5\x7c\xff\xd9\xff\x69\xfd\x6c\x00\x68\x43\
-\x7c\x00\xdc\x72\xf9\xd9\xe5\x1d\x6f\xde\xd6\xfa\xb9\x5f\xfd\xfa\
-\x37\xcb\xbb\xaf\xfe\x9c\x9b\x00\x00\x7a\x29\x3e\x00\x36\x6f\x58\
-\x5f\x3e\x7b\xe9\x59\x9d\x44\x80\x7f\x0e\x00\xa0\xaf\xe2\x03\xa0\
-\x14\x11\x00\x40\x1e\x01\x70\x94\x08\x00\x20\xc9\xa8\xf6\x00\x7d\
-\x32\x8e\x80\x5d\x7b\x0f\x94\xfd\x07\x0f\xb7\x7a\xf6\x38\x02\xf6\
-\xed\xde\x59\xb6\xcc\x6f\x6c\xf5\x6c\xea\x59\xda\xb1\x50\x7b\x84\
-\x41\x5b\x5c\x59\xae\x3d\x42\x23\xbe\xfe\x0c\x99\x1b\x80\x57\x70\
-\x13\x00\x40\x02\x01\x70\x0c\x22\x00\x80\x59\x27\x00\x5e\x85\x08\
-\x00\x60\x96\x09\x80\xe3\x10\x01\x00\xcc\x2a\x01\xf0\x1a\x44\x00\
-\x00\xb3\x48\x00\xac\x82\x08\x00\x60\xd6\x08\x80\x55\x12\x01\x00\
-\xcc\x12\x01\xb0\x06\x22\x00\x80\x59\x21\x00\xd6\x48\x04\x00\x30\
-\x0b\x04\xc0\x04\x44\x00\x00\x43\x27\x00\x26\x24\x02\x00\x18\x32\
-\x01\xd0\x80\x08\x00\x60\xa8\x04\x40\x43\x22\x00\x80\x21\x12\x00\
-\x2d\x10\x01\x00\x0c\x8d\x00\x68\x89\x08\x00\x60\x48\x46\xb5\x07\
-\x98\x25\xe3\x08\xd8\xb5\xf7\x40\xd9\x7f\xf0\x70\xab\x67\x8f\x23\
-\x60\xdf\xee\x9d\x65\xcb\xfc\xc6\x56\xcf\x66\x72\x43\x7f\x9f\x3d\
-\x75\x1d\x79\xec\x86\x46\x9f\x9f\x3b\xed\xfa\x96\x26\x21\x91\x1b\
-\x80\x96\xb9\x09\x00\x60\x08\x04\x40\x07\x44\x00\x00\x7d\x27\x00\
-\x3a\x22\x02\x00\xe8\x33\x01\xd0\x21\x11\x00\x40\x5f\x09\x80\x8e\
-\x89\x00\x00\xfa\x48\x00\x4c\x81\x08\x00\xa0\x6f\x04\xc0\x94\x88\
-\x00\x00\xfa\x44\x00\x4c\x91\x08\x00\xa0\x2f\x04\xc0\x94\x89\x00\
-\x00\xfa\x40\x00\x54\x20\x02\x00\xa8\x4d\x00\x54\x22\x02\x00\xa8\
-\x49\x00\x54\x24\x02\x00\xa8\x45\x00\x54\x26\x02\x00\xa8\x41\x00\
-\xf4\x80\x08\x00\x60\xda\x04\x40\x4f\x88\x00\x00\xa6\x69\x54\x7b\
-\x00\xfe\xdf\x38\x02\x76\xed\x3d\x50\xf6\x1f\x3c\xdc\xea\xd9\xe3\
-\x08\xd8\xb7\x7b\x67\xd9\x32\xbf\xb1\xd5\xb3\x93\x2d\xed\x58\xa8\
-\x3d\xc2\xa0\x2d\xae\x2c\x37\xfa\x7c\xd3\x3f\xff\xa6\xcf\x87\x21\
-\x73\x03\xd0\x33\x6e\x02\x00\x98\x06\x01\xd0\x43\x22\x00\x80\xae\
-\x09\x80\x9e\x12\x01\x00\x74\x49\x00\xf4\x98\x08\x00\xa0\x2b\x02\
-\xa0\xe7\x44\x00\x00\x5d\x10\x00\x03\x20\x02\x00\x68\x9b\x00\x18\
-\x08\x11\x00\x40\x9b\x04\xc0\x80\x88\x00\x00\xda\x22\x00\x06\x46\
-\x04\x00\xd0\x06\x01\x30\x40\x22\x00\x80\xa6\x04\xc0\x40\x89\x00\
-\x00\x9a\x10\x00\x03\x26\x02\x00\x98\x94\x00\x18\x38\x11\x00\xc0\
-\x24\x04\xc0\x0c\x10\x01\x00\xac\x95\x00\x98\x11\x22\x00\x80\xb5\
-\x18\xd5\x1e\x80\xf6\x8c\x23\x60\xd7\xde\x03\x65\xff\xc1\xc3\xad\
-\x9e\x3d\x8e\x80\x7d\xbb\x77\x96\x2d\xf3\x1b\x5b\x3d\x7b\xc8\xbc\
-\x4f\xbe\x2e\x7f\xfe\xcd\x6c\x5f\xba\xaf\xf6\x08\x54\xe4\x06\x60\
-\xc6\xb8\x09\x00\x60\x35\x04\xc0\x0c\x12\x01\x00\xbc\x16\x01\x30\
-\xa3\x44\x00\x00\xc7\x23\x00\x66\x98\x08\x00\xe0\xd5\x08\x80\x19\
-\x27\x02\x00\x38\x16\x01\x10\x40\x04\x00\xf0\x4a\x02\x20\x84\x08\
-\x00\xe0\xe5\x04\x40\x10\x11\x00\xc0\x98\x00\x08\x23\x02\x00\x28\
-\x45\x00\x44\x12\x01\x00\x08\x80\x50\x22\x00\x20\x9b\x00\x08\x26\
-\x02\x00\x72\x09\x80\x70\x22\x00\x20\x93\x00\x40\x04\x00\x04\x12\
-\x00\x94\x52\x44\x00\x40\x9a\x51\xed\x01\xe8\x8f\x71\x04\xec\xda\
-\x7b\xa0\xec\x3f\x78\xb8\xd5\xb3\xc7\x11\xb0\x6f\xf7\xce\xb2\x65\
-\x7e\x63\xab\x67\xd7\xb4\xb4\x63\xa1\xf6\x08\x34\xb0\xb8\xb2\x5c\
-\x7b\x84\x46\x8e\x3c\x76\x43\xed\x11\x1a\x99\x3b\xed\xfa\x46\x9f\
-\x1f\xfa\xd7\xaf\x36\x37\x00\xfc\x18\x37\x01\x00\x19\x04\x00\x3f\
-\x41\x04\x00\xcc\x3e\x01\xc0\x31\x89\x00\x80\xd9\x26\x00\x78\x55\
-\x22\x00\x60\x76\x09\x00\x8e\x4b\x04\x00\xcc\x26\x01\xc0\x6b\x12\
-\x01\x00\xb3\x47\x00\xb0\x2a\x22\x00\x60\xb6\x08\x00\x56\x4d\x04\
-\x00\xcc\x0e\x01\xc0\x9a\x88\x00\x80\xd9\x20\x00\x58\x33\x11\x00\
-\x30\x7c\x02\x80\x89\x88\x00\x80\x61\x13\x00\x4c\x4c\x04\x00\x0c\
-\x97\x00\xa0\x11\x11\x00\x30\x4c\x02\x80\xc6\x44\x00\xc0\xf0\x08\
-\x00\x5a\x21\x02\x00\x86\x65\x54\x7b\x00\x66\xc7\x38\x02\x76\xed\
-\x3d\x50\xf6\x1f\x3c\xdc\xea\xd9\xe3\x08\xd8\xb7\x7b\x67\xd9\x32\
-\xbf\xb1\xd5\xb3\x9b\xf0\x3e\x72\x9a\x98\x3b\xed\xfa\xda\x23\x10\
-\xcc\x0d\x00\xad\x72\x13\x00\x30\x0c\x02\x80\xd6\x89\x00\x80\xfe\
-\x13\x00\x74\x42\x04\x00\xf4\x9b\x00\xa0\x33\x9b\x37\xac\x2f\x37\
-\x7f\xf4\xac\x72\xee\x29\x27\xb6\x7e\xf6\xfd\x07\x9e\x28\xef\xfd\
-\xd8\x2d\xad\x9f\x0b\x90\x42\x00\xd0\xa9\xf9\x13\xd6\x97\x5b\x2e\
-\x3f\xbb\x93\x9b\x80\xaf\x7e\xfd\x9b\xad\x9f\x09\x90\x42\x00\xd0\
-\xb9\x2e\xff\x39\x00\x80\xc9\x08\x00\xa6\x42\x04\x00\xf4\x8b\x00\
-\x60\x6a\x44\x00\x40\x7f\x08\x00\xa6\x4a\x04\x00\xf4\x83\x00\x60\
-\xea\x44\x00\x40\x7d\x02\x80\x2a\x44\x00\x40\x5d\x02\x80\x6a\x44\
-\x00\x40\x3d\x02\x80\xaa\x44\x00\x40\x1d\x02\x80\xea\x44\x00\xc0\
-\xf4\x09\x00\x7a\x41\x04\x00\x4c\xd7\xa8\xf6\x00\xb5\x6d\x5f\xba\
-\xaf\xf6\x08\x0c\xd8\xd2\x8e\x85\xda\x23\xd0\xc0\xe2\xca\x72\xd5\
-\xcf\x43\x4d\x6e\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\x00\x02\
-\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\x00\
-\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\x00\
-\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\
-\x00\x00\x02\x8d\x6a\x0f\xd0\x94\xf7\x71\x53\x93\xef\x3f\x60\xa8\
-\xdc\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\
-\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\
-\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\
-\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\
-\x1a\xd5\x1e\xa0\xa9\xa5\x1d\x0b\xb5\x47\x00\x20\xd0\xe2\xca\x72\
-\xed\x11\x1a\x71\x03\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\
-\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\
-\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\
-\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\
-\x00\x00\x10\x68\x54\x7b\x80\xda\x1e\x7c\x66\xd8\xef\x73\x06\x60\
-\x32\x67\xcc\x2f\xd4\x1e\xa1\x2a\x37\x00\x00\x10\x48\x00\x00\x40\
-\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\
-\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\
-\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\
-\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\
-\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\
-\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\
-\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\
-\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\
-\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\
-\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\
-\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\
-\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\
-\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\
-\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\
-\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\
-\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\
-\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\
-\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\
-\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\
-\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\
-\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\
-\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\
-\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\
-\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\
-\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x46\xb5\x07\xa8\
-\xed\x8c\xf9\x85\xda\x23\x00\xc0\xd4\xb9\x01\x00\x80\x40\x02\x00\
-\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\x02\
-\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\
-\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\
-\x40\x02\x00\x00\x02\x09\x00\x00\x08\x34\xaa\x3d\x40\x53\x8b\x2b\
-\xcb\xb5\x47\x00\x80\xc1\x71\x03\x00\x00\x81\x04\x00\x00\x04\x12\
-\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\
-\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\
-\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\x04\x00\
-\x00\x04\x12\x00\x00\x10\x68\x54\x7b\x80\xa6\x96\x76\x2c\xd4\x1e\
-\x81\x06\x16\x57\x96\x1b\x7d\xde\xd7\x3f\x9b\xef\x1f\x6a\x6a\xfa\
-\xfd\x57\x9b\x1b\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\x40\
-\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\
-\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\
-\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\
-\x00\x80\x40\xa3\xda\x03\xd4\xf6\xe0\x33\xc3\x7e\x9f\x73\x6d\x67\
-\xcc\xe7\xbd\x4f\x7d\xeb\xeb\x37\x95\x2f\xdc\x74\x49\xb9\x60\xe1\
-\xd4\xda\xa3\x0c\xde\xdc\x69\xd7\xd7\x1e\xa1\x91\xf3\xaf\xbb\xb5\
-\xf6\x08\x34\xf0\xb5\x1b\x2f\xab\x3d\x42\x55\x6e\x00\x60\x8d\x9e\
-\x7a\xfa\xb9\xf2\xae\xab\xfe\xba\xfc\xc5\x1d\xff\x5c\x7b\x14\x80\
-\x89\x09\x00\x98\xc0\x0b\x2f\xbe\x54\x7e\xe3\x0f\xfe\xae\xfc\xd6\
-\x1f\xde\x5b\x5e\x7a\xe9\x48\xed\x71\x00\xd6\x4c\x00\x40\x03\x37\
-\xed\x79\xa0\x7c\xe4\x13\x9f\x2f\xcf\xfd\xe0\x87\xb5\x47\x01\x58\
-\x13\x01\x00\x0d\xdd\xf9\xa5\x47\xca\x85\xbb\x3e\x5b\xfe\xfb\xbb\
-\xcf\xd4\x1e\x05\x60\xd5\x04\x00\xb4\xe0\x81\x07\xbf\x55\xce\xbb\
-\xe4\x33\xe5\xb1\xff\xfc\x4e\xed\x51\x00\x56\x45\x00\x40\x4b\x1e\
-\x3f\xf4\x54\x39\xff\xd2\xbf\x2c\xff\xb4\xfc\x78\xed\x51\x00\x5e\
-\x93\x00\x80\x16\x8d\x37\x04\x3e\x7d\xbb\x0d\x01\xa0\xdf\x04\x00\
-\xb4\xec\x85\x17\x5f\x2a\xbf\xb9\x64\x43\x00\xe8\x37\x01\x40\xb4\
-\xb3\x4e\xfe\xe9\xce\xce\xbe\x69\xcf\x03\xe5\xb2\xdf\xbd\xb3\xfc\
-\xe0\xf9\x17\x3a\x7b\x06\xc0\xa4\x04\x00\xd1\xee\xfc\xf5\x73\xcb\
-\xfb\xdf\xfe\xa6\xce\xce\xbf\xfd\xde\x87\xcb\x05\x57\xde\x6c\x43\
-\x00\xe8\x1d\x01\x40\xb4\x13\xd6\xaf\x2b\x37\x7d\xe0\xed\xe5\xe3\
-\xbf\xfc\x96\xce\x9e\x61\x43\x00\xe8\x23\x01\x40\xbc\xb9\xb9\x52\
-\x3e\xf1\x2b\x6f\x29\x37\x5e\xf4\xd6\x32\x5a\x37\xd7\xc9\x33\xc6\
-\x1b\x02\xff\xf8\xc0\x37\x3a\x39\x1f\x60\xad\x04\x00\x1c\x75\xf1\
-\x99\x27\x97\x3d\x97\x9f\x5d\x5e\xff\x53\xdd\xbc\x23\xeb\xa9\xa7\
-\x9f\x2b\xef\xbe\xfa\x73\x36\x04\x80\x5e\x10\x00\xf0\x32\xbf\x74\
-\xea\xb6\x72\xcf\x35\xe7\x95\x53\xb7\x6d\xee\xe4\x7c\x1b\x02\x40\
-\x5f\x08\x00\x78\x85\x53\xb7\x6d\x2e\x77\x5f\xbd\x50\xce\x3d\xe5\
-\xc4\xce\x9e\xe1\x1d\x02\x40\x6d\xdd\xdc\x75\xc2\xc0\x6d\xdd\xb4\
-\xa1\xdc\x7e\xc5\x39\xe5\xba\xbb\x1f\x29\x77\x3d\xfc\xed\x4e\x9e\
-\x71\xe7\x97\x1e\x29\x87\x9e\x7c\xba\xdc\xf5\xa9\x8f\x96\x37\x9c\
-\xf4\xba\x4e\x9e\x41\xb7\xd2\xdf\x27\xcf\xb0\xb9\x01\x80\x57\x31\
-\xad\x0d\x81\x77\x5c\xb2\xdb\x86\x00\x30\x75\x02\x00\x8e\xc3\x86\
-\x00\x30\xab\x04\x00\xac\x82\x0d\x01\x60\xd6\x08\x00\x58\x25\x1b\
-\x02\xc0\x2c\x11\x00\xb0\x06\xe3\x0d\x81\x1d\xa7\x6c\xed\xec\x19\
-\x37\xed\x79\xa0\x5c\xfc\xf1\x3b\x6c\x08\x00\x9d\x12\x00\xb0\x46\
-\x5b\x37\x6d\x28\xb7\x5d\x71\x76\xa7\xef\x10\xf8\xc2\x7d\x8f\x96\
-\x0b\x77\x7d\xb6\xfc\xd7\x77\xbf\xdf\xd9\x33\x80\x6c\x02\x00\x26\
-\x60\x43\x00\x18\x3a\x01\x00\x13\xb2\x21\x00\x0c\x99\x00\x80\x86\
-\x6c\x08\x00\x43\x24\x00\xa0\x05\x36\x04\x80\xa1\x11\x00\xd0\x12\
-\x1b\x02\xc0\x90\x08\x00\x68\xd1\xb4\x36\x04\x2e\xb8\xf2\x66\x1b\
-\x02\x40\x23\x02\x00\x5a\x36\x8d\x0d\x81\xe5\x87\x0e\xd9\x10\x00\
-\x1a\x11\x00\xd0\x81\x97\x6f\x08\x6c\x58\xdf\xcd\x8f\xd9\xe3\x87\
-\x9e\x2a\x0b\x1f\xf9\x4c\xf9\x87\xaf\xfc\x47\x27\xe7\x03\xb3\x4d\
-\x00\x40\x87\x2e\x3e\xf3\xe4\xb2\xe7\xb2\x5f\xe8\x6c\x43\xe0\x7b\
-\xcf\x3c\x5f\xde\x77\xed\xad\x36\x04\x80\x35\xeb\xe6\x6f\x25\xe0\
-\x47\xce\x3f\xba\x21\x70\xe5\xad\xff\x52\x1e\x3f\xfc\x6c\xeb\xe7\
-\x8f\x37\x04\x1e\xfb\xc6\x77\xca\x1f\xfd\xfe\x7b\xca\xba\x8e\xfe\
-\x4f\x82\x59\xb4\xb8\xb2\x5c\x7b\x04\xa8\xc6\x0d\x00\x4c\x81\x0d\
-\x01\xa0\x6f\x04\x00\x4c\x89\x0d\x01\xa0\x4f\x04\x00\x4c\xd1\x34\
-\x37\x04\x1e\xb5\x21\x00\x1c\x87\x00\x80\x29\x9b\xd6\x86\xc0\x79\
-\x36\x04\x80\xe3\x10\x00\x50\x89\x0d\x01\xa0\x26\x01\x00\x15\x9d\
-\x7f\xea\xb6\xf2\xf7\xd7\x9c\x57\x7e\xee\x24\xef\x10\x00\xa6\x4b\
-\x00\x40\x65\x6f\xde\xb6\xb9\xdc\x75\xd5\x74\x36\x04\x9e\xb5\x21\
-\x00\x1c\x25\x00\xa0\x07\xa6\xb5\x21\x70\xa1\x0d\x01\xe0\x28\x01\
-\x00\x3d\x61\x43\x00\x98\x26\x01\x00\x3d\x32\xde\x10\xf8\xe4\x45\
-\x6f\xb3\x21\x00\x74\x4a\x00\x40\x0f\x7d\xf8\xcc\x9f\x29\x77\x5c\
-\x79\x4e\xd9\xb6\x79\x43\x27\xe7\x8f\x37\x04\xfe\xfc\xb6\x95\x4e\
-\xce\x07\xfa\x4f\x00\x40\x4f\x9d\xbb\xfd\xc4\x72\xf7\x55\x0b\x9d\
-\x6e\x08\x5c\x7b\xc3\x3d\x36\x04\x20\x94\x00\x80\x1e\xb3\x21\x00\
-\x74\x45\x00\x40\xcf\x8d\x37\x04\x3e\x60\x43\x00\x68\x91\x00\x80\
-\x01\x38\x61\xfd\xba\xf2\x27\x36\x04\x80\x16\x75\xf3\x7f\x90\x02\
-\xad\x1b\x6f\x08\x6c\x3f\x71\x53\xf9\xbd\x7b\x1e\x2d\x3f\x7c\xf1\
-\xa5\xd6\x9f\x31\xde\x10\xb8\xe3\x93\x17\x97\xf7\xbc\xf3\xe7\x5b\
-\x3f\xbf\x6f\x96\x76\x2c\xd4\x1e\x81\x01\x5b\x5c\x59\xae\x3d\x42\
-\x23\x6e\x00\x60\x60\x6c\x08\x00\x6d\x10\x00\x30\x40\x36\x04\x80\
-\xa6\x04\x00\x0c\x94\x0d\x01\xa0\x09\x01\x00\x03\x66\x43\x00\x98\
-\x94\x00\x80\x81\xb3\x21\x00\x4c\x42\x00\xc0\x0c\xf0\x0e\x01\x60\
-\xad\x04\x00\xcc\x10\x1b\x02\xc0\x6a\x09\x00\x98\x31\x36\x04\x80\
-\xd5\x10\x00\x30\x83\xc6\x1b\x02\x0b\x3f\x6b\x43\x00\x38\x36\x01\
-\x00\x33\x6a\xeb\xa6\x0d\x65\xef\x4e\x1b\x02\xc0\xb1\x09\x00\x98\
-\x61\x36\x04\x80\x57\x23\x00\x60\xc6\xd9\x10\x00\x8e\x45\x00\x40\
-\x08\x1b\x02\xc0\xcb\x09\x00\x08\x62\x43\x00\x18\x13\x00\x10\x66\
-\x5a\x1b\x02\x1f\xfe\x6d\x1b\x02\xd0\x67\xa3\xda\x03\x00\xd3\x37\
-\xde\x10\xf8\x9d\xbb\x1f\x29\x7f\xf3\xf0\xb7\x3b\x79\xc6\x17\xbf\
-\xfc\x68\x39\x74\xe5\xd3\xe5\x6f\xff\xec\xd2\xf2\x86\x93\x5e\xd7\
-\xc9\x33\x6a\x3b\xff\xba\x5b\x6b\x8f\x40\x03\x5f\xbb\xf1\xb2\xda\
-\x23\x54\xe5\x06\x00\x42\xbd\x7c\x43\x60\xae\xa3\x67\xac\x3c\x74\
-\xa8\x9c\xf3\xa1\x4f\x97\x7f\xfd\xb7\x27\x3b\x7a\x02\x30\x29\x01\
-\x00\xc1\xc6\x1b\x02\x37\x76\xb8\x21\x70\xe8\xc9\xa7\xcb\x3b\x2f\
-\xff\xab\x72\xef\x57\xfe\xbd\x93\xf3\x81\xc9\x08\x00\x60\x2a\x1b\
-\x02\x17\x5d\xbb\xd7\x86\x00\xf4\x88\x00\x00\x4a\x29\x36\x04\x20\
-\x8d\x00\x00\x7e\xc4\x86\x00\xe4\x10\x00\xc0\x8f\xd9\xba\x69\x43\
-\xb9\xf5\xf2\xb3\xcb\xfb\xde\xf6\xc6\xce\x9e\xf1\xc5\x2f\xff\xdf\
-\x3b\x04\x80\x7a\x04\x00\xf0\x13\x36\x8e\xd6\x95\x3f\xfd\xe0\xe9\
-\x9d\x6e\x08\x2c\x3f\x74\xa8\xa3\x93\x81\xd5\x10\x00\xc0\x31\x4d\
-\x63\x43\x00\xa8\xc7\x4f\x35\x70\x5c\x5d\x6f\x08\x00\x75\x08\x00\
-\xe0\x35\x75\xbd\x21\x00\x4c\x9f\x00\x00\x56\x65\x1a\x1b\x02\xc0\
-\xf4\x08\x00\x60\xd5\xc6\xef\x10\xf8\xe0\xe9\x6f\xaa\x3d\x0a\xd0\
-\x90\x00\x00\xd6\xe4\x84\xf5\xeb\xca\x1f\xbf\xbf\xdb\x77\x08\x00\
-\xdd\x13\x00\xc0\x9a\x8d\x37\x04\x3e\xf5\xa1\xd3\xcb\xc6\x91\xbf\
-\x46\x60\x88\xfc\xe4\x02\x13\xfb\xb5\xb7\xbe\xb1\xdc\x76\x85\x0d\
-\x01\x18\xa2\x51\xed\x01\x6a\x3b\x63\x7e\xa1\xf6\x08\x54\xb4\x7d\
-\xe9\xbe\xda\x23\x30\x60\xe9\xef\x93\x67\xd8\xdc\x00\x00\x40\x20\
-\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\
-\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\
-\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\
-\x00\x40\x20\x01\x00\x00\x81\x04\x00\x00\x04\x9a\x6b\xe1\x8c\x23\
-\x4d\x3e\xbc\xb8\xb2\xdc\xc2\x08\x00\x30\x2c\x4b\x3b\x16\x9a\x1e\
-\xd1\xe8\x77\xb8\x1b\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\x80\
-\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\x00\
-\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\x00\
-\x00\x80\x40\x02\x00\x00\x02\x09\x00\x00\x08\x24\x00\x00\x20\x90\
-\x00\x00\x80\x40\x8d\xde\x25\x7c\xd4\x91\x16\xce\x00\x00\xd6\xa6\
-\xd1\xef\x70\x37\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\x81\
-\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\x00\
-\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\x00\
-\x00\x81\x04\x00\x00\x04\x12\x00\x00\x10\x48\x00\x00\x40\x20\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xa5\x94\xff\x05\xfc\xd7\x32\x3a\x75\x81\xb8\x98\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0f\x44\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\xbb\x7f\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\
-\x2b\x0e\x1b\x00\x00\x0e\x21\x49\x44\x41\x54\x78\xda\xd5\x9b\x7b\
-\x74\xd3\x55\xb6\xc7\x3f\xbf\x24\x4d\xd2\x36\x34\xe9\x8b\xa6\xa5\
-\x2d\x8f\x16\x28\x85\x4e\x79\x94\x97\x08\x82\xb5\x54\x44\x47\xb8\
-\x2a\xe0\x8c\x8a\x23\xcc\x2c\x67\xae\xf8\x18\xbc\xf7\x7a\x1d\x47\
-\x46\x5c\x33\x2a\xb8\x18\x1d\xd7\xcc\x78\xaf\x6b\x96\x72\xe7\x3a\
-\xa3\x08\x22\x02\x3e\x41\x4a\x2f\x88\x48\x5b\x5a\x79\x14\x29\x8f\
-\x16\x68\x69\x93\x36\x8f\x26\xcd\xa3\x24\x39\xf7\x8f\x5f\x52\x09\
-\x94\x92\xb6\xa9\xe0\x77\xad\xdf\x6a\xd6\x39\xfb\xb7\xcf\x3e\xdf\
-\xdf\xfe\x9d\xdf\x3e\x7b\x9f\x4a\x7c\x7f\x50\x00\x93\x81\x05\xc0\
-\x74\x20\x33\x78\x01\x9c\x0b\x5e\x5f\x02\x5b\x80\xaf\x01\xf1\x3d\
-\xda\x36\xa0\x50\x02\xcb\x81\x86\xe0\xa4\x22\xb9\x1a\x80\x65\xc1\
-\x7b\x7f\xd0\x98\x0a\x1c\x09\x4d\x2c\x41\xad\x16\xb3\x87\x64\x88\
-\x4c\x5d\xbc\x00\x44\x6a\x7c\xac\x30\xea\xe2\x04\x20\x32\xe2\xe3\
-\xc4\x4d\x43\xd2\xc5\x20\x75\xcc\xc5\x44\x1c\x06\xa6\x5c\xeb\x49\
-\xf4\x15\xf7\x49\x92\xe4\x01\x44\xa2\x46\x23\x7e\x39\x6e\xac\xd8\
-\x38\x6f\xae\x98\x93\x99\x21\x00\x91\x12\xa7\x15\xfb\x96\xdf\x25\
-\xf6\x2d\xbf\x4b\xa4\xc4\x69\x05\x20\x6e\xce\x1c\x22\x36\xce\x9b\
-\x2b\x1e\x1e\x97\x2f\x0c\x1a\x8d\x00\x44\x50\xc7\x4f\x07\xca\xc8\
-\x81\x72\xb1\x15\xc0\x1b\x80\x6a\x56\x46\x3a\xbf\x9b\x5a\xc4\xe8\
-\x44\x03\x35\xad\x6d\xac\x3f\x76\x1c\x95\x42\xc1\x5b\x0b\x8a\x19\
-\x9b\x9a\x84\x5e\xa3\xa6\x28\x63\x30\xef\xd7\x9e\xe6\x84\xdd\x4e\
-\x7e\x52\x22\x33\xd2\x8d\xdc\x3a\x34\x8b\x16\xb7\x8b\x33\x0e\xa7\
-\x0a\xf8\x17\xa0\x0d\x79\x6d\xb8\xee\x09\x28\x95\x24\xfe\x0e\x48\
-\xf7\x8e\xca\x65\x59\xfe\x18\x62\x14\x0a\x04\xf0\x72\x75\x0d\x56\
-\xaf\x97\x47\xa6\x14\xb0\x78\x5c\x6e\xd7\x0d\x19\x83\xe2\x71\xf9\
-\x7c\x1c\x68\x34\x51\xef\x70\x50\x9a\x95\x49\x8c\x42\xc1\x74\xa3\
-\x11\x09\x89\xc3\x16\x0b\x92\x44\x29\xb0\x0f\x38\x15\x4d\x63\x15\
-\x51\x9e\x7c\xba\x24\x49\xef\x0a\x81\x62\xfe\xb0\x6c\x16\xe5\xe6\
-\x20\x05\x3b\xbe\x69\x6d\xe3\x94\xbd\x1d\x83\x56\xc3\xc3\x45\x63\
-\x2f\xbb\xf1\x5f\x27\x8f\xc3\xa0\xd5\x50\xdf\xee\xe0\x90\xc5\x02\
-\x80\x04\x2c\x1e\x99\xc3\xbc\xa1\xd9\x08\x81\x52\x82\x0d\x80\xf1\
-\x7a\x26\xe0\x77\x42\x08\x7d\x7e\x52\x22\x3f\x1b\x93\x17\xd6\xf1\
-\x75\x8b\x09\x80\x85\x63\x46\x90\xa0\x51\x5f\x76\x63\x82\x46\xcd\
-\x82\xbc\xe1\x41\x59\x73\x58\xdf\xb2\xfc\x3c\xf2\x12\x0d\x08\x30\
-\x00\xab\xae\x57\x02\xf2\x24\x58\x26\x01\x0f\x8d\xc9\x43\x29\x49\
-\x61\x9d\x95\x66\x79\x52\x25\x23\x32\xaf\xa8\xa0\x24\x27\x0b\x80\
-\x0a\x93\x29\xac\x5d\x29\x49\x2c\xcb\xcf\x43\x02\x24\xf8\x39\x30\
-\xea\x7a\x24\x60\xa9\x00\xe5\xf4\x74\x23\x39\xfa\x84\xb0\x0e\xbf\
-\x10\x98\x5c\x6e\x00\x26\xa6\xa7\x5e\x51\x41\xa8\xcf\xe4\xf6\xe0\
-\x17\xe1\x71\x50\xae\x5e\xcf\x34\x63\x1a\x42\x5e\xb7\x96\x46\xcb\
-\x68\x55\x14\x09\x58\x08\x70\x53\x46\x7a\x58\xa3\x2f\x10\xe0\xa8\
-\xd5\x8a\x00\xd4\x4a\x25\x7f\x3d\x70\x98\x36\xb7\x87\x4e\x7f\x00\
-\xd7\x05\x1f\x00\x71\x31\x2a\xd4\x4a\x05\xc9\xb1\x5a\xd4\x4a\x25\
-\x9d\x7e\x3f\xb5\x16\x2b\x79\x89\x06\x54\x8a\xef\x9e\xd1\xac\x8c\
-\x74\xf6\x35\xb7\x80\x1c\x4d\xfe\x26\x1a\x46\x4b\xfd\x57\x01\xc0\
-\x70\xe0\x94\x5a\xa9\x64\xdd\x8c\xe9\x1c\xb7\xd9\xf9\xd6\x66\xe3\
-\x5b\x9b\x8d\xb3\x0e\xe7\x65\x4f\x33\x52\x28\x25\x89\xac\x41\x3a\
-\x46\x1b\x0c\x8c\x36\x18\xc8\x35\x24\xf0\xe4\x9e\x7d\x74\x06\x02\
-\x00\x23\x80\xd3\xd7\x0b\x01\xc5\xc0\x0e\x95\x42\x81\x4f\x36\x2e\
-\x0c\x89\x49\x49\xe4\xe6\x8e\x24\x7b\xe8\x30\x92\x53\x52\x48\x49\
-\x4d\x25\x36\x36\x0e\xad\x56\x0b\x80\xdb\xed\xc6\xe3\x71\xd3\x6a\
-\x36\xd3\x6a\x36\x73\xa6\xa1\x81\x13\x27\x8e\x63\xb3\x5a\x2f\xd3\
-\x75\xd1\x18\x3f\x06\xb6\xf6\xd7\xf0\x68\xbd\x02\x19\x20\xbb\xbb\
-\x5a\xa3\x61\xe2\xa4\x22\xa6\x4d\x9f\xc1\xa4\xc9\x93\x99\x30\xb1\
-\x88\x94\xd4\xd4\x3e\x29\x35\x9b\x4c\x1c\xac\xaa\xa0\xaa\xa2\x82\
-\xaf\xf6\xed\xa5\xaa\xb2\x82\x4e\xaf\x37\xd4\x9d\xde\x27\xa5\x97\
-\x20\x5a\x1e\xf0\x04\xb0\x6e\xd2\xe4\x29\x6c\xfa\x70\x3b\x5a\x6d\
-\x6c\xb7\x42\x3e\x9f\x8f\x6f\xaa\x0f\xd2\xd0\x50\x8f\xa5\xad\x0d\
-\x4b\x5b\x1b\x00\x49\xc9\xc9\x24\x25\x27\x33\x6c\xd8\x70\x0a\x0a\
-\xc7\xa3\x52\x75\xff\x5c\x3c\x1e\x37\x77\xfd\xf8\x76\x2a\x0f\xec\
-\x07\x58\x09\xac\x8b\x92\xfd\xfd\xc6\x93\x04\x37\x30\xc5\x25\xa5\
-\xe2\xe3\x1d\x65\xa2\xd9\xea\x14\xcd\x56\xa7\xf8\xaa\xea\x90\x78\
-\x66\xd5\x6a\x31\xfb\xe6\x62\x11\x17\x17\x7f\xd5\x9d\x60\x7c\x7c\
-\xbc\x98\x7d\x73\xb1\x78\x66\xd5\x6a\xf1\x55\xd5\xa1\x2e\x3d\x1f\
-\xef\x28\x13\xc5\x25\xa5\x17\xcb\x3e\x19\x0d\xc3\xa3\xe5\x01\x4f\
-\x02\x6b\x15\x0a\x89\x40\x40\x5e\xf0\x6e\x9a\x73\x33\x16\x8b\x85\
-\x43\x35\xd5\x61\x82\xc6\x64\x03\xe3\x72\x32\x49\xd6\xeb\x48\x4a\
-\xd0\x01\x60\x69\x77\xd2\x6a\x77\x70\xe4\x64\x23\xcd\x6d\xb6\x30\
-\xf9\x82\xc2\xf1\x24\x25\x25\xb1\x7b\xd7\x17\x00\x28\x24\x89\x80\
-\xbc\xa8\xfe\x1b\xf0\x72\x7f\x0d\x8f\xe6\x67\x90\x05\x37\x15\xa1\
-\xd7\xc5\xf2\xf6\xc7\x5f\x76\x19\xac\x56\xa9\x98\x5d\x34\x86\xf9\
-\x33\x26\x30\xa3\x70\x14\x39\x99\x83\x7b\xd4\x71\xf2\x9c\x89\xbd\
-\x35\xc7\xd9\xbe\xf7\x20\x65\x15\xb5\x5d\x04\xc6\xa8\x94\xdc\x75\
-\x43\x21\x0e\xb7\x87\xed\x07\x8e\x46\xcd\xe6\xa8\x12\x10\x1f\xab\
-\x61\xdd\x13\xf7\xf1\xc4\x4f\xe6\xf1\xf6\x27\x5f\x32\xd4\x98\xc2\
-\x6d\x33\x0a\xd1\xeb\xe2\x22\xd6\x91\x93\x39\x98\x9c\xcc\xc1\x3c\
-\x30\xff\x46\xec\x4e\x17\x1f\xed\xad\xa1\xfe\xbc\x99\x85\x93\xf3\
-\x49\xd1\xaa\x79\x7a\xfd\xb6\x68\x9a\x1c\x15\x02\xd4\x40\xce\xc5\
-\x0d\x59\x69\xc9\x3c\xb5\xf4\x8e\x7e\x2b\xd6\xeb\xe2\xb8\xb7\x74\
-\x3a\x00\x8e\x96\x56\xbc\x4e\x57\x18\x57\x40\x0c\x70\xa1\x3f\x63\
-\xf4\x37\x14\x5e\x8c\x9c\xbe\x7a\xb8\xdf\xb3\xed\x3d\x1e\x0e\x8e\
-\x7d\xcf\xb5\x22\xe0\x21\xe0\x9f\x80\x31\x5e\xab\xee\x51\xb0\xa5\
-\xcd\x4e\x59\x65\x2d\x3e\x7f\xe0\xaa\x4a\x7d\xfe\x00\x65\x95\xb5\
-\x98\x2c\xed\x3d\xca\xe9\xe2\xb4\x20\xc7\x02\xef\xd2\x8f\xbd\x41\
-\x5f\x5f\x81\x54\xe0\x55\x40\x7a\xf0\x96\x29\xa4\x26\x0c\x62\xed\
-\xfb\x3b\xbb\x15\xb4\x3b\x5d\xcc\xfa\xc5\xf3\xe8\x75\x71\x4c\x1e\
-\x3b\x82\x3f\xff\xfb\x83\x3d\x2a\x7e\xf4\xe5\xf5\x54\x1c\x3d\x8d\
-\xdd\xe9\xe2\xeb\xf5\xab\xaf\xb8\x7e\xac\xbc\xef\x36\x5a\xda\xec\
-\xbc\xbe\x69\xa7\x04\xfc\x09\xd8\x0e\xb4\xf6\x76\x22\x7d\xf5\x80\
-\x85\x80\x2e\x3f\xdb\xc8\x7f\x2e\x2a\x41\xa1\xb8\xf2\xd7\xd4\x64\
-\x6d\xc7\x1f\x08\xb0\xa8\x64\x2a\xb5\xa7\x1b\xbb\xda\x03\x42\x50\
-\x7e\xf0\x18\xe5\x07\x8f\x85\x3e\x6b\x00\xd4\x9e\x6e\x62\x51\xc9\
-\x54\xfc\x81\x00\x26\xeb\x95\xbd\x40\xa9\x50\xf0\xfb\x5f\x2d\xa2\
-\x20\x37\x0b\x20\x01\x79\x83\xd4\x6b\xf4\x95\x80\x51\x00\xd3\xf3\
-\x86\xa1\x90\x7a\x0e\x25\x46\x66\x19\x59\xb1\xb8\x94\xfd\x87\x4f\
-\xf2\xd2\x8a\x7b\xbb\xda\x3b\x2f\xf8\xb8\x73\xe5\x3a\xee\x5c\xb9\
-\x8e\xce\xe0\xae\x10\xe0\xa5\x15\x4b\xd8\x7f\xf8\x24\x8f\x2e\x29\
-\x65\x64\x56\xcf\xc9\x1f\x85\x24\x71\xd3\xc4\xae\xc4\x4b\x1e\x7d\
-\x40\x5f\x5f\x81\x0e\x00\x8b\xc3\x15\x91\xf0\x63\x4b\x4a\x79\x6c\
-\x49\x69\x44\xb2\x53\xc6\xe6\xf0\xde\x8b\x8f\x46\x6c\x88\xd9\xea\
-\x08\xfd\x74\xf6\x65\x22\x7d\xf5\x80\xdd\x00\x9f\x56\x1d\xe3\x5c\
-\xab\x8d\x90\x13\x88\x3e\x6e\x7b\x23\x82\x08\xfb\x83\x84\x44\xfd\
-\x79\x33\xdb\xf6\x1c\x0c\x49\x94\x7d\x9f\x04\xec\x02\xf6\xba\xbc\
-\x9d\x2c\x7e\x69\x3d\x75\x4d\x72\xba\xcb\xee\x74\x47\x3e\xb0\x42\
-\x22\xdb\x98\x4c\xb6\x31\xb9\xc7\x35\x24\x84\x40\x70\x9b\x6d\xef\
-\x90\xc7\x38\x74\xe2\x0c\xb7\x3e\xba\x86\x0e\xb7\x17\xa0\x9c\xe0\
-\x43\xe9\x2d\xfa\xfa\x0a\x08\xe4\x18\xe0\x33\x93\xcd\x91\xbf\x69\
-\x6f\x0d\x00\xe7\x2f\x89\xe3\x7b\x82\x5a\xa5\xa2\xe6\x1f\x2f\x44\
-\x2c\x1f\xf0\xf9\x01\x30\xd9\x64\x4f\xdf\xb0\x63\x7f\xa8\xeb\x30\
-\xb0\x84\x3e\xd6\x12\xfb\x13\x07\x34\x22\x97\xad\x9e\x42\x2e\x7f\
-\x51\xdf\x64\x0e\x5b\xd1\x41\xfe\xae\xdb\x1c\x2e\x1c\x2e\x4f\xc4\
-\x8a\x1d\x2e\x0f\x36\x87\xab\x2b\x6e\x10\x42\x10\xf0\xfb\xf0\x07\
-\x04\x0d\x66\x4b\x48\xec\x08\xf0\x1f\xc8\xe5\xb7\xf3\x7d\x9d\x44\
-\x7f\x23\xc1\x0e\xe0\x25\xa0\x10\x30\xb7\xda\x1c\x54\xd6\x86\x67\
-\xa9\xea\xce\x9c\x67\xf8\x9d\x8f\x33\x65\xe9\xb3\x11\x2b\x2d\x7a\
-\xe0\x19\x86\xdf\xf9\x38\x27\xcf\xb5\xc8\x24\x7a\xbc\x88\x80\xe0\
-\xe0\xa9\x73\xd8\xe4\xd7\xcc\x14\x1c\x73\x0d\x10\xd9\x4a\x3c\x40\
-\x04\x84\xe0\x07\xb6\x01\x7c\x58\x5e\x19\xd6\x91\x95\x96\x4c\x8c\
-\x4a\x49\x8b\xc5\x4e\x93\xd9\x7a\x55\x45\x8d\x26\x0b\x66\xab\x83\
-\x18\x95\x92\xcc\xc1\x49\x00\x74\x76\xc8\xde\xf3\x59\xd5\xb1\x90\
-\xd8\xd6\xe0\x98\xfd\x46\x34\xd3\xe2\xff\x04\x78\x73\x6b\x79\x58\
-\x00\xa3\x8b\xd3\x32\xa3\x70\x14\x42\x08\xfe\xb2\x71\xc7\x55\x95\
-\xfc\xf9\xbd\x1d\x08\x21\x98\x35\x21\x8f\xf8\x58\x0d\x22\x10\xc0\
-\xeb\x70\x62\xb6\x3b\x79\xa7\xbc\x2a\x6c\xac\xeb\x8d\x80\xcf\x81\
-\xdd\x1d\x6e\x2f\x2f\xbe\x15\x9e\xab\x5c\xf9\xd3\xdb\x00\x78\x7d\
-\xd3\x4e\xb6\xec\xae\xbc\xa2\x82\xcd\x65\x15\xfc\x57\x30\xa4\x5e\
-\x79\x9f\x7c\x8f\xdb\xee\x20\x10\x08\xf0\xea\x96\xdd\xb8\xbd\x17\
-\x40\xfe\x02\xed\x24\x4a\x88\x76\x71\xf4\x28\xb0\xbc\xa6\xee\x8c\
-\x34\x32\xcb\xc8\x98\xe1\x43\x00\xc8\x36\xa6\xe0\x74\x79\xd8\x7f\
-\xe4\x24\x1f\x96\x57\xd1\x6a\x77\x32\x3c\x23\x95\x64\xbd\x9c\x11\
-\xaa\x3b\xd3\xcc\x1f\xde\xdc\xc2\xea\x37\x36\x13\x10\x82\x15\x8b\
-\xe6\xf2\xc0\xfc\x99\xf8\x3b\x3b\x71\x98\x2d\x6c\xdb\x7f\x84\x75\
-\x1f\xec\x02\x08\x20\x7f\x7d\x9a\xa2\x65\x70\xb4\x52\x62\x17\xe3\
-\x59\xe0\x39\xad\x26\x86\xcd\x6b\x9e\x60\x5a\x81\x5c\x05\xf6\x07\
-\x02\xac\x7e\x63\x33\xaf\x6d\xf8\xac\x2b\x60\x8a\x0d\xd6\x08\xdd\
-\xde\x4e\xd9\x18\x49\xe2\xb1\x25\xa5\xfc\x76\xf9\x42\x24\xc0\x76\
-\xae\x99\xfd\x47\x4e\xf2\xe0\x1f\xff\x81\x57\x0e\x97\x9f\x05\x9e\
-\x8f\xa6\xb1\x03\x51\x1e\x2f\x07\x46\xfb\xfc\x81\x71\x1b\x77\xee\
-\x27\x23\x35\x91\x82\xdc\x2c\x14\x92\xc4\x9c\xa2\x7c\x8a\x27\x8f\
-\xc5\xda\xde\xc1\xd9\x16\x0b\x6e\x6f\x27\x3e\xbf\x9f\x58\x8d\x9a\
-\x5b\xa7\xff\x88\xbf\x3c\xf5\x20\xf7\x96\xde\x80\x10\x82\xf6\xf3\
-\x66\x3e\x28\xaf\x62\xc5\xeb\x9b\x42\x93\x7f\x1f\x78\x24\xda\xc6\
-\x0e\x84\x07\x00\x68\x81\x8d\xc0\x7c\x80\x85\xb3\x8b\x78\x66\xd9\
-\x02\x46\x0c\xf9\x2e\x1f\xe8\xf3\x07\x30\x07\x17\xcb\xd4\xc4\x04\
-\x54\x4a\x79\x39\xf2\x79\x3b\x39\x74\xe8\x38\x6b\xde\xfd\x9c\x4f\
-\x2a\x6b\x43\xe2\xdb\x81\xbb\x81\xc8\x83\x89\x6b\x40\x80\x12\xf9\
-\xf4\xd7\xed\xc8\xdb\xe5\xb0\x0a\x6e\x8c\x4a\xc9\x1d\xb3\x26\x32\
-\x7f\xc6\x78\x4a\xa6\x16\x30\x48\x4e\x68\x74\xc1\xee\xe8\xe0\xa3\
-\xb2\x0a\xb6\xef\xa9\xe6\xd3\xaa\x6e\x93\x27\x67\x80\x4f\x90\x3f\
-\xb7\x9f\x02\x9d\xd1\x26\xa3\x2f\x48\x00\x16\x01\x6f\x03\x56\x2e\
-\xca\xef\xeb\xd4\x31\xa2\x78\x44\xa6\x00\x84\x52\xa1\x10\x92\x14\
-\x9e\xff\x4f\x4a\x88\x17\x63\x86\x65\x88\xbc\xa1\xe9\xc2\x10\x3c\
-\x28\x15\xba\x24\x09\xa1\x54\x48\x02\x10\x37\x66\xa6\x8b\x58\x95\
-\xea\xd2\xfa\x81\x35\x38\xe6\xa2\xa0\x0d\x7d\x46\x5f\x3d\x60\x28\
-\xf2\x62\x74\x0f\xb2\xbb\x03\x60\xd4\xc5\x51\x32\x22\x8b\x5b\x73\
-\xb3\x99\x9e\x95\x86\x5a\xa9\x64\xd6\x9b\x9b\x39\x65\x6d\xe7\xd7\
-\x0b\xe6\xe0\x0b\xf8\xd9\x51\x7d\x9c\xa3\x67\x9a\xbb\x55\x9a\x9f\
-\x6d\xe4\x96\xf1\xa3\x90\x24\x89\x57\xb7\xec\x26\x37\x49\x4f\xd9\
-\x83\x0b\xe8\xf4\xfb\xd9\x5d\xdf\xc4\xf6\x6f\x1b\x28\x6b\x68\xa4\
-\xd5\x1d\xf6\x26\x78\x90\x4f\x8e\xfc\x16\xd9\x4b\x06\x9c\x80\x79\
-\xc1\x01\x75\x00\x63\x52\x13\x99\x3b\x22\x8b\xd2\xdc\x6c\x0a\xd2\
-\x92\x2f\x53\xf8\x66\xf5\x31\x7e\xfb\xc5\x7e\x92\x07\xc5\xb3\xe9\
-\x37\x3f\x63\x48\xb2\x01\xa7\xdb\xcb\xd9\x56\x1b\xd6\x60\x96\x37\
-\x51\x17\x47\x56\x8a\x01\x5d\xac\x86\xb3\x66\x2b\x77\xbf\xf0\x26\
-\x16\x87\x8b\x3f\x14\x4f\xe3\x81\xc2\xd1\x61\xfa\x04\x50\xd5\x68\
-\x62\xf3\x91\x53\x94\x35\x34\x51\xef\xe8\xca\x07\xb4\x23\x7b\xc4\
-\xa7\x03\x49\x40\x11\xb0\x07\xd0\x4c\xcd\x4c\xe3\xe9\x99\x93\x98\
-\x94\xde\x73\xe1\xd3\x17\x08\x70\xf7\x86\x4f\xa9\x68\x32\x91\xaa\
-\xd7\xf1\xfc\xfd\xb7\x51\x5c\x78\xf9\x01\x0f\x21\x60\x47\xf5\xb7\
-\xac\xfa\xdf\x8f\x31\xb7\x3b\x99\x32\x64\x30\x1b\xee\xb9\x15\x55\
-\x0f\x5b\x65\x8b\xc3\xc3\xc7\x87\xeb\x59\xff\xed\x71\x8e\x5a\xac\
-\x00\x6e\x60\x26\x70\xe5\x68\xab\x1f\x04\x48\xc0\x41\xa0\xb0\x64\
-\x44\x16\xff\x7d\xc7\x6c\x62\x94\x91\x05\x92\xad\x2e\x0f\x4b\x3f\
-\xd8\x49\x4d\xb3\x9c\xb3\xcc\x48\xd2\x33\x26\x2b\x0d\x75\x8c\xfc\
-\x15\xf6\x5e\xf0\x51\x7b\xb6\x85\xf3\xc1\x4c\xf0\x84\xf4\x14\xde\
-\x5a\x50\x4c\x72\xac\xf6\xaa\xba\x1b\xdb\x9c\x34\xb4\xb4\xf3\x52\
-\x55\x35\x95\x26\x33\x41\x1b\x27\x11\xe1\xf6\xb8\x37\x04\xcc\x01\
-\xbe\x88\x8f\x51\xf1\xe5\xf2\xbb\x22\x32\xee\x62\x78\x7c\x7e\x5e\
-\xaf\x38\xcc\x1b\x55\x47\xb1\x7b\xba\x5f\xc0\xf5\x5a\x35\xbf\x98\
-\x34\x96\x87\x27\x8d\x45\xa3\x8a\x2c\x44\x09\x08\xa8\xa9\x33\xd1\
-\xea\xf6\xf0\xcb\xb2\x72\x3c\x7e\x3f\xc0\x6c\x22\x4c\x90\xf4\x26\
-\x21\x52\x02\x70\xc7\xe8\xe1\xbd\x9e\x3c\x80\x56\xa5\xe4\xf1\x69\
-\x85\x3c\x32\xa5\x80\xca\x26\x33\x67\xdb\x9d\x78\x83\x49\x0e\x8d\
-\x4a\x49\x96\x5e\xc7\xa4\xf4\xd4\xb0\x23\x31\x91\x40\x21\x81\x7e\
-\x90\x06\x5f\x20\xc0\x0d\xe9\x46\xbe\x38\xd7\x18\xb2\x35\xea\x04\
-\x64\x03\x8c\x4c\xd6\xf7\x7a\xf2\x61\x03\x2a\x14\x4c\xcd\x4c\x63\
-\x2a\x69\xfd\xd2\x13\x46\xae\x5a\x9e\x46\xf6\x20\x5d\xa8\x69\x58\
-\xa4\xf7\xf6\x86\x6e\x2d\xd0\xed\x19\xbf\x6b\x8d\xd0\x3a\x19\xff\
-\xdd\xc1\x8a\x88\x5d\x34\x2a\xd5\xe1\x8e\x0b\x3e\xde\x39\x54\x87\
-\xd7\x1f\x95\x1c\xc5\x55\xa1\x51\x2a\x59\x52\x30\x92\xf8\x98\xfe\
-\x9b\x1f\x15\x02\xde\x3b\x72\x82\x55\x65\x51\x3f\xc7\xdc\xb3\xe1\
-\x4a\x05\x4b\x2f\x89\x11\xae\x19\x01\x9e\xe0\x62\x36\x72\x98\x9e\
-\x19\x45\xe9\x34\x34\x3a\xd8\xb5\xaf\x11\x63\x7a\x3a\x25\xa5\xf3\
-\xb0\xb4\xb5\xb1\x7d\xeb\x16\x74\xf1\x31\xdc\x3d\x2f\xa7\x5f\x63\
-\xed\xad\x38\x4f\x5d\xbd\x1d\xf7\x45\xd5\xa4\x6b\x4e\x40\x08\xd3\
-\x26\x1a\x79\x65\xd5\x4c\x3e\xfc\xfc\x34\xbb\xf6\x35\x92\x3b\x72\
-\x14\x6b\xff\xf8\x27\x0e\xd5\x54\xb3\x7d\xeb\x16\x92\x0d\x5a\x5e\
-\x59\x35\xb3\x5f\x63\xac\x58\x55\x4e\x5d\xbd\x3d\x6a\x36\x47\xfb\
-\xb0\xf4\x0f\x0e\xd7\x25\x01\xcd\x66\x17\x07\xbe\x31\xf5\x5f\x51\
-\x04\xe8\xf5\x2b\x70\xac\xd5\xca\x17\xa7\xcf\x85\xb5\x9d\xb0\x44\
-\xcf\x25\x4f\x34\xd8\xb9\xfd\xa1\x6d\x34\x9b\x5c\xac\x7a\x7c\x32\
-\x4f\x2c\x1b\xdf\xbd\x9c\xc5\xde\x65\x87\xd5\xe1\xc5\x6c\x77\xd1\
-\xe0\xe8\x7d\x7d\xb4\xd7\x04\xfc\xad\xaa\x96\xbf\x55\xd5\xf6\xf6\
-\xb6\x5e\x4f\x1e\xe0\xb9\x57\x0e\x00\x74\x4b\xc2\x3b\x87\xeb\x78\
-\xe7\x70\x5d\xbf\xc7\xec\x35\x01\xc3\x32\x52\x49\x35\x0c\x0a\x6b\
-\x6b\x6e\xb3\x73\xb6\xa5\xad\x5f\x86\xd4\xd5\xdb\xb9\xe3\xa1\x6d\
-\x34\x9b\x5d\xfc\x68\xfc\x04\x6e\x29\x29\x65\xdd\xda\x17\x79\xee\
-\x95\x03\x68\x62\x94\xfc\xea\x81\x82\x30\xf9\xac\xb4\x64\x8c\x97\
-\x44\xa5\x66\x9b\x83\xfa\x26\x73\x6f\x86\xed\x3d\x01\xbf\xfe\xc9\
-\x3c\xee\xbf\xed\xc6\xb0\xb6\xd7\x36\x7c\xc6\xb3\xaf\x6f\xbc\x4c\
-\xd6\xe9\x74\xf2\x4d\xf5\x41\xea\xea\x8e\x47\x3c\xf9\xb1\xe3\x0a\
-\x78\x6f\xf3\x56\xf4\x06\x03\x4a\x95\x92\xb5\x2f\xfc\x9e\xa7\xd7\
-\x7e\x05\x10\x46\xc2\xcf\x17\xce\x61\xc5\xa2\xb9\x61\x7a\xfe\xfe\
-\xd1\x1e\x1e\x7d\xf9\x7f\x06\x96\x80\x48\x20\x05\x0f\x0c\x54\x57\
-\x55\x32\x77\xce\xcc\x8b\xda\xbb\x97\xbf\xff\xf1\xcf\x69\x36\xcb\
-\x6e\x5f\x7f\xfa\xbb\xff\x89\xaa\x3f\xf5\xdd\xef\xa7\xd7\x7e\xc5\
-\xe4\xf1\xd1\xdb\x3f\x0c\x28\x01\x93\x0a\x52\x99\x30\x36\x15\xab\
-\x3d\x3c\x89\xbb\xf8\xf6\x91\xdd\xca\xcf\x9a\x92\x81\xc7\xeb\xe3\
-\x6c\x93\x93\x8e\x8e\x0e\x4c\xa6\x16\xf4\x06\x43\x17\x19\x69\x29\
-\x71\x64\xa4\xc5\x93\x31\x38\xfe\x87\x41\x40\x46\x5a\x3c\xbb\xde\
-\x59\x10\xb1\xfc\x9a\xa7\x6f\x60\x0d\x37\x90\x77\xf3\xdb\x5d\x9e\
-\x70\x31\x5e\x5b\x3d\x8b\xb9\x33\xb3\x06\xc2\xd4\xde\x13\xe0\xf6\
-\x76\x62\xbb\xe4\x6c\x50\xa8\xb2\xd3\x79\xc1\x8f\xad\xdd\xdb\x5b\
-\x95\x5d\x08\x9d\x2d\x70\x38\xda\xb1\xdb\x6c\xf8\x7c\x72\xb8\xdb\
-\xe1\xba\xd0\xa5\xb7\xf3\x82\xff\xaa\x76\x0c\x14\x36\x12\xf9\x3f\
-\x3f\x5f\xeb\x6b\x23\x11\xa2\x37\x91\xe0\x1e\xa2\x54\x93\x1f\x60\
-\xf8\x81\xff\x8b\x54\xf8\xff\x01\x68\xe5\xa2\x7b\x95\x52\xbb\x99\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
-\x61\x74\x65\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\x32\
-\x30\x3a\x33\x36\x3a\x32\x34\x2b\x30\x32\x3a\x30\x30\x7e\x96\xbf\
-\xee\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
-\x64\x69\x66\x79\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\
-\x32\x30\x3a\x33\x36\x3a\x32\x34\x2b\x30\x32\x3a\x30\x30\x0f\xcb\
-\x07\x52\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\
-\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x14\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\xbb\x7f\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\
-\x2b\x0e\x1b\x00\x00\x12\xe1\x49\x44\x41\x54\x78\xda\xed\x9d\x7b\
-\x94\x5d\x55\x7d\xc7\x3f\xbf\xf3\xba\x8f\xb9\x77\xe6\xce\x7b\xc8\
-\x83\x90\x07\x09\x8f\x84\x40\x12\x44\x50\x31\x08\x22\x06\x84\x50\
-\x01\xe5\x51\xb5\x55\xb4\xb6\x82\xad\x65\x51\xda\xae\x5a\x6c\x5d\
-\xb6\x62\xb5\x88\xed\x6a\xed\x72\x55\x94\x02\xea\x12\x1b\xd4\x5a\
-\x45\x30\x40\x54\x10\x03\x64\x62\x1e\x93\x44\x82\x90\x04\x32\x33\
-\x99\xf7\xdc\x3b\xf7\x71\xce\xd9\xfd\xe3\x26\x34\x99\xcc\xe3\x3e\
-\xce\xb9\xe7\xde\x99\xf9\xac\x75\xff\x98\xb9\xe7\xfc\xf6\xef\xb7\
-\xcf\xf7\xee\x73\xce\xde\xbf\xbd\xb7\x30\xc3\x51\x4f\xac\x5d\x8a\
-\xd2\x2e\x44\xc9\x19\x08\x2b\x80\xe5\x40\x1c\x48\x00\xb1\x97\xce\
-\xfd\xb9\xa9\xb9\x69\x25\x2a\x65\x6b\x76\xca\xd6\x9d\xfe\x5e\xdd\
-\x1e\xdc\xaf\xdb\x23\x9d\xe2\x0c\x3d\xd0\x7a\xe6\x87\x9e\x0f\x3a\
-\x06\x3f\x91\xa0\x1d\xf0\x1a\xf5\xf3\x15\x71\xdb\xd0\xee\x94\xac\
-\x75\x89\x9e\xb3\x96\xa1\xa4\x7d\xaa\xe3\x7f\xbb\xe6\x57\x53\xda\
-\x33\x33\x07\xb3\xd6\xd8\xcb\x7b\x4c\xe7\xf0\xfd\x2d\x07\x77\xdd\
-\x27\x97\xdc\x6d\x07\x1d\xa3\x97\xcc\x18\x01\x8c\x3d\xbf\xfc\x6d\
-\x46\xda\xba\x57\xcf\x84\xce\x15\x57\xd7\x0a\x3d\x6f\x3a\x01\x1c\
-\x8f\x9e\xeb\xb5\x23\xa3\xdb\x7f\x69\xda\x07\xee\x68\x59\xf1\x07\
-\xbf\x0e\x3a\x66\x2f\xa8\x79\x01\x8c\xee\x49\xac\x76\x95\xf1\x0f\
-\x66\xaa\xee\x8a\x70\x7f\x7b\xd1\xf1\x14\x23\x80\x63\x88\x9b\x23\
-\x3c\xfa\xe2\xfe\x70\x66\xdf\x47\x5b\x56\xdc\xf2\x44\xd0\x75\x50\
-\x0e\x35\x2b\x80\xfe\x9d\x8d\xa7\x1a\x9a\xf6\xf7\x08\xb7\x00\x9a\
-\x91\x8a\x11\xe9\x6f\x2f\xda\x4e\x29\x02\x38\x86\x28\x9b\xe8\xd0\
-\x2f\xb7\x6a\xee\x2b\x57\x76\x2c\xfb\x40\x4f\xd0\x75\x52\x0a\x05\
-\x37\x95\xd5\x82\x52\xc8\xd0\xee\xe6\x4f\x18\xba\xd6\x85\xf0\x81\
-\x20\x63\x50\x62\x90\x4c\x5c\xbc\x2e\x55\xff\xee\x43\x3d\x7b\xbf\
-\xf7\xd9\xa0\xeb\xa6\x14\x6a\xaa\x05\x18\xfd\x4d\x5b\xbb\x6b\x39\
-\x5f\x43\x71\xd5\xf8\xef\x82\x68\x01\xc6\x13\x19\x7e\x6e\x7f\x3c\
-\xf9\x9b\xf3\x1b\xce\xfe\x48\x7f\xb0\x35\x55\x38\x35\xd3\x02\x8c\
-\xec\x6d\xbd\xd8\x35\xdd\x1d\x13\x5d\xfc\x6a\x61\xac\xfe\x4d\x4b\
-\x06\x13\xef\x38\xd0\xb3\xeb\xfe\x8b\x83\xf6\xa5\x50\x6a\x42\x00\
-\xc3\x7b\x9a\x37\x2a\xd7\xfd\x31\xa8\x96\xa0\x7d\x99\x8e\x6c\x64\
-\x71\x74\xb4\xe5\xea\xcd\xbd\xbb\x1f\xb8\x31\x68\x5f\x0a\xa1\xea\
-\x05\x30\xb4\xbb\xf9\x13\x28\x1e\x01\x22\x41\xfb\x52\x28\x8e\xd1\
-\xa8\x0d\xb7\xbe\xf7\xc1\xee\xae\x6f\xdf\x19\xb4\x2f\xd3\x51\xd5\
-\x02\x18\xd9\xdd\xf2\x31\x11\xbe\x52\xed\x7e\x4e\x84\xab\x45\x64\
-\xa4\xe5\xea\xcf\xf7\xee\x79\xf8\xd6\xa0\x7d\x99\x8a\xaa\xad\xd8\
-\xe1\xae\xe6\x6b\x94\xa8\x7f\x0d\xda\x8f\x72\x50\x5a\x98\x91\xc6\
-\x0d\x5f\xed\xdd\xf5\xf0\x95\x41\xfb\x32\x19\x55\x29\x80\xe1\xdd\
-\x4d\x17\x02\xdf\x06\xf4\xa0\x7d\x29\x17\xc7\xa8\x97\x91\xe6\x4b\
-\x37\x1d\xd9\xf3\xf5\x33\x82\xf6\x65\x22\xaa\x4e\x00\x03\x2f\x27\
-\x12\x88\x3c\x04\x84\x82\xf6\xc5\x2b\x1c\xb3\xd5\x18\x8b\xae\xdb\
-\xa2\x36\xdf\x6d\x04\xed\xcb\x78\xaa\x4a\x00\x4a\x21\x7a\x5a\xff\
-\x4f\xe0\xb4\xa0\x7d\xf1\x9a\x74\xdd\xca\x96\xc3\x0b\x2f\x7c\x34\
-\x68\x3f\xc6\x53\x55\x02\x18\xde\xdb\x7c\x0b\xc2\xb5\x41\xfb\xe1\
-\x17\xc9\xc6\x77\x6c\x38\xd2\xf5\x8d\x6b\x82\xf6\xe3\x78\xaa\x46\
-\x00\x7d\xfb\x9a\xea\x45\xf1\x8f\x41\xfb\xe1\x27\x4a\x0c\x52\xb1\
-\x37\x7f\x43\xa9\xbb\xab\xa6\xde\xab\xc6\x11\xcb\xd1\x3e\x03\xcc\
-\x2b\xd9\x80\xa8\xa0\x43\x28\x88\x4c\x74\x79\x43\xcf\xbe\xd5\xff\
-\x12\xb4\x1f\xc7\xa8\x0a\x01\xa4\xf6\x34\xcf\x57\xa8\x8f\x97\x65\
-\xa4\x46\x04\x00\x90\x4c\xbc\xf5\xd6\xd7\x5e\xfb\x6a\x34\x68\x3f\
-\xa0\x4a\x04\x60\xbb\xf2\x29\xca\x7c\xea\x57\x9a\x1b\x74\x18\x05\
-\xe3\x18\x2d\x86\x3e\xda\xf1\xcf\x41\xfb\x01\x55\x20\x80\xc1\xed\
-\x0d\x8d\x88\xfa\x68\xb9\x76\x5c\xad\xb6\x32\xb5\xc6\xe2\xe7\x7d\
-\xa8\x1a\x5e\x0b\x03\x17\x80\x1e\x32\x6e\x04\x62\xe5\xda\x51\x86\
-\x8d\x92\xda\x69\x05\x72\xa1\x85\xd6\x91\x05\x67\xdc\x1e\xb4\x1f\
-\x81\x0b\x40\x29\x6e\xf6\xca\x96\x6b\xe6\x82\x0e\xa7\x28\xb2\xe6\
-\xa2\xf2\x9e\x7b\x3c\x20\x50\x01\x0c\xee\x6d\x5f\x02\x5c\xe8\x95\
-\x3d\xc7\x4a\x07\x19\x4e\xd1\xa4\x63\xe7\x2c\x1d\x79\xe1\xbe\xd6\
-\x20\x7d\x08\x54\x00\xe2\xd8\x57\xe2\x61\x56\x92\x13\x4e\x05\x19\
-\x4e\xd1\xb8\x5a\x54\x52\xb1\x53\x6e\x0b\xd2\x87\x60\x05\x20\xbc\
-\xdd\x4b\x7b\x76\x68\xac\xa6\xde\x06\x00\x1c\xab\x2d\xd0\x91\xc2\
-\xe0\x12\x2a\x15\x02\xbc\xcd\x53\xa3\xa2\xb0\xa3\xc9\xa0\x42\x2a\
-\x89\x9c\xb5\xe8\xcc\x20\xcb\x0f\x4c\x00\x43\x7b\x1a\x4e\x03\xda\
-\xbc\xb6\x9b\x8b\x0e\x05\x15\x52\x49\x64\xc3\xa7\x46\x8e\x6c\xfb\
-\xc6\xfc\xa0\xca\x0f\xee\x16\xa0\xf4\xd3\xfd\x30\xeb\x58\x19\x9c\
-\xf0\x58\x60\x61\x15\x8f\x40\xc4\x7a\x47\x50\xa5\x07\x26\x00\x41\
-\x56\xf8\x65\x3b\x13\xaf\x99\xac\x6c\x00\x1c\x2d\xec\xd9\x9b\x50\
-\xb1\x04\x29\x80\xd3\xfc\xb2\xed\x84\xd2\xd8\xd1\xd1\xa0\x42\x2b\
-\x1a\x57\x8b\x9f\x1d\x54\xd9\xc1\xdd\x02\x84\x7a\x3f\xcd\xdb\xed\
-\x2b\x41\xaf\x0b\x2c\xbc\x62\x70\xb5\x50\x22\xa8\xb2\x03\x7c\x0b\
-\x70\xcb\xee\xfe\x9d\x0c\xd1\x12\x84\x9a\x3e\x05\x8b\xcb\x1e\x62\
-\xa8\x4c\x5d\x88\x15\x98\x52\x83\xbb\x05\x88\xf8\x14\xb4\x10\x4e\
-\xfc\x2d\xa2\xb7\x41\xd3\x05\xd0\x7e\x45\x50\x21\x16\xe1\xb2\x19\
-\xd8\x9c\x87\x00\x3b\x82\x94\x2f\x19\xbf\x56\xfc\xc3\x18\xe1\xb7\
-\xfe\xff\x3f\x4e\xfd\x00\x34\xae\x0b\x2e\xcc\x42\x6a\x42\xd3\xcd\
-\xa0\xca\x0e\x7c\x30\xc8\x4b\xcc\xc8\x06\x42\xf1\x71\xcd\xbe\x68\
-\xb0\xf4\x76\x68\x58\x19\xb4\x7b\x55\x49\xc5\x05\xa0\xf6\xfd\x28\
-\xa4\x0e\x3c\x7d\x9b\xae\xaf\x7c\x8b\x97\x76\xcd\xe8\x46\xc2\x8d\
-\x9f\x66\xc2\xa1\x05\xcd\x82\xd3\xef\x82\xe6\xc0\xde\xb6\xa6\xa9\
-\x14\x37\x31\xb4\xfd\xc1\x4f\xa8\x9d\xdf\xb1\x2a\x5d\x74\x45\x05\
-\xa0\x0e\x3c\xb5\x81\x48\xac\x0b\xe1\x3e\x21\xd4\xe0\x8d\x55\x21\
-\x14\xbf\x95\x70\xe2\xaf\x99\x72\x1e\x89\x66\xc0\x92\xdb\x60\xde\
-\xc6\x7c\xab\x50\x45\x88\x52\xa6\x28\xbe\x32\x62\xe7\xba\x86\x3a\
-\x1f\xaa\xe8\x43\x4b\xc5\x6a\x42\x1d\x7a\xfa\x4e\x44\x7e\x80\x87\
-\x39\xff\xa2\x25\x88\x34\xdf\x8b\x15\x2f\xf0\x69\x5f\x34\x58\xf0\
-\x7e\x58\xfe\x17\x60\x35\x56\x2a\xf4\x62\x58\x2c\xa8\x1f\x0e\x77\
-\x3e\x78\x47\xa5\x0a\xac\x88\x00\xd4\x81\xa7\x3e\x89\xe2\xf3\x27\
-\x94\x27\xe5\x64\x43\x09\x66\xf4\x2a\xea\x5a\xbf\x8d\x11\xba\xa8\
-\xf8\xd3\x1b\x56\xc3\xaa\x2f\x41\xfb\xbb\x11\xe5\x54\xa2\x0a\xa6\
-\x8e\xe6\x44\x1f\x74\xe0\x0b\x43\xdb\x1e\xaa\xc8\x30\xb1\xef\x2b\
-\x84\xa8\x03\x5b\xd6\x23\xea\x71\xc6\xb5\xcf\x99\xec\xc3\x64\xb3\
-\xdf\x29\xda\x5d\x23\x74\x11\x56\xfc\xc3\xe8\xd6\x2a\x4f\xfc\xcb\
-\xf5\xef\x63\x90\x28\xc3\xb1\x0b\x50\x5a\x30\x0f\xe3\x0d\x47\xfe\
-\x97\xf0\xd8\xc0\xf8\x7f\xdb\x22\x5c\x1a\x3f\xe7\xe6\xa7\xfd\x2c\
-\xdb\x57\x01\x28\xa5\x34\x0e\x6d\xd9\x0a\x9c\x77\xd2\x77\x24\x49\
-\x26\x3f\x89\x52\x7d\xd3\x3b\xa9\x37\x61\x86\x2f\xc7\x8c\xbe\x07\
-\xcd\x5c\xee\xad\x93\xc3\x07\x01\xb0\x9d\x0c\xa3\x0e\x8c\x86\x16\
-\x91\x8e\x2c\xf3\xbb\x6a\xde\xc0\xc8\xf5\xd2\xdc\xfd\x18\xa8\x09\
-\xca\x53\xd2\x19\x5f\xbd\x77\x8d\xc8\xdd\xbe\x25\x39\xf8\x2b\x80\
-\x83\x5b\xae\x07\x35\xe9\xcf\xdc\x55\xdd\xa4\xd3\xff\x86\xe3\x6c\
-\x07\x8e\xe6\xf5\x8b\x89\xa6\xcf\x47\x33\x4e\x43\xb7\x56\xa2\x5b\
-\xe7\xa1\x5b\x67\xe3\xdb\x44\xe1\xa3\x02\x38\x1e\xdb\x49\x93\x72\
-\x15\x19\xc2\x64\xac\x76\x72\x66\x07\xae\x1e\x43\x89\x97\x3e\x28\
-\x22\xa3\xdb\x89\x0d\xee\x40\x53\x93\x5f\x06\x41\xae\x8b\xaf\xbe\
-\xe9\x11\x7f\x82\x07\x9f\xd3\x92\xd5\xfb\xa6\xfa\x56\x93\x76\xa2\
-\x91\xbb\x51\x2a\x05\x64\x81\x30\x12\x6a\x86\x70\xb0\x0f\x68\x86\
-\x1e\xa6\xfe\xd8\xb5\x56\x3d\x90\xed\x01\xe5\xe2\x2a\x07\x57\x39\
-\x94\x3a\x05\xc5\x71\x1c\x32\xc9\x7c\x8b\xa7\x29\x8e\xfe\xea\xa7\
-\xfe\x0d\xba\xe2\xde\x00\xf8\x26\x00\xdf\x5a\x00\xa5\x36\x1b\x1c\
-\xd2\x07\x28\x36\xe5\xdb\xaa\xab\xac\x00\x26\x68\x01\xfc\x22\x67\
-\xdb\xa4\x87\x5e\x2f\xf6\xb4\x91\xf8\x1e\xb3\x51\x6e\xb8\xc1\x97\
-\xa7\x55\xff\xde\x02\x0e\xd1\x81\x07\xf9\xfe\x73\x10\x4f\x2d\xc9\
-\x78\x9e\x39\x75\x0c\xff\x04\xe0\x9a\x1d\xbe\xd9\x9e\x65\xe4\x2c\
-\xad\xf4\x49\xb3\xd3\xe0\x9f\x00\xc4\xcd\xfa\x66\x7b\x96\xa1\x2b\
-\x27\xe3\x97\x6d\xff\x04\xa0\x3b\xaf\xf9\x66\x7b\x96\xe1\x1a\x61\
-\xdf\xea\xd2\x3f\x01\x9c\xb2\xbe\x0f\x28\xfa\x89\x67\x8e\xf1\xc8\
-\xa1\xfa\xb3\xae\x1f\x28\xdf\xce\xc4\xf8\x26\x00\x11\x51\x40\xd5\
-\xad\x89\x53\x6b\x28\xa5\x36\x1d\xad\x4b\x5f\xf0\x79\x2c\xc0\xfd\
-\xa6\xbf\xf6\x67\x3c\x0a\xd1\x1e\xf0\xb3\x00\x5f\x05\x20\x0b\xd6\
-\x3f\x83\x62\x93\x9f\x65\xcc\x6c\xe4\x91\x86\xd5\x37\x7a\xb7\x9c\
-\xf9\x04\xf8\x3f\x1a\x68\x38\x7f\x06\x1c\xf1\xbd\x9c\x99\x47\xaf\
-\xe3\x28\xdf\x87\x85\x7d\x17\x80\x9c\x72\xc9\xef\x50\x5c\x47\xbe\
-\xaf\x77\x7a\x54\xed\xac\xf5\x53\x3c\x05\xc7\x96\x01\xf7\xbd\x8d\
-\x6b\x6e\x7e\xc5\x6f\x8f\x2a\x92\x0f\x20\x0b\x2f\x7e\x0a\xcd\xbd\
-\x0c\xe8\x9d\xfe\xe8\x99\x2b\x00\xa5\x0a\x1a\xd4\xeb\xc6\x55\x97\
-\xd6\xaf\xfe\xfd\x2d\x95\xf0\xa9\x62\x19\x41\x32\x6f\xfd\x16\x44\
-\xad\x45\xf1\x30\x53\x5d\xe5\x99\xdc\x02\x38\x53\x0a\xc0\x15\xc5\
-\x83\x06\x6a\x5d\xfd\x79\xb7\xfc\xa2\x52\x2e\x05\xb2\x65\x8c\x3a\
-\xb8\x65\x35\x4a\xdd\x8c\xc8\x7b\x40\xad\x38\xc1\x0f\xdd\x82\x3a\
-\xdf\xba\xbe\x4f\xa6\x82\x83\x41\xe9\xb1\x11\x72\xa9\xc1\x13\xaa\
-\x02\xd8\x83\x92\xef\x6b\x3a\x0f\xc6\x56\xdd\xb4\xbd\x72\x81\xe7\
-\x09\x7c\xcf\x20\xb5\x75\xab\x49\xc7\x48\x3b\x9a\x91\xdf\xf0\x27\
-\x14\x5f\x86\x59\xff\xad\x8a\x39\x50\x41\x01\xb8\xa8\x3b\x46\xfa\
-\x0f\x3e\x09\x60\x29\xd5\x1d\xc9\x25\xbb\x65\xdd\xc7\x02\x5d\xd8\
-\x28\x70\x01\x8c\x47\x0d\xbe\xd2\x88\xe6\x54\x6e\x7a\x6f\x05\x05\
-\x80\xd9\xb8\x4c\xda\x57\xbd\x54\xb9\x02\xa7\xa7\xba\xf2\xa3\x01\
-\x49\x2c\x1a\x00\xa6\xcf\x13\xab\x35\x44\x77\xab\xed\xe2\x43\x15\
-\x0a\x20\x8f\x74\xfa\x65\x59\xb9\x0e\xca\xb5\xdf\xf8\xb8\x76\xf6\
-\x84\x8f\x6f\x68\xfa\xa0\x7f\xc6\x4b\x27\xf0\x95\x2a\x27\x44\xa9\
-\x67\x10\xbc\x5b\x35\x43\x29\x32\x43\x07\xc9\x0d\x1d\x46\xb9\xe3\
-\x56\x14\xed\x39\x70\xe2\xdf\x9a\x86\x5e\xdf\x42\xf4\x94\x25\x78\
-\xfb\xfb\xd0\x76\xfa\x56\x5f\xe5\x78\x15\xb4\x03\x13\xa2\xab\x27\
-\xbd\x34\x97\x3e\xb2\x9f\xec\xc0\xc1\x93\x2f\xfe\x44\xb8\x2e\xce\
-\x60\x0f\xc9\x57\x77\x7b\x1b\x93\x61\x7e\xdf\x5b\x83\xde\x50\x9d\
-\x02\xa8\x1b\x78\x0a\xf0\x64\xb5\x27\x27\x9b\x24\x37\x5a\xfc\xb6\
-\xbe\x6e\x72\x88\x5c\xd2\xa3\x05\xa7\x44\x53\x28\xeb\xdf\xbd\xac\
-\x22\xaf\xa8\x4a\x01\x88\xac\xcb\x01\x3f\xf0\xc2\x96\x9b\x29\x7d\
-\xa9\x18\x27\xe5\x91\x00\x74\x6b\xbf\xb4\x9d\x5d\x95\x6b\xd6\x54\
-\xa5\x00\x00\x10\xf7\xeb\x9e\x98\xd1\x4a\x7f\xcc\x11\xc3\xa3\xc9\
-\xba\xba\x59\x35\x1b\x44\x8c\xa7\x7a\x05\x10\x5b\xba\x19\xc5\xb6\
-\x72\xcd\xe8\xd1\x04\x9a\x11\x2e\xe1\x44\x03\xb3\xbe\xb9\xfc\x38\
-\xc4\x18\xa3\xe5\xdc\xfb\x7c\xa8\x21\x4f\xa8\x5a\x01\x88\x88\x42\
-\xf8\x74\xf9\x76\x74\xc2\xed\xcb\xd1\x8c\xc2\xf7\xa3\x10\xc3\x20\
-\x3c\xef\x74\x3c\x59\xb8\xc3\x08\xdd\x23\x52\xbd\xeb\xd8\x57\x5d\
-\x4f\xe0\x78\xd4\xf0\xfe\x67\x80\x37\x97\x6d\x47\x39\xd8\xc9\x01\
-\xc6\x27\xd8\x3a\xdd\xbf\x3d\xb1\x42\xac\x30\x56\x43\x3b\x9a\xee\
-\xc1\x1b\xb2\x6e\x25\xe9\xb8\xa0\xbe\x9a\x05\x50\x9d\xfd\x00\xc7\
-\xa3\xa9\xbf\xc1\x95\x9f\x96\x6b\x46\x44\xc7\x8c\x4d\xb0\xf9\xb8\
-\x9f\x7b\x0d\x99\xe6\xdf\x55\xf3\xc5\x87\x2a\xbe\x05\x1c\x43\x62\
-\x4b\x1f\x07\x75\x7f\xd0\x7e\x14\x8d\x1e\xde\x2b\x2d\x6b\xef\x09\
-\xda\x8d\xe9\xa8\x7a\x01\x00\x90\x4e\xdf\x06\xfc\xb6\x6c\x3b\x95\
-\x42\x74\x1b\x33\xb8\xf5\x7f\x8b\xa1\x26\x04\x90\x7f\x87\x76\x3f\
-\x04\x04\xbf\x9c\x47\x21\x98\x91\x3f\x97\x96\x73\x0f\x05\xed\x46\
-\x21\xd4\x84\x00\x00\xa4\x7e\xd9\x2f\x80\xbb\x82\xf6\x63\x5a\xcc\
-\xe8\xa3\xd2\xb6\xa6\x6a\x5f\xfb\xc6\x53\x33\x02\x00\x90\xfa\x25\
-\xff\x84\xa8\x2f\x07\xed\xc7\xa4\x18\xe1\x9d\xd2\xbe\x6e\x63\xd0\
-\x6e\x14\x43\x4d\x09\x00\x80\xd8\x92\x4f\x81\x7c\x2f\x68\x37\x4e\
-\x42\xb7\xba\x69\xaf\x5b\x13\xb4\x1b\xc5\x52\x73\x02\x10\x11\x97\
-\xb8\x71\x0b\x42\xd9\xaf\x86\x9e\xa1\x87\xfa\x88\xc6\xcf\x12\x39\
-\xbb\xe6\x66\x44\xd7\x9c\x00\x00\x44\x16\x8e\x11\x1b\xbb\x0a\xf8\
-\x6e\xd0\xbe\xa0\x87\x0e\x13\xb6\x96\x49\xc3\xd9\xb5\xb5\x4b\xc5\
-\x51\xaa\xbe\x27\x70\x2a\x94\x52\x3a\xfd\xbb\xf6\x63\x46\x4e\x2d\
-\xd9\x48\x19\x39\x81\x4a\xd3\x1d\x39\x25\x1b\x13\xb9\xa4\xb6\x36\
-\x2c\x3c\x8e\x9a\x6c\x01\x8e\x21\x22\x0e\xa9\xbe\x17\xc9\x56\x7e\
-\xa4\xd5\x51\xc2\xd8\xc0\xeb\xbd\xb5\x7c\xf1\xa1\xc6\x05\xf0\x06\
-\xe9\x41\x18\xeb\xaf\xcc\xa4\x12\x11\x72\x8e\x4d\xaa\xff\xd5\xa0\
-\xa3\xf6\x84\xea\x1f\x0b\x28\x94\x5c\x0a\x1c\x1b\xea\x9a\xc1\xd3\
-\xf5\xfc\x8e\x43\x34\xd2\xa9\x61\x72\x29\xdf\xd6\x6b\xa8\x38\x33\
-\xa3\x05\x38\x86\x9b\x85\x64\x0f\x38\xde\x3f\x8c\x2b\xd1\x49\x0e\
-\xf7\xcc\xa8\x8b\x0f\x33\x4d\x00\x00\xae\x03\xa9\x5e\xc8\x0c\x7b\
-\x33\xcf\x54\x04\xc7\x55\x8c\xf6\xbd\x82\x9b\xad\xa5\xfd\x08\x0b\
-\xa3\xa6\x05\xd0\xde\xa9\xea\x7a\x95\xd5\x74\xd2\x17\x4a\xe5\x05\
-\x90\xec\x06\xbb\xf4\x67\x34\x25\x3a\x63\xa3\xfd\xa4\x06\x0e\x4e\
-\xf8\x7c\x91\x71\xf5\xc8\x39\x3f\x51\x15\x9c\xc8\xe8\x3d\x35\xf3\
-\x0c\xd0\xba\x53\xc5\xcc\x9c\x7d\xae\x52\xda\x5a\x44\xad\x05\x39\
-\x0b\xd7\x59\xb5\xd7\x89\x59\xad\xda\x24\xaf\xe0\x6e\x0e\x52\x47\
-\xf2\x9b\x45\x58\x31\x30\x42\x30\xdd\x8a\xe0\xa2\xe3\xb8\x2e\xd9\
-\xd1\x3e\xec\xec\xd4\xfb\x10\xdb\xca\x68\x98\xff\x72\xba\xbb\xed\
-\xeb\xe9\x5c\xce\xa2\x3f\x6b\xd2\xe5\x9a\xb2\xc5\x0e\xa9\xfb\x9f\
-\xdf\x10\xae\xba\x59\x40\x13\x86\x1b\xb4\x03\x13\xd1\xd2\xa5\xe2\
-\x56\xda\x5e\xfd\xc6\xc5\x56\x6a\x2d\xc8\x19\x1c\xd7\x62\x09\xf0\
-\xc1\x66\xf8\x4c\xb8\x0b\x33\x5b\x44\x1f\x8c\x68\xf9\x19\xc8\xa2\
-\x81\xe8\xd8\xe9\x21\x94\xeb\xa2\x9c\x2c\xb9\xcc\x28\x6e\xae\xf0\
-\x25\xf9\x24\xd4\xc0\xaf\xf5\x2b\xf8\xd2\xe6\x1c\xee\xb8\xb4\x0f\
-\xdb\xc0\xcd\x44\xa4\xf7\x98\x28\x70\xd4\x37\x7f\x75\x5d\x78\x5f\
-\xd0\x75\x7b\x52\x0c\x41\x3b\xd0\xf4\xac\xaa\x0f\x87\xed\x73\xa6\
-\xba\xd8\xe3\x69\x36\xe0\xf3\xf3\x60\x7d\x1c\x42\x83\x5d\xe8\xc5\
-\x08\x60\x1c\x23\x7d\x07\x4a\x3e\x57\x42\x0d\x1c\x6e\xbb\x92\x9c\
-\xad\xb8\x6f\x73\x8e\x57\x07\xa6\x4e\xfe\x19\x2f\x0a\x3b\xca\x83\
-\xcf\xbf\x2b\xd4\xe5\x7f\x2d\x4f\x11\x43\x25\x0b\x6b\xdc\xaa\x1a\
-\x22\x86\xbd\xaa\x98\x8b\x3d\x9e\xb7\xc4\xe0\x0b\xf3\xa0\xed\x68\
-\x4b\x6e\x0d\xbf\x84\x91\xee\x2e\xd9\xa7\x72\x04\x40\xa4\x85\xee\
-\x96\xcb\x81\x7c\x45\x3e\xb1\x27\xc7\xa3\x9d\xc5\xa5\x2c\x8c\x17\
-\x45\x56\x78\xf8\xc5\x8d\xa1\x5d\xa5\x3b\x55\x1c\xbe\x09\xe0\xd4\
-\xed\xaa\x31\xe7\xda\x6f\x22\x7f\xb1\xd7\xa0\x58\x4b\x19\xfb\x05\
-\x59\x02\x7f\xda\x06\x1f\x69\x39\x51\x2d\x7a\x66\x80\xd0\x50\xe9\
-\xd3\xb8\xca\x11\xc0\x58\xd3\x5a\x86\xeb\x4e\xdc\x03\x7b\x20\xe9\
-\xf2\xc5\xc7\xb3\x8c\x94\xb1\xb8\x6b\xce\x12\x3b\x1b\xa1\x3b\x63\
-\xb0\xcb\x35\xf5\x27\xd1\xec\x87\x9f\xbb\x3a\xf2\x72\xe9\x16\x27\
-\xc7\x53\x01\xb4\x6d\x55\x4b\x75\xdd\x7d\x1f\xa8\x0d\xe4\x33\x79\
-\x3d\xe9\x91\x59\x1a\x82\x7b\x17\xc0\x99\x93\xa4\xf7\x87\x07\x77\
-\xa0\x65\x87\x4b\xb2\x5d\xaa\x00\xc4\x8c\x72\xb8\x63\xe3\x24\xdf\
-\x2a\x1e\x78\x36\xcb\xd6\x57\xbd\xe9\x99\x54\x40\x3a\x2a\xc3\xe9\
-\x30\xcf\xda\x61\xfd\x73\xbf\xbe\xda\x7c\xca\x13\xc3\x78\x24\x80\
-\xf6\x4e\xb5\x58\x73\x9d\xbb\x80\x3f\xc4\xe3\x37\x8b\x6b\x13\xf0\
-\x99\x53\x20\x3a\xc5\x4d\x42\xb3\x53\x84\xfb\x3b\x29\xe5\xc5\xbf\
-\x24\x01\x08\x8c\xb4\xae\x27\x15\x9a\x37\xe5\x31\x5d\xaf\x3b\x7c\
-\xf5\xe9\x1c\x5e\xa6\x05\x2b\x81\x64\x4c\x0e\x8e\xc6\xf4\x5b\x5f\
-\xb8\xc6\xfc\x71\xb9\xf6\xca\x13\xc0\x77\x94\xde\xb1\xcc\xfd\x2b\
-\x11\xf5\x69\x3c\xbe\xf0\x71\x1d\x3e\x3b\x0f\xae\x2c\x70\x8f\x71\
-\x6b\x64\x3f\xc6\xd8\xe1\xa2\xcb\x29\x45\x00\x2a\xd2\x46\x4f\xcb\
-\x65\x05\x1d\x3b\x96\x55\x7c\xe9\x67\x39\x7a\x86\xbd\xcd\x0e\x57\
-\x02\x83\x4d\xf2\xc4\xb0\x0a\x6d\xd8\x79\x83\x94\xdc\xf5\x59\xb2\
-\x00\x16\xbe\xa0\xe6\xd9\xe2\x3c\x04\xbc\xdd\xd3\xc8\x80\x37\xd7\
-\xc1\x17\x17\x40\x7b\x11\x92\x12\xd7\x26\xdc\xff\x22\xe2\x16\xb7\
-\xe4\x4e\xb1\x02\x10\xd1\xe8\xeb\xb8\x8a\x9c\x51\xf8\x5e\x18\x22\
-\xf0\xd8\xce\x1c\x3f\xdc\xe1\x7d\x4e\x6b\xaa\x4e\x06\x07\x63\xda\
-\x25\xdb\xae\xb5\xb6\x95\x72\x7e\x49\x02\x68\xef\x54\x6d\x9a\x6b\
-\x3f\x09\x72\xa6\x97\xc1\x18\x02\x7f\xdc\x02\x7f\xd2\x0a\x7a\x09\
-\x9e\x19\x63\x87\xb1\x46\xf6\x17\x75\x4e\xb1\x02\xb0\x1b\x96\xd3\
-\x57\x5f\xda\x66\xd4\x47\x46\x5c\xee\xf9\x69\x96\x4c\x01\xcb\x14\
-\x14\x43\x26\x44\xae\x2f\xa1\xbf\xa9\x14\x11\x14\xdd\x15\xdc\xf1\
-\x82\x6a\xd5\x5c\x7b\xb3\xd7\x17\x3f\xa6\xc3\x03\xa7\xc1\xed\x6d\
-\xa5\x5d\x7c\x00\x3b\xd2\x81\x6b\xfa\xb4\x2b\x3d\x20\x46\x98\xbe\
-\x78\xe9\x69\x7f\x2d\x71\x8d\xcf\x5d\x13\x22\x11\xf5\xd6\xaf\x50\
-\x06\xb3\x65\xd0\x79\x76\xed\x4f\x32\x67\x14\x7b\x6e\x71\x02\x50\
-\x4a\x44\x9c\xfb\x41\xce\xf2\x36\x04\xb8\xa3\x0d\xce\xf7\xa0\x62\
-\xb2\xb1\x25\x5e\xbb\xf6\x06\xc9\xc4\x79\x65\xef\x3b\x6c\xe8\xc2\
-\xed\xeb\xbd\xdf\x23\xda\xca\x10\x8a\xf7\xf2\x73\x94\x2a\xca\xc1\
-\xa2\x0e\xee\xd8\xe6\x7e\x1c\xd8\xe0\xb5\xf3\x02\x5c\xe3\xd1\x56\
-\xd2\xae\x19\xc7\x0e\xb7\x7a\xed\x22\x84\x9b\x18\x89\x2c\xf6\xc4\
-\x54\x4b\xcc\x9f\x31\xb8\xe8\xa8\xdb\x7c\xc1\x23\xd9\xff\x2a\xe6\
-\x9c\x82\x3d\x69\x7d\x4e\x75\x08\xca\x97\xb9\x6e\x9a\x40\x9d\x87\
-\x39\x1c\xb9\xd8\x22\x4f\x93\x42\x44\x34\x06\x1a\x2f\xf0\xcc\x9e\
-\x02\x34\x9f\xc6\x61\x1b\x07\xdc\xf7\xaf\xfb\x61\x66\x65\xa1\xc7\
-\x17\xec\x86\x61\xd9\x9f\x04\x7c\xb9\xc1\x3a\x0a\x76\x78\x38\xd4\
-\xae\x34\x8b\x5c\x74\xbe\x67\xf6\xec\xba\x45\x64\x0d\xef\xf6\x32\
-\x74\x5d\x75\xd2\xe0\x91\x57\x68\x0e\x62\xa6\x54\xc1\xeb\x11\x15\
-\x24\x80\x96\x2e\x15\x47\xc9\x1f\xf9\xe3\x72\x9e\x7b\xba\x21\xe7\
-\x61\x4a\x5f\x2e\x3a\x1f\xa5\x47\xca\xb6\x23\xba\x49\x7f\xc3\xf9\
-\x9e\xf9\x25\xc0\xff\xec\xf4\xf8\x35\x60\x1c\xf5\x43\xea\xa2\x95\
-\x9b\xd4\xc2\x42\x8e\x2d\x48\x00\xe6\x98\x73\x35\x90\xf0\xd3\xe9\
-\x67\x93\xf0\xc1\x57\x60\x9b\x57\x2d\x81\x08\xd9\xd8\x69\x65\x9b\
-\x49\x35\x9c\x83\x5b\xc6\x3a\x43\xc7\xe3\xba\x8a\xff\xee\xcc\xf1\
-\xf8\x6e\x7f\xe7\xb8\xea\x0e\x12\x73\x32\x77\x16\x72\x6c\x41\x91\
-\x09\xbc\xb3\x12\x8b\xb8\x3f\x97\x84\xeb\xf6\xe7\xfb\xfe\xdf\x9b\
-\x80\xdf\x4b\x40\x4b\x19\x75\xef\x84\x1a\x71\x42\x8d\xe8\x99\xd2\
-\xf2\xf8\xc4\x8a\x9f\x34\xd8\x53\xb4\x0d\xa0\x3f\xe9\xf2\xa3\x9d\
-\x36\xcf\xfd\xae\x72\x6b\x45\x98\x59\xde\x55\xc8\x71\x05\x55\xaf\
-\x82\xc2\xfa\x3d\x3d\xe2\xa5\x4c\xfe\x96\xf0\xc5\x1e\xb8\xa0\x0e\
-\xde\xdf\x08\xef\x8c\x83\x59\x42\xff\x40\x36\xb6\x98\x48\x76\x08\
-\x0a\xdb\xac\xe1\x38\x84\xc1\xa6\xd2\x57\xa6\xc9\x39\x8a\xe7\x5e\
-\x76\xd8\xb4\xdd\x26\xeb\x6f\x8b\x3f\x21\xe1\x14\x05\xbd\x0f\x4f\
-\x5b\xa5\x8d\x5b\x55\x43\x58\x77\x06\x2b\x1f\xc2\x89\xd4\xeb\xb0\
-\xa1\x1e\x6e\x6a\x82\xb3\x8a\x5c\xf4\xcb\x4c\xbe\x82\x99\x9c\x78\
-\xba\xfe\x64\x3d\x81\x6e\x6c\x3e\xbd\x8d\xc5\xf6\x72\x2b\x5e\xea\
-\x75\x79\xe4\x05\x87\x43\x43\xc1\xaf\x0c\xf3\xea\xb2\x70\xc7\x8e\
-\xcb\x64\xca\x64\x89\x69\x5b\x80\xa8\x41\xbb\x5b\x05\x9b\x78\x0c\
-\x3b\xf0\xad\x81\xfc\xe7\xf4\x50\x7e\x94\xf0\xba\x04\x34\x15\xd0\
-\x86\xe5\xa2\x0b\x30\xc6\x7a\x0b\xde\xcd\x56\x34\x9d\xfe\x86\xc2\
-\x5e\xfb\x8e\x35\xf1\x4f\xef\x73\xf8\xd9\xde\xea\x5a\xbf\x22\x94\
-\xb4\xcf\x02\xca\x13\x80\x52\x76\x6b\x15\x64\x8e\x9d\xc0\xbe\xa3\
-\xb7\x88\x7b\x7b\xe0\xad\x75\xb0\xb1\x11\x2e\x8f\xe7\xc7\x12\x26\
-\x44\x74\x72\xb1\x45\x58\xc3\x85\xa5\xe4\xa5\xeb\xcf\xc4\xd1\xa6\
-\x6e\x66\x72\x8e\xa2\xf3\xa0\xc3\xa6\x6d\x76\x59\xc9\x1f\x7e\xa2\
-\xe7\x77\x63\xd9\x3c\xd5\x31\x85\x3c\x03\x78\xdc\x73\xed\x1d\x59\
-\x05\x3f\x1b\xcd\x7f\xda\x0c\xd8\xd0\x00\xd7\x37\xc2\x8a\x09\x96\
-\x04\xb4\xc3\xad\x18\xe9\xee\x69\x13\x47\xc4\x88\x30\x18\x3f\x67\
-\x92\x6f\x15\x07\xfa\x5c\x1e\xdd\xee\xb0\xaf\x37\xf8\x26\x7e\x5a\
-\x94\x4c\xdb\xbf\x5a\x33\x69\xe1\xd3\xd1\x63\xc3\xfd\x7d\xf9\xcf\
-\xca\x08\x5c\xdb\x00\x1b\x13\xd0\x70\x5c\x87\x60\x36\xb6\x98\x70\
-\xff\x76\x26\x4f\x1c\x11\x86\x1b\xcf\x1f\xf7\x1f\x18\x1e\x73\xd9\
-\xf2\x92\xc3\x4f\x77\x39\x9e\x26\x77\x54\x03\x33\x46\x00\xc7\xb3\
-\x63\x2c\xff\xb9\xa7\x07\x2e\x8d\xe5\x85\xf0\xf6\x18\x60\xd4\x61\
-\x47\xda\x27\x4d\x1c\x51\xd1\x56\x52\xe1\x05\x00\xd8\xae\x62\xd7\
-\x6b\x0e\xdf\x7d\xd1\x66\x68\xe6\x4d\x08\x7a\x83\x19\x29\x80\x63\
-\x64\x5c\xf8\xd1\x70\xfe\xd3\x61\xc0\xd5\x09\xb8\x29\x71\x2a\xa7\
-\x67\x87\x10\xe7\xc4\xab\x2a\xba\x49\x5f\xe2\x22\x5e\x1f\x74\x78\
-\xb4\xd3\x61\x77\xf7\x4c\xfb\xad\x4f\xcc\x8c\x16\xc0\xf1\x1c\xb6\
-\xe1\x3f\x8e\xc0\xd7\x8e\x18\x5c\x16\x5b\xc9\x5d\x75\x07\x58\xa8\
-\x06\x11\xdd\x20\x67\x36\xb1\xe9\xc8\x3a\xbe\xf7\x4b\x0d\xb7\xc8\
-\x8c\xa2\x5a\x67\xd6\x08\xe0\x18\x2e\xf0\xd8\xa8\xc9\x63\xa3\xf9\
-\x7e\x92\xf3\x7e\xb5\x2a\x68\x97\x02\xa5\xa6\x27\x87\xce\x51\x3e\
-\x73\x02\x98\xe5\xcc\x09\x60\x96\x33\x27\x80\x59\xce\x9c\x00\x66\
-\x39\x73\x02\x98\xe5\xcc\x09\x60\x96\x33\x27\x80\x59\xce\x9c\x00\
-\x66\x39\x73\x02\x98\xe5\x4c\x2b\x00\xa5\x51\xd3\x6b\xe1\xce\x66\
-\x04\x35\xed\x22\xca\xd3\x0a\x20\x9d\x33\xb6\x03\xa9\xa0\x83\x99\
-\xa3\x38\x5c\x4d\x91\xce\x9a\x9b\xa6\x3b\x6e\x5a\x01\x0c\xac\x93\
-\x21\x51\xf2\x97\x41\x07\x34\x47\x71\x0c\x35\x9a\xdf\xed\xbc\x41\
-\xa6\xdd\xb8\xaa\xa0\x67\x80\xd7\xd6\xe8\xf7\x89\xe2\x46\x44\x75\
-\x51\x2b\x3b\x77\xcd\x42\x14\x90\x09\x4b\xa6\xaf\x5d\xff\xf2\x33\
-\xd7\x9b\xd7\x17\x72\xce\xff\x01\x02\x45\x4a\xcc\x8e\xc3\x01\xe5\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
-\x61\x74\x65\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x33\x31\x54\x31\
-\x37\x3a\x30\x38\x3a\x35\x37\x2b\x30\x32\x3a\x30\x30\xc3\x8f\x05\
-\x1b\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
-\x64\x69\x66\x79\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x33\x31\x54\
-\x31\x37\x3a\x30\x38\x3a\x35\x37\x2b\x30\x32\x3a\x30\x30\xb2\xd2\
-\xbd\xa7\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\
-\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x1c\x64\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1b\xe1\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x7b\xb0\x5d\x57\x79\x18\xf0\x6f\xed\x7b\
-\xae\x24\xdb\xb2\xb1\x2d\xdb\x58\xc2\xb8\x06\x5b\x32\x2d\xa5\xd3\
-\xe2\x40\x0a\x25\x09\x16\x9d\x3a\x31\x71\x09\x86\x91\x8d\x65\xd9\
-\x78\xc8\x0c\x49\x0c\x49\x33\xd3\x29\x4d\x48\x20\x0d\x93\xe6\xd1\
-\xce\xb4\x29\x8f\xc2\x04\x50\xb1\x1e\x36\x6a\x29\x21\x10\x02\x71\
-\x2d\x07\x06\xc2\x84\x62\xca\xa4\x75\xc7\x0f\xf9\x51\x90\x9f\x92\
-\x6c\xc7\x96\xed\x5c\xe9\xde\xbd\xfa\x87\x2d\x90\x65\xe9\x3e\xcf\
-\x3e\x7b\x1d\xaf\xdf\x6f\xe6\x0c\xd6\x7d\xec\xf3\xcd\x62\xcf\xfa\
-\xbe\xfb\xed\x6f\x9f\x9d\x82\xa1\xfa\x7b\x4f\x7e\x3c\xf7\x1d\xc3\
-\x6c\xfe\xef\x09\xbf\x90\xfa\x8e\x01\x28\x93\xfd\xab\x2e\x4d\xdf\
-\x01\x00\x00\xa3\xa7\x00\x00\x80\x0a\x0d\xfa\x0e\xe0\x05\x27\xeb\
-\x50\x01\x63\xca\xfe\x55\x15\x1d\x00\x00\xa8\x90\x02\x00\x00\x2a\
-\xe4\x12\xc0\x90\x15\x3d\x42\x0b\x30\x0b\xfb\x57\x5d\x74\x00\x00\
-\xa0\x42\x3a\x00\x43\x67\x88\x06\x18\x57\xf6\xaf\x9a\x28\x00\x86\
-\x4d\x0f\x0d\x18\x57\xf6\xaf\xaa\xb8\x04\x00\x00\x15\x52\x00\x00\
-\x40\x85\x14\x00\x00\x50\x21\x33\x00\x43\x67\x88\x06\x18\x57\xf6\
-\xaf\x9a\xe8\x00\x00\x40\x85\x74\x00\x86\xcd\x14\x2d\x30\xae\xec\
-\x5f\x55\xd1\x01\x00\x80\x0a\x29\x00\x00\xa0\x42\x2e\x01\x0c\x59\
-\x36\x44\x03\x8c\x29\xfb\x57\x5d\x74\x00\x00\xa0\x42\x0a\x00\x00\
-\xa8\x90\x4b\x00\xc3\x66\x8a\x16\x18\x57\xf6\xaf\xaa\xe8\x00\x00\
-\x40\x85\x74\x00\x86\xce\x10\x0d\x30\xae\xec\x5f\x35\xd1\x01\x00\
-\x80\x0a\x29\x00\x00\xa0\x42\x2e\x01\x0c\x9b\x21\x1a\x60\x5c\xd9\
-\xbf\xaa\xa2\x03\x00\x00\x15\xd2\x01\x18\x3a\x43\x34\xc0\xb8\xb2\
-\x7f\xd5\x44\x07\x00\x00\x2a\xa4\x03\x30\x64\x2e\xa1\x01\xe3\xca\
-\xfe\x55\x17\x1d\x00\x00\xa8\x90\x0e\xc0\xb0\x29\xa1\x81\x71\x65\
-\xff\xaa\x8a\x02\x60\xe8\x0c\xd1\x00\xe3\xca\xfe\x55\x13\x97\x00\
-\x00\xa0\x42\x0a\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\
-\x0a\x19\x02\x1c\xb6\x6c\x88\x06\x18\x53\xf6\xaf\xaa\xe8\x00\x00\
-\x40\x85\x5e\x10\xe5\xde\xab\x1e\xdb\x76\xca\xc1\x3c\xf3\x0f\xda\
-\x36\xaf\x8d\xd4\xbe\x2c\x45\x73\x4e\x44\x5e\x1d\x11\xab\x9e\x7d\
-\x1d\x1f\x11\xcb\x9f\xfd\x5f\x00\x38\x96\xa7\x22\x62\xea\xd9\xff\
-\xdd\xf7\xec\xeb\xfe\x88\xb8\x37\xe7\x74\x6f\xd3\xa4\x3b\x27\xd3\
-\xc4\x5f\xff\xef\x93\x37\x3e\xda\x67\x90\xc3\x30\x96\x05\xc0\xda\
-\xbd\xd7\xfd\xdd\xd4\xb4\xeb\x53\x8a\x0b\x23\xc7\x6b\x23\xe2\xa5\
-\x7d\xc7\x04\x40\x55\xbe\x1f\x29\xbe\x9d\x73\xba\x39\xda\x76\xe7\
-\x1d\xa7\x5d\x73\x5b\xdf\x01\x2d\xd4\x58\x14\x00\xeb\x1e\xdf\x7e\
-\x5a\x3a\x78\xe0\x2d\x91\xd2\xfa\x88\x7c\x61\x44\xac\xee\x3b\x26\
-\x00\x38\xcc\x03\x11\xb1\x33\x72\xde\x99\x26\x9b\x2f\xdc\x76\xd2\
-\xd5\xfb\xfa\x0e\x68\x2e\xc5\x16\x00\xe7\xe5\xff\xb4\x3c\x1e\x3d\
-\xf9\x9f\x35\x29\x6f\x8a\x1c\x6f\x89\x88\x65\x7d\xc7\x04\x00\xf3\
-\x30\x13\x29\x6e\x8e\xc8\x5b\x9e\xda\x7f\xfc\x7f\xdd\xfd\xd2\x0d\
-\x4f\xf7\x1d\xd0\xd1\x14\x57\x00\x9c\xb7\x67\xcb\xab\x53\xca\x3f\
-\x9f\x52\xbe\x2c\x22\x4e\xed\x3b\x1e\x00\x58\x82\x47\x22\xc7\x0d\
-\x6d\x6e\x3e\xb5\xeb\xf4\x4d\xdf\xed\x3b\x98\xc3\x15\x53\x00\xac\
-\x7b\xe4\xba\x37\x44\x9b\xdf\x17\x29\xde\x1c\x05\xc5\x05\x00\x43\
-\xf2\xcd\xc8\xf9\x83\x77\x9c\xf6\xce\x9b\xfa\x0e\x24\xa2\x80\x44\
-\x7b\x58\xe2\xff\xd9\xbe\x63\x01\x80\x11\xf8\x66\x9b\xd2\xef\xef\
-\x3a\xf5\xaa\x2f\xf6\x19\x44\x6f\x05\xc0\xba\xbd\x9b\x5f\x13\xa9\
-\xf9\x70\x44\xfc\x78\x5f\x31\x00\x40\x5f\x52\xc4\xb7\x52\x9b\xdf\
-\x7b\xdb\xe9\xef\xbc\xa5\xa7\xf7\x1f\xad\x73\x1e\xdd\x7c\xf2\xf2\
-\x76\xe2\xdf\xe4\x88\x6b\x23\x62\x62\xd4\xef\x0f\x00\x05\x69\x23\
-\xc5\xb6\x66\x90\x7f\x75\xd4\x77\x0e\x8c\xae\x00\xc8\x39\xad\xdb\
-\xb7\x75\x53\xa4\xfc\xef\x22\xe2\x8c\x91\xbd\x2f\x00\x94\x6f\x5f\
-\xa4\xf4\xeb\x77\x9c\x72\xe5\x1f\x45\x4a\x79\x14\x6f\x38\x92\x02\
-\x60\xdd\xde\xcf\xbc\x24\x22\x6d\x89\x88\x0b\x47\xf1\x7e\x00\x30\
-\x9e\xf2\x4d\x29\x2f\xbb\xea\xf6\xd3\xdf\x71\x7f\xd7\xef\xd4\x79\
-\x01\xb0\x6e\xef\xd6\x37\x45\xb4\x5b\x23\xe2\xcc\xae\xdf\x0b\x00\
-\x5e\x00\xf6\xa4\x94\xae\xba\x7d\xd5\xa6\xaf\x74\xf9\x26\x9d\x15\
-\x00\x6f\xcc\x37\x0f\xee\xdf\xfb\xfd\xdf\x88\x94\x7e\x33\x3c\x74\
-\x08\x00\x16\x22\xa7\x88\x0f\xaf\x5c\xf5\xf4\xbf\xbc\x25\xbd\xfb\
-\x60\x17\x6f\xd0\x49\x01\x70\xfe\x9e\xeb\xd7\xe4\x98\xfe\x6c\xa4\
-\x78\x43\x17\xc7\x07\x80\x2a\xa4\xf8\xfa\xe4\xcc\xf4\x65\xb7\x9e\
-\x71\xcd\x83\xc3\x3f\xf4\x90\xad\x7b\x68\xdb\xcb\x63\xa2\xfd\x6a\
-\x44\x9c\x37\xec\x63\x03\x40\x7d\xd2\xbd\x4d\x9e\xb9\xe8\xb6\xd3\
-\xaf\xbe\x63\xa8\x47\x1d\xe6\xc1\xce\xdd\xb3\xed\x82\x26\xb5\x5f\
-\x0e\x53\xfe\x00\x30\x4c\x0f\xe5\x1c\x17\x0f\xf3\xe3\x84\x87\x56\
-\x00\x9c\xbb\x67\xdb\x85\x4d\xb4\x7f\x1c\x11\x27\x0d\xeb\x98\x00\
-\xc0\x0f\xed\xcf\x4d\x7a\xdb\xae\x55\x57\xfe\xf9\x30\x0e\x36\x94\
-\xe1\xbc\xb5\x7b\xaf\xbb\xb4\x89\xf6\xcf\x42\xf2\x07\x80\xae\xac\
-\x4c\x6d\xfe\x93\x75\x7b\xb7\xbe\x75\x18\x07\x5b\x72\x07\xe0\xd9\
-\xbf\xfc\xff\x2c\x22\x2d\x1f\x46\x40\x00\xc0\xac\x0e\xe4\x26\x2e\
-\x59\x6a\x27\x60\x49\x05\xc0\xf9\x7b\xae\xfb\xb1\x36\x9a\x9d\x11\
-\x71\xe2\x52\x8e\x03\x00\x2c\xc8\x13\x6d\xa4\x0b\xef\x3a\x7d\xe3\
-\xa2\x9f\x23\xb0\xe8\x02\xe0\xdc\x87\xb7\x9c\xd7\xa4\xf4\x8d\x88\
-\x78\xf1\x62\x8f\x01\x00\x2c\x56\xde\xd3\x44\xfc\xc4\xed\xa7\x6f\
-\xba\x7d\x31\xbf\xbd\xa8\x19\x80\xf3\xf7\x5c\xbf\xa6\x69\xd2\x8d\
-\x21\xf9\x03\x40\x4f\xd2\xe9\x6d\xa4\x2f\x9f\xf3\xf0\xe6\x45\x7d\
-\xd2\xee\x82\x3b\x00\x6f\xcc\x37\x0f\xee\xdb\xb3\xfb\xe6\x88\xe4\
-\x43\x7e\x00\xa0\x7f\x5f\xbf\xf3\xf4\x65\xeb\x23\x6d\x98\x59\xc8\
-\x2f\x0d\x16\xfa\x2e\xf7\xef\xb9\xef\x43\x11\x8d\xe4\x0f\x00\x65\
-\xf8\xc9\xb5\x0f\x1f\xfc\xe0\x9d\x11\x1f\x58\xc8\x2f\x2d\xa8\x03\
-\x70\xee\xc3\xdb\x7f\xba\x89\xfc\xa7\xe1\xb3\xfd\x01\xa0\x24\x6d\
-\xce\xf9\x67\x76\xbd\x78\xfe\x77\x06\xcc\xbb\x00\x38\xe7\xe1\x1d\
-\x67\x2e\x8b\x03\xff\x2b\x47\xf2\x54\x3f\x00\x28\xcf\xc3\x4d\x6a\
-\xfe\xd1\x7c\x1f\x25\x3c\xbf\xbf\xe4\x73\x4e\xcb\xe2\xe0\x76\xc9\
-\x1f\x00\x8a\x75\x46\x1b\xed\x75\x91\xf3\xbc\xfe\xb8\x9f\xd7\x0f\
-\xad\x7d\x78\xdb\x3b\x73\xc4\xe6\xa5\xc5\x05\x00\x74\x2e\xa7\x4d\
-\xbb\x5e\x7c\xc5\xd6\xb9\x7e\x6c\xce\x02\xe0\xec\xc7\xb6\x9d\xb2\
-\x6c\x2a\xdd\x16\x1e\xf0\x03\x00\xe3\xe0\xa1\xe9\x65\x53\xaf\xb8\
-\xf7\x94\x6b\x1e\x9b\xed\x87\xe6\xbc\x04\x30\x39\x15\xff\x36\x24\
-\x7f\x00\x18\x17\x2f\x1e\x4c\xad\xf8\xd0\x5c\x3f\x34\x6b\x07\xe0\
-\xdc\x3d\xdb\x2e\x48\x6d\xfa\xab\x88\x98\x18\x5a\x58\x00\x40\xd7\
-\xda\xa6\xcd\xaf\xbb\x63\xf5\xc6\x6f\x1f\xeb\x07\x66\xed\x00\xa4\
-\x36\x7d\x34\x24\x7f\x00\x18\x37\x4d\xdb\xa4\xff\x30\xeb\x0f\x1c\
-\xeb\x1b\xe7\x3d\xb4\xed\xa2\x88\xf8\xf1\xa1\x87\x04\x00\x8c\xc2\
-\xeb\x5f\xfe\xe0\xf5\x6f\x3a\xd6\x37\x8f\x59\x00\xe4\x48\xef\xef\
-\x26\x1e\x00\x60\x14\x9a\x26\x1f\x33\x97\x1f\x75\x06\xe0\xbc\x87\
-\xb6\xbf\x2e\x72\xfa\xcb\xee\x42\x02\x00\x46\xa1\x6d\xf2\x4f\xdc\
-\x7d\xc6\x15\xdf\x38\xf2\xeb\x47\xef\x00\xb4\xcd\x07\x3b\x8f\x08\
-\x00\xe8\xdc\x44\xdb\xfc\xda\xd1\xbe\xfe\xbc\x0e\xc0\x79\xf7\xdf\
-\xf0\xea\x68\xf2\x2d\xdd\x87\x04\x00\x8c\x40\x4e\x4d\xfb\xea\x3b\
-\xcf\xd8\xf8\xbd\xc3\xbf\xf8\xfc\x0e\x40\xca\x3f\x3f\xb2\x90\x00\
-\x80\xae\xa5\xdc\x36\xef\x7a\xde\x17\x0f\xff\xc7\x2b\x6f\xdd\xb1\
-\x6c\x6a\xd5\xcc\xfd\x11\xb1\x6a\x64\x61\x01\x00\x5d\x7b\x64\xf9\
-\xbe\x89\xd5\xb7\xbe\x72\xc3\x81\x43\x5f\x18\x1c\xfe\xdd\xa7\x4f\
-\xc9\x97\xa4\x9c\x24\x7f\x00\x78\x61\x39\x75\x6a\x55\xfb\x33\x11\
-\xf1\x85\x43\x5f\x78\x4e\x01\x90\x22\x6f\x1a\x79\x48\xdd\x68\x23\
-\xe2\xdb\x91\xd3\xce\x1c\xf9\x96\x26\xb5\xb7\x1f\x38\x90\xef\x3f\
-\xfd\xec\xfd\xfb\x6f\x49\xef\x3e\xd8\xe5\x1b\x9f\xfb\xc0\x0d\xb9\
-\xcb\xe3\x2f\xd5\x5d\xab\x2f\x9f\xf7\x23\xa0\x81\xba\xd4\xbe\x7f\
-\x5d\x90\x3f\x31\xb9\xe7\xfb\x2b\x57\x2e\x5b\x96\xd6\xb4\x79\xe2\
-\x15\x11\xed\x05\x91\xd2\xfa\x14\xf1\x9a\x98\xef\xd3\x73\x0b\x96\
-\x73\x5c\x15\x47\x2b\x00\xce\x7b\x60\xc7\xe9\x39\xda\x8b\x7b\x89\
-\x6a\x68\xd2\xee\x9c\xf2\x47\x07\x07\x9b\x2d\x77\xbc\x74\xc3\x7d\
-\x47\x7e\xf7\xfb\x7d\x84\x04\xc0\x58\x78\xf6\x0f\xc4\x47\x9f\x7d\
-\xdd\x1a\x11\x9f\x8b\x88\x38\x6f\xf7\xd6\xb3\x62\x30\xb9\x29\x47\
-\xbe\x36\x72\xbc\xa4\xcf\x18\x97\xe8\xcd\x67\xfd\x60\xc7\xa9\xbb\
-\x5f\xba\xe1\x91\x88\xc3\x2b\x9a\x34\xf3\xcf\x23\x62\xb2\xaf\xa8\
-\x96\x26\xef\xcb\x39\xfd\xe2\x8a\x47\xd2\xb9\x77\x9f\x79\xf9\xef\
-\x1d\x2d\xf9\x03\xc0\x62\xec\x3a\xeb\xca\xdd\xbb\xce\xbc\xec\x77\
-\xd3\x13\x27\x9d\x9b\x22\xae\x4d\x11\x8f\xf4\x1d\xd3\x22\x2d\x5f\
-\x3e\xc8\x97\x1c\xfa\xc7\x8f\x0a\x80\x36\xad\xef\x25\x9c\xa5\xbb\
-\x61\x72\x66\xf9\xf9\x77\xaf\xb9\xec\xe3\x87\x0f\x37\x00\xc0\x30\
-\xed\x5a\x7b\xf1\xd4\xae\xd5\x97\x7f\xac\xc9\xed\xf9\x11\x79\x47\
-\xdf\xf1\x2c\x4e\xfe\x61\xae\x7f\xe6\x12\x40\xce\x29\x3f\xb8\xe3\
-\xc2\xde\xe2\x59\x9c\xe9\x9c\xe3\xbd\x77\xaf\xb9\xec\xe3\x7d\x07\
-\xf2\x5c\x2e\xb1\x03\xe3\xca\xfe\x35\x1f\x77\xac\xb9\x62\x6f\x44\
-\x5c\x76\xde\x03\x9f\xfd\x7a\x8e\xf8\x8f\x71\xc4\x3c\x5d\xe1\x7e\
-\x58\x00\x34\x11\x11\x6b\x1f\xf8\xec\x2b\x22\xc7\xea\xc8\x11\x63\
-\xf2\x7a\x3a\xa7\xfc\xd6\xf2\x92\x7f\xf4\xbd\x2e\x73\xbf\x00\x8e\
-\xa5\xef\xfd\x69\xcc\xf6\xaf\x5d\xab\x2f\xfb\x68\x6a\xe3\xd2\xc8\
-\xf1\x74\xef\x6b\x33\xff\xd7\x59\x2f\xdf\x7d\xc3\xba\x88\x67\x0b\
-\x80\x9c\xc6\xaa\xfd\x3f\x13\x91\x36\xde\x7d\xe6\xe5\x5f\xea\x3b\
-\x10\x00\xea\xb6\xeb\x25\x97\x7d\x31\x37\x79\x43\x44\x4c\xf7\x1d\
-\xcb\xbc\x35\xcf\xe4\xfc\x67\x66\x00\x72\x8c\x4d\xfb\x3f\x47\xbc\
-\xe7\xae\x35\x1b\x3e\xdf\x77\x1c\x00\x10\x11\x71\xf7\x99\x97\x7f\
-\x29\x72\xfa\xd5\xbe\xe3\x98\xaf\x14\x87\x15\x00\x39\xe2\xb5\xfd\
-\x86\x33\x4f\x29\x6e\x28\xb2\xed\x0f\x40\xd5\xee\x7a\xc9\x86\x8f\
-\xe4\x88\xff\xd6\x77\x1c\xf3\xd3\xbe\x36\x22\x62\x70\xd6\x0f\x76\
-\x9c\x1a\x11\x2f\xed\x39\x9a\x39\xa5\x88\x47\x9a\x3c\xfd\xde\xbe\
-\xe3\x98\x9b\x21\x1a\x60\x5c\xd9\xbf\x96\x62\x59\x3b\xf9\x0b\x07\
-\x9b\xe9\x0b\xa3\xf8\x8f\xd3\x4f\x67\x9f\x73\xcf\xe7\x4f\x6e\x56\
-\x0c\xe2\x55\x7d\x87\x32\x1f\x6d\xe4\xf7\x3f\x3b\x79\x09\x00\xc5\
-\xb9\xed\xac\x4b\xf7\x45\x8e\xdf\xea\x3b\x8e\x79\x48\xcd\xf2\x83\
-\x7f\x7f\x30\x93\xf3\xba\x94\x8b\xaf\xfa\x76\x1f\xf7\x58\xfa\x74\
-\xdf\x41\xcc\x47\x2e\x70\x52\x15\x60\x3e\xec\x5f\x4b\x97\x9e\x5a\
-\xf9\x47\xed\xf1\xfb\xff\x75\x44\xe9\x9f\x18\x98\xd6\x36\x4d\xdb\
-\x9c\xd3\x77\x18\x73\x4a\xf1\x51\x1f\xf2\x03\x40\xe9\x76\xad\xbd\
-\x78\x2a\xa7\xfc\xb1\xbe\xe3\x98\x4b\x4e\xf1\xb2\x26\xa7\x7c\x4e\
-\xdf\x81\xcc\x61\x66\x30\x13\x5b\xfa\x0e\x02\x00\xe6\x23\x45\xda\
-\x1a\xcf\x3c\x94\xae\x58\xa9\x8d\x97\x35\x91\x62\xf5\x33\x83\x1f\
-\x65\xbe\x52\xc4\xff\x1c\xaf\xcf\xf6\xef\x7f\xcd\x66\x7f\x01\x1c\
-\x4b\xdf\xfb\xd3\x0b\x63\xff\xba\x7b\xcd\x86\xef\x47\x4a\xdf\xe9\
-\x7f\xbd\x66\x79\xa5\x58\xdd\x44\xa4\xd3\xba\x5c\x88\x25\x4b\xcd\
-\x4d\x7d\x87\x00\x00\x0b\x92\xe3\xe6\xbe\x43\x98\xc3\xaa\x26\x72\
-\x9c\xda\x77\x14\xb3\xc9\x91\xbf\xdb\x77\x0c\x00\xb0\x10\x39\xe7\
-\xef\xf4\x1d\xc3\xec\xd2\xaa\x41\xe4\x58\xd9\x77\x18\xb3\x69\xa6\
-\xd3\xed\x7d\xc7\xb0\x20\xa6\x68\x81\x71\x65\xff\x1a\x9a\x94\xa3\
-\xf0\xdc\x95\x57\x36\x11\xb1\xac\xef\x30\x66\xf3\xb7\x4d\xfb\x40\
-\xdf\x31\x00\xc0\x42\x0c\x26\xa6\x4b\xcf\x5d\xcb\x07\x11\xa9\xe8\
-\x02\xe0\x45\x8f\xe7\xfd\xbb\xfb\x0e\x62\x41\xc6\x67\x50\x05\xe0\
-\xb9\xec\x5f\xc3\xd2\x3e\x79\xf2\x13\x71\xdc\x53\x7d\x87\x31\x9b\
-\xe5\x4d\x44\x4c\xf4\x1d\xc5\x6c\xdc\xff\x0f\xc0\xb8\xd9\xb5\xf6\
-\xe2\xa9\xbe\x63\x98\xc3\x44\xd3\x77\x04\x00\xc0\xe8\x29\x00\x00\
-\xa0\x42\x03\x53\x9f\x43\x66\x3d\x81\x71\x65\xff\x1a\xae\xc2\xd7\
-\x73\x90\x0d\x7d\x0c\x95\xf5\x04\xc6\x95\xfd\x6b\xb8\x4a\x5f\x4f\
-\x97\x00\x00\xa0\x42\x0a\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\
-\x00\x80\x0a\x0d\x22\x97\x3d\xa4\x30\x76\xac\x27\x30\xae\xec\x5f\
-\xc3\x55\xf8\x7a\xea\x00\x00\x40\x85\x14\x00\x00\x50\x21\x05\x00\
-\x00\x54\x48\x01\x00\x00\x15\x1a\x78\xfc\xe3\xb0\x59\x4f\x60\x5c\
-\xd9\xbf\x86\xab\xec\xf5\xf4\x2c\x80\x61\xb3\x9e\xc0\xb8\xb2\x7f\
-\x0d\x57\xe1\xeb\x39\x28\x3c\xbe\xb1\x63\x3d\x81\x71\x65\xff\x1a\
-\xae\xd2\xd7\xd3\x0c\x00\x00\x54\x48\x01\x00\x00\x15\x32\x04\x38\
-\x74\xd6\x13\x18\x57\xf6\xaf\xe1\x2a\x7b\x3d\x07\x7d\x07\xf0\x42\
-\x73\xef\xdf\xf9\xb9\xb2\xff\x1f\x07\x38\x06\xfb\x57\x5d\xdc\x05\
-\x00\x00\x5d\x28\x3c\xbf\x9a\x01\x00\x80\x0a\x29\x00\x00\xa0\x42\
-\x86\x00\x01\xa0\x13\x65\xe7\x57\x1d\x00\x00\xa8\x90\x02\x00\x00\
-\x2a\xe4\x2e\x00\x00\xe8\x42\xe1\xf9\xd5\xb3\x00\x00\xa0\x03\xa5\
-\xe7\x57\x43\x80\x00\xd0\x89\xb2\xf3\xab\x19\x00\x00\xa8\x90\x02\
-\x00\x00\x2a\x64\x08\x10\x00\xba\x50\x78\x7e\xd5\x01\x00\x80\x0a\
-\x19\x02\x04\x80\x4e\x94\x9d\x5f\x75\x00\x00\xa0\x42\x0a\x00\x00\
-\xa8\x90\x02\x00\x00\x2a\xe4\x2e\x00\x00\xe8\x42\xe1\xf9\xd5\x10\
-\x20\x00\x74\xa2\xec\xfc\xea\x59\x00\x00\xd0\x81\xd2\xf3\xab\x19\
-\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\x0d\x22\x97\
-\x3d\xa4\x00\x00\x63\xa9\xf0\xfc\xaa\x03\x00\x00\x15\x52\x00\x00\
-\x40\x85\x14\x00\x00\x50\xa1\x74\xf6\xae\x3f\x2d\xfd\x56\x45\x00\
-\x60\xc8\x74\x00\x00\xa0\x42\xee\x02\x00\x80\x0a\xe9\x00\x00\x40\
-\x85\x3c\x0b\x00\x00\x2a\xa4\x03\x00\x00\x15\x52\x00\x00\x40\x85\
-\x06\xa5\x3f\xaf\x18\x00\x18\xbe\x41\xf1\x0f\x2c\x06\x00\x86\xce\
-\x25\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\x19\x02\
-\x04\x80\x0a\xe9\x00\x00\x40\x85\xdc\x05\x00\x00\x15\xd2\x01\x00\
-\x80\x0a\x29\x00\x00\xa0\x42\x83\x6c\x08\x10\x00\xaa\xa3\x03\x00\
-\x00\x15\x52\x00\x00\x40\x85\xdc\x05\x00\x00\x15\xd2\x01\x00\x80\
-\x0a\xf9\x24\x40\x00\xa8\x90\x0e\x00\x00\x54\x48\x01\x00\x00\x15\
-\x52\x00\x00\x40\x85\xdc\x05\x00\x00\x15\x32\x04\x08\x00\x15\x72\
-\x09\x00\x00\x2a\x34\x70\x05\x00\x00\xea\xa3\x03\x00\x00\x15\x32\
-\x04\x08\x00\x15\x32\x04\x08\x00\x15\x72\x09\x00\x00\x2a\xa4\x00\
-\x00\x80\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\xd0\x20\xb2\x21\
-\x40\x00\xa8\x8d\x0e\x00\x00\x54\x48\x01\x00\x00\x15\x1a\xf4\x1d\
-\xc0\x5c\xee\x7b\xe5\x9b\x5c\xa3\x00\x60\xec\xbc\xe4\xd6\x9b\x8a\
-\xfe\xa8\x3d\xcf\x02\x00\x80\x0e\x94\x9e\x5f\x7d\x12\x20\x00\x74\
-\xa2\xec\xfc\xea\x59\x00\x00\xd0\x85\xc2\xf3\xab\x21\x40\x00\xa8\
-\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\x19\x02\x04\x80\x4e\x94\
-\x9d\x5f\x75\x00\x00\xa0\x42\xee\x02\x00\x80\x2e\x14\x9e\x5f\x75\
-\x00\x00\xa0\x42\x0a\x00\x00\xa8\x90\x21\x40\x00\xe8\x44\xd9\xf9\
-\xd5\xb3\x00\x00\xa0\x03\xa5\xe7\x57\x97\x00\x00\xa0\x42\xee\x02\
-\x00\x80\x2e\x14\x9e\x5f\x75\x00\x00\xa0\x42\x86\x00\x01\xa0\x13\
-\x65\xe7\x57\x1d\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\
-\x0a\xb9\x0b\x00\x00\xba\x50\x78\x7e\x35\x04\x08\x00\x9d\x28\x3b\
-\xbf\xba\x04\x00\x00\x15\x52\x00\x00\x40\x85\x3c\x0b\x00\x00\x3a\
-\x50\x7a\x7e\xd5\x01\x00\x80\x0a\x0d\x22\x97\x3d\xa4\x00\x00\x63\
-\xa9\xf0\xfc\xaa\x03\x00\x00\x15\x52\x00\x00\x40\x85\x14\x00\x00\
-\x50\x21\x05\x00\x00\x54\x48\x01\x00\x00\x15\x72\x17\x00\x00\x74\
-\xa1\xf0\xfc\xaa\x03\x00\x00\x15\x52\x00\x00\x40\x85\x14\x00\x00\
-\x50\x21\x05\x00\x00\x54\x68\x90\x0b\x7f\x5e\x31\x00\x8c\xa3\xd2\
-\xf3\xeb\xa0\xf8\xc7\x15\x01\xc0\x38\x2a\x3c\xbf\xba\x04\x00\x00\
-\x15\x52\x00\x00\x40\x85\x14\x00\x00\x50\xa1\x41\x14\x3e\xa4\x00\
-\x00\xe3\xa9\xec\xfc\x6a\x08\x10\x00\xba\x50\x78\x7e\x75\x09\x00\
-\x00\x2a\xa4\x00\x00\x80\x0a\x29\x00\x00\xa0\x42\x86\x00\x01\xa0\
-\x13\x65\xe7\x57\x1d\x00\x00\xa8\xd0\x20\x17\x3e\xa5\x08\x00\xe3\
-\xa8\xf4\xfc\xaa\x03\x00\x00\x15\x52\x00\x00\x40\x85\x0c\x01\x02\
-\x40\x27\xca\xce\xaf\x3a\x00\x00\x50\x21\x05\x00\x00\x54\xc8\xb3\
-\x00\x00\xa0\x0b\x85\xe7\x57\x1d\x00\x00\xa8\x90\x21\x40\x00\xe8\
-\x44\xd9\xf9\x55\x07\x00\x00\x2a\xa4\x00\x00\x80\x0a\x29\x00\x00\
-\xa0\x42\x9e\x05\x00\x00\x1d\x28\x3d\xbf\x1a\x02\x04\x80\x4e\x94\
-\x9d\x5f\x5d\x02\x00\x80\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\
-\x90\x02\x00\x00\x2a\x34\x88\x5c\xf6\x90\x02\x00\x8c\xa5\xc2\xf3\
-\xab\x0e\x00\x00\x54\x48\x01\x00\x00\x15\x52\x00\x00\x40\x85\x14\
-\x00\x00\x50\x21\x9f\x04\x08\x00\x9d\x28\x3b\xbf\x7a\x16\x00\x00\
-\x74\xa0\xf4\xfc\xea\x12\x00\x00\x54\x48\x01\x00\x00\x15\x52\x00\
-\x00\x40\x85\x0c\x01\x02\x40\x27\xca\xce\xaf\x3a\x00\x00\x50\xa1\
-\x41\x14\x3e\xa5\x08\x00\x63\xa9\xf0\xfc\xaa\x03\x00\x00\x15\x52\
-\x00\x00\x40\x85\x0c\x01\x02\x40\x27\xca\xce\xaf\x3a\x00\x00\x50\
-\x21\x05\x00\x00\x54\xc8\xb3\x00\x00\xa0\x03\xa5\xe7\x57\x1d\x00\
-\x00\xa8\x90\x21\x40\x00\xe8\x44\xd9\xf9\x55\x07\x00\x00\x2a\xa4\
-\x00\x00\x80\x0a\x29\x00\x00\xa0\x42\x9e\x05\x00\x00\x5d\x28\x3c\
-\xbf\x1a\x02\x04\x80\x4e\x94\x9d\x5f\x5d\x02\x00\x80\x0a\x29\x00\
-\x00\xa0\x42\x0a\x00\x00\xa8\x90\x21\x40\x00\xe8\x42\xe1\xf9\x75\
-\x90\x0b\x1f\x52\x00\x80\x71\x54\x7a\x7e\x75\x09\x00\x00\x2a\xa4\
-\x00\x00\x80\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\xd0\x20\x72\
-\xd9\x43\x0a\x00\x30\x96\x0a\xcf\xaf\x3a\x00\x00\x50\x21\x05\x00\
-\x00\x54\x48\x01\x00\x00\x15\x52\x00\x00\x40\x85\x14\x00\x00\x50\
-\x21\x77\x01\x00\x40\x17\x0a\xcf\xaf\x3a\x00\x00\x50\xa1\x41\xe1\
-\x0f\x2b\x02\x80\xb1\x54\x7a\x7e\xd5\x01\x00\x80\x0a\x29\x00\x00\
-\xa0\x42\x83\x28\xfc\x79\xc5\x00\x30\x9e\xca\xce\xaf\x83\xe2\x2f\
-\x52\x00\xc0\x38\x2a\x3c\xbf\xba\x04\x00\x00\x15\x52\x00\x00\x40\
-\x85\x14\x00\x00\x50\x21\x43\x80\x00\xd0\x89\xb2\xf3\xab\x0e\x00\
-\x00\x54\xc8\x5d\x00\x00\xd0\x85\xc2\xf3\xeb\xa0\xef\x00\x00\x46\
-\xe5\x94\xbf\xb8\xb5\xf0\x2d\x99\xa5\x78\xf4\x8d\xaf\x2c\xbb\xe7\
-\x5e\x18\xcf\x02\x00\xaa\x61\xbf\x63\x94\x4a\x3f\xdf\x0c\x01\x02\
-\x15\xb1\xdf\x31\x4a\x65\x9f\x6f\x86\x00\x01\xa0\x42\x0a\x00\x00\
-\xa8\x90\xbb\x00\x80\x7a\xd8\xef\x18\xa5\xc2\xcf\x37\x1d\x00\x00\
-\xa8\x90\x21\x40\xa0\x22\xf6\x3b\x46\xa9\xec\xf3\x4d\x07\x00\x00\
-\x2a\xa4\x00\x00\x80\x0a\x29\x00\x00\xa0\x42\xee\x02\x00\xea\x61\
-\xbf\x63\x94\x0a\x3f\xdf\x0c\x01\x02\x15\xb1\xdf\x31\x4a\x65\x9f\
-\x6f\x9e\x05\x00\x54\xc3\x7e\xc7\x28\x95\x7e\xbe\x99\x01\x00\x80\
-\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\xd0\x20\x72\xd9\x43\x0a\
-\x00\x43\x63\xbf\x63\x94\x0a\x3f\xdf\x74\x00\x00\xa0\x42\x0a\x00\
-\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\xf9\x24\x40\xa0\
-\x22\xf6\x3b\x46\xa9\xec\xf3\xcd\xb3\x00\x80\x7a\xd8\xef\x18\xa5\
-\xc2\xcf\x37\x97\x00\x00\xa0\x42\x9e\x05\x00\x54\xc3\x7e\xc7\x28\
-\x95\x7e\xbe\xe9\x00\x00\x40\x85\x0c\x01\x02\x15\xb1\xdf\x31\x4a\
-\x65\x9f\x6f\x86\x00\x81\x7a\xd8\xef\x18\xa5\xc2\xcf\x37\x97\x00\
-\x00\xa0\x42\x0a\x00\x00\xa8\x90\x02\x00\x00\x2a\x64\x08\x10\xa8\
-\x88\xfd\x8e\x51\x2a\xfb\x7c\xd3\x01\x00\x80\x0a\xb9\x0b\x00\xa8\
-\x87\xfd\x8e\x51\x2a\xfc\x7c\xd3\x01\x00\x80\x0a\x29\x00\x00\xa0\
-\x42\x83\x5c\xf8\x90\x02\xc0\xb0\xd8\xef\x18\xa5\xd2\xcf\x37\x1d\
-\x00\x00\xa8\x90\x02\x00\x00\x2a\xe4\x2e\x00\xa0\x1e\x85\xef\x77\
-\x4f\x5c\x74\x6e\xd1\x3d\xe3\x13\xbf\x7a\x57\xe1\x2b\x58\x98\xc2\
-\x57\x4b\x07\x00\x00\x2a\xe4\x93\x00\x81\x8a\xd8\xef\x96\xc6\xfa\
-\x2d\x4c\xd9\xeb\xa5\x03\x00\x00\x15\x52\x00\x00\x40\x85\x14\x00\
-\x00\x50\x21\x77\x01\x00\xf5\xb0\xdf\x2d\x8d\xf5\x5b\x98\xc2\xd7\
-\xcb\x10\x20\x50\x11\xfb\xdd\xd2\x58\xbf\x85\x29\x7b\xbd\x5c\x02\
-\x00\x80\x0a\x29\x00\x00\xa0\x42\x83\xc2\x2f\x51\x00\x0c\x8d\xfd\
-\x6e\x69\xac\xdf\xc2\x94\xbe\x5e\x3a\x00\x00\x50\xa1\x41\xe4\xb2\
-\x87\x14\x00\x86\xc6\x7e\xb7\x34\xd6\x6f\x61\x0a\x5f\x2f\x1d\x00\
-\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\x29\x00\x00\xa0\
-\x42\x0a\x00\x00\xa8\x90\xbb\x00\x80\x7a\xd8\xef\x96\xc6\xfa\x2d\
-\x4c\xe1\xeb\xa5\x03\x00\x00\x15\x52\x00\x00\x40\x85\x14\x00\x00\
-\x50\x21\xcf\x02\x00\xaa\x61\xbf\x5b\x1a\xeb\xb7\x30\xa5\xaf\xd7\
-\xa0\xf4\xe7\x15\x03\x0c\x8f\xfd\x6e\x69\xac\xdf\xc2\x94\xbd\x5e\
-\x83\xe2\x4b\x14\x80\x61\xb1\xdf\x2d\x8d\xf5\x5b\x98\xc2\xd7\xcb\
-\x0c\x00\x00\x54\x48\x01\x00\x00\x15\x52\x00\x00\x40\x85\x0c\x01\
-\x02\x15\xb1\xdf\x2d\x8d\xf5\x5b\x98\xb2\xd7\x4b\x07\x00\x00\x2a\
-\xe4\x2e\x00\xa0\x1e\xf6\xbb\xa5\xb1\x7e\x0b\x53\xf8\x7a\xe9\x00\
-\x00\x40\x85\x14\x00\x00\x50\x21\x43\x80\x40\x45\xec\x77\x4b\x63\
-\xfd\x16\xa6\xec\xf5\xf2\x2c\x00\xa0\x1a\xf6\xbb\xa5\xb1\x7e\x0b\
-\x53\xfa\x7a\x19\x02\x04\xea\x61\xbf\x5b\x1a\xeb\xb7\x30\x85\xaf\
-\x97\x19\x00\x00\xa8\x90\x02\x00\x00\x2a\x64\x08\x10\xa8\x88\xfd\
-\x6e\x69\xac\xdf\xc2\x94\xbd\x5e\x3a\x00\x00\x50\xa1\x41\xdf\x01\
-\x00\xf0\x8c\xe3\xbf\x78\x5f\xe1\x63\x63\xbc\x90\xb8\x0b\x00\xa8\
-\x87\xfd\x8e\x51\x2a\xfc\x7c\x73\x09\x00\x00\x2a\x64\x08\x10\xa8\
-\x88\xfd\x8e\x51\x2a\xfb\x7c\xd3\x01\x00\x80\x0a\x29\x00\x00\xa0\
-\x42\x9e\x05\x00\x54\xc3\x7e\xc7\x28\x95\x7e\xbe\xb9\x0b\x00\xa8\
-\x87\xfd\x8e\x51\x2a\xfc\x7c\x33\x04\x08\x54\xc4\x7e\xc7\x28\x95\
-\x7d\xbe\x99\x01\x00\x80\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\
-\x90\x02\x00\x00\x2a\x34\x88\x5c\xf6\x90\x02\xc0\xd0\xd8\xef\x18\
-\xa5\xc2\xcf\x37\x1d\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\
-\x80\x0a\x29\x00\x00\xa0\x42\x83\x5c\xf8\x27\x15\x01\x0c\x8b\xfd\
-\x8e\x51\x2a\xfd\x7c\xf3\x2c\x00\xa0\x1e\xf6\x3b\x46\xa9\xf0\xf3\
-\xcd\x25\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\x00\x80\x0a\x79\
-\x1c\x30\x50\x11\xfb\x1d\xa3\x54\xf6\xf9\xa6\x03\x00\x00\x15\x72\
-\x17\x00\x50\x0f\xfb\x1d\xa3\x54\xf8\xf9\xa6\x03\x00\x00\x15\x52\
-\x00\x00\x40\x85\x0c\x01\x02\x15\xb1\xdf\x31\x4a\x65\x9f\x6f\x3a\
-\x00\x00\x50\x21\x05\x00\x00\x54\x68\x90\x0b\x9f\x52\x04\x18\x16\
-\xfb\x1d\xa3\x54\xfa\xf9\xa6\x03\x00\x00\x15\x32\x04\x08\x54\xc4\
-\x7e\xc7\x28\x95\x7d\xbe\xe9\x00\x00\x40\x85\x14\x00\x00\x50\x21\
-\x05\x00\x00\x54\xc8\xb3\x00\x80\x7a\xd8\xef\x18\xa5\xc2\xcf\x37\
-\x43\x80\x40\x45\xec\x77\x8c\x52\xd9\xe7\x9b\x4b\x00\x00\x50\xa1\
-\x41\xdf\x01\x00\x8c\xca\xd4\xdb\x57\x95\xfd\x27\x19\x8c\x90\x0e\
-\x00\x00\x54\x48\x01\x00\x00\x15\x1a\xe4\xac\x23\x06\x00\xc3\x56\
-\x7a\x7e\xd5\x01\x00\x80\x0a\x29\x00\x00\xa0\x42\x0a\x00\x00\xa8\
-\x90\x02\x00\x00\x2a\x34\x88\xc2\x87\x14\x00\x60\x2c\x15\x9e\x5f\
-\x75\x00\x00\xa0\x42\x0a\x00\x00\xa8\x90\x02\x00\x00\x2a\xa4\x00\
-\x00\x80\x0a\x29\x00\x00\xa0\x42\xee\x02\x00\x80\x2e\x14\x9e\x5f\
-\x07\xb9\xef\x08\x00\xe0\x05\xa8\xf4\xfc\xea\x12\x00\x00\x54\x48\
-\x01\x00\x00\x15\x52\x00\x00\x40\x85\x06\x11\x65\x0f\x29\x00\xc0\
-\x78\x2a\x3b\xbf\x0e\x8a\x9f\x52\x00\x80\x71\x54\x78\x7e\x75\x09\
-\x00\x00\x2a\xd4\x44\xc4\x4c\xdf\x41\xcc\x6a\x47\x5e\xd6\x77\x08\
-\x00\xb0\x20\x5f\xce\xcb\xfb\x0e\x61\x0e\x33\x4d\x44\x3e\xd0\x77\
-\x14\xb3\x7b\x7c\x65\xdf\x11\x00\xc0\x82\x3c\xf6\xc4\x89\x7d\x87\
-\x30\x87\xa9\x41\x44\x73\x20\x22\x8e\xeb\x3b\x92\x63\x59\x36\x9d\
-\x56\x1f\x88\x78\xa4\xef\x38\x00\x60\xbe\x96\x0d\x9a\xd5\xb9\x6d\
-\xfb\x0e\x63\x36\x53\x4d\x8e\xd8\xdf\x77\x14\xb3\x6a\xe2\xfc\xbe\
-\x43\x00\x80\x05\x99\xc9\x85\xe7\xae\xbc\xbf\x49\x39\xf6\x45\x8e\
-\x28\xf7\x95\x2f\xe8\x70\x05\x00\x60\xf8\x52\x7e\x4d\xff\xf9\x73\
-\xd6\xd7\xde\x26\x47\xec\xed\x3f\x8e\x63\xbf\xda\x88\x37\x2d\x66\
-\xed\x01\xa0\x2f\x6d\x8e\xf5\x7d\xe7\xcf\xd9\xff\xb6\x8e\x7d\x4d\
-\x8a\xf4\x60\x87\x6b\x30\x0c\xaf\x89\xad\x4f\x9d\xd5\x77\x10\x00\
-\x30\x2f\x3b\x1e\x39\x3b\x22\x5e\xdd\x77\x18\xb3\x49\x29\x3d\xd8\
-\xe4\x1c\xf7\x3c\xf3\x69\x45\xc5\xbe\x9a\x41\x33\xbd\xa9\xc3\x75\
-\x00\x80\xa1\x19\xb4\x93\x9b\x22\x52\x53\x40\xfe\x3c\xe6\x2b\x47\
-\xba\xa7\x49\x91\xef\xed\x70\x1d\x86\x23\xa5\x5f\x1a\x83\x7b\x2a\
-\x01\xa8\xdd\x97\xf3\xf2\xc8\xf1\x4b\x7d\x87\x31\x97\x14\xf9\xee\
-\x26\x4f\xa4\x3b\xfa\x0e\x64\x1e\xce\x9a\x7c\x6c\xff\xbb\xfa\x0e\
-\x02\x00\x66\x33\xf9\x37\xfb\xdf\x1d\x11\x6b\xfa\x8e\x63\x2e\xb9\
-\x89\x3b\x53\x6c\x7e\xf4\xe4\xc1\xf2\xc1\x23\x51\xfa\x53\x0b\x22\
-\x1e\x99\x1e\xc4\x2b\x62\xc3\x89\x7b\xfa\x0e\x04\x00\x9e\xe7\xba\
-\x27\xce\x18\x0c\xe2\xb6\x88\x38\xa5\xef\x50\xe6\x90\xa7\xdb\x03\
-\x27\x37\x71\xcd\x29\x8f\xa5\x88\xdd\x7d\x47\x33\x0f\xa7\x4e\x4e\
-\xc7\x47\xfa\x0e\x02\x00\x8e\x66\x30\x19\xff\x39\xca\x4f\xfe\x91\
-\x23\xfd\xbf\xb8\x72\xd5\xe3\xcd\x33\xff\x68\xfe\xaa\xef\x81\x84\
-\x79\x0e\x2d\x6c\x98\xbc\xfe\x89\x6b\xbb\x5a\x14\x00\x58\x8c\xc9\
-\x6d\xfb\x7f\x25\x72\xba\xb4\xef\x3c\x39\x9f\x57\x13\xf1\xed\x88\
-\x67\x9f\x06\x98\x52\xfb\x17\x9d\xac\x48\x07\x72\x4e\x7f\x38\xb1\
-\xed\x89\x4b\xfb\x8e\x03\x00\x22\x22\x26\xb6\x3f\x79\x49\x4e\xf1\
-\xef\xfb\x8e\x63\xfe\xd2\xce\x88\x43\x05\x40\xce\x37\xf5\x1b\xcc\
-\x82\x4c\xa4\x94\xb6\x4e\x6c\x7f\xf2\x92\xbe\x03\x01\xa0\x6e\x13\
-\xdb\x9e\x7c\x4b\x8a\xbc\x23\x22\x06\x7d\xc7\x32\x5f\x4d\x9e\xfe\
-\x51\x01\x70\xe0\x8a\x93\x6e\x8b\x88\xfb\x7b\x8d\x68\x61\x8e\x4b\
-\x91\xff\xfb\xe4\xb6\x27\xde\xd3\x77\x20\x00\xd4\x69\x72\xdb\xfe\
-\x5f\x49\x29\x7f\x2e\x22\x56\xf4\x1d\xcb\x7c\xa5\x88\x1f\x4c\x6d\
-\x7c\xd1\x9d\x11\x87\x55\x2c\x29\xc7\xcd\x39\x62\x63\x7f\x61\x2d\
-\xd8\x20\x47\xfa\xf0\x60\xfb\x93\x3f\x35\x3d\xdd\x5e\x1b\x57\x9d\
-\xf8\x70\xdf\x01\x01\x50\x81\xed\xfb\x5f\x3c\xc8\xe9\x63\x39\xf2\
-\xa5\x91\xfb\x0e\x66\xc1\x6e\x3e\xf4\x1f\xcd\xa1\xff\x68\x73\xda\
-\x99\x9f\x19\xb4\x1b\xaf\x57\x8e\xb7\x4f\x4c\x34\xb7\x35\xdb\x9e\
-\x7a\x8f\x0f\x0b\x02\xa0\x33\x9b\xf3\x8a\x66\xdb\x53\xbf\x3c\x91\
-\xd3\x6d\x39\xe2\xd2\xde\xf3\xdf\x22\x5e\x6d\xc4\x0f\x2f\xf9\xff\
-\xe8\xde\xff\xed\x8f\x9f\x36\x91\x27\xee\x8b\x88\x65\x7d\xac\xeb\
-\x90\xdc\x9f\x23\x3e\xda\x36\x69\x4b\xbc\xe3\xf8\x1f\xf4\x1d\x0c\
-\x00\x2f\x00\xd7\x3d\x7d\x76\x33\x68\x37\xa5\x1c\xd7\x46\xc4\xea\
-\xbe\xc3\x59\x82\xa9\x99\x38\xb8\x3a\x36\x9e\xfc\x68\xc4\x11\x1f\
-\xfe\x33\xb1\xed\xc9\xcf\x47\xc4\xcf\xf5\x12\xd6\x70\xb5\x11\xf1\
-\x9d\x94\xd3\xce\x1c\x71\xcb\x44\xb4\xb7\x1f\x58\x36\x73\x5f\xc4\
-\x49\xfb\x63\x43\x3a\xd0\x77\x70\x00\x14\x68\x47\x5e\x16\xf1\xf8\
-\xca\x65\xd3\x13\x67\xcd\xb4\xcd\xba\x94\xe2\xc7\x72\xe4\xf5\x11\
-\x71\x41\x1c\xd6\x31\x1f\x63\x9f\x9b\xd9\x78\xc2\xdb\x0f\xfd\xe3\
-\x88\x02\xe0\xa9\x4b\x23\xf2\xe7\x46\x1f\x13\x00\xd0\xa9\x36\xde\
-\x32\xb3\xe9\x84\x3f\x39\xf4\xcf\xe7\x54\x34\x33\x93\xc7\x7d\x29\
-\x22\xf6\x8d\x3c\x28\x00\xa0\x4b\xfb\x66\x96\x1f\xff\x95\xc3\xbf\
-\xf0\xdc\xfb\x16\x37\xa4\x03\xb1\xe5\xe9\x1d\x91\xf2\x2f\x8e\x34\
-\x2c\x00\xa0\x3b\x29\xae\x3f\xf2\x12\xf8\xf3\xae\x69\x34\xd1\x7e\
-\x72\x74\x11\x01\x00\x1d\xcb\x4d\xb4\x9f\x3a\xf2\x8b\xcf\x2b\x00\
-\x0e\x6e\x3a\xe1\xbb\x11\xe9\x2b\x47\x7e\x1d\x00\x18\x47\xe9\xcb\
-\x07\x37\xae\xfc\xde\x91\x5f\x3d\xea\x54\x63\x6a\xf2\x6f\x77\x1f\
-\x10\x00\xd0\xb5\x14\xf9\x77\x8f\xf6\xf5\xa3\x16\x00\xd3\x57\x1c\
-\xff\xad\xc8\xf1\xb5\x6e\x43\x02\x00\x3a\x95\x62\xe7\xf4\x95\xc7\
-\x7f\xf3\x68\xdf\x3a\xe6\xc3\x0b\x52\x34\xbf\x93\x23\xff\x54\x77\
-\x51\x01\x00\x5d\x4a\x33\xf1\x3b\xc7\xfc\xde\x6c\xbf\x38\xb1\xf5\
-\xe9\xbf\x8c\x1c\xaf\x1b\x7e\x48\x00\x40\xc7\xbe\x31\xb3\xe9\xb8\
-\x9f\x38\xd6\x37\x67\xfd\x64\xa3\x26\xb5\xef\x8d\x88\x99\xa1\x87\
-\x04\x00\x74\x69\xa6\x69\xdb\x5f\x9e\xed\x07\x66\xed\x00\x44\x44\
-\x34\x5b\x9f\xfa\x48\xe4\x74\xed\xf0\x62\x02\x00\xba\x95\xff\xb0\
-\xdd\x74\xfc\xbf\x98\xed\x27\xe6\xfc\x6c\xe3\x36\x8e\xfb\xf5\x88\
-\x78\x60\x68\x31\x01\x00\x5d\x7a\xa8\x9d\x9e\xfa\xad\xb9\x7e\x68\
-\xce\x0e\x40\x44\xc4\xc4\x96\xa7\xaf\xca\x91\x3e\xb3\xe4\x90\x00\
-\x80\x4e\xa5\x94\x36\xce\x5c\xb9\x7c\xfb\x9c\x3f\x37\xaf\xa3\xe5\
-\x9c\xd2\xd6\xa9\x1b\x53\xc4\x9b\x96\x1c\x19\x00\xd0\x89\x1c\x71\
-\x63\xbe\x72\xf9\x45\x91\x52\x9e\xeb\x67\x8f\x79\x1b\xe0\x73\xa4\
-\x94\xf3\xf6\xfd\x1b\xd3\xf4\xe0\x7b\x11\x71\xe6\x52\x03\x04\x00\
-\x86\xee\xe1\x9c\x66\xae\x9e\x4f\xf2\x8f\x58\xc8\xf3\x8d\xaf\x58\
-\xf9\x50\x93\xf3\x15\xe1\xae\x00\x00\x28\x4d\xdb\xa4\xb8\x32\x36\
-\x9d\x30\xef\x99\xbd\xf9\x17\x00\x11\x31\x7d\xf5\x71\x37\x47\xe4\
-\xdf\x5b\x78\x5c\x00\x40\x67\x72\xfe\xd0\xf4\xa6\x15\x37\x2e\xe4\
-\x57\xe6\x77\x09\xe0\x30\xed\xdd\x2b\x3e\x90\x5e\x7e\xf0\x75\x29\
-\xf2\xfa\x85\xfe\x2e\x00\x30\x5c\x29\xf2\xd7\x66\x8e\x5b\xf1\xa1\
-\x85\xff\xde\x62\x6c\xde\x7f\x66\x33\x31\xf9\xcd\x88\x78\xf9\xa2\
-\x7e\x1f\x00\x18\x86\x5d\x6d\x1c\xf8\x27\x71\xd5\x89\x0f\x2f\xf4\
-\x17\x17\x57\x00\x44\x44\xfc\x97\xbf\x3d\xb7\x49\xe9\x1b\x61\x28\
-\x10\x00\x7a\x90\xf7\xb4\x11\x6f\x88\xab\x57\xdc\xb1\x98\xdf\x5e\
-\xd0\x0c\xc0\x73\xbc\x73\xc5\x5d\x6d\xc4\x45\x11\xf1\xd8\xa2\x8f\
-\x01\x00\x2c\xc6\xe3\x6d\xd3\xfc\xf4\x62\x93\x7f\xc4\x52\x0a\x80\
-\x88\x88\xab\x97\xff\x75\xd3\xb6\x6f\x8d\x88\xa9\x25\x1d\x07\x00\
-\x98\xaf\x03\x4d\x93\xdf\x1e\x9b\x96\x7d\x77\x29\x07\x59\xfc\x25\
-\x80\xc3\x7d\x66\xea\xad\x29\xd2\xf5\x11\xb1\x7c\x28\xc7\x03\x00\
-\x8e\x66\x2a\x37\xf9\xf2\xd8\xb4\xfc\x8f\x97\x7a\xa0\xe1\x14\x00\
-\x11\x11\x9b\x0f\xbe\x31\x35\xf9\x0b\x11\x71\xd2\xd0\x8e\x09\x00\
-\x1c\xb2\x3f\xe7\xf4\xb6\x78\xe7\xe4\x9f\x0f\xe3\x60\xc3\x2b\x00\
-\x22\x22\x36\x4f\xbd\x2a\x35\xcd\x57\x22\xf2\x9a\xa1\x1e\x17\x00\
-\x6a\x96\xe3\xa1\x3c\x11\x17\x2f\xb5\xed\x7f\xb8\xe1\x16\x00\x11\
-\x11\xd7\x3d\xfd\xb2\xd4\x4e\x7c\x35\x22\xd6\x0e\xfd\xd8\x00\x50\
-\x9f\x7b\x72\x6e\x2f\x8a\x6b\x56\xdc\x39\xcc\x83\x2e\x6d\x08\xf0\
-\x68\xae\x3a\xee\x9e\x9c\x27\x7f\x32\x72\x7c\x6d\xe8\xc7\x06\x80\
-\xba\xdc\x9c\x9b\xc9\x7f\x3c\xec\xe4\x1f\xd1\x45\x07\xe0\x90\x1d\
-\x79\xa2\x79\x72\xfa\x37\x73\x8a\xdf\x88\x88\x89\xce\xde\x07\x00\
-\x5e\x78\x72\xca\xf1\x07\xed\x09\x83\xf7\xc7\x86\xd4\xc9\x33\x78\
-\xba\x2b\x00\x0e\xf9\xcc\xc1\x0b\x53\x8e\x6d\x11\xb1\xba\xf3\xf7\
-\x02\x80\xf1\xb7\x27\x37\xb1\x29\xae\x9a\xfc\x6a\x97\x6f\xd2\x7d\
-\x01\x10\x11\xb1\x25\xaf\x4e\x33\xd3\xd7\x45\xc4\x3f\x1d\xc9\xfb\
-\x01\xc0\x78\xba\x31\xe7\xc1\x55\x71\x4d\x7a\xb0\xeb\x37\x1a\x4d\
-\x01\x70\xc8\xe6\xe9\x4b\x52\xca\x1f\x8b\x88\xb3\x46\xfa\xbe\x00\
-\x50\xb6\x07\x73\xa4\xf7\xc5\xd5\x13\x5b\x22\xa5\x3c\x8a\x37\x1c\
-\x6d\x01\x10\x11\xf1\x89\xfc\xa2\x66\x72\xfa\xb7\x73\x8a\x6b\xc3\
-\x6c\x00\x00\x75\x6b\x53\x4e\x9f\x6c\x0f\x4e\xfc\xab\x78\x77\xfa\
-\x9b\x51\xbe\xf1\xe8\x0b\x80\x43\x3e\x7d\xe0\xd5\x29\x35\x1f\x8e\
-\x88\xd7\xf7\x16\x03\x00\xf4\x25\xc5\x37\x72\x6e\xdf\x1b\xd7\x2c\
-\xfb\x5e\x3f\x6f\xdf\xb7\x4f\x1d\x7c\x43\x9a\x48\xef\x8b\x1c\x3f\
-\xdb\x77\x28\x00\x30\x02\xdf\xcc\x11\xbf\x1f\xd7\x0c\xbe\xd8\x67\
-\x10\xfd\x17\x00\x87\x7c\xfa\xe0\xeb\xa3\x49\xbf\x16\x39\xde\x1c\
-\x25\xc5\x05\x00\xc3\x90\xe2\x7f\x44\xca\x1f\x88\xab\x27\xbf\xd5\
-\x77\x28\x11\x25\x26\xda\xcd\x07\xfe\x61\xa4\xe6\x5d\x91\xe3\x1d\
-\x11\xb1\xaa\xef\x70\x00\x60\xd1\x52\xec\x8d\x88\x1b\x22\xb7\x9f\
-\xea\xab\xd5\x7f\x2c\xe5\x15\x00\x87\xec\xc8\x13\xb1\x7f\xfa\xc2\
-\x48\xe9\xaa\x88\x78\x5b\x44\x1c\xdf\x77\x48\x00\x30\x0f\x53\x91\
-\xe2\xc6\xc8\x71\x5d\x9c\x30\xf1\x85\xd8\x90\x0e\xf4\x1d\xd0\xd1\
-\x94\x5b\x00\x1c\xee\x93\xf9\xd4\x68\x66\x2e\x89\x48\xeb\x23\x62\
-\x7d\xb8\x8d\x10\x80\xb2\xec\x8e\x88\x9d\x91\xf3\x4d\xb1\x62\xe2\
-\x8b\xb1\x31\x3d\xda\x77\x40\x73\x19\x8f\x02\xe0\x48\x9f\xc9\xeb\
-\x62\xba\x5d\x1f\x29\xad\x8f\xc8\xaf\x89\x88\x73\xfa\x0e\x09\x80\
-\xaa\xdc\x1b\x11\xdf\x8e\x88\x9d\x91\x9a\x9d\x71\x4d\x1a\xfa\x67\
-\xf5\x77\x6d\x3c\x0b\x80\x23\x7d\x22\xbf\x28\x06\xf1\xaa\x48\x33\
-\x6b\x23\xa5\x97\x45\x1b\xe7\x44\xa4\x35\x91\xf2\x69\xf1\xcc\x1c\
-\xc1\x09\x11\x31\x88\x88\x13\x7b\x8d\x13\x80\xd2\x3d\x11\x11\xd3\
-\x11\xb1\x3f\x22\xf6\x45\x4e\xfb\x22\xf2\xfd\xd1\xc4\xbd\x91\xf3\
-\x3d\xd1\x4c\xdc\x11\x53\xf1\x7f\x46\x7d\xcf\x7e\x17\xfe\x3f\x03\
-\xec\x17\xfa\x2e\x7b\xca\x21\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x1e\xd3\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\xbb\x7f\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\
-\x2b\x0e\x1b\x00\x00\x1d\xb0\x49\x44\x41\x54\x78\xda\xed\x9d\x79\
-\x70\x5c\xc7\x79\xe0\x7f\x73\xdf\xf7\x0c\xee\x9b\x00\x01\x92\xa2\
-\x04\x52\x94\x49\x5d\x24\x25\x5b\x97\x2f\xf9\x92\x2d\xdb\x65\xc7\
-\xa9\x72\x39\xd9\x75\x5c\x59\x57\x36\x3e\xd6\xce\xc6\x5e\x47\xb1\
-\xac\x64\xed\x8d\x1c\xa7\x6c\xc7\x8e\x53\xb6\xe2\x5b\x56\x24\x45\
-\x92\x75\x51\x24\x45\xf1\x10\x29\x5e\x20\x08\x12\x00\x71\x1f\x03\
-\xcc\x60\xee\xfb\x78\xb3\x7f\x0c\x08\x02\x20\x88\x39\x30\x0f\xa0\
-\xc8\xf9\x55\xbd\x9a\x9a\x37\xef\x75\xbf\xaf\xfb\x9b\x7e\xdd\xfd\
-\x7d\xfd\x35\x94\x29\x53\xa6\x4c\x99\x32\x65\xca\x94\x29\x53\xe6\
-\xfa\x42\xb2\xd6\x0f\x00\x18\x00\x33\x60\x9a\x3d\xcc\x40\x1a\x48\
-\xcd\xfe\x2e\x00\x7e\x20\x09\x4c\xcf\x1e\xc2\x5a\x3f\xf4\x15\x50\
-\x00\x15\xb3\x87\x71\xf6\x3b\x80\x74\x56\xb6\x04\xe0\x9b\x95\xe7\
-\xe2\xa7\x77\x2d\x1f\x78\x35\x14\x40\x02\xb4\x03\x1b\x80\x75\x40\
-\xeb\xbc\xcf\x7a\x40\x56\x60\x7a\x69\x60\x0a\x70\x02\x93\x40\x2f\
-\xd0\x35\x7b\x9c\x05\x22\x22\xcb\x63\x00\x36\x01\x37\x02\x9b\x81\
-\x36\xa0\x86\x6c\xa5\x57\x16\x91\x9e\x00\x8c\x01\xfd\xb3\xc7\x85\
-\xd9\xcf\xb3\xc0\x79\x20\x23\xa6\x30\x62\x28\x80\x11\xd8\xb1\xe8\
-\xb0\x88\x29\xc4\x3c\xd2\xc0\x00\xf0\x16\xb0\x17\xd8\x03\xf4\xad\
-\x30\xcd\x0e\xe0\x6e\xe0\x2e\x60\x2b\xd0\xcc\xea\xb5\x9c\x3e\xe0\
-\x30\x70\x68\xf6\xf3\x30\x10\x28\x65\x06\xa5\x10\x44\x05\xdc\x0e\
-\xbc\x0b\xb8\x67\xb6\x90\xa4\xab\x54\x40\xf9\x30\x0a\xbc\x06\xbc\
-\x02\xfc\x17\xb9\x9b\x5c\x2b\xf0\x7e\xb2\x95\xfe\x4e\xb2\xff\xee\
-\xab\x05\x01\x38\x41\x56\xb1\xf7\x00\xaf\x03\xe1\x95\x24\x58\x8c\
-\x02\x48\xc8\x36\x7f\xf7\x90\xad\xf4\x3b\x01\x6d\xa9\x24\xd4\xe8\
-\x8d\x48\x65\xd9\xb7\x42\x34\x14\x40\x48\xa7\x4b\x95\x34\x64\xdf\
-\xc1\x2f\x02\xbf\x06\x9e\x01\x42\xb3\xe7\x0d\x64\x2b\xfd\xe3\xc0\
-\xbd\x5c\x7a\x77\x17\x8d\xce\x74\xa9\xd1\xd3\xe8\xf4\xc8\xe4\x72\
-\x04\x41\x20\x12\xf0\x13\x0e\xf8\x4a\x25\x4f\x12\x38\x02\xbc\x4a\
-\x56\x21\x0e\xcf\xca\x98\x37\xf9\x2a\x80\x11\xf8\x30\xd9\x4a\x7f\
-\x27\xd9\xf7\x5d\x41\xc8\xe4\x0a\x2a\xea\x1b\xa9\x6a\x6a\xa5\xba\
-\xb9\x95\xea\xe6\x36\x2a\xea\x9b\x30\x58\x6c\xe8\x4c\x16\xf4\x26\
-\x33\x3a\x93\x65\xae\xf2\x17\x13\x09\xfa\xf1\xb9\xa6\x08\xcc\xb8\
-\xf0\xcf\xb8\xf0\x4d\x3b\x99\x1e\x19\x64\xa4\xb7\x9b\xb1\xbe\x1e\
-\x66\x26\xc6\x0a\x7d\xa4\x28\xf0\xec\x6c\x19\xbc\x17\xd0\xe4\x7b\
-\xa3\x54\x26\xa3\xb2\xa1\x99\x86\xf6\x1b\xa8\x6b\xdb\x40\x55\x73\
-\x2b\x46\x9b\x03\x4b\x45\x15\x26\x5b\x05\x46\x9b\x03\x99\x5c\x7e\
-\xc5\xfb\x33\x99\x0c\x91\x80\x8f\x90\xdf\x47\xd0\xe3\xc6\x35\x36\
-\x8c\x73\xe8\x02\xce\xe1\x0b\x38\x87\x2e\x30\x71\xe1\x3c\xfe\x19\
-\x57\xa1\xf2\x40\xb6\xff\xf3\x3a\x59\x65\x78\x02\x98\xc8\x75\x43\
-\x3e\x0a\x50\x09\x1c\x03\xea\x0a\x79\x12\x5b\x75\x2d\xeb\x6f\xbe\
-\x95\xf5\x5b\x77\xb0\x7e\xeb\x76\x5a\x36\x6f\x41\x26\x5f\xf1\x1f\
-\xeb\xca\x92\x07\xfd\x8c\xf5\xf5\xd0\x7f\xf2\x18\xdd\x87\xf7\x71\
-\xee\xcd\x37\x08\x7a\x67\x4a\x92\xb6\xda\xe2\xa0\x71\xeb\x9d\xdc\
-\x79\xd7\x6e\xda\xb6\xbc\x83\xda\xd6\x0e\x94\xea\xbc\xf5\xa5\x28\
-\x66\x26\xc6\x38\xff\xd6\x21\xfa\x4e\x1c\xa1\xf7\xf8\x9b\x0c\x9e\
-\x39\x41\x2a\x59\xd0\x9f\x7b\x06\xe8\x24\xdb\xc1\xbc\x22\xf9\x28\
-\xc0\x7f\x07\x7e\x90\xeb\x22\x8d\xb5\x92\x8a\xce\x9d\xb4\xee\xb8\
-\x8b\x8f\xbc\xef\x3e\x6c\x35\x05\xe9\x4b\xc9\xc9\x08\x02\x23\xe7\
-\xbb\x39\x7b\x78\x3f\xc7\xf7\x3c\xcf\x99\x83\x7b\x49\xa7\x52\x79\
-\xdd\x2b\x95\x2b\xa9\xdc\xb2\x93\x9a\xed\xf7\x52\xb1\xf9\x36\x8c\
-\x0d\xed\xd4\x19\x15\x6c\xaf\x13\xb7\xd2\x97\x23\x19\x8f\x71\xee\
-\xd8\x21\xba\x0e\xbc\x4a\xd7\x1b\xaf\x31\x78\xe6\x44\x3e\xaf\xc7\
-\x2f\x00\xff\xbc\xdc\x05\xf9\x28\xc0\x97\x81\x47\x17\x9f\x94\xab\
-\xb5\xd8\x36\xdc\x42\xe5\x96\x9d\x54\x75\xee\xc2\xd2\x7a\x23\x48\
-\x24\xd8\x75\x72\x76\x35\x96\xac\x4b\x50\x32\xc2\x7e\x2f\xc7\x5e\
-\x79\x8e\xc3\xcf\x3d\xc9\xa9\xfd\xaf\x5c\xf6\x6f\x92\x48\x65\xd8\
-\x3a\x6e\xa6\xfe\xce\x07\x69\xd8\xfd\x21\xd4\x66\xfb\x82\xdf\xd7\
-\x5a\x01\x16\x13\x0b\x87\xe8\x3b\xf1\x26\xa7\x0f\xbc\x4a\xd7\x81\
-\x3d\x0c\x74\x1d\x5f\xea\xb2\xaf\x00\xdf\x59\x2e\x9d\x82\x15\x40\
-\x57\x51\xcf\x8e\x2f\xff\x08\x5b\xfb\x16\x24\xb2\xcb\xdf\x73\x57\
-\xab\x02\xcc\x67\xb8\xa7\x8b\xbf\xbe\x7f\xdb\x82\x73\xf7\xfd\xcb\
-\x3e\xcc\xcd\x1b\xaf\x78\xcf\xd5\xa6\x00\x8b\x71\x4f\x8c\xf2\xad\
-\x4f\xdc\xcf\xe4\x60\xff\xfc\xd3\x39\x15\x40\x4e\x81\x28\x4d\x56\
-\xec\x1b\x6f\x59\x6b\x79\x57\x84\x5a\xa7\xbf\xbc\x20\x34\xba\xb5\
-\x7e\xac\x15\x61\xaf\xa9\x47\xa3\x37\x16\x7c\x9f\x14\xb0\x01\x8f\
-\x01\xff\x4a\x76\x78\x57\xe6\xda\xe6\x26\xe0\x27\x64\xeb\xdc\x2a\
-\x07\x7e\x49\x76\xec\x0b\xf0\x41\xb2\xd3\xb4\xfe\xb5\x7e\xca\x32\
-\xa2\x60\x26\x3b\x44\xb4\xce\x7e\xdf\x2c\x27\x3b\xc5\x79\x11\xdb\
-\x9f\x3c\x56\x77\xb0\xe3\x56\xfd\xdc\x74\xe3\x1f\x7f\xe4\xaa\xd9\
-\xf7\x44\x69\x86\x53\x65\x56\x97\x3b\x3f\xa8\x7b\xe0\xb3\x8f\x58\
-\xe6\x66\xa4\x5e\x7f\x2a\x5c\xff\x93\xaf\x79\xad\xf3\x2e\x79\xa7\
-\x9c\x45\xb3\x5e\x09\x41\xb1\x31\x18\xb9\x74\x4a\xaa\x12\x6f\xec\
-\x5e\x46\x5c\xaa\x9b\xe5\xbb\xc8\xb0\xeb\xe2\x77\x6b\xe5\x65\x5d\
-\x3e\xc5\xd5\x34\x67\x5f\x66\x0d\x28\x2b\xc0\x75\x4e\x59\x01\xae\
-\x73\xca\x0a\x70\x9d\x53\xf0\x44\x90\x18\x24\xe3\x31\x42\x3e\x2f\
-\x89\x78\x8c\x48\xc0\x47\x26\x73\xc9\x09\x46\x26\x57\xa0\xd6\xe9\
-\x51\x6b\x75\xe8\xcd\x16\x51\x0d\x4a\xa5\x22\x95\x4c\x10\x8f\x84\
-\x89\x86\x43\x0b\xec\x0f\x12\x89\x04\x9d\xd1\x84\x42\xa5\x16\xdd\
-\x98\x94\x2f\xab\xa2\x00\xa9\x64\x82\xf1\xfe\x73\x8c\xf6\x9e\x65\
-\xac\xaf\x07\xd7\xd8\x08\xee\xf1\xec\x11\xf0\xb8\x89\x47\xf3\xf7\
-\xe2\xd2\xe8\x0c\x98\x2b\xab\xb0\x57\xd7\x61\xaf\x6d\xa0\xb2\xa1\
-\x85\xda\xb6\x0e\x1a\xda\x6f\xa0\xb2\xa1\xf9\x8a\xe6\xe4\x52\x12\
-\x98\x71\x31\x72\xbe\x9b\xf1\xfe\x73\x4c\x8d\x0c\xe0\x1e\x1f\xc5\
-\x3d\x31\x8a\x6f\xda\x49\xc8\xef\x25\x16\x0e\xe5\x4c\x43\xa9\xd6\
-\xa0\x37\x5b\x30\x5a\x1d\xd8\x6b\xeb\x71\xd4\x36\x60\xaf\x6b\xa4\
-\xae\x6d\x03\x75\x6d\x1b\x70\xd4\x36\x88\x2e\x07\x88\xac\x00\x89\
-\x58\x94\x1f\x7e\xe9\xcf\x39\xf4\xdc\x93\xa4\x53\xc9\x92\xa4\x19\
-\x0d\x07\x89\x0e\x04\x99\x1c\xb8\xdc\xd3\x4b\xa5\xd5\x71\xc7\x83\
-\x0f\xf3\xd9\xbf\xfb\xa7\x92\xb7\x14\x42\x3a\xc5\x2f\x1e\xf9\x0a\
-\xfb\xff\xf0\x1f\xf8\xdd\xd3\x25\x29\x1b\x8f\x33\x8a\xc7\x39\xc1\
-\xd0\xd9\x53\x97\xfd\xae\xd1\x1b\xd9\xfd\xd0\xa7\xf8\xf4\xd7\x1f\
-\x5b\xd6\xb7\x60\xa5\x88\xda\x07\x78\xf5\x57\xff\xc6\x81\xa7\x7f\
-\x5d\xb2\xca\xcf\x45\x3c\x12\xe6\xd5\x5f\xfd\x94\xfd\x7f\xf8\x65\
-\xc9\xd3\x3e\xf7\xf2\xef\x79\xf6\xc7\xdf\x2b\x49\xe5\xe7\x43\x34\
-\x14\xe0\x85\x9f\xfd\x80\xbd\xbf\xff\xb9\xa8\xf9\x88\xaa\x00\xa5\
-\x72\xc8\x28\x94\x40\x71\xde\x34\xcb\xcb\x32\x3d\xbe\x26\xb2\x14\
-\xe1\xe9\x54\x10\xa2\xbe\x02\x76\x7e\xe8\x93\xbc\xf8\xf3\x1f\x2e\
-\x50\x04\x8d\xde\x38\xeb\x12\xd6\x4a\x55\xe3\x3a\xac\xd5\xb5\x68\
-\x0d\x26\x54\x1a\x2d\x2a\x8d\x16\x9d\xc9\x8c\x4a\xa3\x45\xae\x54\
-\x11\x8f\x84\x89\x47\x23\xc4\xc2\x21\x22\xa1\x00\x89\x68\x84\x48\
-\x30\x80\x6b\x6c\x98\xc9\xa1\xfe\xac\x1b\xd5\xd0\x05\x92\xf1\xd8\
-\x5c\xfa\xd6\xaa\x1a\xee\xf8\xc0\xc7\x4b\x2e\x4b\xc7\xbb\x3e\xcc\
-\xc9\xdf\xfc\x80\x90\xcf\xb3\xe0\xbc\xb5\xaa\x86\xea\xa6\x56\xaa\
-\x9a\x5a\x71\xd4\x35\xa2\x35\x9a\x50\x69\x34\xa8\x75\x06\x34\x3a\
-\x03\x2a\x8d\x06\x95\x56\x47\x32\x11\x27\x11\x8d\x12\xf2\x7b\x49\
-\x44\x23\xc4\x67\x65\x99\x99\x1c\xc3\x39\x2b\x8b\x6b\x7c\x64\x81\
-\x93\x87\xce\x68\xe6\x4e\x11\x64\x99\x8f\xa8\x0a\x50\xd5\xb4\x8e\
-\x7f\xda\x7b\x86\xee\x43\xfb\x30\x3b\x2a\xa9\x6a\x6e\xc3\x64\x73\
-\x94\x34\x8f\x8c\x20\x30\xe3\x1c\x67\x72\xb0\x9f\x8c\x20\xd0\xb6\
-\xf5\x1d\x68\x74\x86\x92\xcb\x62\xaa\x69\xe2\xff\xed\x39\x4d\xf7\
-\xa1\x7d\x48\xa4\xd2\x39\x05\x56\x69\x4b\x67\x46\x4e\x25\x13\x4c\
-\x8f\x0e\x31\x39\xd8\x4f\x2c\x14\x64\xe3\x8e\x9d\x58\x2a\xab\x4b\
-\x2e\xcb\x7c\x44\x1f\x05\xe8\xcd\x56\xb6\x3f\xf0\x41\xd1\xd2\x97\
-\x48\xa5\xd8\x6b\xea\xb1\xd7\xd4\x8b\x2d\x0a\x46\x9b\x83\x5b\xdf\
-\xfb\x11\xd1\xd2\x97\x2b\x94\xd4\xb4\xac\xa7\xa6\x65\xbd\xe8\xb2\
-\x5c\xa4\x3c\x11\x74\x9d\x53\x56\x80\xeb\x9c\xb2\x02\x5c\xe7\x94\
-\x15\xe0\x3a\xa7\xac\x00\xd7\x39\x6b\x6a\x0c\x0a\x7a\xdc\x04\x3c\
-\x6e\x42\x3e\xcf\x25\x63\x50\xd0\x4f\x46\xb8\xb4\xfc\x7f\xb1\x31\
-\x48\x6f\xb2\x62\xae\xac\x12\x65\xa8\xb7\x12\x32\x82\x40\xd0\x3b\
-\x43\xc8\xef\x25\xe4\xf3\x10\x8f\x64\xe7\x2f\x52\xf3\x66\x41\xa5\
-\x52\x29\x5a\x83\x09\x85\x4a\x85\xde\x6c\x45\x6f\xb6\x62\xb0\x58\
-\x4b\x36\x6d\xbd\xd8\x0e\x22\xcd\xc3\x2c\x22\xba\x02\x64\x04\x81\
-\x81\xae\xe3\x8c\x9c\x3f\xc3\x58\x6f\x0f\xa3\x7d\x67\x71\x8f\x8f\
-\xe2\x1a\x1b\x2e\xc8\x08\xb4\x18\x9d\xc9\x82\xbd\xa6\x6e\x81\x31\
-\xa8\xa1\xe3\x06\xea\xd7\x6f\x2c\x3a\xcd\x7c\xf0\x38\x27\x18\x39\
-\x77\x86\xd1\xd9\x35\x89\x53\x23\x83\xb8\xc7\x47\xf0\x38\x27\x0a\
-\x5d\xba\x05\x64\x87\xb1\x96\x8a\x2a\x1c\x75\x4d\xd8\x6b\xeb\xe7\
-\x8c\x41\x8d\x1d\x9b\xa9\x6a\x5a\x57\x50\x5a\xeb\xb7\x6e\xa7\xff\
-\xe4\xd1\x6c\xba\x12\x68\xed\x54\xe5\xbc\x47\x54\x05\xf0\xbb\xa7\
-\xf9\xc6\xc7\xee\x61\xbc\xff\x5c\xc9\xd3\x0e\xfb\xbd\x84\xfd\x5e\
-\x86\x7b\xba\xe0\xc5\xa7\xe7\xce\xb7\x6c\xde\xca\xdf\xfc\xf2\x05\
-\x74\x46\x73\x49\xf3\x4b\x44\x42\x7c\xf3\xe1\x07\xe9\x3e\xb4\xaf\
-\xa4\xe9\x66\x04\x01\x8f\x73\x02\x8f\x73\x82\xf3\xc7\x16\xfe\xd6\
-\xbe\xed\x36\xbe\xf2\xb3\xa7\xf2\x96\xe5\xe1\xff\xf9\x4d\x64\x32\
-\x39\x7d\x5d\x7f\x64\xe7\x83\xd3\xb4\x75\x2a\x73\xde\x23\x6a\x1f\
-\xe0\x95\x5f\xfd\x54\x94\xca\x5f\x8e\x81\xae\xe3\xec\xfd\xdd\x2f\
-\x4a\x9e\xee\x99\xe7\x9e\x28\x79\xe5\xe7\xe2\xfc\xb1\x83\xec\xf9\
-\xcd\xbf\xe7\x7d\xbd\x5a\xa7\xe7\x53\x5f\xff\x0e\x7f\xfe\xf8\xe7\
-\xb8\xfd\xfd\xf9\xad\xce\x12\x55\x01\xe4\x8a\xdc\x1a\xb8\x14\x4a\
-\xb5\x06\x9d\xc9\x52\xf4\xfd\x52\x69\xe9\xc5\xca\x94\x36\x4e\x41\
-\xde\x08\x79\x2e\x68\x2d\x16\x51\x5f\x01\x77\x7f\xec\x33\x1c\x7e\
-\xee\x49\x2e\x9c\x7e\x0b\x89\x44\x82\xb5\xba\x96\xaa\xc6\x75\x54\
-\x37\xb7\x51\xd5\xb4\x8e\xea\xa6\xd6\x45\xc6\x20\xcd\x82\xc0\x0a\
-\x00\xe9\x54\x8a\x58\x38\x48\x24\x14\xbc\xdc\x18\x34\xd8\xcf\xe4\
-\x60\x3f\x93\x43\xfd\x04\x3d\x6e\x00\x36\xdd\xba\x8b\xbb\x3e\xfa\
-\x27\x25\x97\x65\xd3\x7b\x3e\xc9\xf0\x6b\xbf\x67\xf0\xcc\x09\x00\
-\x14\x4a\x15\x15\x0d\xcd\xd4\xb4\xb4\x51\xd5\xb8\x8e\xaa\xe6\x56\
-\x1c\xb5\x8d\xe8\x4c\x26\x94\x6a\x2d\x6a\x9d\x1e\xad\xc1\x88\x4a\
-\xa3\x45\xa9\xd6\xcc\x79\x09\x85\x03\x7e\xe2\xd1\xc8\x9c\x2c\x33\
-\x93\x63\x97\x0c\x5b\xb3\xb2\x5c\x74\x28\xa9\x6f\xdf\x24\x8a\x2c\
-\xf3\x11\x55\x01\x0c\x16\x1b\xdf\x7e\xf6\x20\xae\xb1\x61\x4c\xf6\
-\x8a\xa2\xdc\xa0\x64\x72\x39\x3a\x93\x65\x81\x62\xb4\x6d\x79\xc7\
-\x65\xd7\x85\x03\x3e\x84\x74\x1a\x83\xc5\x26\x8a\x2c\x6a\x83\x99\
-\x47\x9f\x3d\xc8\xf4\xd8\x30\xd2\x59\xfb\x83\xa4\x80\x96\x46\xae\
-\x50\x22\x37\x29\x2f\x53\xf0\xa5\xf0\xb9\xa6\x88\x47\xc2\x54\xd4\
-\x37\x15\x94\x47\x31\xac\xca\x30\xd0\x51\xd7\x28\x7a\x1e\xa5\xee\
-\xf4\x2d\x85\x44\x2a\xa5\xb2\xa1\x59\xf4\x7c\xcc\x8e\x62\x82\x8d\
-\x65\x57\x08\xff\xcb\x5f\x7d\x96\x91\xde\xe3\xec\xfc\x40\x86\x87\
-\xbe\x68\xca\x79\x4f\x79\x22\xe8\x1a\xe2\x89\xbf\xff\x2a\x67\x0e\
-\xee\x25\xe0\x0e\xf0\x5f\x3f\x09\xd2\xf5\x46\x2c\xe7\x3d\x65\x05\
-\xb8\x86\x18\xef\x3f\xbf\xe0\xfb\xc4\x85\xdc\x1d\xc8\xb2\x02\x5c\
-\x53\x2c\x8c\x29\x39\xdf\xbd\xfe\x4a\x94\x15\xe0\x3a\xa7\xac\x00\
-\xd7\x39\xa5\x1f\x05\xe4\x11\xd9\x36\x11\x8b\xe2\x1a\x1b\xc6\x3d\
-\x3e\x4a\xc0\xe3\x22\xe4\xcb\x1a\x50\xb2\xc6\xa0\xc0\x02\x63\x90\
-\x5c\xa1\x40\xa5\xd5\xa1\xd6\xe9\xd1\x9b\x2c\xe8\xcd\x56\xcc\x15\
-\x55\xd8\x6b\xea\xb1\x55\xd7\x16\x3d\x59\x54\xb0\x58\xcb\xc8\x15\
-\xf2\x79\x70\x4f\x8c\xe2\x9d\x76\x5e\x32\x6c\x45\x23\x44\x96\x08\
-\x74\xa9\x33\x9a\x51\xa8\xd4\x59\xc3\x96\xd9\x8a\xd1\x6a\xc7\x5e\
-\xdb\x80\xa5\xa2\x6a\x55\xe4\x58\x4c\xc9\x15\x20\x25\x2c\x2c\x29\
-\xef\xd4\x24\xc7\x5e\x7e\x96\x91\xf3\xdd\x8c\xf5\x9e\x65\xb4\xaf\
-\xa7\x64\x6e\xdb\x12\xa9\x14\x5b\x55\xed\x02\x63\xd0\x96\xdd\xf7\
-\x61\x2c\xb1\xe3\x29\x40\x3a\x93\x21\x1a\x0e\xd2\x7d\x70\x1f\x23\
-\xe7\xce\x30\x72\xfe\x0c\xe3\xfd\xe7\x70\x0e\x0f\x10\x8f\xac\x28\
-\x5a\x2b\x90\x9d\x58\xb2\xd7\x35\x2c\x30\x06\x75\xee\xbe\x17\xad\
-\x21\xf7\x50\x6e\x25\x94\x5c\x01\x92\xf3\x14\x60\xac\xaf\x87\xaf\
-\x7d\x60\x27\xd1\x50\x49\xe3\x1b\xcf\x91\x11\x04\xdc\x13\xd9\x65\
-\x59\xa7\xf6\xbd\x0c\x80\xc1\x6a\xe7\xd1\x67\x0f\x96\x7c\xee\xc1\
-\x3f\x3d\xc1\x17\x1f\xba\x07\x8f\x33\x67\xf0\xcd\xe2\xca\x2d\x11\
-\x67\x72\xa0\x8f\xc9\x81\x3e\x8e\xbe\xf8\x0c\x00\x26\x9b\x83\x47\
-\x9e\x3e\x40\x45\x7d\x93\x28\x79\x82\x08\x7d\x80\x68\x52\xe0\xa2\
-\x0e\xbc\xfe\x9f\xbf\x12\xad\xf2\xaf\x44\xd0\xe3\xe6\xc0\x7f\xfe\
-\xba\xe4\xe9\x76\x3d\xff\x6b\xd1\x2a\xff\x4a\xf8\x67\x5c\xec\xff\
-\xc3\x7f\x88\x9a\x47\xc9\x5b\x00\x21\x03\x91\x84\x80\x5e\x25\xc5\
-\x5e\x9d\x5f\xb4\x50\x8d\xce\x80\x52\xa3\x41\xad\xd5\xa1\x35\x66\
-\x17\x86\x28\x54\x2a\xe2\x91\xc8\xec\xc2\x90\x4b\xb6\x80\x7c\x7c\
-\x08\xc4\x88\x52\x2a\x35\x58\xf3\xbe\x56\x26\x97\xa3\xd6\x19\xd0\
-\xea\x0d\x28\x67\x17\xbc\x2c\xb6\x05\xcc\x5f\xcc\xb2\x1c\x62\x4d\
-\x6d\x5f\x44\x94\xa9\xe0\x99\x68\x0a\xbd\x4a\xc9\x5d\x1f\xfb\x0c\
-\x83\xdd\xa7\x38\xf2\xc2\x53\x98\xec\x15\xd9\xc5\x14\xb3\xc1\xa2\
-\xab\x9a\x5a\xe7\x8c\x41\x12\x49\xfe\x41\xcb\xd3\xa9\x24\xae\xb1\
-\x91\x79\xc6\xa0\xbe\x39\x63\x8a\x90\x4e\xb3\xe3\xdd\x1f\x12\x65\
-\x35\x4d\xf3\xbb\x1e\x46\x31\x7a\x92\x53\x2f\x3f\x8d\x54\x26\xa3\
-\xaa\x69\x1d\x55\x4d\xad\x8b\x8c\x41\x0d\x68\x8d\xa6\xbc\x3a\xa6\
-\x19\x41\x20\x1c\xf0\xe1\x71\x4e\xcc\xc9\xe2\x1c\xba\xc0\xe4\x50\
-\x56\xa6\x78\x24\xc2\xcd\xef\x7a\x0f\x77\x7f\xec\x33\x62\x54\xd1\
-\x1c\xa2\x28\xc0\x74\x38\x4d\xa3\x39\x6b\x00\xf9\xdc\xb7\x7f\xc0\
-\xe7\xbe\x9d\x33\xd4\x70\xde\xc8\xe4\x8a\xd9\xc2\x5f\x07\xbb\xef\
-\x13\xb5\x70\xe6\x23\x91\xc9\xb9\xff\xab\xdf\xe7\x7f\x7c\xf7\xc7\
-\xa5\x49\x4f\x2a\x9d\x73\x0b\x6b\xe8\xb8\x61\xd5\xe4\x58\x8c\x28\
-\xf3\x00\x13\xc1\x14\x69\x41\xd4\x9d\x4e\xd6\x84\xf1\xa0\xb8\xb6\
-\xf9\xb5\x40\x14\x05\x48\x09\x19\x26\x43\xd7\x5e\x61\xf9\x62\x69\
-\x02\xf1\xab\x75\xbf\xaa\xe2\x10\x6d\x26\xb0\x77\xa6\x70\x07\xc9\
-\xb7\x03\xfd\x9e\x6b\x4b\x2e\xd1\x14\xc0\x1b\x4d\x33\x75\x0d\xb6\
-\x02\x23\xfe\x24\xd1\xe4\xb5\xf3\x7a\x13\xd5\x16\x70\x6a\x2a\x26\
-\xee\x9e\x67\x6b\x40\x5a\xc8\x70\x66\x3a\xbf\x21\xdc\xdb\x01\x71\
-\x23\x84\xc4\x05\xce\xb9\xe2\x6b\x2d\x63\xc9\x19\xf5\x27\x71\x5e\
-\x23\xad\x9b\xe8\x2e\x61\x3d\xee\x38\x0e\x9d\x0c\xbb\x36\x9b\x95\
-\x7b\x62\x14\xf7\xf8\xc8\x15\x8d\x41\xd1\x50\x70\x81\x01\x45\xa1\
-\x54\x65\x27\x89\x74\x7a\xf4\x26\x2b\x7a\xb3\x65\xce\x18\x64\xaf\
-\xa9\xa7\xb2\xa1\x59\x94\xb9\xff\xe5\xc8\x00\xc7\x27\xa3\xdc\xdd\
-\xa8\x21\xe2\x99\xc6\x35\x36\x84\x7b\x7c\x14\x9f\x7b\x7a\xd6\x18\
-\xe4\x21\xe4\xf7\xce\x79\xf4\x46\x82\x7e\x34\x7a\x63\x76\xbe\x43\
-\x22\x99\x1d\xfe\x5d\x32\x06\x39\x6a\x1b\xb0\xad\xb2\x71\xeb\x22\
-\xa2\x2b\x80\xf3\xe4\xeb\x7c\xef\xf1\xa7\x48\x8f\x9f\x63\xb2\xff\
-\x1c\xd1\x70\xb0\xe4\x79\x18\x6d\x0e\xea\xd7\x6f\xa4\xa1\xe3\x06\
-\xee\x78\xf0\xe1\x25\x9d\x46\x4b\x41\x70\x7c\x80\xf1\x43\xcf\xe3\
-\x1b\xe8\x26\x30\x72\x9e\x5f\x8c\xf4\x92\x4e\x96\xae\x85\x93\xc9\
-\xe5\x54\x36\xb4\x50\xdf\xbe\x89\x86\xf6\x4d\xdc\xf6\xbe\x87\xa8\
-\x6d\xed\x10\x45\x96\x8b\x88\xaa\x00\xd3\xa7\x0e\xb0\xef\xab\x1f\
-\x21\x93\x11\x77\xe8\x14\x98\x71\xd1\x7d\x68\x1f\xdd\x87\xf6\xf1\
-\xd2\x2f\x7e\xc4\xb7\x9e\xdc\x4b\x6b\x67\x69\x77\x35\xf1\x0f\xf5\
-\xf0\xca\x17\xef\x27\x15\x13\x6f\x67\xda\x74\x2a\xc5\xc4\x40\x2f\
-\x13\x03\xbd\x1c\x79\xe1\x29\x9e\xfe\xe1\xff\xe5\xef\x9e\xda\x47\
-\xd3\xc6\x9b\x44\xcb\x53\xd4\x3e\xc0\xe4\x5b\x7b\x44\xaf\xfc\xc5\
-\xa4\x53\x29\x4e\xee\x7b\xa9\xe4\xe9\x8e\x1d\x7c\x4e\xd4\xca\x5f\
-\x8a\x44\x2c\xca\x91\xe7\x9f\x12\x35\x8f\x9c\x2d\x80\x4c\xb1\x70\
-\x9e\x5e\x2a\xcf\xff\x1d\x65\x6b\xdf\xba\xec\xef\x26\x9b\x03\x6b\
-\x75\xdd\x9c\xd1\xe4\x92\x31\x48\x83\x42\xa5\x26\x16\x0e\x91\x88\
-\x45\xb3\x51\xc2\x82\x7e\xe2\xd1\x28\xd1\x50\x80\xe9\xd1\xe1\x65\
-\xad\x8c\xeb\xb7\xee\x28\x79\x41\x99\x1a\x72\x37\xc5\x3a\xb3\x15\
-\xbd\xd1\x84\x5a\x67\xc8\x2e\x74\xd1\x6a\xd1\x1a\x4c\xc8\x15\x0a\
-\x84\x74\x7a\x4e\x86\x78\x34\x42\x24\xe0\x23\x16\x09\x13\xf0\xb8\
-\x17\x38\xc0\x2c\xa6\xa6\xb5\xbd\xe4\xb2\xcc\x27\xa7\x02\x34\x75\
-\xea\x91\xca\x24\x08\xe9\xec\x80\xae\x7a\xdb\xdd\x79\x27\x5e\x77\
-\xfb\x7b\xb9\xe5\x2f\xbf\xcb\xe8\xeb\xcf\xa2\xb6\x38\xd0\xd7\xb4\
-\x60\xa8\x6d\x41\x5f\xd3\x4c\x7b\x47\x3b\xdb\x5b\x2b\x50\xc9\x8a\
-\xdb\xbe\xd8\x3f\xe3\xc2\x39\xd8\x37\xb7\x32\xc8\x39\xd8\x8f\x20\
-\x08\xec\x78\xf7\x87\xb8\xf1\xce\x77\x96\xbc\xa0\xea\xee\x78\x2f\
-\x37\x7d\xf6\x1b\x8c\x1f\x7c\x0e\x90\xcc\xca\xd1\x82\xa1\xa6\x05\
-\x7d\x6d\x0b\x86\x9a\x66\xd4\x3a\x03\x37\x55\xa9\x68\x34\x2b\xf3\
-\xde\x92\x35\x99\x88\x33\x35\x3c\xc0\xe4\x60\xff\x5c\xb8\xb8\xc9\
-\xc1\x3e\xa2\xa1\x20\xef\xb8\xef\x41\xee\x78\xf0\xe1\x92\xcb\x32\
-\x9f\x9c\x0a\x50\xd1\xac\xe6\x13\x8f\x36\xd3\xb5\xbf\x1d\x79\xe3\
-\x5d\xac\x7b\xe0\xd3\x05\x65\xd0\x72\xff\xa7\x68\xb9\xff\x53\x97\
-\x9d\x77\xa5\xe1\xc5\xbe\x10\xad\x56\x25\x6d\x36\x25\x8a\x02\x15\
-\xc1\x64\x73\x60\xb2\x39\x68\xdf\x76\x9b\xa8\x05\x34\x9f\x8e\x0f\
-\x7f\x9e\x8e\x0f\x7f\xfe\x8a\xbf\xa7\x84\x0c\x6f\x4d\xc4\x18\xf4\
-\x25\xd9\xec\x50\x61\xd7\xe5\xee\x62\x29\x94\xaa\x39\x2f\xa0\xb5\
-\x20\xaf\x4e\x60\xc3\x8d\x3a\x2a\x3a\xff\x1b\xe3\xa9\x5b\x4b\x9a\
-\x79\x52\xc8\xd0\xe3\x8e\xd3\xeb\x49\x50\x67\x94\xd3\x60\x52\x62\
-\xd3\x4a\x91\x15\x60\x1e\xbe\x1a\xf1\x44\xd2\xec\x1b\x8e\x60\xd1\
-\xc8\x58\x67\x51\x50\x6d\x50\xa0\x2c\xb2\xa5\x13\x9b\xab\x22\x5c\
-\x7c\x5a\xc8\x30\xec\x4b\x32\xec\x4b\x22\x97\x4a\xb0\x69\xa5\x98\
-\x55\x32\xf4\x2a\x29\x6a\xb9\x14\x95\x4c\x92\xfd\x94\x83\xf4\x6d\
-\xa4\x1c\xde\x68\x9a\x63\xd1\x34\x52\x49\x0c\x9b\x36\x3b\x17\x62\
-\x56\xcb\xd0\x2b\xa5\x68\x15\x12\xe4\xd2\xb5\x97\xe5\xaa\x50\x80\
-\xf9\xa4\x84\x0c\x53\xa1\x34\x53\xa1\xa5\x97\x63\x2b\xa4\x12\x54\
-\x0a\x09\x2a\x99\x14\x9d\x42\x82\x49\x25\xc3\xa8\x96\x62\x54\xc9\
-\xd0\x2a\xd6\xbe\x40\x97\x42\xc8\x80\x2b\x9c\xc6\x15\x5e\x28\x93\
-\x5c\x2a\x41\x25\x97\xa0\x96\x49\xd1\x29\x25\x18\x54\x52\x74\x0a\
-\x29\xa6\x59\x25\x59\x0d\xfd\xc8\x5b\x01\x52\xf1\x38\x88\x1f\x8a\
-\x3f\x27\x49\x21\x43\x32\x9e\x21\x84\x40\x36\x02\xf1\xa5\x18\x3c\
-\x0a\xa9\x04\xa3\x5a\x86\x43\x2b\xc5\xa1\x53\x60\xd7\x4a\xaf\xea\
-\x16\x23\x25\x64\x48\x25\x32\x84\x11\x98\x89\x2e\xfc\x4d\x2a\x91\
-\x60\x52\x4b\xb1\xa8\xa5\x38\xb4\x72\xec\x3a\x39\x6a\x79\xe9\x65\
-\xc9\xa9\x00\x42\x2a\xc3\x53\x7f\x3f\xc2\xf9\x83\x1f\x45\x5f\xd5\
-\xc8\x9d\xdf\x78\x02\x63\x83\xb8\x43\x93\x62\x49\x0a\x19\x66\x22\
-\x29\x66\x22\x70\xce\x9d\x40\x2a\x91\x60\x9f\x55\x86\x2a\xbd\x0c\
-\xb3\xfa\x2a\xd0\xe0\x3c\x11\x32\x19\xbc\xd1\x34\xde\x68\x9a\x01\
-\x6f\x56\xc9\x0d\x4a\x29\x15\x7a\x39\x15\x3a\x39\x76\xad\xac\x24\
-\xfd\x8a\x9c\x0a\xd0\xf3\xba\x9f\xf3\x6f\x64\xc7\xdc\xa1\xc9\x21\
-\xba\x7e\xfe\x28\xb7\x7f\xfd\x67\x6b\x5d\x3e\x79\x21\x64\x32\x4c\
-\x87\xd3\x4c\x87\xd3\x74\x4f\x83\x41\x25\xa5\xde\xa8\x40\x9d\x7c\
-\x7b\x3a\x75\x04\x13\x02\x41\x4f\x82\x0b\x9e\x04\x12\x09\x98\x55\
-\x32\x1c\x7a\x19\x95\xb3\xad\x5d\x31\xe4\x54\x80\x80\x6b\xe1\x66\
-\x0f\xe1\xe9\xd1\xb5\x2e\x87\xa2\x09\xc6\x05\xce\xba\xe2\x84\x9d\
-\xab\x3b\xa3\x27\x06\x99\x0c\x78\x63\x69\xbc\xb1\x34\xbd\xee\x04\
-\x72\xa9\x84\x70\xa2\x70\xc5\xbe\x2e\xd7\x06\x5e\x6b\x3e\x0a\x30\
-\xdb\x9f\x28\xc2\x0f\xf3\xba\x54\x80\x32\x97\x28\x2b\xc0\x75\xce\
-\x9a\xcc\x03\xc4\x7c\x6e\x42\x13\x03\xc4\xfd\x6e\x12\x41\x1f\xf1\
-\xa0\x97\x44\xd0\x47\x22\xe0\x59\xf2\x7a\xa9\x5c\x81\xd2\x60\x41\
-\x69\xb4\xa2\x32\x5a\x50\x1a\xac\x68\xac\x95\xe8\x6b\x9a\x91\xab\
-\xf3\x8b\x87\x27\x16\xe9\x78\x94\xe0\xc4\x20\x31\xcf\x14\xf1\xc0\
-\x0c\x71\xbf\x27\xfb\x19\xf0\x80\x20\x90\x4e\xc4\x48\x27\x2e\xb9\
-\x90\xc9\x94\x1a\x94\x06\x73\xf6\xd0\x67\x3f\x55\x26\x1b\xfa\x9a\
-\x16\x74\x8e\x5a\x24\xb2\xd5\xad\x12\x51\x73\x4b\x86\xfd\xb8\x7b\
-\x8e\xe1\xe9\x3d\x41\x60\xb4\x8f\xd0\xf8\x00\xc1\x89\x01\x92\xe1\
-\xd2\xad\x17\xd4\x56\xd4\x61\xa8\x5d\x87\xb1\xae\x15\x63\xc3\x7a\
-\xac\xed\x5b\xb1\xb4\xdc\x50\xf2\x82\xcc\x08\x69\xfc\x43\xe7\x98\
-\x39\x77\x8c\xc0\x68\x2f\x81\xd1\x3e\x82\x63\xfd\x84\xa7\xc7\x96\
-\x5f\x3b\x5e\x00\x52\xb9\x12\x5d\x65\x3d\xfa\x9a\x66\x8c\xf5\x6d\
-\x58\xdb\x3a\xb1\x6d\xb8\x05\x5d\xa5\x78\xbb\xa1\x94\xb4\x94\x42\
-\x93\x43\xb8\xba\x0e\xe1\x3e\x7b\x04\x77\xcf\x31\x82\xa3\x7d\xa2\
-\xfb\x03\x44\xa6\xc7\x88\x4c\x8f\x31\x75\xe2\x52\x14\x4f\xb9\x5a\
-\x8b\xb5\x7d\x2b\x8e\x4d\xdb\xb1\x6f\xdc\x8e\x63\xf3\xad\xc8\x94\
-\xea\x82\xd2\x15\x52\x09\xdc\x67\x8f\xe2\x3a\x73\x98\x99\x9e\x37\
-\x71\x9f\x3d\x4a\x32\x52\x7a\x6f\xa6\xc5\x79\x06\xc7\x2f\x10\x1c\
-\xbf\xc0\xe4\xd1\x57\xe6\xce\xab\x2d\x15\xd8\x3a\xb6\x61\xdf\x78\
-\x0b\x15\x37\xde\x8e\xa5\xf5\x46\x24\xf9\x44\x82\xce\x83\x15\x29\
-\x40\xcc\x3b\x8d\xeb\xcc\x61\xa6\x4e\xec\xc3\x79\x62\x2f\x61\xe7\
-\x88\xa8\x05\x94\x2f\xa9\x58\x84\xe9\x53\x07\x98\x3e\x75\x00\x00\
-\x99\x52\x4d\xe5\x96\x9d\xd4\x6c\xbf\x8f\xda\x1d\xf7\x5f\xf1\xbe\
-\x74\x3c\xca\xd4\xc9\xfd\x8c\xbe\xfe\x0c\xe3\x87\x5f\x24\x19\xf6\
-\xaf\xb5\x28\x40\xb6\x9c\xc7\x0f\x3d\xcf\xf8\xa1\xe7\x01\x90\x6b\
-\x74\xd8\x3a\xb6\x51\xb9\x65\x27\x55\x9d\xbb\xb0\xb4\x15\xef\x31\
-\x54\xb0\x02\xc4\xbd\x2e\x8e\x3d\xfe\x57\x4c\x9f\x3e\x40\x70\x7c\
-\x60\x45\x82\x49\x15\x2a\x14\x1a\x03\x0a\x8d\x11\xb9\xc6\x80\x42\
-\x6b\x40\xa6\x5c\xf8\x4e\x17\x52\x09\xd2\xc9\x18\xe9\x78\x84\x78\
-\xc0\x4d\x22\x38\x53\xb0\x1f\x5e\x3a\x11\x63\xe2\xc8\x4b\x4c\x1c\
-\x79\x89\xb7\xfe\xf9\x4b\x98\x5b\x36\x5d\x76\xcd\x91\x7f\xfc\x3c\
-\x9e\xde\x13\x08\x45\x44\xfc\x06\x90\x48\x65\x28\xf5\x56\x94\x7a\
-\x0b\x2a\xa3\x03\xb9\x3a\xbb\x9b\x98\x54\xae\x9c\x6b\x7d\x32\x82\
-\x40\x32\x1a\x24\x15\x0d\x90\x8c\x04\x48\x46\xfc\x24\xc2\x3e\xd2\
-\xf1\xc2\xe6\x25\x52\xd1\x30\x53\x27\xf6\x31\x75\x62\x1f\xa7\xf9\
-\x16\xba\xaa\x06\x2a\x3b\x77\x11\xf7\x17\xbe\x4f\x63\xc1\x0a\x10\
-\x71\x4f\x70\xe1\x85\xc2\x76\xb3\x54\x9b\x2b\x31\x35\x6e\x46\xe7\
-\x68\x40\x6b\x6f\x40\x3b\xfb\xa9\x36\x55\x64\xe3\x9a\x17\x48\x2a\
-\x1e\x26\xee\x77\x11\x9d\x19\x23\x38\xd1\x47\xc8\x79\x81\x90\xb3\
-\x9f\x90\xf3\xc2\x82\x0e\xd7\x52\x64\x84\x34\xde\xfe\xd3\x97\x9d\
-\x77\x77\x1f\xc9\x4f\x16\x4b\x35\xfa\xca\x16\x0c\x35\x6d\xe8\x2a\
-\x5b\x30\x54\xb7\xa2\xb1\xd5\xa1\xd4\xe7\x8e\x00\x7a\x25\x12\x21\
-\x2f\x11\xd7\x30\xe1\xe9\x61\xc2\xae\x61\x22\xae\x61\x7c\xc3\x5d\
-\xc4\xbc\x93\x79\xdd\x1f\x76\x8e\x30\xf0\xc7\xe2\x02\x64\x97\xbc\
-\x13\x28\x91\xca\x30\x35\x6c\xc2\xdc\x74\x13\xe6\xe6\x4e\xcc\x4d\
-\x37\xa1\x36\x17\x17\xf9\xf2\x8a\x0f\xad\xd2\x21\xaf\xd0\xa1\xab\
-\x68\xc2\xbe\xe1\x8e\xb9\xf3\x99\x8c\x40\x68\xb2\x1f\x4f\xdf\x51\
-\x3c\x7d\x6f\xe2\x19\x38\x4e\x32\xec\x5b\x51\x5e\xfa\xca\x16\x2c\
-\xad\xdb\xb0\xce\x1e\x2a\x63\xe9\x5d\xd0\x95\x7a\x0b\x4a\xbd\x05\
-\x73\x73\xe7\x82\xf3\x71\xff\x34\xde\xc1\x93\xf8\x06\x4f\xe2\x1b\
-\x3a\x85\x7f\xa4\x9b\x8c\x90\x7f\xd0\xea\x44\x52\x46\x24\x76\x69\
-\x33\x8a\x78\xe2\xf2\xb5\x0c\x25\x51\x00\x7d\x55\x2b\xb6\xf6\xed\
-\xd8\xd6\xef\xc0\xda\x76\x0b\x72\x55\xe9\x36\x53\x2c\x04\x89\x44\
-\x8a\xa1\x66\x3d\x86\x9a\xf5\x34\xee\xfa\x64\x56\x21\x26\xfa\x98\
-\xee\xde\x87\xf3\xc4\x8b\x04\x27\x7a\x73\xa7\x21\x93\x63\x5b\xbf\
-\x83\xaa\xce\x7b\xa9\xd8\xb4\x13\xa5\x41\xdc\x00\x0d\xcb\xa1\x32\
-\x55\x50\xd5\x79\x2f\x55\x9d\xf7\x02\xd9\x96\xcf\xd3\x77\x94\x99\
-\xde\xc3\xcc\x9c\x3f\x42\xc8\xd9\xbf\xec\xfd\xbe\xb0\x8a\x51\xb7\
-\x7e\xee\xfb\xf4\x12\x83\xaf\xa2\x14\x40\x6d\xaa\xc0\xd6\x7e\x2b\
-\xb6\xf5\xdb\xb1\xb5\xef\x28\xd9\xbf\x22\x19\x59\x7a\x78\x28\x95\
-\xc9\x91\xa9\x0a\x1f\xef\x4b\x24\x52\x0c\xb5\xed\x18\x6a\xdb\x59\
-\x77\xef\xe7\x08\x4f\x0f\xe1\x3c\xf1\x22\x93\xc7\xff\x78\x59\xe1\
-\xd9\xd6\x6f\xa7\xfa\xe6\x77\x53\x79\xe3\x3b\x51\x68\x57\x1e\x98\
-\x29\x15\x0b\x91\x11\x04\x32\xe9\x14\xa9\xc4\xa5\x77\xbc\x4c\xa1\
-\x42\xa1\x35\x15\xe4\x5c\x7b\x11\xb9\x4a\x47\xc5\x0d\xbb\xa9\xb8\
-\x61\x37\x00\xf1\x80\x8b\x99\xf3\x87\x99\xe9\x3d\xc2\xcc\xf9\x43\
-\xc4\xfc\x85\x6f\x6c\x5d\xb0\x02\x18\x6b\x3b\xb8\xed\x4b\xbf\x2b\
-\xec\xa6\x4c\x86\x98\xcf\x49\xd8\x35\x92\x7d\xd7\xb9\x86\x89\xb8\
-\x46\x48\x04\x3d\x24\x22\x7e\x92\xb3\xc7\x72\xe3\x69\xa9\x5c\x89\
-\x42\x67\x46\xa9\x33\xa3\xd0\x99\x51\x19\xed\xe8\x1c\x0d\xe8\x2a\
-\x9a\xd1\x55\x36\xa3\x73\x34\xe6\x54\x12\x5d\x45\x13\xeb\xee\xfb\
-\x33\xaa\xb7\xbd\x87\xfd\xff\xe7\x81\x05\xbf\x6d\x7a\xf8\x1b\x68\
-\x6d\xf9\x85\x96\x49\x27\xe3\x84\xa7\x07\x09\x4f\x0f\x11\x76\x0e\
-\x10\x76\x0d\x13\x0f\xb8\x49\x86\xbd\x24\x42\x3e\x12\x61\x2f\x99\
-\xf4\xf2\x4b\xc7\x64\x4a\x35\x0a\xad\x09\x85\xd6\x88\x52\x6f\x45\
-\x6b\xaf\x5f\xd0\x3f\xd2\x3a\x1a\x90\x29\x96\xdf\xf2\x45\x65\x74\
-\x50\x73\xcb\xfb\xa8\xb9\xe5\x7d\x00\x1c\x7c\xec\x21\x02\xe3\x85\
-\x6d\xd0\x51\x78\x0b\x90\x47\xf8\xf2\x44\xd8\x8b\x6f\xf0\x14\xbe\
-\xa1\x53\xf8\x06\x4e\xe0\x1f\xed\xce\xd9\x39\xcb\x85\x90\x4a\x10\
-\xf7\x4f\x13\x5f\x46\xcb\xd5\x96\x6a\xcc\x8d\x9b\xb1\xb4\x6c\xc1\
-\xdc\xdc\x89\xb1\x6e\xc3\x8a\xc7\xcb\x19\x41\x20\x34\xd9\x87\x77\
-\xe0\x78\xf6\x7d\x3c\x74\x8a\xa8\x67\x62\xc5\x93\x3f\x17\x67\x08\
-\x63\xbe\x29\x00\x66\x7a\x17\x76\x42\x25\x52\x29\xfa\xaa\x56\xcc\
-\xcd\x37\x65\xfb\x53\x4d\x37\xa1\x73\x34\x2e\xdf\x69\x2e\x22\xb4\
-\x7c\x49\xfa\x00\xf1\x80\x3b\xdb\xe9\xea\x3b\x8a\xe7\xc2\x31\xc2\
-\xd3\x43\xa5\x48\xb6\x60\x62\xde\x49\x9c\xde\x49\x9c\x27\xb3\x0b\
-\x43\x64\x4a\x0d\xa6\xc6\xcd\x38\x36\xdc\x41\xe5\x8d\x77\xa3\x75\
-\xe4\x17\x3a\x2e\xea\x99\x60\xba\xeb\x35\x5c\x3d\x07\xf0\x0d\x9e\
-\x24\x15\x0b\xad\xba\x2c\x19\x41\x20\x38\xd1\x4b\x70\xa2\x97\xd1\
-\x37\xb2\x2d\xae\x42\x67\xc6\xda\xba\x0d\xdb\xfa\x1d\xd8\x3b\x6e\
-\x45\x6b\x6f\x58\x71\x3e\x45\x29\x40\x32\xec\xc3\xd3\x7f\x8c\x99\
-\xbe\x37\xf1\xf4\xbd\x49\xc8\x79\x61\xd5\x0b\x28\x1f\xd2\x89\xe8\
-\xac\x62\xbe\xc9\xf9\x67\xbe\x8b\xbe\x6a\x1d\x15\x37\xec\xc6\x58\
-\x77\xb9\x0b\x76\x68\xb2\x9f\xc9\x63\xcf\x31\x75\xfa\x55\x02\x63\
-\x3d\x6b\xfd\xe8\x4b\x92\x0c\xfb\x98\x3a\xf5\x0a\x53\xa7\xb2\xb3\
-\x84\x1a\x6b\x4d\xb6\x2f\xd6\xbe\x03\x5b\xdb\xf6\xa2\xd2\x2c\x58\
-\x01\x82\xe3\xe7\xd9\xf3\xb5\x5d\x45\x4f\xf1\x5a\x55\x4a\xda\x2d\
-\x7a\xd6\x19\x75\x54\x68\x54\x54\x6a\xd4\x38\x34\x4a\x6c\x6a\x25\
-\x36\xb5\x6a\x81\x23\xa4\x5c\x22\xe1\xad\xfa\x00\xfb\xab\xbc\xc4\
-\xc3\x69\x12\x11\x81\x58\x38\x8d\x7f\x2a\x89\xcf\x99\xc0\xef\x4c\
-\xe0\x73\x26\x48\x44\xf3\x7b\x96\xec\x7c\xc1\xd2\xca\x7a\xfc\x5f\
-\xbf\x50\x90\x1c\x52\xb9\x04\x7b\xbd\x0a\x5b\xbd\x0a\x83\x4d\x81\
-\xde\x2a\x47\x67\x95\xa3\xb7\x28\xd0\xdb\xe4\x28\x54\x97\x9a\x63\
-\xa5\x56\x8a\x54\x26\x21\x19\x13\x88\x85\xd2\x73\x47\x3c\x2c\x10\
-\xf2\xa6\xf0\x4e\xc4\xf1\x8e\x27\xf0\x8c\xc7\x09\xb8\x93\x79\x3b\
-\x2c\x44\x3d\x13\x8c\x1d\x7a\x92\xb1\x43\x4f\x22\x91\x48\x8b\x9a\
-\x53\x29\x58\x01\x0a\x19\x87\x5e\x64\x57\x8d\x9d\xaf\x6d\x6d\x67\
-\x83\xc5\x80\x43\x93\x7b\x2f\xbb\xf9\x04\xeb\x32\x8c\x6e\x4e\x2e\
-\x7b\x4d\x68\x26\xc9\x64\x5f\x94\xc9\xde\x28\xce\xbe\x28\x93\x7d\
-\x51\xc2\xde\xd2\xad\xdf\x97\xca\x25\xd4\x76\x68\xa9\xdb\xa8\xa5\
-\xa2\x45\x8d\xa3\x49\x8d\xbd\x5e\x85\xb4\x40\x27\x4d\xb5\x5e\x86\
-\xc1\xbe\xfc\x26\x91\xa9\x44\x86\x99\xd1\x38\x13\xe7\x22\x8c\x9d\
-\x8d\x30\x76\x36\x8c\x77\x22\xf7\xec\x64\x26\x23\x14\xe5\xe9\x52\
-\xd2\x89\x20\x6b\x9d\x8a\x96\xad\x7a\xc6\x7a\x22\x38\xfb\x2e\xb9\
-\xb9\xb6\x9a\xf4\xec\xac\xb1\x2f\x7f\xb3\x52\x45\xc6\x68\x42\xa2\
-\xd6\x80\x4c\x01\x32\x19\xc8\x65\x54\x2a\xc7\x00\xcf\xb2\xb7\xea\
-\x6d\x0a\xda\x6c\x0a\xda\x76\x18\xe7\xce\xcd\x8c\xc6\x19\x38\x16\
-\x64\xe0\xad\x10\x23\xa7\xc3\x24\x0b\x09\xee\x24\x81\xca\x75\x1a\
-\x9a\x3a\x75\x34\x75\xea\xa9\xbf\x41\x87\x52\xb3\x3a\xae\x13\x72\
-\xa5\x84\xca\x75\x6a\x2a\xd7\xa9\xd9\xf2\x9e\x6c\x70\xca\xb0\x2f\
-\xc5\xf8\xd9\x08\x43\x27\x43\x0c\x9d\x08\xe1\x1e\xc9\x6f\x2a\x3c\
-\x9f\x06\x21\xa7\x02\x98\x2a\xae\xac\xb1\x1a\x83\x8c\xa6\x2d\x7a\
-\x9a\xb7\xea\x69\xbe\xd9\x30\x77\xed\x53\x8f\x8c\x2c\x50\x80\xe5\
-\x9f\x52\x0a\x0d\x2d\xe0\xa8\x46\xb2\x84\x23\xbc\x3a\xe6\x2d\xaa\
-\x20\x6d\xb3\xcd\xf3\x2d\x1f\xb4\x93\x4e\x66\x18\x3e\x15\xa2\x7b\
-\xaf\x9f\xf3\x07\xfc\x57\x7c\x65\x54\xb4\xa8\xd9\x74\x97\x99\x4d\
-\xbb\xcd\x18\x2b\x4a\xb3\x9d\x6b\x29\xd0\x99\xe5\xac\xbf\xcd\xc8\
-\xfa\xdb\xb2\x0a\x1e\x74\x27\x19\x3a\x11\x62\xf0\x44\x56\x21\x42\
-\x9e\xa5\x5b\x3b\x53\x65\xee\xb9\x86\x9c\x0a\xd0\x71\x87\x89\xb6\
-\x1d\x7e\xfa\x0e\x07\x90\xca\x25\xd4\x6d\xd4\x66\x2b\x7c\xab\x9e\
-\xea\x36\xcd\x92\x95\x96\x37\x12\x09\xb4\x6f\x02\xe3\xd2\xf3\xe8\
-\xcf\x9d\xea\xe6\x99\xae\xa3\x04\x6e\xf7\xb3\x61\x67\xf1\x93\x33\
-\x32\x85\x84\x96\x6d\x06\x5a\xb6\x19\x78\xe0\x0b\x35\xf4\x1e\x0a\
-\xd0\xfd\x9a\x9f\xb1\xee\x30\x3a\x8b\x9c\xf6\xdb\x4d\x6c\xba\xdb\
-\x8c\xbd\xa1\xb0\xd7\xd3\x5a\x61\xb0\x2b\xd8\x7c\x8f\x85\xcd\xf7\
-\x64\xcb\xcd\x35\x14\xcb\x2a\xc3\xf1\x10\x23\x5d\x61\x12\x31\x81\
-\x0d\x77\x9a\x68\xdb\x91\x7b\x7f\xe5\x9c\x0a\x20\x95\x4b\x78\xe8\
-\x9b\x8d\x44\x03\x69\x64\x0a\x49\x69\x9b\xc2\xca\x9a\x2b\x56\xfe\
-\x0b\xa7\x7b\xf8\xf0\xf7\xff\x2d\xfb\x65\x2f\x08\xe9\x7a\x36\xdd\
-\x65\x5e\x71\x96\x72\x95\x94\x8d\xbb\xcd\x6c\xdc\xbd\xf2\xb4\xae\
-\x16\x1c\x4d\xd9\x7e\xc9\x3b\x3e\x68\x47\x48\x65\x48\x26\x32\xa8\
-\xf2\x74\x13\xcf\xbb\x36\x35\x46\x59\xe9\xdf\x83\x95\xb5\x57\xfc\
-\xe9\xa5\x33\x0b\x67\xb4\x2e\x1c\x15\xd7\x19\xe3\x5a\x41\x2a\x97\
-\xe4\x5d\xf9\xb0\x96\x4e\xa1\x4a\x15\xa8\xae\xec\xa5\x93\x58\xb4\
-\x65\x6a\xfa\x1a\x8a\xcd\x77\x35\x71\xd9\x2b\x60\x2a\xdf\xce\xdb\
-\x32\xe4\x35\x04\x2b\xd0\x67\x2f\xe0\x4a\xd2\xb3\x7f\xa1\x87\x8e\
-\x5c\x21\xc1\xe8\x50\x50\xd1\xa2\x5e\x59\x5f\xa4\x08\x32\x42\x86\
-\xa9\x81\x18\x41\x57\x92\xd4\xdb\x44\x39\x5d\x43\x97\x4f\xc7\x5f\
-\x56\x0b\x7b\x7e\xea\x5c\x9d\xa7\xc9\x33\x5e\xfe\x45\xc6\x7b\x22\
-\x3c\xf5\xc8\xd2\x2e\x67\x1a\x83\x8c\x1b\xef\xb3\x70\xeb\x47\x1d\
-\x68\x4d\xe2\x7a\xd5\x46\xfc\x29\x0e\xfd\xc6\xc5\xe9\x97\xbc\x44\
-\x83\x6b\xb3\xa1\x74\x29\x91\x93\x9d\x3e\x58\xfd\x25\xb4\x42\x1a\
-\x7c\x5e\x30\x17\xef\x49\x73\x91\x68\x30\xcd\x91\xdf\xbb\xe9\x7a\
-\xd9\xc7\x83\x5f\xae\xa7\xf9\x66\xfd\x8a\xd3\x5c\x8a\x81\x63\x41\
-\x9e\x79\x6c\x8c\x88\xff\xda\x08\x12\x09\x64\xa4\x40\xd7\x9a\x65\
-\x3f\x31\x5c\x32\x97\x6a\xc8\xfe\x3b\x7f\xfb\xbf\x87\x44\xe9\x30\
-\xf6\xbf\x19\xe4\xb7\x7f\x3b\x7c\x2d\x55\x3e\xc0\x69\x39\xf0\x69\
-\xe0\xfb\xc0\x26\x4a\xd7\x12\xe8\x80\xdc\xb3\x10\xa1\x00\x38\xc7\
-\x21\xbf\xad\x65\x12\xc0\xe2\xed\xb9\xd4\xc0\x82\x2d\xc9\xd3\xa9\
-\x0c\x4f\x3f\x3a\xca\xe7\x7e\xdc\x86\xde\x56\x9a\xc9\x9c\xa0\x3b\
-\xc9\x33\xdf\x19\x45\x48\x2d\xa9\xac\x51\xe0\xed\x16\x3c\x38\x03\
-\x9c\x01\xbe\x20\x07\x4e\x01\x3b\x4b\x9c\xc1\x6f\x81\x87\xf2\xba\
-\x72\x7c\x08\x0c\x46\xd0\x1b\x73\x5d\xf9\x34\xf0\xd1\x45\xe7\x24\
-\xc0\xed\xc0\x3f\x00\x73\xb1\xe1\x62\xa1\x34\xaf\x3f\x31\xcd\x03\
-\x7f\x59\x9b\x2b\xcd\xbc\x78\xfd\x89\x69\x62\x97\x47\x2c\x39\x08\
-\x7c\x69\xf6\xf3\xed\xd1\x0b\x5c\x82\xb5\x5f\x1b\x28\x08\xd0\xdb\
-\x0d\xc5\x05\x61\xcc\x00\x07\x80\x5d\xc0\xfe\xf9\x3f\x9c\xd9\xe3\
-\x23\x19\x5b\xf9\xa2\x94\x64\x4c\xa0\x7b\x8f\x6f\xf1\xe9\xbd\xc0\
-\x5d\xc0\x1b\xbc\x8d\x2b\x1f\xae\x96\x18\x41\xa9\x24\x9c\xeb\x82\
-\xf6\xcd\xa0\x29\x6a\xad\x5f\x02\xf8\x0b\x60\xce\xdf\x3b\x19\x13\
-\x78\xfc\xe3\x3d\x2b\x1e\x1e\x66\x84\xcc\x52\x86\xa4\xbf\x98\xcd\
-\xf3\x6d\xcf\xd5\xa1\x00\x00\x89\x38\xf4\x9c\x84\x75\x1b\xc0\x54\
-\xd4\xc8\xa0\x0b\x18\x01\xe6\xdc\x64\xe2\x11\x51\x96\xa5\x0d\x01\
-\xdd\x6b\x50\x42\xa2\xb0\x66\xaf\x80\x83\xce\x19\xde\xfb\xfc\x21\
-\xde\xf7\xfc\x21\x0e\x3a\x67\x57\xb4\xa4\x52\xd0\x7b\x06\x06\x7b\
-\x8b\x1d\x1d\xe4\xf6\xfb\x5e\x39\xfd\x2b\x4f\xe2\xea\x61\xd5\x5b\
-\x00\x21\x93\xe1\x1f\x4e\xf6\xf1\xad\xb7\xce\xcd\x45\xb4\x78\x6d\
-\xc2\xc5\xdf\xdc\xdc\xc1\x5f\x77\xb6\x65\x35\xd2\xe5\x04\xaf\xbb\
-\x98\xe4\xbf\x07\xdc\x09\x88\x65\xd6\x8b\x01\xdf\x5d\xed\x32\x13\
-\x93\x55\x55\x00\x77\x2c\xce\x9f\xee\x39\xce\xcb\x63\x0b\x3d\x7b\
-\x53\x42\x86\xbf\x3d\xda\xc3\x81\xc9\x19\x7e\x76\xf7\x56\xec\x6a\
-\x15\xa4\x8b\x9a\x65\x7b\x1e\x68\x05\xb6\x01\xa5\x36\xe8\x27\x81\
-\xa3\xc0\xf8\x6a\x96\x99\xd8\xac\x9a\x02\x1c\x98\x9c\xe1\xd3\x7b\
-\x8e\x31\x11\xbe\xf2\x90\xf9\xe5\xb1\x69\xb6\xfe\xee\x35\xfe\xfd\
-\xee\x9b\x57\x92\xd5\xd8\xec\x51\x66\x0d\xf9\x2d\xd9\xe1\x51\x06\
-\xc8\xd4\xeb\x35\x19\xb9\x54\x92\x99\x7f\x6e\xb9\x43\x2e\x95\x64\
-\xea\xf5\x9a\xc5\xe7\x7f\xbb\xd6\x42\x5d\x8b\xac\x4a\x27\x70\x34\
-\x14\x5d\x2a\x82\x55\x10\xf8\x24\xf0\x11\x60\x81\x99\x2f\x25\x64\
-\x18\x0d\xad\xdc\x2a\x59\x26\x37\x6b\x35\x0c\x3c\x0e\x7c\x8c\x4b\
-\x3d\xea\x2e\xb2\xff\x70\xf1\xf6\x46\x29\xb3\x24\xab\x3d\x0c\xcc\
-\x00\x8f\x03\xb7\xb1\x70\x38\xd5\x4b\x76\x2a\xf7\xf1\xb5\x2e\x90\
-\x32\xa5\xe1\x37\x5c\xfe\x6e\x9f\x01\xde\x9f\xc7\xbd\x9f\x00\x02\
-\x4b\xdc\xff\x9b\xb5\x16\xaa\x4c\xfe\xfc\x2f\x16\x56\xde\x01\xa0\
-\x90\x50\x57\xed\x64\x8d\x54\xf3\xd3\xf8\xca\x5a\x0b\x55\x26\x7f\
-\x54\xc0\x63\xc0\xab\xc0\x17\x29\xae\xaf\xa1\x01\x1e\x05\xde\x04\
-\xfe\x91\x7c\xcc\xcb\x65\xca\x94\x29\x53\xa6\x4c\x99\x32\x65\xca\
-\x94\x29\x53\x26\x07\xff\x1f\x16\xd8\xa8\x4e\x21\x44\x70\x9a\x00\
-\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\
-\x74\x65\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\x32\x30\
-\x3a\x33\x34\x3a\x31\x37\x2b\x30\x32\x3a\x30\x30\xc5\x04\x72\xad\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\
-\x69\x66\x79\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\x32\
-\x30\x3a\x33\x34\x3a\x31\x37\x2b\x30\x32\x3a\x30\x30\xb4\x59\xca\
-\x11\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\
-\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\
-\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x12\x81\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\xbb\x7f\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01\x42\
-\x28\x9b\x78\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe3\x05\x0f\x16\
-\x25\x1b\xb6\xba\x9a\x63\x00\x00\x11\x4b\x49\x44\x41\x54\x78\xda\
-\xd5\xdb\x7b\xb0\xd5\xd5\x75\x07\xf0\xcf\x3e\xe7\xc0\x05\x41\x85\
-\x8b\x02\x22\x18\x40\xd4\xa8\x21\x3a\x12\xf1\x85\x4a\x02\xde\x03\
-\xe2\x83\xa6\xa1\x6a\xc7\xa4\xc9\xe4\x6d\x63\x26\xd3\x24\x9d\x3a\
-\x6d\x27\x76\x32\xd3\xa4\x69\x32\x63\x63\x9b\x98\xd1\x46\x63\x1e\
-\x1a\xcd\x44\x50\x11\x2e\x62\x4a\x02\x0d\x8a\xd5\x21\xa0\x0e\x2f\
-\x79\x04\xb0\x80\x8a\x28\x18\x1e\xde\x73\x76\xff\xd8\xfb\xdc\x7b\
-\xee\xe5\xdc\x47\x14\x9c\x74\xcd\xfc\x66\xee\xfd\x9d\xfd\xdb\xbf\
-\xbd\xbe\x7b\xad\xbd\x9e\xbf\xe0\x5d\xa0\x08\x2d\xc6\x0b\x3e\x8e\
-\xbf\xc4\x58\x14\xbb\x0c\xab\x60\x13\xee\xc3\xdd\xa1\xd5\xa6\x77\
-\x63\x6d\xe1\x5d\x01\xa0\xec\x1c\x7c\x09\xd7\xa3\x3f\x0a\xdd\x0c\
-\xad\xe2\x10\xee\x13\xdd\x16\x16\x59\x75\xb4\xd7\x56\x78\xe7\x53\
-\xf4\xc2\xfc\x74\xfd\xf1\x01\x5c\x8b\x01\xbd\xbc\xb3\x80\x01\xa2\
-\xd9\xb8\x20\xce\xd2\x74\xb4\xd7\x57\x3a\xda\x2f\x50\x34\x0a\xef\
-\xc3\x90\x7c\xe7\x10\xb6\xe1\x95\x2e\x23\x4f\xc0\x68\xf4\x17\x0c\
-\xc1\x59\x2a\x4e\xc2\xe6\xff\xdf\x00\x04\x27\x89\xc6\xea\x50\xb7\
-\x5d\xf8\x57\xac\xe8\x32\xf2\x42\xdc\x92\x41\x08\x78\x8f\x68\xe4\
-\x9f\x1c\x00\x71\x0e\xf6\x2b\xda\xa7\x29\x2c\xf1\x87\x3e\x3c\x32\
-\x3c\x33\x55\xa3\xd7\xb1\x38\xb4\xda\xd0\x69\xde\x16\x7b\x05\x7f\
-\x5d\x77\x6b\x74\x7e\xb6\xf7\x35\xcd\x32\x48\x3f\x07\xf4\x53\x09\
-\x0f\x1e\x25\x00\xe2\x54\x45\xfd\x8c\xf1\x86\x99\x98\xa8\xc9\x80\
-\x58\xb6\x5d\xf4\x28\x9e\x09\x8b\xb4\x35\x7e\xb0\x13\x00\x6d\xd8\
-\x8d\xed\x0d\xc6\x6d\x13\xbc\x9a\xc7\x94\x30\xa6\x27\x00\x62\x8b\
-\x12\x26\x09\xae\xd6\x66\x94\x36\xfb\xed\xb7\x2e\xb6\x78\x54\xc5\
-\x96\xf0\x44\x37\xeb\x79\x3b\x00\xc4\x16\xfd\x70\x76\x36\x63\x57\
-\x62\x9c\x64\xc6\xf6\x08\xce\xc1\xa3\x71\x86\x47\x05\x3b\xc3\x02\
-\x95\xba\xe7\x06\x62\x04\x86\xe5\x5b\x7f\xc0\xa6\xd0\x6a\x7f\xd7\
-\x77\x84\xc7\xed\x8f\x65\x9b\x71\x0e\x8e\x43\x33\x46\xc4\x2b\x0d\
-\x0c\x8f\x75\x8c\x8f\xd3\x14\x14\x9c\x88\xab\x04\xd7\xe2\x52\x1c\
-\x2f\x99\xd1\xad\x82\xd3\x94\xfc\x30\x96\xad\x0e\xad\xde\x7a\xc7\
-\x00\xc4\x69\xfa\xe1\xfd\x82\x4f\xe1\x3a\x0c\xad\xfb\x79\x28\xae\
-\xc6\x99\xa2\x09\xa2\x87\x63\xd9\xca\xd0\x6a\x5f\xfe\xfd\xa4\xbc\
-\x93\xfd\xf2\xff\x7b\xb1\xae\x87\xd7\xad\xcb\x63\x8e\x93\xcc\xe5\
-\x18\x55\x23\x25\xff\x40\x2c\x1b\x9c\x01\xba\x0a\xb3\xf1\xde\x2e\
-\xbc\x8c\xc3\x8d\xf9\x7d\x77\xc6\x69\x7e\x17\x9e\xe8\x19\x84\x1e\
-\x01\x88\xd3\xf4\x53\x6c\xc8\x7c\x05\xfb\x32\xf2\x30\x01\x5f\xc0\
-\x69\x82\x87\xe2\x0c\xab\x71\xac\x68\x8a\x64\x02\x6b\xb4\x17\x6b\
-\xbb\x7d\x61\xb0\x46\xb4\xb7\xee\xce\x07\x44\x37\xc4\x19\x96\xe5\
-\x67\x27\x8a\xfe\x0c\x65\x0c\xac\x1b\xf7\x3a\x06\x4b\x52\x79\x3c\
-\xe6\xa0\xaa\xe8\xae\x38\xcd\xaa\x9e\x40\xe8\x16\x80\x38\x4b\x51\
-\x9b\xf7\xe1\xd3\xf8\x8b\x3a\xe6\xdf\xc4\xb3\x58\x2d\x89\xdf\xd9\
-\x92\xfd\x1e\x88\xd9\xa2\xb3\xf0\xac\x60\x38\xce\x95\x44\x99\xa4\
-\xdb\x3b\x15\xac\xee\x1e\x71\xcf\x49\x56\xe2\xb4\xcc\xcc\xa4\xbc\
-\xab\xd3\x44\xbb\x70\x1e\x4e\xaf\x7b\xa2\x8a\xe7\xb1\x14\x13\xf3\
-\xef\x83\xf2\x5a\xaf\x13\x04\x45\x3f\x88\x53\xad\x0a\x4b\x3a\x54\
-\xb3\x6f\x12\x50\x71\x0a\x3e\x9e\x77\x7e\x48\xbe\xbb\x0f\xff\x2d\
-\xfa\x86\x68\x85\xa2\xd9\xa2\xcf\xe5\x97\x1f\x9f\x81\x38\x1d\xa7\
-\x27\xff\xb7\xd3\x42\x5f\xc2\x52\x83\xbd\xd8\xed\x3b\x0b\x36\xa8\
-\x5a\x96\x99\x3e\x39\xcf\xd7\x2c\xfa\x50\x97\x91\xd5\xbc\xeb\xab\
-\x05\x77\xa8\x98\x2b\x98\x2c\xb8\x05\x97\x64\x69\xa8\x81\x70\x50\
-\x7f\xb7\xd1\xd8\xb5\x6e\xe8\x0a\xc7\x99\x82\xaa\x9b\x24\xf7\x75\
-\x42\xdd\xce\x2f\x13\x7d\x23\x2c\xf2\xeb\xf6\xb1\x65\xe3\xf1\x77\
-\xf8\xa0\xa4\xef\xf5\xde\x5b\x9b\x24\xba\xdb\xb1\x50\xd5\xbf\x87\
-\xc7\x6d\xd1\x03\xc5\xb2\xb1\x92\x3a\xcd\xc0\x28\x1c\xdb\x65\xa3\
-\x0e\x62\x2b\xfe\x0b\xdf\x0c\xad\x36\xb6\x3f\xdb\xe2\xf2\x0c\xc2\
-\x94\x2c\x09\xb0\x41\x70\x9b\xe0\x7b\x61\x41\x97\x6d\xe9\x01\x80\
-\x7e\x2a\xbe\x9b\x75\xbf\x24\xe9\xfc\x6f\x45\xff\x58\xcf\x7c\xfb\
-\xf8\xa9\x8a\x06\xb8\x3e\x4b\xc3\xa9\x19\x84\x36\xec\x90\xc4\xf3\
-\x17\x9a\x3c\x19\x1e\x76\x40\x1f\x28\x5e\x63\x80\x83\x2e\xc4\x47\
-\x24\x35\x1b\x99\xd7\x71\x10\x2f\x0a\xee\x70\xc0\xfd\x8d\xc4\x3a\
-\x83\xf0\x75\x5c\x2c\xa9\x51\x1b\xee\xc2\x17\x1b\x59\x85\xee\x54\
-\xa0\x24\xe8\xaf\x23\x62\xdb\x87\xd5\xe2\x61\xde\x5b\x42\x31\x2d\
-\xe4\xa7\xf1\x4a\x0b\xb4\x99\x22\x18\x8b\xed\x82\xa7\x5d\x68\x6b\
-\xb8\xf5\x70\xe4\x7b\xa2\x0c\xd4\x92\x78\xab\x5f\x5b\x61\x8c\xaa\
-\xc9\xa2\x51\xa2\xcd\x4a\x96\x85\xc7\xec\xee\x1e\x3d\x2b\x04\xab\
-\xf1\x7e\x49\x2d\x8b\xe8\xe7\x60\xe3\x18\xa4\x31\x00\x0b\x1c\x50\
-\xb6\x4d\x72\x5a\x86\xe5\x89\x2e\x55\x34\x5b\x0a\x57\x1b\x2f\x3c\
-\x2d\xec\xe1\x4e\x37\x17\xfe\x31\xac\x77\x99\x2f\x01\xf7\xfb\x7c\
-\xf5\x8d\xd2\xb9\x54\xf3\x0d\x64\x1e\xb6\x85\x25\x0e\x36\x1a\xde\
-\x10\x95\x40\x14\x3d\x86\xdf\xd6\xdd\x3e\x5b\xf4\xb9\xac\xf3\x7f\
-\x92\x14\xcb\xc6\x67\x35\x3c\xbb\xee\xf6\x6f\x45\x0b\xba\x7b\xa6\
-\xa7\xd0\xf4\x19\xd1\x3c\xac\xa9\x1b\xfb\x7e\xfc\x7d\x9c\xf4\xce\
-\x83\xa8\x78\xb5\x10\xaf\x36\x2c\x5f\xef\x38\x2f\x11\xa7\x2a\x4a\
-\x87\xf1\xc4\x3a\xbe\xd6\xe1\x11\x3c\xd3\xdd\x73\xdd\x32\x12\x16\
-\x69\x8b\x2d\xe6\x4b\x36\xf9\x3d\x92\x9d\x3f\x0e\x97\x1b\xe6\x3a\
-\xfc\xb4\xcf\x8b\x9b\xa4\xa0\xd9\x70\x05\x17\x89\x2e\x17\x9c\xe7\
-\x90\xe1\x52\x7e\x00\x0e\xc4\xb2\x9d\x92\x7f\xf1\x1b\x55\xcb\xed\
-\xb6\x2b\x3c\xa3\xda\x67\x04\x9a\xdc\x80\x0f\xe9\x10\xfd\x03\x98\
-\x27\x98\x1f\x5a\xbb\x8f\x0b\x7a\x44\x3e\x96\x15\x71\x11\xbe\x2c\
-\xb9\x9e\xa4\x93\xf8\x69\x55\xb3\xc3\xe3\x5e\xed\xf1\x79\xb8\xc2\
-\x38\x05\xb3\x71\x4d\x06\xb2\x09\x3b\x25\x87\xa7\x76\x98\x35\x4b\
-\x31\xc3\x70\x29\x5f\xb0\x09\x0f\x8b\xe6\x59\x64\x53\x6f\xe2\x11\
-\x67\x3a\x51\xd5\x2f\x71\xbe\x0e\x33\x3c\x17\xdf\x51\xb0\xbc\x3e\
-\x3e\xe9\x4a\x3d\x8a\x72\x68\x55\x89\x65\x2b\x05\x0f\x65\x0f\xef\
-\xf4\xfc\x82\x53\x15\x4d\xc1\xbc\x1e\xc0\x1b\x20\xb9\xac\x37\x4a\
-\xfe\xfb\x5e\xd1\x03\x82\x15\x52\x42\x64\x7f\x06\x53\x9e\x73\xa0\
-\x68\x8c\x60\x32\xa6\xe3\x26\xc1\x25\xca\x7e\x12\x4b\x16\x86\xf9\
-\x8d\x0f\x31\x50\x71\xa9\x60\x42\x1d\xf3\xeb\xf2\x9a\x57\xf6\xc4\
-\x7c\xaf\x00\x64\x10\xf6\x65\xdf\xfe\x59\x1d\x6e\x68\x7f\xb1\x53\
-\x8c\xdf\x99\xf9\x2b\x0c\x91\xfc\xf1\x8f\x49\x8e\xcc\x7c\xc9\x1e\
-\xac\x11\xed\x0c\x8b\x1a\xfb\x03\x71\xba\x55\x4a\xfe\x47\xf4\x2b\
-\xcc\x94\x9c\xab\x2f\x6b\x73\x62\x2c\xfb\x45\x68\xb5\xa7\x9b\x57\
-\xa6\x4c\x52\x07\x3d\x8b\xd5\x75\x41\xd9\xdb\x07\x20\xd3\xb1\x82\
-\xe1\x75\xd6\xbc\x4d\xa3\x98\x5e\xfb\xce\xcf\xc1\x27\x25\x71\xbe\
-\x1b\x8f\x29\xd8\x14\x16\xf4\x1c\xa3\x87\xc5\x0e\x60\x4b\x9c\x69\
-\xbb\x8a\x8d\x82\xcd\xf8\x73\x7c\x0a\xe2\x2c\x3f\x6e\x28\x09\xc1\
-\xf6\xbc\xa6\x1a\x0d\x17\x1d\xd7\x17\xc6\x7a\x8e\x06\xaf\x34\x50\
-\xc5\xc8\x1c\xd5\x9d\x5b\xc7\xfc\x0e\xc5\xc3\x4f\xd6\x8c\x4f\x59\
-\xda\xf9\x43\xb8\x17\x8f\x84\x56\x3b\xdb\xc7\xcc\x52\x50\x35\x58\
-\xc5\x58\x05\xc7\xab\x8a\x78\x43\xc5\x26\x15\x6f\x86\x25\xaa\x19\
-\xa8\xf5\xb1\xec\x3e\xc9\x05\xff\x18\x3e\xa6\x62\x57\xe4\xe1\xc3\
-\xce\x84\xa2\xa7\x55\xec\x90\xce\x92\x52\x5e\xeb\x94\x38\xc3\x56\
-\xfc\x6f\x58\x78\x78\xfe\xe1\x30\x00\xe2\x54\xfd\x0d\x30\x2a\xe7\
-\xe1\x86\x63\xb8\x8a\x11\x92\x7f\x7f\xbe\x8e\xa8\x6e\x2f\x96\x99\
-\x6c\x9b\xc7\xba\xcc\x76\x45\x7b\x3c\x7e\x6c\xde\xf9\x76\xe6\x63\
-\x8b\xa2\x60\xa4\x36\x17\xe2\x5c\xc1\x78\xd1\xf1\x42\x06\xa0\xe4\
-\x45\x45\x2b\x63\xd9\x93\x0a\x29\xb1\x12\x5a\xed\x8c\x2d\x1e\x11\
-\x0c\xc2\x27\x44\x37\x2a\x5b\xa5\xb5\x4b\x9e\x70\xb2\xad\x96\x5b\
-\x9a\xd7\x3a\x34\xaf\xf5\xc3\xa2\x53\xb0\x35\x5b\x98\x9d\xa2\x5d\
-\x0a\x76\x38\xe0\xa5\xb0\xc4\x21\x08\x31\xed\xd9\x39\xa2\xc9\x82\
-\xb3\xa4\x93\x7a\x74\x9e\xac\x59\x67\xdd\xaa\xe2\x05\xdc\x1c\x5a\
-\x2d\xe9\xb4\xfb\x93\x14\x9c\xe0\x8b\xb8\x49\xd2\xf9\xef\x85\x56\
-\xeb\x33\xf3\x4d\x82\x33\xf0\x61\x29\x99\x31\x41\x52\xa1\x3d\xf9\
-\xf1\x21\xf9\x9d\xeb\x25\x4f\x72\x2e\xd6\x86\xd6\x24\xee\x71\x86\
-\xd3\x44\x5f\x90\xce\x85\xff\xf0\x8a\xdb\xbb\x9a\xc8\x58\xf6\x41\
-\xdc\x8e\x33\x75\xf6\x6f\xde\xc2\xab\xd2\xc1\xbb\x15\x5b\x44\xcf\
-\x63\x45\x58\x64\x55\x49\x8b\xf1\xf8\x92\x60\xb6\x64\x43\xbb\xb3\
-\x3a\x95\xbc\xe8\x56\x4d\x9e\x3c\xec\xd7\x66\xc3\x25\x53\xf7\x06\
-\x16\x2a\xe4\x2c\x4e\xda\xf9\x33\xf0\x19\x29\xb8\x79\x99\x6c\x0d\
-\xaa\xf9\x1c\x09\x46\x63\xb2\x64\x72\x6f\xc2\x89\xb8\x33\xce\xf4\
-\x7c\x58\xa0\xa2\xcd\x26\x45\x0b\xa4\x28\xef\x5a\xcd\xee\xa7\x43\
-\xad\x40\xc1\x72\x55\xad\x92\xaf\x32\x4a\x47\x1c\xd3\x4f\x0a\xa6\
-\x46\x4a\xc9\x99\x28\xa5\xf2\xe6\xc6\xb2\xaf\x97\x04\x9f\x90\x2a\
-\x36\x03\xba\xb0\xd4\x26\xe5\xf0\xf6\xe6\x6b\x17\x96\x0a\xee\x6c\
-\x18\xd5\x15\x5c\x84\xb1\xa2\x07\xb0\xa6\xfd\xc0\x0b\x46\xe6\x9d\
-\xff\x88\x94\xe2\xfe\xbe\x8a\x07\xc3\xe2\xce\x19\xe5\x38\xdd\x4f\
-\x15\x5d\x87\xcf\x4a\x87\xe8\xcb\xa2\x57\xf0\x52\x58\xac\x2d\x96\
-\xad\xc1\x62\xcc\x51\x74\x51\x96\x92\x76\x0a\x0b\x1c\x88\x65\xb7\
-\x4b\x0e\xd0\x14\x49\x8d\x8f\xcd\xd7\x31\x3a\xd4\x3d\x08\x86\xe2\
-\x06\x6c\x2d\xe5\x3f\x6a\x62\x7e\x28\x33\xfa\xba\xe4\xa4\x6c\x92\
-\xdc\xc9\xb5\x0a\x56\x1b\xec\xc5\xf0\x60\xb7\xd9\xdf\xcb\x05\x4d\
-\x82\x15\x62\xd6\xfb\x59\x0a\x59\xe7\xaf\xc2\xcb\x82\x3b\xc2\x42\
-\x3f\x6a\xf4\x78\x06\xe4\xee\x58\x46\x72\xbc\xae\x16\xad\x8e\xd3\
-\xcd\x0b\x8b\x55\x55\xec\x50\xb0\x42\x70\xa3\xe8\xb2\xae\x00\x40\
-\x68\xb5\x39\xce\xf1\x35\x7b\x4d\x50\xf5\xbe\x2c\x79\xa7\x4b\x09\
-\x96\xe6\x2c\xe1\xc3\x33\xbf\xfd\x45\x37\x94\x24\x9d\xaf\xe9\xcc\
-\x4b\xf8\x96\xe8\x71\xc1\xf6\x46\xd9\xdb\xc6\xbc\x23\x38\x2f\x8b\
-\xe5\xb6\x76\x3b\x5f\x35\x58\x3a\x91\x27\xe0\x01\x6d\x1e\xe8\x75\
-\xb2\x83\x7e\xae\xc9\xc5\x59\x0a\xce\x55\xb0\x18\x7b\xc3\x62\x07\
-\x62\xd9\x56\x49\x85\x26\x45\x8d\x75\x35\x6f\xd0\x1a\x1d\x31\x8c\
-\x58\x36\x50\x74\x32\x5a\x04\x5f\x95\x8a\xb3\x05\xc1\xb8\x82\xce\
-\xa6\xf0\x55\xe9\x70\xd8\xd0\x57\xe6\xc1\x44\x85\x8c\xec\x4e\xea\
-\x44\xbb\x62\x2c\xc6\x4b\xb9\x81\x15\x5d\xc5\xbe\xa1\x24\xa4\x62\
-\xcb\x8a\xbc\x19\xa7\x2a\x18\xdb\xf1\xa3\xfd\x82\x9d\x18\xe1\x8c\
-\xbe\xd7\x35\x43\xab\xfd\x61\x91\x0d\x78\x4a\xec\x94\x4b\x28\x1d\
-\x99\xe2\xe8\x58\x43\xa5\x33\x64\xb7\xa4\x46\x35\x1a\x92\xaf\xd7\
-\x44\xdb\xfa\x3c\x5f\x1a\xfb\x1a\x86\x88\xed\xf9\x48\xa2\x83\xa2\
-\x57\x31\xc0\xe8\xba\xfb\xef\x80\x8e\x0c\x00\x7f\x68\xf7\x11\x3b\
-\x4b\x65\xb2\xf1\x31\xff\xd5\xf7\x90\x37\xb4\x8f\x8d\x62\x9d\xff\
-\x19\xdb\xe7\x89\x4a\x7f\x5c\x96\xe9\xe8\x02\xb0\xcd\x1e\x29\xb8\
-\x69\xd6\x39\x29\xba\x27\x5f\x43\xb2\xa9\xeb\x1b\xa5\x38\x63\x28\
-\xf6\x28\xd4\xf9\xff\x41\x7f\xc1\x30\x1c\xb0\xc5\xeb\x47\x0a\x80\
-\xfa\x53\x7d\x18\x2e\x88\x2d\x26\xc4\x72\xa7\xc2\x43\xcf\xb4\x56\
-\x55\xb2\x1e\x23\xd4\x17\x2c\xda\x6c\xc6\x46\xc9\xc9\x99\x1c\xa7\
-\x3b\xa6\x57\xde\x67\x19\x94\x23\xc2\x93\xb1\x51\xb5\x2e\x8b\x1c\
-\x1d\x93\x6b\x8d\x3b\xad\xe9\x7b\xae\x20\x96\x0d\x8c\x2d\x26\xe0\
-\x02\xa1\xdd\xa3\x85\xb6\x92\x64\x9b\xc7\x67\x30\x46\xe1\x16\xc1\
-\x4d\xd8\x1d\xcb\xd9\x0c\x46\x6b\x15\x3c\xe7\x58\x1b\x1a\x99\xc1\
-\x24\x93\x9e\x95\x0a\x28\xa7\xc4\x19\x56\x87\x85\xf6\xab\x78\x53\
-\xd1\x4a\xc1\x7a\x5c\x94\xed\xfc\xdd\x3d\xae\xb6\xe2\x7a\xc9\x21\
-\x5a\x87\x95\xaa\xde\x84\x78\xa5\x01\xaa\xc6\x88\x4e\x14\x3d\xd1\
-\x9d\x3e\xc5\x39\x4a\x0d\xcd\x60\xe8\x64\x06\xa1\x2a\xda\x54\x92\
-\x92\x9c\x5f\x95\x0e\xb1\xfe\x79\xb7\x46\x67\xc9\x48\x71\x7c\xb0\
-\x57\xb4\xcb\x1b\x96\xc6\x19\xee\x0c\x0b\x1b\xe6\xf6\x7f\x83\xd9\
-\x82\xf3\xf1\x34\xb6\x84\x25\xaa\xb1\xec\x49\x29\x2d\xf5\x79\x7c\
-\x36\x96\x71\xd0\xcf\xbb\x96\xd6\xe3\x2c\x83\x54\x5c\x2f\xfa\x8c\
-\xa4\x4a\xf7\x2b\x78\x2a\xb4\xe6\x9d\xae\x18\x29\x79\x8b\x07\x05\
-\x4b\xbb\xd9\xe9\xb1\xde\xf0\x69\x4c\xc9\x95\xa9\x46\x8e\x50\x8d\
-\x0e\x09\xee\x2b\xe5\x1d\x19\x2d\x9a\x9d\x3b\x33\x6a\xe0\x96\x24\
-\xb7\xb2\x16\x56\x9e\x86\x71\xa2\x01\x71\xa6\x7f\x08\x0b\xba\x78\
-\x83\x55\xcb\x15\x6c\x12\x4d\xc7\xaf\xe2\x4c\xdb\xc3\x02\x6d\x0a\
-\x76\xaa\x7a\x48\xea\x00\xf9\x08\xbe\xac\xc9\xc5\xb1\x6c\x85\x90\
-\x2d\x43\x34\x5a\x9b\x0b\xf2\xce\x37\xe3\x41\xc1\x5c\xa5\xec\x50\
-\x4d\x55\x12\x9d\x29\x98\x8e\xcd\xaa\x96\x1f\xc6\xfc\x4c\x03\x54\
-\xdd\x2c\xf9\x0f\xf5\xae\xf0\x61\x43\x25\x0b\x33\x57\x70\x4f\x29\
-\xb4\xda\x14\x5b\xdc\x26\x65\x80\xcf\x96\x1c\xa3\x31\x59\x0a\x86\
-\xe9\xa8\xec\x16\x25\xbd\x9c\xa1\x6a\xbe\x54\x99\xe9\xa0\xdd\x76\
-\x39\xc1\xc3\x92\x2f\x3f\x53\xc5\x46\xac\x0f\x0b\x54\x62\xd9\x5a\
-\xdc\x29\x39\x31\x57\xe7\x45\x5e\x22\x7a\x2d\x3f\x3d\x34\xcf\xbd\
-\x0e\xf7\x0b\xe6\x0a\xd6\x85\x47\x72\x36\xa7\xc9\x78\x29\x10\x1a\
-\x8c\x1f\xd9\xed\xe5\xc3\xd8\xaa\xba\x48\x0a\xc5\x6b\x25\xb5\x8e\
-\x9d\x4e\xe6\x79\xab\x14\x10\x6d\x16\xbd\xa0\xe0\xa9\xb0\xb0\x2e\
-\xdd\xd6\x1e\x0e\x57\x8d\xcc\xe2\x33\x22\x5f\x63\xa4\x20\xe2\xbc\
-\x3c\xf4\x35\xfc\xcc\x45\x6e\xee\x5a\xf0\x88\x29\xff\xf7\x2d\x49\
-\xef\xee\xc6\x7d\xed\xe1\xf0\x4c\x45\x55\x23\x44\x17\xe6\x9e\x82\
-\x53\x75\x24\x30\x5f\xc7\x8b\x58\xa9\xe0\x29\x25\x3b\x6b\xcc\xc7\
-\x19\x46\x8a\x6e\x90\xea\x94\x6b\xf1\xb7\xa1\x4b\x38\x1c\x6f\x15\
-\x2c\x77\xbb\xd4\x82\x57\x2b\xe2\x3e\x2b\xa9\xe2\x56\x1d\x39\xc8\
-\x5d\x42\x97\x70\x58\x0f\x14\x67\x18\x88\x93\xf2\x02\xfe\x26\x8b\
-\x67\x1b\x5e\x50\x70\x55\x58\x60\x6b\x57\xd9\x52\x76\xad\xe4\xcb\
-\x07\xdc\x2b\x7a\x24\x2c\xb2\xa3\x7d\xcc\x74\x05\x05\x83\x14\x8c\
-\x55\xcd\x00\x14\xbc\xae\x6a\xb3\xaa\x37\xc3\xe2\x8e\xd3\x3d\x33\
-\x7f\x0d\x3e\x9a\xa7\xff\xb6\xd6\xc3\x13\x22\x71\xa6\x31\xaa\x1e\
-\xc5\x59\x92\xea\xee\xc6\x77\x70\x9f\xa2\x1d\xf5\x0d\x16\x5d\xa9\
-\xe7\xa4\x68\xca\xa4\x6c\x8c\x65\xcb\x30\x4d\xca\xd1\x95\x30\x52\
-\x74\x7e\x46\xb7\x63\x7c\x5a\x65\xab\x74\xd2\x7e\x52\xca\xe4\x0c\
-\x8a\x2d\xe6\xab\xda\x14\x16\x6b\xcb\x0c\xee\xa5\xfb\x32\x79\x9c\
-\xaa\xa4\xc9\x78\xd1\x2c\x29\x92\xec\x87\xbb\x94\xb4\x36\xdc\xb1\
-\xaa\xf3\x75\xd4\x0f\x09\x56\x62\x59\x58\xd8\x7b\xb3\x65\x5f\x73\
-\x82\xb5\x70\xb8\x46\x45\xe9\xa0\x39\x1c\xb4\x56\x07\xe2\x15\x1e\
-\xcc\x5a\xf8\xd1\x1c\x6e\x8f\x55\xb4\x30\x96\xad\xc9\x3b\xd2\x38\
-\x29\x3a\xc3\x40\xd1\x08\xd1\x99\x92\xce\x5f\x2e\xa9\xc7\x5d\xf8\
-\x45\x0f\x99\xe1\xd1\x9d\x78\x89\x76\x09\x9d\x1a\x2d\xde\x3e\x00\
-\xb9\x2d\xa5\xd6\x7c\x50\xa3\x43\xba\xec\x7e\x27\x10\x1e\xb7\x27\
-\x96\xfd\x38\x83\x76\xa3\xd4\x57\x74\x29\x9e\x50\xb5\x22\x96\xfd\
-\x5e\xb0\x5f\x35\xc7\x0d\x05\xfd\x45\x03\x73\x0a\x6b\x72\x3e\xed\
-\x07\x63\x25\x7e\xa2\xa4\xb5\xc7\xb4\x78\x5a\x4b\x7d\x0c\x72\x1e\
-\x26\xc6\xb2\xf5\xbd\x65\x86\xfb\x5a\x18\xf9\x8a\xd4\xe9\xc9\x1f\
-\x5b\x18\x69\x31\x2e\x37\x33\x5d\x23\xc5\xe5\x4d\xd2\x61\xb4\x53\
-\x35\x47\x66\x05\xcd\xa2\x11\x52\x26\xe8\xa0\xe4\x9c\xcd\xc3\x3c\
-\xad\x36\xf7\x5a\x18\xb9\xca\x09\xde\xf2\x90\x23\x5d\x18\xc9\x0b\
-\xba\x0a\x2d\xf9\xff\x2a\xb6\x89\xee\xe8\x8d\xf9\x76\x74\x17\xd9\
-\x14\x27\xf9\xae\x66\xf7\xe7\xac\xd1\x65\x38\x4f\x74\x4a\xf6\xd4\
-\x88\xf6\x4b\x27\xf5\xaf\x04\xbf\x51\xb1\xdc\x6e\x2f\xf7\xb5\x34\
-\x16\x1e\xf5\x4a\x2c\xfb\x81\xd4\x94\x35\x4e\x32\x83\x33\xb0\x41\
-\xb4\x51\x0a\xad\xbb\x5f\x63\x43\x54\x5b\x94\x04\x7f\x25\xed\x7e\
-\xad\x1b\xeb\x35\xfc\xd2\x2b\x3e\x17\x9e\xe9\x5b\x1f\x5e\xb7\xf3\
-\xa7\x82\x68\x73\x8e\x24\x5f\x0b\x4f\xbc\xb3\xe8\x2e\x4e\x55\xd4\
-\xe4\xfb\x92\xb3\x55\x33\x85\xeb\xf0\x6d\xa9\xfb\xbc\xe1\x7a\x7b\
-\x92\x80\x49\x92\xd8\xd7\x98\xaf\x4a\x27\xf7\x3f\xbf\x53\xe6\x21\
-\x3c\x22\xd2\xbb\x14\xf5\x79\xbe\x25\x2a\xb1\xec\x9b\x38\x43\xca\
-\x09\xd6\xfa\x95\xae\xc6\xef\x68\xdc\xdc\xd1\x30\x1c\x8e\x29\x22\
-\xbf\x52\x6a\x33\xa9\xd1\xf3\x82\x3b\xea\x7b\x72\xfe\xd4\x28\xb4\
-\xda\x28\xb8\x43\xea\x1c\xab\xd1\xc5\xd2\x21\xdc\x90\x1a\x4b\x40\
-\xf2\xab\x47\xeb\x28\x86\xbc\x8e\xa5\x2a\x87\x27\x22\x3b\x01\x57\
-\x36\x4c\x30\x45\x6a\x74\x7e\xdb\x2d\x32\xed\xf3\xdd\x2a\x78\xd2\
-\x98\x6c\xe7\x47\x61\x4b\xaf\x2d\x32\x15\x73\x15\x5c\x82\x53\x24\
-\x4f\xb3\x19\xa3\xe3\x54\x4d\x8d\xba\x44\xba\x53\x81\x36\xd1\x21\
-\x41\x25\x8f\x49\xa6\x30\xc5\xe9\x3d\x37\x49\xc5\xba\x26\xa9\x68\
-\x87\xe5\x96\xc6\xf2\xdb\x6c\x92\x5a\x9e\x9b\xa4\x42\x5d\x93\x54\
-\xc5\x8b\xb1\xc5\x1d\x0e\x35\x6e\x92\x52\x70\xbe\x64\xb6\x07\xb7\
-\x43\xc2\x5b\x9a\x1a\x1f\xa8\xdd\x03\x10\x3c\x27\x99\xa3\x09\x92\
-\xe3\x73\x9e\xe0\x96\xd8\x42\xc3\x36\xb9\xd8\xb0\x4d\xae\x39\xdf\
-\x9b\xea\xa0\x85\x71\x86\xdb\xbb\x09\xa5\x3b\x98\x9f\xe1\x3d\x0e\
-\xba\x59\xf7\x6d\x72\xcd\x82\x91\x9a\x5c\x16\x67\xfa\x97\xb0\xa0\
-\xae\x4d\xae\xec\x32\xa9\xe5\x7e\x92\x8e\x68\x70\x13\x56\x2b\x34\
-\x3e\xb7\x7a\xb2\x02\xe3\x04\x5f\x92\xdc\xd9\x21\xf9\x76\x47\xa3\
-\x64\xd5\x0a\x05\xd7\x0a\x3e\xaf\x73\xa3\x64\x23\xaa\x4a\x55\xa5\
-\x1f\x3b\xce\xd7\xba\xab\x2d\xc4\x39\x4a\xde\xf0\x4f\x92\xef\x7f\
-\x72\x2f\xf3\xed\xc1\x73\xa2\xef\xab\x9a\xa7\xe8\xfc\xcc\xfc\x94\
-\xba\xdd\xdf\x83\x7b\x05\xb7\x75\xe7\x16\x77\x6f\x05\x0e\xf9\xbd\
-\xfe\xee\x11\x34\xe9\x68\x95\x1d\x2c\x25\x1b\xbe\xae\x68\x95\x64\
-\xd3\x6b\xad\xb2\x35\x5a\xa7\xd6\x2a\x1b\xdb\x5b\x65\x6b\xd9\xa6\
-\x29\xf6\x9a\xa0\x2e\x67\xdf\x89\xf6\x39\x35\x33\x30\xaa\x6e\xce\
-\xdd\x92\x47\x58\xdf\x2a\x5b\xc8\xf3\x4e\x11\x0c\xcd\xcd\x1a\x13\
-\xf3\xce\xd7\x1a\x24\x5f\xc3\x03\xb8\x47\xb1\xfb\x2e\xb3\xee\x7b\
-\x84\x96\xa8\xc4\x69\x9e\x53\x74\x67\xce\xee\xd6\x9a\xa5\x07\x49\
-\x27\x6b\xad\x0f\xaf\x46\xfb\xd1\x2a\x78\x88\xdc\x2c\x9d\x98\xf9\
-\xb0\x0e\x91\x1c\x2e\x7d\x3e\xd3\x18\x80\xaa\x89\x79\x4c\x4d\x7c\
-\x9f\xc5\x2f\xb1\x4c\xf0\x86\xc3\x9b\xa5\x0b\x99\xf1\x53\x74\x34\
-\x4b\xd7\x98\xff\xb9\xe8\x2e\x15\xcf\x85\xd6\xb7\xdb\x22\xf3\x84\
-\xb7\xe2\x34\xab\x14\xdd\x95\x95\xa5\x06\x42\xad\x2b\xbb\x46\x1b\
-\xf0\x90\xd4\xd7\xd3\xde\x2e\x1f\x67\xd8\x9a\xfd\xfb\x49\x79\xdc\
-\xb1\x62\xa7\x16\xf7\xae\xf4\xde\x0c\x5c\x8d\x9e\x56\xf0\xb3\xb0\
-\xa0\xbd\x5d\x7e\xbd\x94\x37\x58\xa3\x73\xbb\x7c\xfd\x5a\x5e\xc7\
-\x83\xf8\x4f\x95\x9e\x3b\xc5\x7b\x05\xa0\x1d\x84\x16\xab\xf0\x03\
-\xa9\xd4\x3c\x2b\x23\x9e\x3e\x98\x60\x19\x1e\x15\x0e\xff\x60\x42\
-\xc1\x0e\x95\xf6\x40\xa5\x7f\x66\xee\xf4\x1e\x5e\x77\x7a\x1d\x00\
-\x6f\x61\x9b\xd0\x91\x4b\x08\xad\xf6\xc5\x69\x96\x2b\xd8\x20\x58\
-\x9f\x2b\xda\x53\xa4\x33\xaa\x22\x35\x54\x2e\xc0\x0f\xb1\xba\x37\
-\xe6\xfb\x04\x00\x84\x45\xde\xca\xea\xf0\x6f\x82\x0d\x92\xb7\x35\
-\x00\x2f\xb5\x7f\x32\xd3\xc0\xd5\x0c\x8f\xd9\x9f\x9b\x13\x76\x4b\
-\xf1\xfa\x31\x18\x1b\xcb\x06\x76\x2d\xbd\xe5\x34\xfc\xd8\x3c\x86\
-\xe4\x25\xee\xec\x9a\xcc\x08\x4f\xa8\x62\x67\x2c\xbb\x17\xcf\x49\
-\x9e\xde\xc9\xd8\x2f\x5a\x2b\x9a\xaf\x7a\x84\x3f\x99\xc9\x2f\x6e\
-\xc3\x8b\x71\x8e\xef\xfe\x91\x1f\x4d\xed\x92\xc2\xd5\x9a\x2d\x6f\
-\xce\x85\xca\x4e\x1f\x4d\x89\x46\xe7\xd4\x75\x6d\x4d\xdb\x72\x1d\
-\xb0\xf1\x7a\x12\xe0\x2b\xb0\xe2\x5d\xf9\x68\xaa\xfd\xc5\xe9\x05\
-\x15\xfa\xc4\x7c\x0d\x80\x6d\x52\xa8\x0a\xc7\x0b\xae\x88\xe5\xc3\
-\x9a\x98\x2e\xd4\x59\x97\xb7\xe6\x8f\x24\x7a\x5f\xd3\xfc\x54\x3b\
-\x78\x3b\xf4\x6e\x7c\x37\xb8\x43\xb4\x59\xad\x46\x98\x4e\xf9\xaf\
-\x68\xfc\xe1\x64\xad\x68\x11\xb1\x85\xee\x25\xe0\x48\xd1\xd1\x07\
-\xa0\xcd\x4b\x8a\x9e\x97\x4c\x53\xad\xe7\x68\x7c\xbe\x1a\x53\xb4\
-\x47\xf0\x82\x52\xf7\x71\xfc\x91\xa2\xa3\xfe\xed\x70\x58\xec\x90\
-\x94\x9e\x9e\x2b\xb5\xaf\xf4\x94\xe4\xa8\xe2\x80\xe0\x21\xc1\x93\
-\xbd\xa4\xc1\x8e\xcc\xfa\x8e\xf6\x0b\x6a\x14\xcb\xc6\xe1\x13\x52\
-\x4b\x4e\xed\xbb\xc3\x7a\x6a\x13\x6d\x12\xdc\x27\xb8\xa7\x2f\x19\
-\xdd\x23\x41\xff\x07\x43\xe4\x16\x43\x30\x70\xdd\x4e\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\x32\x30\x3a\x33\
-\x37\x3a\x32\x37\x2b\x30\x32\x3a\x30\x30\xa0\xbc\xce\x4d\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x35\x54\x32\x30\x3a\
-\x33\x37\x3a\x32\x37\x2b\x30\x32\x3a\x30\x30\xd1\xe1\x76\xf1\x00\
-\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\
-\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\
-\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-"
+import os
 
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x09\
-\x0c\x38\xa2\x87\
-\x00\x74\
-\x00\x68\x00\x65\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x09\xc5\x58\xc7\
-\x00\x75\
-\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x07\x76\xa6\xc7\
-\x00\x70\
-\x00\x72\x00\x65\x00\x70\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\xb5\x0f\xc7\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\x5e\x5a\x67\
-\x00\x62\
-\x00\x6f\x00\x6f\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x00\xbd\xc0\x27\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x6f\xce\
-\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x50\xf7\
-\x00\x00\x00\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x87\
-\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x34\x8f\
-\x00\x00\x00\x28\x00\x00\x00\x00\x00\x01\x00\x00\x11\x3f\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x6f\xce\
-\x00\x00\x01\x6a\xbc\xc8\xf6\x4a\
-\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x50\xf7\
-\x00\x00\x01\x6a\xbc\xc6\x11\xe6\
-\x00\x00\x00\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x87\
-\x00\x00\x01\x6b\x0e\x6f\xd5\xfc\
-\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x34\x8f\
-\x00\x00\x01\x6a\xbc\xc6\x66\xde\
-\x00\x00\x00\x28\x00\x00\x00\x00\x00\x01\x00\x00\x11\x3f\
-\x00\x00\x01\x6a\xbc\xc8\x01\x98\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x6a\xbc\xca\x22\x0c\
-"
+from PyQt5 import QtCore
 
-qt_version = QtCore.qVersion().split('.')
-if qt_version < ['5', '8', '0']:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
+RCC_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons.rcc')
 
 def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return QtCore.QResource.registerResource(RCC_FILE)
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return QtCore.QResource.unregisterResource(RCC_FILE)
 
 qInitResources()
@@ -1,62 +1,139 @@
-{
- "cells": [
-  {
-   "cell_type": "code",
-   "execution_count": 9,
-   "metadata": {},
-   "outputs": [],
-   "source": [
-    "import pyqt5ac"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": 10,
-   "metadata": {},
-   "outputs": [
-    {
-     "name": "stdout",
-     "output_type": "stream",
-     "text": [
-      "pyuic5 --from-imports -o 'C:\\Users\\This Pc\\Desktop\\data_science_begin\\raw_python\\app\\python_gui\\library_management_system\\generated\\app_design_ui.py' 'C:\\Users\\This Pc\\Desktop\\data_science_begin\\raw_python\\app\\python_gui\\library_management_system\\app_design.ui'\n",
-      "pyrcc5 -o 'C:\\Users\\This Pc\\Desktop\\data_science_begin\\raw_python\\app\\python_gui\\library_management_system\\generated\\icons_rc.py' 'C:\\Users\\This Pc\\Desktop\\data_science_begin\\raw_python\\app\\python_gui\\library_management_system\\icons.qrc'\n"
-     ]
-    }
-   ],
-   "source": [
-    "pyqt5ac.main(uicOptions='--from-imports', force=False, ioPaths=[\n",
-    "        ['app_design.ui', 'generated/%%FILENAME%%_ui.py'],\n",
-    "        ['icons.qrc', 'generated/%%FILENAME%%_rc.py']\n",
-    "    ])"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "metadata": {},
-   "outputs": [],
-   "source": []
-  }
- ],
- "metadata": {
-  "kernelspec": {
-   "display_name": "Python 3",
-   "language": "python",
-   "name": "python3"
-  },
-  "language_info": {
-   "codemirror_mode": {
-    "name": "ipython",
-    "version": 3
-   },
-   "file_extension": ".py",
-   "mimetype": "text/x-python",
-   "name": "python",
-   "nbconvert_exporter": "python",
-   "pygments_lexer": "ipython3",
-   "version": "3.6.8"
-  }
- },
- "nbformat": 4,
- "nbformat_minor": 2
-}
+"""
+Build the icon resources.
+
+Compiles a Qt resource collection (.qrc) into a binary .rcc file, which
+src/resources.py (and the icons_rc.py loaders) register with
+QResource.registerResource(): Qt maps the file instead of Python compiling
+every PNG into a bytes literal at import. PyQt5's pyrcc5 cannot write the
+binary format and Qt's own rcc is not installed with it, so the file is
+written here (rcc format version 2, uncompressed). Run from
+python_distribution after changing an icon or icons.qrc:
+
+    python convert_qrc_to_py.py [icons.qrc] [-o src/res/icons.rcc]
+
+``--module PATH`` also runs pyrcc5 for code that needs an old-style
+Python resource module.
+"""
+
+import argparse
+import os
+import struct
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_QRC = os.path.join(HERE, "icons.qrc")
+DEFAULT_RCC = os.path.join(HERE, "src", "res", "icons.rcc")
+
+FORMAT_VERSION = 2
+DIRECTORY = 0x02
+LANGUAGE_C = 1   # QLocale::C, the locale of resources without a lang attribute
+
+
+def qt_hash(name):
+    """The hash Qt sorts and looks up resource names by."""
+    h = 0
+    encoded = name.encode("utf-16-be")
+    for unit in struct.unpack(f">{len(encoded) // 2}H", encoded):
+        h = (h << 4) + unit
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+def read_qrc(qrc_path):
+    """{resource path: file path} of a .qrc, paths relative to the .qrc's directory."""
+    base = os.path.dirname(os.path.abspath(qrc_path))
+    files = {}
+    for resource in ElementTree.parse(qrc_path).getroot().iter("qresource"):
+        prefix = resource.get("prefix", "/").strip("/")
+        for entry in resource.iter("file"):
+            alias = entry.get("alias") or entry.text.strip()
+            path = "/".join(part for part in (prefix, alias) if part)
+            files[path] = os.path.join(base, entry.text.strip())
+    return files
+
+
+class Node:
+    def __init__(self, name, source=None):
+        self.name = name
+        self.source = source
+        self.children = {}
+
+    def sorted_children(self):
+        return sorted(self.children.values(), key=lambda child: qt_hash(child.name))
+
+
+def build_tree(files):
+    root = Node("")
+    for path, source in files.items():
+        node = root
+        *dirs, name = path.split("/")
+        for part in dirs:
+            node = node.children.setdefault(part, Node(part))
+        node.children[name] = Node(name, source)
+    return root
+
+
+def write_rcc(files, rcc_path):
+    """Write ``files`` ({resource path: file path}) as a binary .rcc; returns its size in bytes."""
+    root = build_tree(files)
+
+    # Breadth first: every directory's children are consecutive nodes,
+    # sorted by name hash so Qt can binary-search them.
+    order, child_index = [root], {}
+    for node in order:
+        if node.source is None:
+            child_index[id(node)] = len(order)
+            order.extend(node.sorted_children())
+
+    data, names, name_offsets = bytearray(), bytearray(), {}
+    tree = bytearray()
+    for node in order:
+        if node is root:
+            name_offset = 0
+        else:
+            if node.name not in name_offsets:
+                name_offsets[node.name] = len(names)
+                names += struct.pack(">HI", len(node.name), qt_hash(node.name)) + node.name.encode("utf-16-be")
+            name_offset = name_offsets[node.name]
+        if node.source is None:
+            tree += struct.pack(">IHII", name_offset, DIRECTORY, len(node.children), child_index[id(node)])
+        else:
+            with open(node.source, "rb") as f:
+                content = f.read()
+            tree += struct.pack(">IHHHI", name_offset, 0, 0, LANGUAGE_C, len(data))
+            data += struct.pack(">I", len(content)) + content
+        tree += struct.pack(">Q", 0)  # last modified: unset, so rebuilds are byte-identical
+
+    header_size = 20
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    with open(rcc_path, "wb") as f:
+        f.write(b"qres" + struct.pack(">IIII", FORMAT_VERSION, tree_offset, data_offset, names_offset))
+        f.write(data)
+        f.write(names)
+        f.write(tree)
+    return tree_offset + len(tree)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("qrc", nargs="?", default=DEFAULT_QRC)
+    parser.add_argument("-o", "--output", default=DEFAULT_RCC, help="binary .rcc to write")
+    parser.add_argument("--module", help="also write a Python resource module here with pyrcc5")
+    args = parser.parse_args(argv)
+
+    files = read_qrc(args.qrc)
+    size = write_rcc(files, args.output)
+    print(f"Wrote {args.output}: {len(files)} files, {size:,} bytes")
+    if args.module:
+        subprocess.run(["pyrcc5", "-o", args.module, args.qrc], check=True)
+        print(f"Wrote {args.module}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,54 +1,88 @@
-
 import sys
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
 import logging
 import traceback
-from PyQt5.QtWidgets import QApplication
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("debug.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
 logger = logging.getLogger(__name__)
 
 try:
+    from src import logs
     from src.login import LoginCls
-    from src.database import setup_database_schema
-    from src.styles import apply_stylesheet
+    from src.database import close_all_connections
+    from src.models import loader_pool
+    from src.resources import icon
+    from src.startup import StartupTimeline
+    from src.styles import apply_base_stylesheet, apply_stylesheet
+    from src.workers import StartupTask
 except ImportError as e:
-    logger.critical(f"Import Error: {e}")
+    logger.critical("Import Error: %s", e)
     sys.exit(1)
 
+IMPORTED = time.perf_counter()
+
+
+def parse_args(argv):
+    """Our options, and whatever is left over for QApplication."""
+    parser = argparse.ArgumentParser(description="Bookhub library management")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup stage took, then exit")
+    parser.add_argument("--log-level", metavar="SPEC", type=logs.parse_levels,
+                        help="logger levels, e.g. 'INFO,src.database=DEBUG' (see src/logs.py)")
+    return parser.parse_known_args(argv)
+
+
 def main():
+    args, qt_args = parse_args(sys.argv[1:])
+    logs.start(levels=args.log_level)
+    timeline = StartupTimeline(STARTED)
+    timeline.add("imports", STARTED, IMPORTED)
     logger.info("Application starting...")
     try:
-        app = QApplication(sys.argv)
-        logger.info("QApplication created.")
-        
-        # Apply modern stylesheet
-        logger.info("Applying modern stylesheet...")
-        apply_stylesheet(app)
-        logger.info("Stylesheet applied.")
-        
-        # Ensure DB tables exist
-        logger.info("Setting up database schema...")
-        if not setup_database_schema():
-            logger.error("Database setup failed.")
-            sys.exit(1)
-        logger.info("Database setup complete.")
-            
-        logger.info("Initializing Login Window...")
-        win = LoginCls()
-        win.show()
+        # Stage 1, on the GUI thread: only what the login window needs.
+        with timeline.stage("QApplication"):
+            app = QApplication(sys.argv[:1] + qt_args)
+            app.aboutToQuit.connect(close_all_connections)
+            apply_base_stylesheet(app)
+
+        with timeline.stage("login window"):
+            win = LoginCls()
+            win.set_waiting("STARTING…")
+            win.show()
+        QTimer.singleShot(0, lambda: timeline.mark("event loop running"))
         logger.info("Login Window shown.")
-        
+
+        # Stage 2, while the user types: schema check and main window import
+        # in the background, then the full stylesheet back on the GUI thread.
+        def finish():
+            with timeline.stage("main stylesheet"):
+                apply_stylesheet(app)
+            win.setWindowIcon(icon("book.png"))
+            win.reset_login_button()
+            timeline.mark("login enabled")
+            logger.info("Startup complete in %.0f ms.", (time.perf_counter() - STARTED) * 1000)
+            if args.profile_startup:
+                print(timeline.report())
+                app.quit()
+
+        def fail(message):
+            logger.error("Startup failed: %s", message)
+            QMessageBox.critical(win, "Database Error", message)
+            app.exit(1)
+
+        task = StartupTask(timeline)
+        task.signals.finished.connect(finish)
+        task.signals.failed.connect(fail)
+        loader_pool().start(task)
+
         sys.exit(app.exec_())
     except Exception as e:
-        logger.critical(f"Unhandled exception: {e}")
+        logger.critical("Unhandled exception: %s", e)
         logger.critical(traceback.format_exc())
         sys.exit(1)
 
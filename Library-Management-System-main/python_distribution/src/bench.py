@@ -0,0 +1,1167 @@
+"""
+Micro-benchmarks for the database layer.
+
+Each benchmark builds a throw-away database in a temporary directory, so the
+real library_management.db is never touched. Run with:
+
+    python -m src.bench <name> [--rows N]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import database
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark function under ``name``."""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def timed(func, repeat=5):
+    """Run ``func`` ``repeat`` times and return the median wall time in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = "  ".join(str(h).ljust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+
+# The text-column layout used before normalise_schema(), for comparisons.
+LEGACY_TABLES = dict(database.TABLES, book="""CREATE TABLE book (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_name TEXT,
+        book_description TEXT,
+        book_code TEXT,
+        book_category TEXT,
+        book_author TEXT,
+        book_publisher TEXT,
+        book_price INTEGER
+    )""", dayoperations="""CREATE TABLE dayoperations (
+        iddayoperations INTEGER PRIMARY KEY AUTOINCREMENT,
+        bookname TEXT,
+        type TEXT,
+        days INTEGER,
+        fromDate TEXT,
+        toDate TEXT,
+        clientName TEXT
+    )""")
+
+LEGACY_INDEXES = (
+    "CREATE UNIQUE INDEX idx_users_username ON users(username)",
+    "CREATE UNIQUE INDEX idx_book_code ON book(book_code)",
+    "CREATE UNIQUE INDEX idx_client_nid ON client(clientNid)",
+    "CREATE INDEX idx_book_name ON book(book_name)",
+)
+
+REFERENCE_SIZES = {"category": 50, "author": 5000, "publisher": 200}
+
+# Vocabulary for synthetic book descriptions, so text search has real words to find.
+DESCRIPTION_WORDS = (
+    "adventure", "ancient", "biography", "castle", "chemistry", "children", "classic", "cooking",
+    "detective", "dragon", "economics", "empire", "engineering", "family", "garden", "geography",
+    "history", "island", "journey", "kingdom", "language", "letters", "mathematics", "medicine",
+    "mountain", "music", "mystery", "ocean", "philosophy", "physics", "poetry", "politics",
+    "psychology", "river", "romance", "science", "secret", "travel", "village", "winter",
+)
+
+
+def book_description(i):
+    words = DESCRIPTION_WORDS
+    return f"{words[i % len(words)].title()} and {words[i // len(words) % len(words)]}, volume {i}"
+
+
+def peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_isolated(func_name, *args):
+    """Run ``src.bench.<func_name>(*args)`` in a fresh interpreter; return its JSON result.
+
+    Used where peak RSS matters, so one measurement cannot inflate the next.
+    """
+    code = f"import json, src.bench as b; print(json.dumps(b.{func_name}(*{args!r})))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def seed_database(path, books=0, clients=0, users=0, operations=0, legacy=False):
+    """Create the schema at ``path`` and fill it with synthetic rows.
+
+    With ``legacy=True`` the pre-normalisation text-column layout is built
+    instead, without running any migration.
+    """
+    profile = database.get_pool().profile
+    database.configure(path, "bulk-load")
+    categories, authors, publishers = REFERENCE_SIZES.values()
+    with database.db_connection() as conn:
+        if legacy:
+            for table_sql in LEGACY_TABLES.values():
+                conn.execute(table_sql)
+            for index_sql in LEGACY_INDEXES:
+                conn.execute(index_sql)
+            conn.executemany(
+                "INSERT INTO book(book_name, book_description, book_code, book_category, book_author, book_publisher, book_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((f"Book {i}", book_description(i), f"B{i:07d}", f"Category {i % categories}",
+                  f"Author {i % authors}", f"Publisher {i % publishers}", i % 90 + 10) for i in range(books)))
+        else:
+            database.setup_database_schema()
+            for table, size in REFERENCE_SIZES.items():
+                column = database.LOOKUP_TABLES[table][1]
+                conn.executemany(f"INSERT INTO {table}({column}) VALUES (?)",
+                                 ((f"{table.title()} {i}",) for i in range(size)))
+            conn.executemany(
+                "INSERT INTO book(book_name, book_description, book_code, category_id, author_id, publisher_id, book_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((f"Book {i}", book_description(i), f"B{i:07d}", i % categories + 1,
+                  i % authors + 1, i % publishers + 1, i % 90 + 10) for i in range(books)))
+        conn.executemany(
+            "INSERT INTO client(clientName, clientEmail, clientNid) VALUES (?, ?, ?)",
+            ((f"Client {i}", f"client{i}@example.com", f"N{i:09d}") for i in range(clients)))
+        conn.executemany(
+            "INSERT INTO users(username, useremail, userspassword) VALUES (?, ?, ?)",
+            ((f"user{i}", f"user{i}@example.com", f"pass{i}") for i in range(users)))
+        if legacy:
+            conn.executemany(
+                "INSERT INTO dayoperations(bookname, type, days, fromDate, toDate, clientName) VALUES (?, ?, ?, ?, ?, ?)",
+                ((f"Book {i % max(books, 1)}", "rent", 7, "2024-01-01", "2024-01-08",
+                  f"Client {i % max(clients, 1)}") for i in range(operations)))
+        else:
+            conn.executemany(
+                "INSERT INTO dayoperations(book_id, type, days, fromDate, toDate, client_id) VALUES (?, ?, ?, ?, ?, ?)",
+                ((i % books + 1, "rent", 7, "2024-01-01", "2024-01-08", i % clients + 1)
+                 for i in range(operations if books and clients else 0)))
+    database.configure(path, profile)
+
+
+# The four data tabs refresh_all_data() reloads.
+REFRESH_QUERIES = tuple(database.LISTINGS[name][1] for name in ("book", "client", "users", "dayoperations"))
+
+
+@benchmark("connections")
+def bench_connections(rows=100_000, repeat=5):
+    """Per-refresh latency: connect/close per query vs. pooled connections."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed_database(path, books=rows, clients=rows // 10, users=100, operations=rows)
+
+        def legacy(queries):
+            for sql in queries:
+                conn = sqlite3.connect(path)
+                conn.execute(sql).fetchall()
+                conn.close()
+
+        def pooled(queries):
+            for sql in queries:
+                with database.db_connection() as conn:
+                    conn.execute(sql).fetchall()
+
+        lookup = ("SELECT category_name FROM category",) * 3
+        database.configure(path)
+        results = [
+            ("refresh_all_data (4 queries)", timed(lambda: legacy(REFRESH_QUERIES), repeat),
+             timed(lambda: pooled(REFRESH_QUERIES), repeat)),
+            ("open_add_book_dialog lookups", timed(lambda: legacy(lookup), repeat * 20),
+             timed(lambda: pooled(lookup), repeat * 20)),
+        ]
+        database.close_all_connections()
+
+    print(f"Connection benchmark, {rows:,} books / {rows:,} operations")
+    print_table(["workload", "connect/close ms", "pooled ms", "speedup"],
+                [(name, f"{old:.2f}", f"{new:.2f}", f"{old / new:.1f}x") for name, old, new in results])
+    return results
+
+
+@benchmark("storage")
+def bench_storage(rows=50_000, repeat=5, inserts=500):
+    """Insert throughput and read latency under each storage profile."""
+    insert_sql = ("INSERT INTO book(book_name, book_description, book_code, category_id, author_id, publisher_id, book_price) "
+                  "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+    def book(i):
+        return (f"New {i}", "", f"N{i:07d}", 1, 1, 1, 10)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Baseline: what the app did before profiles existed.
+        path = os.path.join(tmp, "legacy.db")
+        seed_database(path, books=rows)
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.execute("PRAGMA synchronous = FULL")
+
+        def legacy_insert():
+            for i in range(inserts):
+                conn.execute(insert_sql, book(i))
+                conn.commit()
+            conn.execute("DELETE FROM book WHERE book_name LIKE 'New %'")
+            conn.commit()
+
+        per_commit = timed(legacy_insert, 1)
+        results.append(("legacy (rollback journal)", inserts / per_commit * 1000,
+                        timed(lambda: conn.execute(REFRESH_QUERIES[0]).fetchall(), repeat),
+                        timed(lambda: conn.execute("SELECT * FROM book WHERE id = ?", (rows // 2,)).fetchone(), repeat * 100)))
+        conn.close()
+
+        for profile in database.STORAGE_PROFILES:
+            path = os.path.join(tmp, f"{profile}.db")
+            seed_database(path, books=rows)
+            database.configure(path, profile)
+
+            def insert():
+                for i in range(inserts):
+                    with database.db_connection() as conn:
+                        conn.execute(insert_sql, book(i))
+                with database.db_connection() as conn:
+                    conn.execute("DELETE FROM book WHERE book_name LIKE 'New %'")
+
+            def full_read():
+                with database.db_connection() as conn:
+                    conn.execute(REFRESH_QUERIES[0]).fetchall()
+
+            def point_read():
+                with database.db_connection() as conn:
+                    conn.execute("SELECT * FROM book WHERE id = ?", (rows // 2,)).fetchone()
+
+            if database.get_pool().read_only:
+                rate = None
+            else:
+                rate = inserts / timed(insert, 1) * 1000
+            results.append((profile, rate, timed(full_read, repeat), timed(point_read, repeat * 100)))
+            database.close_all_connections()
+
+    print(f"Storage profile benchmark, {rows:,} books, {inserts} single-row commits")
+    print_table(["profile", "inserts/s", "full read ms", "point read ms"],
+                [(name, "read-only" if rate is None else f"{rate:,.0f}", f"{full:.2f}", f"{point:.3f}")
+                 for name, rate, full, point in results])
+    return results
+
+
+LOOKUP_QUERIES = (
+    ("login", "SELECT id_users, userspassword FROM users WHERE username=?", lambda i: (f"user{i}",)),
+    ("book by code", "SELECT * FROM book WHERE book_code=?", lambda i: (f"B{i:07d}",)),
+    ("book by name", "SELECT * FROM book WHERE book_name=?", lambda i: (f"Book {i}",)),
+    ("client by NID", "SELECT * FROM client WHERE clientNid=?", lambda i: (f"N{i:09d}",)),
+)
+
+
+@benchmark("indexes")
+def bench_indexes(rows=1_000_000, repeat=200):
+    """Login and key lookup latency as the tables grow, with and without indexes."""
+    sizes = sorted({n for n in (1_000, 10_000, 100_000, rows) if n <= rows})
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"{size}.db")
+            seed_database(path, books=size, clients=size, users=size)
+            with database.db_connection() as conn:
+                for label, sql, args in LOOKUP_QUERIES:
+                    key = args(size // 2)
+                    plan = " / ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, key))
+                    indexed = timed(lambda: conn.execute(sql, key).fetchall(), repeat)
+                    results.append([size, label, indexed, plan])
+                # Same lookups against the pre-index schema.
+                for name, _, _ in database.UNIQUE_INDEXES:
+                    conn.execute(f"DROP INDEX {name}")
+                conn.execute("DROP INDEX idx_book_name")
+                for row, (label, sql, args) in zip(results[-len(LOOKUP_QUERIES):], LOOKUP_QUERIES):
+                    key = args(size // 2)
+                    row.insert(2, timed(lambda: conn.execute(sql, key).fetchall(), max(repeat // 50, 3)))
+            database.close_all_connections()
+
+    print(f"Index benchmark, {sizes[0]:,} to {sizes[-1]:,} rows per table")
+    print_table(["rows", "lookup", "no index ms", "indexed ms", "plan"],
+                [(f"{size:,}", label, f"{scan:.3f}", f"{seek:.3f}", plan)
+                 for size, label, scan, seek, plan in results])
+    return results
+
+
+@benchmark("normalised")
+def bench_normalised(rows=200_000, repeat=5):
+    """File size and query latency: text-column layout vs. foreign keys."""
+    legacy_queries = {
+        "book": "SELECT book_code, book_name, book_description, book_category, book_author FROM book",
+        "dayoperations": "SELECT bookname, clientName, type, fromDate, toDate FROM dayoperations",
+    }
+    legacy_rename = "UPDATE book SET book_author = ? WHERE book_author = ?"
+    rename = "UPDATE author SET author_name = ? WHERE idauthor = ?"
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        layouts = {}
+        for name, legacy in (("text columns", True), ("foreign keys", False)):
+            path = os.path.join(tmp, f"{'legacy' if legacy else 'normalised'}.db")
+            seed_database(path, books=rows, clients=rows // 10, operations=rows, legacy=legacy)
+            layouts[name] = path
+            with database.db_connection() as conn:
+                conn.execute("VACUUM")
+                queries = legacy_queries if legacy else dict(zip(database.LISTINGS, REFRESH_QUERIES))
+
+                def rename_author(n=[0]):
+                    n[0] += 1
+                    if legacy:
+                        conn.execute(legacy_rename, (f"Author 7 v{n[0]}", f"Author 7 v{n[0] - 1}" if n[0] > 1 else "Author 7"))
+                    else:
+                        conn.execute(rename, (f"Author 7 v{n[0]}", 8))
+
+                sizes = dict(conn.execute("""SELECT m.type, SUM(s.pgsize) FROM dbstat s
+                    JOIN sqlite_master m ON m.name = s.name GROUP BY m.type""").fetchall())
+                results.append((name, os.path.getsize(path) / 1e6, sizes.get("table", 0) / 1e6, sizes.get("index", 0) / 1e6,
+                                timed(lambda: conn.execute(queries["book"]).fetchall(), repeat),
+                                timed(lambda: conn.execute(queries["dayoperations"]).fetchall(), repeat),
+                                timed(rename_author, repeat)))
+            database.close_all_connections()
+
+        # One-shot migration cost on the legacy file.
+        database.configure(layouts["text columns"])
+        with database.db_connection() as conn:
+            migrate_ms = timed(lambda: database.migrate(conn), 1)
+        database.close_all_connections()
+
+    print(f"Normalised schema benchmark, {rows:,} books / {rows:,} operations")
+    print_table(["layout", "file MB", "tables MB", "indexes MB", "books ms", "day ops ms", "rename author ms"],
+                [(name, f"{size:.1f}", f"{tables:.1f}", f"{indexes:.1f}", f"{books:.1f}", f"{ops:.1f}", f"{ren:.3f}")
+                 for name, size, tables, indexes, books, ops, ren in results])
+    print(f"Migration from text columns: {migrate_ms:.0f} ms")
+    return results
+
+
+@benchmark("startup")
+def bench_startup(rows=1_000_000, repeat=20):
+    """Schema check at launch: CREATE IF NOT EXISTS walk vs. user_version read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "startup.db")
+        seed_database(path, books=rows, clients=rows // 10, users=rows // 10, operations=rows)
+
+        def legacy_setup():
+            # What setup_database_schema() did on every launch before versioning.
+            conn = sqlite3.connect(path)
+            for table_sql in database.TABLES.values():
+                conn.execute(table_sql)
+            conn.execute("SELECT * FROM users").fetchall()
+            conn.close()
+
+        def versioned_setup():
+            conn = sqlite3.connect(path)
+            database.migrate(conn)
+            conn.close()
+
+        size = os.path.getsize(path) / 1e6
+        results = [("CREATE IF NOT EXISTS + users fetch", timed(legacy_setup, repeat)),
+                   ("PRAGMA user_version", timed(versioned_setup, repeat))]
+        database.close_all_connections()
+
+    print(f"Startup schema check, {size:.0f} MB database, {rows // 10:,} users")
+    print_table(["strategy", "ms"], [(name, f"{ms:.3f}") for name, ms in results])
+    return results
+
+
+def paint_table(path, mode):
+    """Time from query to first painted frame of the day operations table."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem
+    from .models import LazyTableModel
+
+    app = QApplication.instance() or QApplication([])
+    database.configure(path)
+    headers = ["Book", "Client", "Type", "From", "To"]
+    start = time.perf_counter()
+    if mode == "QTableWidget":
+        # The pre-model update_table(): every cell becomes a QTableWidgetItem.
+        with database.db_connection() as conn:
+            data = database.fetch_page(conn, "dayoperations")
+        view = QTableWidget()
+        view.setColumnCount(len(headers))
+        view.setHorizontalHeaderLabels(headers)
+        for row_idx, row_data in enumerate(data):
+            view.insertRow(row_idx)
+            for col_idx, item in enumerate(row_data[1:]):
+                view.setItem(row_idx, col_idx, QTableWidgetItem(str(item)))
+    else:
+        def fetch(after_key, limit):
+            with database.db_connection() as conn:
+                yield from database.iter_page(conn, "dayoperations", after_key, limit)
+        view = QTableView()
+        model = LazyTableModel(headers, fetch, parent=view)
+        view.setModel(model)
+        model.fetchMore()
+    view.resize(1200, 800)
+    view.show()
+    app.processEvents()
+    while mode != "QTableWidget" and model.loading:
+        app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    return {"ms": elapsed, "rss_mb": peak_rss_mb()}
+
+
+@benchmark("tables")
+def bench_tables(rows=1_000_000):
+    """Time-to-first-paint and peak RSS: QTableWidget items vs. LazyTableModel."""
+    sizes = sorted({n for n in (10_000, 100_000, rows) if n <= rows})
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"{size}.db")
+            seed_database(path, books=1000, clients=1000, operations=size)
+            database.close_all_connections()
+            for mode in ("QTableWidget", "LazyTableModel"):
+                result = run_isolated("paint_table", path, mode)
+                results.append((size, mode, result["ms"], result["rss_mb"]))
+
+    print("Day operations table, time to first paint (offscreen)")
+    print_table(["rows", "view", "first paint ms", "peak RSS MB"],
+                [(f"{size:,}", mode, f"{ms:.0f}", f"{rss:.0f}") for size, mode, ms, rss in results])
+    return results
+
+
+def open_window(path, threaded):
+    """Library() construction to visible window, then to the first tab's page loaded."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from .models import LazyTableModel
+    from .main import Library
+
+    app = QApplication.instance() or QApplication([])
+    database.configure(path)
+    LazyTableModel.threaded = threaded
+    start = time.perf_counter()
+    window = Library()
+    window.show()
+    app.processEvents()
+    shown = (time.perf_counter() - start) * 1000
+    while any(model.loading for model in window.models.values()):
+        app.processEvents()
+    loaded = (time.perf_counter() - start) * 1000
+    window.close()
+    return {"shown_ms": shown, "loaded_ms": loaded}
+
+
+@benchmark("window")
+def bench_window(rows=1_000_000, repeat=3):
+    """Window-open latency with table pages read on the GUI thread vs. loader threads."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "window.db")
+        seed_database(path, books=rows, clients=rows // 10, users=1000, operations=rows)
+        database.close_all_connections()
+        for label, threaded in (("GUI thread", False), ("loader threads", True)):
+            runs = [run_isolated("open_window", path, threaded) for _ in range(repeat)]
+            results.append((label, statistics.median(r["shown_ms"] for r in runs),
+                            statistics.median(r["loaded_ms"] for r in runs)))
+
+    print(f"Main window open, {rows:,} books / {rows:,} operations")
+    print_table(["loading", "window shown ms", "first tab loaded ms"],
+                [(label, f"{shown:.0f}", f"{loaded:.0f}") for label, shown, loaded in results])
+    return results
+
+
+SEARCH_QUERIES = (
+    ("exact word", "mystery"),
+    ("prefix", "myst"),
+    ("two words", "dragon ocean"),
+    ("typo", "mistery"),
+    ("code", "B0000042"),
+    ("no match", "zeppelin"),
+)
+
+
+@benchmark("search")
+def bench_search(rows=1_000_000, repeat=20):
+    """First-page latency of the book search: LIKE over the listing vs. FTS5."""
+    from . import search
+
+    key, select = database.LISTINGS["book"]
+    like = (f"{select} WHERE {key} > 0 AND (b.book_name LIKE :q OR b.book_description LIKE :q "
+            f"OR b.book_code LIKE :q OR a.author_name LIKE :q) ORDER BY {key} LIMIT 256")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "search.db")
+        seed_database(path, books=rows)
+        with database.db_connection() as conn:
+            for label, text in SEARCH_QUERIES:
+                found = len(search.search(conn, "book", text, limit=256))
+                scan = timed(lambda: conn.execute(like, {"q": f"%{text}%"}).fetchall(), max(repeat // 10, 3))
+                fts = timed(lambda: search.search(conn, "book", text, limit=256), repeat)
+                results.append((label, text, found, scan, fts))
+            match = timed(lambda: search.match_expression(conn, "book", "mistery"), repeat)
+        database.close_all_connections()
+
+    print(f"Book search, {rows:,} books, first page of 256")
+    print_table(["query", "text", "rows", "LIKE ms", "FTS ms"],
+                [(label, text, found, f"{scan:.1f}", f"{fts:.2f}") for label, text, found, scan, fts in results])
+    print(f"Typo expansion alone: {match:.2f} ms")
+    return results
+
+
+def export_legacy(path, table, filename):
+    """The pre-streaming _export_table: fetchall(), then one cell at a time."""
+    from xlsxwriter import Workbook
+
+    database.configure(path)
+    start = time.perf_counter()
+    with database.db_connection() as conn:
+        cur = conn.execute(database.export_query(table))
+        data = cur.fetchall()
+        names = [description[0] for description in cur.description]
+    wb = Workbook(filename)
+    sheet = wb.add_worksheet()
+    for col, name in enumerate(names):
+        sheet.write(0, col, name)
+    for row_idx, row in enumerate(data):
+        for col_idx, item in enumerate(row):
+            sheet.write(row_idx + 1, col_idx, str(item))
+    wb.close()
+    return {"rows": len(data), "seconds": time.perf_counter() - start, "peak_mb": peak_rss_mb()}
+
+
+def export_streaming(path, table, filename):
+    from . import export
+
+    database.configure(path)
+    start = time.perf_counter()
+    with database.db_connection() as conn:
+        rows = export.export_table(conn, table, filename)
+    return {"rows": rows, "seconds": time.perf_counter() - start, "peak_mb": peak_rss_mb()}
+
+
+def export_streaming_text(path, table, filename):
+    """Streaming export with every value stringified, as before typed cells."""
+    from xlsxwriter import Workbook
+
+    database.configure(path)
+    start = time.perf_counter()
+    rows = 0
+    with database.db_connection() as conn:
+        cur = conn.execute(database.export_query(table))
+        wb = Workbook(filename, {"constant_memory": True})
+        sheet = wb.add_worksheet()
+        sheet.write_row(0, 0, [description[0] for description in cur.description])
+        for chunk in iter(lambda: cur.fetchmany(2000), []):
+            for row in chunk:
+                rows += 1
+                for col, item in enumerate(row):
+                    sheet.write_string(rows, col, str(item))
+        wb.close()
+    return {"rows": rows, "seconds": time.perf_counter() - start, "peak_mb": peak_rss_mb()}
+
+
+@benchmark("export")
+def bench_export(rows=1_000_000, repeat=1):
+    """Peak RSS and throughput of a day-operations XLSX export."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.db")
+        seed_database(path, books=rows // 10, clients=rows // 100, operations=rows)
+        database.close_all_connections()
+        baseline = run_isolated("peak_rss_mb")
+        for label, func in (("fetchall + write", "export_legacy"), ("streaming, text cells", "export_streaming_text"),
+                            ("streaming, typed cells", "export_streaming")):
+            filename = os.path.join(tmp, f"{func}.xlsx")
+            runs = [run_isolated(func, path, "dayoperations", filename) for _ in range(repeat)]
+            seconds = statistics.median(r["seconds"] for r in runs)
+            results.append((label, runs[0]["rows"], seconds, runs[0]["rows"] / seconds,
+                            max(r["peak_mb"] for r in runs) - baseline, os.path.getsize(filename) / 1e6))
+
+    print(f"Day operations export, {rows:,} rows")
+    print_table(["export", "rows", "seconds", "rows/s", "peak RSS MB (over idle)", "file MB"],
+                [(label, f"{n:,}", f"{sec:.1f}", f"{rate:,.0f}", f"{peak:.0f}", f"{size:.1f}")
+                 for label, n, sec, rate, peak, size in results])
+    return results
+
+
+@benchmark("formats")
+def bench_formats(rows=1_000_000, repeat=1):
+    """Throughput and output size of each registered export format."""
+    from . import export
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "formats.db")
+        seed_database(path, books=rows // 10, clients=rows // 100, operations=rows)
+        with database.db_connection() as conn:
+            for name, (_, extension, _) in export.EXPORTERS.items():
+                filename = os.path.join(tmp, "out" + extension)
+                seconds = timed(lambda: export.export_table(conn, "dayoperations", filename, name), repeat) / 1000
+                results.append((name, seconds, rows / seconds, os.path.getsize(filename) / 1e6))
+        database.close_all_connections()
+
+    print(f"Day operations export by format, {rows:,} rows")
+    print_table(["format", "seconds", "rows/s", "file MB"],
+                [(name, f"{sec:.1f}", f"{rate:,.0f}", f"{size:.1f}") for name, sec, rate, size in results])
+    return results
+
+
+@benchmark("import")
+def bench_import(rows=300_000, repeat=1):
+    """Book import throughput: one add_book() commit per row vs. the batched importer."""
+    import csv
+    from . import export, importer
+
+    categories, authors, publishers = REFERENCE_SIZES.values()
+    columns = importer.IMPORT_COLUMNS["book"]
+    records = [{"code": f"B{i:07d}", "name": f"Book {i}", "description": book_description(i),
+                "category": f"Category {i % categories}", "author": f"Author {i % authors}",
+                "publisher": f"Publisher {i % publishers}", "price": i % 90 + 10} for i in range(rows)]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, "books.csv")
+        xlsx_file = os.path.join(tmp, "books.xlsx")
+        with open(csv_file, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([record[key] for key in columns.values()] for record in records)
+
+        def per_row():
+            # What the Add Book dialog does, once per row
+            for record in records:
+                with database.db_connection() as conn:
+                    database.add_book(conn, record)
+
+        database.configure(os.path.join(tmp, "per_row.db"))
+        database.setup_database_schema()
+        results.append(("add_book per row", timed(per_row, repeat)))
+
+        database.configure(os.path.join(tmp, "import.db"))
+        database.setup_database_schema()
+        results.append(("import CSV (inserts)", timed(lambda: importer.import_file("book", csv_file), repeat)))
+        results.append(("import CSV (updates)", timed(lambda: importer.import_file("book", csv_file), repeat)))
+        with database.db_connection() as conn:
+            export.export_table(conn, "book", xlsx_file)
+
+        database.configure(os.path.join(tmp, "xlsx.db"))
+        database.setup_database_schema()
+        results.append(("import XLSX (inserts)", timed(lambda: importer.import_file("book", xlsx_file), repeat)))
+        database.close_all_connections()
+
+    print(f"Book import, {rows:,} rows")
+    print_table(["method", "seconds", "rows/s"],
+                [(label, f"{ms / 1000:.1f}", f"{rows / (ms / 1000):,.0f}") for label, ms in results])
+    return results
+
+
+def open_book_dialog(path, mode):
+    """Time to open the Add Book dialog, in a fresh interpreter."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtCore import QStringListModel
+    from PyQt5.QtWidgets import QApplication, QComboBox
+    from .dialogs import BookDialog
+
+    app = QApplication.instance() or QApplication([])
+    database.configure(path)
+    models = {table: QStringListModel() for table in database.LOOKUP_TABLES}
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        if mode == "combo boxes":
+            # The pre-cache dialog: three queries, then addItems() into plain combos
+            with database.db_connection() as conn:
+                lists = [[name for (name,) in conn.execute(f"SELECT {column} FROM {table}")]
+                         for table, (_, column) in database.LOOKUP_TABLES.items()]
+            dialog = BookDialog()
+            for items in lists:
+                QComboBox(dialog).addItems(items)
+        else:
+            with database.db_connection() as conn:
+                for table, model in models.items():
+                    names = database.lookup_names(conn, table)
+                    if model.rowCount() != len(names):
+                        model.setStringList(list(names))
+            dialog = BookDialog(None, models["category"], models["author"], models["publisher"])
+        dialog.show()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+        dialog.close()
+    return {"first_ms": samples[0], "again_ms": statistics.median(samples[1:])}
+
+
+@benchmark("lookups")
+def bench_lookups(rows=50_000, repeat=50):
+    """Reference lists for the Add Book dialog: query every time vs. lookup_names() cache."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lookups.db")
+        seed_database(path)
+        with database.db_connection() as conn:
+            conn.executemany("INSERT INTO author(author_name) VALUES (?)", ((f"Writer {i}",) for i in range(rows)))
+
+            def query_all():
+                for table, (_, column) in database.LOOKUP_TABLES.items():
+                    [name for (name,) in conn.execute(f"SELECT {column} FROM {table}")]
+
+            def cached():
+                for table in database.LOOKUP_TABLES:
+                    database.lookup_names(conn, table)
+
+            results.append(("query every open", timed(query_all, repeat)))
+            database.lookup_id(conn, "author", "Brand New Author")
+            results.append(("cache, after a write", timed(lambda: (conn.execute(
+                "UPDATE lookup_version SET version = version + 1 WHERE table_name = 'author'"), cached()), repeat)))
+            results.append(("cache hit", timed(cached, repeat)))
+        database.close_all_connections()
+        try:
+            for mode in ("combo boxes", "completer"):
+                run = run_isolated("open_book_dialog", path, mode)
+                results.append((f"dialog open, {mode} (first / again)", f"{run['first_ms']:.1f} / {run['again_ms']:.1f}"))
+        except subprocess.CalledProcessError as e:
+            print(f"Dialog timings skipped: {e.stderr.strip().splitlines()[-1]}")
+
+    print(f"Book dialog reference lists, {rows:,} authors")
+    print_table(["method", "ms"], [(label, ms if isinstance(ms, str) else f"{ms:.3f}") for label, ms in results])
+    return results
+
+
+@benchmark("reference")
+def bench_reference(rows=1_000_000, repeat=5, names=10_000):
+    """Settings-tab reference data: batch add, rename and merge against a large catalogue."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reference.db")
+        seed_database(path, books=rows)
+        new_names = [f"Writer {i}" for i in range(names)]
+
+        database.configure(path)
+        with database.db_connection() as conn:
+            first_page = timed(lambda: database.fetch_page(conn, "author", 0, 256), repeat)
+            last_key = conn.execute("SELECT MAX(idauthor) FROM author").fetchone()[0]
+            last_page = timed(lambda: database.fetch_page(conn, "author", last_key - 256, 256), repeat)
+        results.append(("author page (256 rows, with book counts)", first_page, last_page))
+
+        def add_one_by_one():
+            # What typing each name into the Add Book dialog amounts to
+            for name in new_names:
+                with database.db_connection() as conn:
+                    database.lookup_id(conn, "author", name)
+
+        def add_batch():
+            with database.db_connection() as conn:
+                database.add_lookup_names(conn, "author", new_names)
+
+        def delete_new():
+            with database.db_connection() as conn:
+                conn.execute("DELETE FROM author WHERE author_name LIKE 'Writer %'")
+
+        for label, func in ((f"add {names:,} authors, one commit each", add_one_by_one),
+                            (f"add {names:,} authors, add_lookup_names()", add_batch)):
+            start = time.perf_counter()
+            func()
+            results.append((label, (time.perf_counter() - start) * 1000, None))
+            delete_new()
+
+        def rename(n=[0]):
+            n[0] += 1
+            with database.db_connection() as conn:
+                database.rename_lookup(conn, "author", 7, f"Author 7 v{n[0]}")
+
+        results.append((f"rename an author ({rows // REFERENCE_SIZES['author']:,} books)", timed(rename, repeat), None))
+
+        with database.db_connection() as conn:
+            sources = [row[0] for row in conn.execute("SELECT idauthor FROM author WHERE idauthor > 1 LIMIT 10")]
+            books = conn.execute(f"SELECT id, author_id FROM book WHERE author_id IN ({','.join('?' * len(sources))})",
+                                 sources).fetchall()
+
+        def merge_per_book():
+            # Re-pointing one book at a time, as a clerk editing each book would
+            with database.db_connection() as conn:
+                conn.executemany("UPDATE book SET author_id = 1 WHERE id = ?", ((book,) for book, _ in books))
+                conn.executemany("DELETE FROM author WHERE idauthor = ?", ((source,) for source in sources))
+                conn.rollback()
+
+        def merge_batch():
+            with database.db_connection() as conn:
+                database.merge_lookups(conn, "author", 1, sources)
+                conn.rollback()
+
+        label = f"merge 10 authors ({len(books):,} books)"
+        results.append((f"{label}, per book", timed(merge_per_book, repeat), None))
+        results.append((f"{label}, merge_lookups()", timed(merge_batch, repeat), None))
+        database.close_all_connections()
+
+    print(f"Reference data, {rows:,} books / {REFERENCE_SIZES['author']:,} authors")
+    print_table(["operation", "ms", "last page ms"],
+                [(label, f"{ms:.1f}", "" if extra is None else f"{extra:.1f}") for label, ms, extra in results])
+    return results
+
+
+@benchmark("edits")
+def bench_edits(rows=1_000_000, repeat=20, deletes=1000):
+    """Edit and delete latency by primary key as the book table grows."""
+    data = {"name": "Edited", "description": "", "code": "EDITED", "category": "Category 1",
+            "author": "Author 1", "publisher": "Publisher 1", "price": 10}
+    # The notebook app's update, keyed on the unindexed, non-unique book name;
+    # the unary + keeps SQLite from using today's idx_book_name.
+    by_name = "UPDATE book SET book_description = ? WHERE +book_name = ?"
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (rows // 100, rows // 10, rows):
+            path = os.path.join(tmp, f"edits_{size}.db")
+            seed_database(path, books=size)
+            middle = size // 2
+
+            def update_by_key():
+                with database.db_connection() as conn:
+                    database.update_book(conn, middle, data)
+                    database.fetch_row(conn, "book", middle)
+
+            def update_by_name():
+                with database.db_connection() as conn:
+                    conn.execute(by_name, ("Edited", f"Book {middle}"))
+
+            doomed = list(range(1, deletes + 1))
+
+            def delete_one_by_one():
+                for key in doomed:
+                    with database.db_connection() as conn:
+                        conn.execute("DELETE FROM book WHERE id = ?", (key,))
+
+            def delete_batch():
+                with database.db_connection() as conn:
+                    database.delete_rows(conn, "book", [key + deletes for key in doomed])
+
+            results.append((f"{size:,}", timed(update_by_key, repeat), timed(update_by_name, max(repeat // 4, 1)),
+                            timed(delete_one_by_one, 1), timed(delete_batch, 1)))
+            database.close_all_connections()
+
+    print(f"Book edits and deletes by table size ({deletes:,} rows deleted)")
+    print_table(["books", "update by id ms", "update by name ms", "delete 1 commit each ms", "delete_rows() ms"],
+                [(size, f"{key:.2f}", f"{name:.1f}", f"{one:.0f}", f"{batch:.1f}")
+                 for size, key, name, one, batch in results])
+    return results
+
+
+def seed_loans(conn, loans, books, clients, out_every=200):
+    """``loans`` days of history, oldest first: 14-day loans, one in ``out_every`` still out.
+
+    Generated by a recursive CTE so 10M rows load at C speed.
+    """
+    conn.execute("""WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < ? - 1)
+        INSERT INTO dayoperations(book_id, client_id, type, days, fromDate, toDate, status, returnDate)
+        SELECT i % ? + 1, i * 7919 % ? + 1, 'rent', 14, d, date(d, '+14 days'),
+               CASE WHEN i % ? = 0 THEN 'out' ELSE 'returned' END,
+               CASE WHEN i % ? = 0 THEN NULL ELSE date(d, '+10 days') END
+        FROM (SELECT i, date('2024-06-30', '-' || ((? - 1 - i) * 3650 / ?) || ' days') AS d FROM n)""",
+                 (loans, books, clients, out_every, out_every, loans, loans))
+
+
+@benchmark("circulation")
+def bench_circulation(rows=10_000_000, repeat=20):
+    """Active-loan queries over a long operations history: single-column vs. circulation indexes."""
+    from . import circulation
+
+    books, clients, on = 100_000, 50_000, "2024-06-30"
+    single = ["CREATE INDEX idx_dayoperations_book ON dayoperations(book_id)",
+              "CREATE INDEX idx_dayoperations_client ON dayoperations(client_id)"]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "circulation.db")
+        seed_database(path, books=books, clients=clients)
+        database.configure(path, "bulk-load")
+        start = time.perf_counter()
+        with database.db_connection() as conn:
+            seed_loans(conn, rows, books, clients)
+            conn.execute("ANALYZE")
+        seed_seconds = time.perf_counter() - start
+        database.configure(path, "desktop")
+
+        with database.db_connection() as conn:
+            client = conn.execute("SELECT client_id FROM dayoperations WHERE status = 'out' LIMIT 1").fetchone()[0]
+            book = conn.execute("SELECT book_id FROM dayoperations WHERE status = 'out' LIMIT 1").fetchone()[0]
+            free_book = conn.execute("""SELECT id FROM book WHERE id NOT IN
+                (SELECT book_id FROM dayoperations WHERE status = 'out') LIMIT 1""").fetchone()[0]
+
+            def lend_and_return():
+                loan = circulation.borrow(conn, free_book, client, on=on)
+                circulation.return_loan(conn, loan, on=on)
+                conn.rollback()
+
+            queries = [
+                ("overdue today (count)", lambda: circulation.overdue_count(conn, on)),
+                ("overdue today (first page)", lambda: next(circulation.iter_overdue(conn, on, limit=256), None)),
+                ("client's open loans", lambda: circulation.client_loans(conn, client)),
+                ("book's open loan", lambda: circulation.current_loan(conn, book)),
+                ("borrow + return", lend_and_return),
+            ]
+            for label, indexes in (("circulation indexes", None), ("single-column indexes", single)):
+                if indexes:
+                    for index in database.CIRCULATION_INDEXES:
+                        conn.execute(f"DROP INDEX {index.split()[5]}")
+                    for index in indexes:
+                        conn.execute(index)
+                    conn.execute("ANALYZE")
+                    conn.commit()
+                for name, func in queries:
+                    results.append((label, name, timed(func, repeat if indexes is None or "overdue" not in name else 3)))
+            out = conn.execute("SELECT COUNT(*) FROM dayoperations WHERE status = 'out'").fetchone()[0]
+        database.close_all_connections()
+
+    print(f"Circulation, {rows:,} operations ({out:,} open) over {books:,} books / {clients:,} clients; "
+          f"seeded in {seed_seconds:.0f}s")
+    print_table(["indexes", "query", "ms"], [(label, name, f"{ms:.3f}") for label, name, ms in results])
+    return results
+
+
+@benchmark("availability")
+def bench_availability(rows=2_000_000, repeat=20):
+    """Book availability: maintained counters vs. counting loans, plus the trigger cost on writes."""
+    from . import circulation
+
+    books, clients, on = 100_000, 50_000, "2024-06-30"
+    key, select = database.LISTINGS["book"]
+    counted = select.replace("av.copies - av.on_loan",
+                             "1 - (SELECT COUNT(*) FROM dayoperations WHERE book_id = b.id AND status = 'out')")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "availability.db")
+        seed_database(path, books=books, clients=clients)
+        database.configure(path, "bulk-load")
+        with database.db_connection() as conn:
+            seed_loans(conn, rows, books, clients)
+            database.rebuild_availability(conn)
+            conn.execute("ANALYZE")
+        database.configure(path, "desktop")
+
+        with database.db_connection() as conn:
+            middle = books // 2
+            page = f"{{}} WHERE {key} > ? ORDER BY {key} LIMIT 256"
+            results.append(("page of 256 books, maintained counters",
+                            timed(lambda: conn.execute(page.format(select), (middle,)).fetchall(), repeat)))
+            results.append(("page of 256 books, indexed COUNT per book",
+                            timed(lambda: conn.execute(page.format(counted), (middle,)).fetchall(), repeat)))
+            results.append(("one book, notebook-style history scan", timed(lambda: conn.execute(
+                "SELECT COUNT(*) FROM dayoperations NOT INDEXED WHERE book_id = ? AND status = 'out'",
+                (middle,)).fetchone(), 3)))
+            results.append(("one book, maintained counter",
+                            timed(lambda: circulation.available_copies(conn, middle), repeat)))
+
+            client = 1
+            free_book = conn.execute("SELECT book_id FROM book_availability WHERE on_loan = 0 LIMIT 1").fetchone()[0]
+
+            def lend_and_return():
+                for _ in range(100):
+                    loan = circulation.borrow(conn, free_book, client, on=on)
+                    circulation.return_loan(conn, loan, on=on)
+                conn.rollback()
+
+            results.append(("100 x borrow + return, with triggers", timed(lend_and_return, repeat)))
+            results.append(("check_availability()", timed(lambda: database.check_availability(conn), 3)))
+            results.append(("rebuild_availability()", timed(lambda: (database.rebuild_availability(conn),
+                                                                     conn.rollback()), 3)))
+            for name, in conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'loan_availability_%'").fetchall():
+                conn.execute(f"DROP TRIGGER {name}")
+            results.append(("100 x borrow + return, without triggers", timed(lend_and_return, repeat)))
+            conn.rollback()
+        database.close_all_connections()
+
+    print(f"Book availability, {books:,} books / {rows:,} operations")
+    print_table(["query", "ms"], [(label, f"{ms:.3f}") for label, ms in results])
+    return results
+
+
+@benchmark("passwords")
+def bench_passwords(rows=10_000, repeat=9):
+    """Login latency for each scrypt work factor: right password, wrong password, unknown user."""
+    from . import passwords
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "passwords.db")
+        seed_database(path, users=rows)
+        database.configure(path)
+        with database.db_connection() as conn:
+            for exponent in range(12, 18):
+                n = 2 ** exponent
+                conn.execute("UPDATE users SET userspassword = ? WHERE username = 'user1'",
+                             (passwords.hash_password("pass1", n=n),))
+                conn.commit()
+                old = passwords.SCRYPT_N, passwords._dummy_hash
+                passwords.SCRYPT_N, passwords._dummy_hash = n, None
+                try:
+                    passwords.dummy_hash()
+                    right = timed(lambda: passwords.authenticate(conn, "user1", "pass1"), repeat)
+                    wrong = timed(lambda: passwords.authenticate(conn, "user1", "pass2"), repeat)
+                    unknown = timed(lambda: passwords.authenticate(conn, "nobody", "pass1"), repeat)
+                finally:
+                    passwords.SCRYPT_N, passwords._dummy_hash = old
+                results.append((n, 128 * n * passwords.SCRYPT_R / 2 ** 20, right, wrong, unknown))
+        database.close_all_connections()
+
+    print(f"Password checks, {rows:,} users, scrypt r={passwords.SCRYPT_R} p={passwords.SCRYPT_P} "
+          f"(current N={passwords.SCRYPT_N})")
+    print_table(["N", "memory MiB", "login ms", "wrong password ms", "unknown user ms"],
+                [(n, f"{mib:.0f}", f"{a:.1f}", f"{b:.1f}", f"{c:.1f}") for n, mib, a, b, c in results])
+    return results
+
+
+@benchmark("logging")
+def bench_logging(rows=1_000_000, repeat=20, records=20_000):
+    """Tab refresh latency and GUI-thread cost per record: logging off, run.py's old setup, the queue."""
+    import logging
+    from . import logs
+
+    root = logging.getLogger()
+    log = logging.getLogger("src.bench")
+    saved = root.handlers[:], root.level
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        path = os.path.join(tmp, "logging.db")
+        seed_database(path, books=rows, clients=rows // 10, users=1000, operations=rows)
+        database.configure(path)
+
+        def refresh():
+            # First page of each data tab, as refresh_all_data() loads them.
+            for listing in ("book", "client", "users", "dayoperations"):
+                with database.db_connection() as conn:
+                    for _ in database.iter_page(conn, listing, 0, 256):
+                        pass
+
+        def emit():
+            for i in range(records):
+                log.debug("Read %d rows of %s after key %s", 256, "book", i)
+
+        def sync_setup():
+            # What run.py configured before: DEBUG everywhere, written on the calling thread.
+            logs.stop()
+            file_handler = logging.FileHandler(os.path.join(tmp, "sync.log"))
+            stream_handler = logging.StreamHandler(devnull)
+            for handler in (file_handler, stream_handler):
+                handler.setFormatter(logging.Formatter(logs.FORMAT))
+            root.handlers[:] = [file_handler, stream_handler]
+            root.setLevel(logging.DEBUG)
+
+        def off():
+            logs.stop()
+            root.handlers[:] = []
+            root.setLevel(logging.WARNING)
+
+        setups = [
+            ("off", off),
+            ("before: DEBUG, FileHandler + stdout", sync_setup),
+            ("queue, default levels (INFO)", lambda: logs.start(os.path.join(tmp, "queue.log"), console=False)),
+            ("queue, DEBUG", lambda: logs.start(os.path.join(tmp, "queue.log"), "DEBUG", console=False)),
+            ("queue, DEBUG, no rate limit",
+             lambda: logs.start(os.path.join(tmp, "queue.log"), "DEBUG", console=False, burst=None)),
+        ]
+        try:
+            # Setups take turns, so drift over the run does not favour one.
+            samples = {name: ([], []) for name, _ in setups}
+            for _ in range(5):
+                for name, setup in setups:
+                    setup()
+                    samples[name][0].append(timed(refresh, repeat))
+                    samples[name][1].append(timed(emit, 1) * 1000 / records)
+                    logs.stop()
+            results = [(name, statistics.median(refresh_ms), statistics.median(record_us))
+                       for name, (refresh_ms, record_us) in samples.items()]
+            # A disabled debug line: f-string formatting vs. lazy arguments.
+            off()
+            fstring = timed(lambda: [log.debug(f"Read {256} rows of {'book'} after key {i}")
+                                     for i in range(records)], 5) * 1000 / records
+            lazy = timed(lambda: [log.debug("Read %d rows of %s after key %s", 256, "book", i)
+                                  for i in range(records)], 5) * 1000 / records
+        finally:
+            root.handlers[:], level = saved
+            root.setLevel(level)
+            database.close_all_connections()
+
+    print(f"Logging, {rows:,} books: refresh = first 256-row page of the four data tabs")
+    print_table(["setup", "refresh ms", "us per debug call"],
+                [(name, f"{ms:.3f}", f"{us:.2f}") for name, ms, us in results])
+    print(f"disabled debug call: f-string {fstring:.3f} us, %-args {lazy:.3f} us")
+    return results
+
+
+@benchmark("profiler")
+def bench_profiler(rows=1_000_000, repeat=20):
+    """Query profiler overhead on a tab refresh and a full listing read, and what it reports."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profiler.db")
+        seed_database(path, books=rows, clients=rows // 10, users=1000, operations=rows)
+        database.configure(path)
+
+        def refresh():
+            # First page of each data tab, as refresh_all_data() loads them.
+            for listing in ("book", "client", "users", "dayoperations"):
+                with database.db_connection() as conn:
+                    for _ in database.iter_page(conn, listing, 0, 256):
+                        pass
+
+        def read_books():
+            # The whole book listing, as an export reads it.
+            with database.db_connection() as conn:
+                for _ in database.iter_page(conn, "book"):
+                    pass
+
+        def scan():
+            # A filter no index covers, so the report has a full scan to flag.
+            with database.db_connection() as conn:
+                conn.execute("SELECT COUNT(*) FROM book WHERE book_price > ?", (50,)).fetchone()
+
+        try:
+            # Off and on take turns, so drift over the run does not favour one.
+            samples = {"off": ([], []), "on": ([], [])}
+            for _ in range(5):
+                for name in samples:
+                    if name == "on":
+                        database.start_profiling()
+                    samples[name][0].append(timed(refresh, repeat))
+                    samples[name][1].append(timed(read_books, 1))
+                    database.stop_profiling()
+            results = [(name, statistics.median(refresh_ms), statistics.median(read_ms))
+                       for name, (refresh_ms, read_ms) in samples.items()]
+
+            profiler = database.start_profiling()
+            profiler.reset()
+            refresh()
+            scan()
+            with database.db_connection() as conn:
+                report = profiler.report(conn)
+            database.stop_profiling()
+        finally:
+            database.stop_profiling()
+            database.close_all_connections()
+
+    print(f"Query profiler, {rows:,} books: refresh = first 256-row page of the four data tabs")
+    print_table(["profiling", "refresh ms", "book listing ms"],
+                [(name, f"{refresh_ms:.3f}", f"{read_ms:.1f}") for name, refresh_ms, read_ms in results])
+    print()
+    print_table(["statement", "count", "total ms", "rows", "full scan"],
+                [(entry["sql"][:70], entry["count"], f"{entry['total_ms']:.2f}", entry["rows"],
+                  "yes" if entry["full_scan"] else "") for entry in report])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("name", choices=sorted(BENCHMARKS))
+    parser.add_argument("--rows", type=int, help="dataset size (benchmark specific default)")
+    args = parser.parse_args(argv)
+    kwargs = {"rows": args.rows} if args.rows else {}
+    BENCHMARKS[args.name](**kwargs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
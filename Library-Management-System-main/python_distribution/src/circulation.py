@@ -0,0 +1,135 @@
+"""
+Borrowing, returning and renewing books.
+
+Each loan is one ``dayoperations`` row: type 'rent', the client and book by
+id, ``fromDate`` (borrowed) and ``toDate`` (due) as ISO 'YYYY-MM-DD' text,
+which sorts and compares as dates, and ``status`` 'out' until the book comes
+back. The circulation indexes lead with status, client or book, so every
+query here is an index range scan however long the history grows.
+"""
+
+import datetime
+import json
+import logging
+
+from .database import LISTINGS
+from .search import FILTERS, match_expression
+
+logger = logging.getLogger(__name__)
+
+# Default loan and renewal period, in days.
+LOAN_DAYS = 14
+
+
+def today():
+    return datetime.date.today().isoformat()
+
+
+def ids_for(conn, book_code, client_nid):
+    """Resolve a book code and a client national ID to their ids; ValueError if either is unknown."""
+    book = conn.execute("SELECT id FROM book WHERE book_code = ?", (book_code,)).fetchone()
+    if book is None:
+        raise ValueError(f"No book has the code '{book_code}'.")
+    client = conn.execute("SELECT idclient FROM client WHERE clientNid = ?", (client_nid,)).fetchone()
+    if client is None:
+        raise ValueError(f"No client has the ID '{client_nid}'.")
+    return book[0], client[0]
+
+
+def current_loan(conn, book_id):
+    """Id of an open loan of a book, or None if no copy is out."""
+    row = conn.execute("SELECT iddayoperations FROM dayoperations WHERE book_id = ? AND status = 'out'",
+                       (book_id,)).fetchone()
+    return row[0] if row else None
+
+
+def available_copies(conn, book_id):
+    """Copies of a book on the shelf, from the maintained counters (0 if unknown)."""
+    row = conn.execute("SELECT copies - on_loan FROM book_availability WHERE book_id = ?", (book_id,)).fetchone()
+    return row[0] if row else 0
+
+
+def borrow(conn, book_id, client_id, days=LOAN_DAYS, on=None):
+    """Lend a book to a client for ``days`` from ``on`` (default today); returns the loan id.
+
+    Raises ValueError if every copy is already out.
+    """
+    if days < 1:
+        raise ValueError("A loan must last at least one day.")
+    if available_copies(conn, book_id) < 1:
+        raise ValueError("No copy of this book is available.")
+    on = on or today()
+    return conn.execute("""INSERT INTO dayoperations(book_id, client_id, type, days, fromDate, toDate, status)
+        VALUES (?, ?, 'rent', ?, ?, date(?, '+' || ? || ' days'), 'out')""",
+                        (book_id, client_id, days, on, on, days)).lastrowid
+
+
+def return_loan(conn, loan_id, on=None):
+    """Close a loan, by its id, as returned ``on`` (default today).
+
+    Raises ValueError if there is no open loan with that id.
+    """
+    cur = conn.execute("UPDATE dayoperations SET status = 'returned', returnDate = ? "
+                       "WHERE iddayoperations = ? AND status = 'out'", (on or today(), loan_id))
+    if cur.rowcount == 0:
+        raise ValueError("That loan is not open.")
+
+
+def renew(conn, loan_id, days=LOAN_DAYS):
+    """Push an open loan's due date back by ``days``; returns the new due date.
+
+    Raises ValueError if there is no open loan with that id.
+    """
+    row = conn.execute("""UPDATE dayoperations SET toDate = date(toDate, '+' || ? || ' days'), days = days + ?
+        WHERE iddayoperations = ? AND status = 'out' RETURNING toDate""", (days, days, loan_id)).fetchone()
+    if row is None:
+        raise ValueError("That loan is not open.")
+    return row[0]
+
+
+def loan_books(conn, loan_ids):
+    """Distinct book ids of the given loans."""
+    return [book_id for (book_id,) in conn.execute(
+        "SELECT DISTINCT book_id FROM dayoperations WHERE iddayoperations IN (SELECT value FROM json_each(?))",
+        (json.dumps(list(loan_ids)),))]
+
+
+def overdue_count(conn, on=None):
+    return conn.execute("SELECT COUNT(*) FROM dayoperations WHERE status = 'out' AND toDate < ?",
+                        (on or today(),)).fetchone()[0]
+
+
+def client_loans(conn, client_id):
+    """Open loans of a client as (loan id, book name, due date), soonest due first."""
+    return conn.execute("""SELECT d.iddayoperations, b.book_name, d.toDate
+        FROM dayoperations d LEFT JOIN book b ON b.id = d.book_id
+        WHERE d.client_id = ? AND d.status = 'out'
+        ORDER BY d.toDate""", (client_id,)).fetchall()
+
+
+def iter_overdue(conn, on=None, after_key=0, limit=-1, chunk_size=200, text=""):
+    """Rows of the day-operations listing still out past their due date, paged by key like iter_page().
+
+    With ``text``, only loans whose book or client matches it, as in search.iter_search().
+    """
+    key, select = LISTINGS["dayoperations"]
+    params = {"on": on or today(), "after": after_key, "limit": limit}
+    match = ""
+    if text:
+        params["match"] = match_expression(conn, "dayoperations", text)
+        if not params["match"]:
+            return
+        match = f"AND {FILTERS['dayoperations']}"
+    # The page is picked inside the subquery from idx_dayoperations_status_due,
+    # then sorted: overdue loans are few. The unary + stops the planner from
+    # walking the whole history in key order to avoid that sort.
+    cur = conn.execute(f"""{select} WHERE {key} IN (
+            SELECT d.iddayoperations FROM dayoperations d
+            WHERE d.status = 'out' AND d.toDate < :on AND +d.iddayoperations > :after {match}
+            ORDER BY +d.iddayoperations LIMIT :limit)
+        ORDER BY {key}""", params)
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
@@ -0,0 +1,199 @@
+"""
+Command-line entry point for batch jobs. Run from python_distribution as:
+
+    python -m src <command> [options]
+
+Only the database layer is imported, never PyQt, so a cron job starts in
+milliseconds and runs on a server without a display.
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+
+from . import database
+
+logger = logging.getLogger(__name__)
+
+
+def cmd_export(args):
+    from . import export
+
+    fmt = args.format
+    filename = args.output
+    if filename is None:
+        fmt = fmt or "xlsx"
+        filename = export.DEFAULT_FILENAMES[args.table] + export.EXPORTERS[fmt][1]
+    start = time.perf_counter()
+    with database.db_connection() as conn:
+        written = export.export_table(conn, args.table, filename, fmt)
+    print(f"{written} rows written to {filename} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def cmd_import(args):
+    from . import importer
+
+    start = time.perf_counter()
+    imported, rejected = importer.import_file(args.table, args.file)
+    seconds = time.perf_counter() - start
+    for line, message in rejected:
+        print(f"{args.file}:{line}: {message}", file=sys.stderr)
+    print(f"{imported} rows imported into {args.table} in {seconds:.1f}s "
+          f"({imported / max(seconds, 1e-9):,.0f} rows/s, {len(rejected)} rejected)")
+    return 0
+
+
+def cmd_stats(args):
+    pool = database.get_pool()
+    with database.db_connection() as conn:
+        counts = [(table, conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]) for table in database.TABLES]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = conn.execute("PRAGMA page_count").fetchone()[0]
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        version = database.schema_version(conn)
+    print(f"database        {os.path.abspath(pool.path)}")
+    print(f"profile         {pool.profile}")
+    print(f"schema version  {version}")
+    print(f"journal mode    {journal}")
+    print(f"size            {pages * page_size / 1e6:.1f} MB ({free * page_size / 1e6:.1f} MB free)")
+    for table, count in counts:
+        print(f"{table:<16}{count:,}")
+    return 0
+
+
+def cmd_vacuum(args):
+    path = database.get_pool().path
+    before = os.path.getsize(path)
+    start = time.perf_counter()
+    with database.db_connection() as conn:
+        # Merge the search indexes' segments and drop their delete markers;
+        # VACUUM copies FTS5 segments as they are, deleted rows included
+        for table in ("book_fts", "client_fts"):
+            conn.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+    with database.db_connection() as conn:
+        # Fold the WAL back in first, or VACUUM copies pages that are about to be freed
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        # In WAL mode VACUUM writes the new copy to the WAL; the file only shrinks once it is folded in
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA optimize")
+    after = os.path.getsize(path)
+    print(f"{path}: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def cmd_check(args):
+    start = time.perf_counter()
+    with database.db_connection() as conn:
+        wrong = database.check_availability(conn)
+        for book_id, stored, actual in wrong[:20]:
+            print(f"book {book_id}: {stored} on loan recorded, {actual} in the loan history", file=sys.stderr)
+        if wrong and args.repair:
+            database.rebuild_availability(conn)
+    seconds = time.perf_counter() - start
+    if not wrong:
+        print(f"availability counters match the loan history ({seconds:.1f}s)")
+        return 0
+    print(f"{len(wrong)} availability counters {'repaired' if args.repair else 'wrong'} ({seconds:.1f}s)")
+    return 0 if args.repair else 1
+
+
+def cmd_bench(args):
+    from . import bench
+
+    return bench.main(args.args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="Bookhub batch operations.")
+    parser.add_argument("--db", default=database.DB_NAME, help=f"database file (default: {database.DB_NAME})")
+    parser.add_argument("--profile", choices=sorted(database.STORAGE_PROFILES), default=database.DEFAULT_PROFILE,
+                        help=f"storage profile (default: {database.DEFAULT_PROFILE})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+    parser.add_argument("--query-profile", metavar="FILE",
+                        help="record every SQL statement the command runs and write the statistics to FILE as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Choices are spelled out rather than read from src.export, which would
+    # pull in xlsxwriter (~50 ms) for every command.
+    export = commands.add_parser("export", help="export a table to xlsx, csv, csv.gz or jsonl")
+    export.add_argument("table", choices=["book", "client", "dayoperations"])
+    export.add_argument("-o", "--output", help="output file (default: the table's usual name)")
+    export.add_argument("--format", choices=["xlsx", "csv", "csv.gz", "jsonl"],
+                        help="output format (default: from the file extension, else xlsx)")
+    export.set_defaults(func=cmd_export)
+
+    imp = commands.add_parser("import", help="import or update books or clients from a .csv or .xlsx file")
+    imp.add_argument("table", choices=["book", "client"])
+    imp.add_argument("file")
+    imp.set_defaults(func=cmd_import)
+
+    stats = commands.add_parser("stats", help="show row counts and file statistics")
+    stats.set_defaults(func=cmd_stats)
+
+    vacuum = commands.add_parser("vacuum", help="checkpoint, compact and re-analyse the database")
+    vacuum.set_defaults(func=cmd_vacuum)
+
+    check = commands.add_parser("check", help="check book availability counters against the loan history")
+    check.add_argument("--repair", action="store_true", help="rebuild the counters that are wrong")
+    check.set_defaults(func=cmd_check)
+
+    bench = commands.add_parser("bench", help="run a benchmark (see python -m src bench -h)", add_help=False)
+    bench.add_argument("args", nargs=argparse.REMAINDER)
+    bench.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # Options after "bench" (including -h) belong to the benchmark runner
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.args = extra + args.args
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+    if args.command == "bench":
+        # Benchmarks build their own throw-away databases.
+        return args.func(args)
+    database.configure(args.db, args.profile)
+    if args.query_profile:
+        database.start_profiling()
+    try:
+        status = run_command(args)
+        if args.query_profile:
+            # Written even when the command failed; a failed write is reported the same way.
+            try:
+                write_query_profile(args.query_profile)
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Writing the query profile failed", exc_info=True)
+                print(f"error: {e}", file=sys.stderr)
+                status = 1
+        return status
+    finally:
+        database.stop_profiling()
+        database.close_all_connections()
+
+
+def run_command(args):
+    try:
+        if not database.setup_database_schema():
+            return 1
+        return args.func(args)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.debug("Command failed", exc_info=True)
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+def write_query_profile(filename):
+    profiler = database.stop_profiling()
+    with database.db_connection() as conn, open(filename, "w", encoding="utf-8") as f:
+        profiler.dump(f, conn)
+    logger.info("Wrote query profile to %s", filename)
@@ -1,92 +1,1178 @@
-
+import itertools
+import json
+import math
 import sqlite3
 import sys
+import os
 import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    from .passwords import hash_password
+except ImportError:  # imported as a top-level module, as the backend tests do
+    from passwords import hash_password
 
 logger = logging.getLogger(__name__)
 
 DB_NAME = 'library_management.db'
 
+# Named storage profiles. The pragmas are applied once when a pooled
+# connection is opened, never per query. busy_timeout goes first so the
+# journal_mode switch itself waits for other connections instead of failing.
+STORAGE_PROFILES = {
+    # Interactive clerk workstation: WAL lets exports read while the clerk
+    # writes, and synchronous=NORMAL only fsyncs at checkpoints.
+    "desktop": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,        # ~16 MB
+        "mmap_size": 268435456,      # 256 MB
+        "temp_store": "MEMORY",
+    },
+    # Imports and migrations: durability traded for throughput. A crash can
+    # lose the last transactions but cannot corrupt the file in WAL mode.
+    "bulk-load": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,       # ~256 MB
+        "mmap_size": 1073741824,     # 1 GB
+        "temp_store": "MEMORY",
+    },
+    # Public catalogue terminals: opened read-only, writes are refused.
+    "kiosk-readonly": {
+        "busy_timeout": 2000,
+        "query_only": "ON",
+        "cache_size": -32000,        # ~32 MB
+        "mmap_size": 536870912,      # 512 MB
+        "temp_store": "MEMORY",
+    },
+}
+READ_ONLY_PROFILES = {"kiosk-readonly"}
+PROFILE_ENV_VAR = "BOOKHUB_DB_PROFILE"
+
+
+def _default_profile():
+    """The profile named by BOOKHUB_DB_PROFILE, or "desktop" if it is unset or unknown."""
+    profile = os.environ.get(PROFILE_ENV_VAR, "desktop")
+    if profile not in STORAGE_PROFILES:
+        # Read at import: a typo must not stop the app or the CLI from starting.
+        logger.warning("Ignoring %s=%r: unknown storage profile, using 'desktop'", PROFILE_ENV_VAR, profile)
+        return "desktop"
+    return profile
+
+
+DEFAULT_PROFILE = _default_profile()
+
+
+# While the profiler is on, statements slower than this (ms, including
+# fetching their rows) are logged as warnings.
+SLOW_QUERY_MS = 100
+# The progress handler runs every PROGRESS_STEPS SQLite VM instructions.
+PROGRESS_STEPS = 1000
+# Statements explain_statement() can plan.
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "REPLACE", "UPDATE", "DELETE")
+
+
+def explain_statement(conn, sql, params=()):
+    """The EXPLAIN QUERY PLAN detail lines of a statement, or [] if it has none."""
+    words = sql.split(None, 1)
+    if not words or words[0].upper() not in EXPLAINABLE:
+        return []
+    try:
+        # Through the base class, so a profiled connection does not record it.
+        rows = sqlite3.Connection.execute(conn, "EXPLAIN QUERY PLAN " + sql, params or ()).fetchall()
+    except sqlite3.Error:
+        return []
+    return [row[-1] for row in rows]
+
+
+def is_full_scan(plan):
+    """True if a plan walks a whole table or index (virtual tables such as FTS and json_each aside)."""
+    return any(detail.startswith("SCAN ") and "VIRTUAL TABLE" not in detail and "CONSTANT ROW" not in detail
+               for detail in plan)
+
+
+class StatementStats:
+    """Running totals for one statement text; ``samples`` holds recent executions' seconds."""
+
+    __slots__ = ("sql", "params", "count", "total", "rows", "steps", "samples", "plan")
+
+    def __init__(self, sql, params, sample_size):
+        self.sql = sql
+        self.params = params
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.steps = 0
+        self.samples = deque(maxlen=sample_size)
+        self.plan = None
+
+
+class QueryProfiler:
+    """Per-statement count, latency and rows returned, fed by profiled connections.
+
+    An execution runs from execute() to the last row fetched, so a listing
+    read in chunks is one sample. Statements are keyed by their text with
+    whitespace collapsed; the app binds values as parameters, so one query
+    is one key however often it runs.
+    """
+
+    def __init__(self, slow_ms=SLOW_QUERY_MS, sample_size=1000):
+        self.slow_ms = slow_ms
+        self.sample_size = sample_size
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def statement(self, sql, params):
+        key = " ".join(sql.split())
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, StatementStats(key, params, self.sample_size))
+        return stats
+
+    def begin(self, stats):
+        """Count a new execution of ``stats``; returns its sample to add() time to."""
+        sample = [0.0]
+        with self._lock:
+            stats.count += 1
+            stats.samples.append(sample)
+        return sample
+
+    def add(self, stats, sample, seconds, rows=0, done=True):
+        """Charge ``seconds`` to an execution; ``done`` is False while it may have rows left to fetch."""
+        with self._lock:
+            before = sample[0]
+            sample[0] += seconds
+            stats.total += seconds
+            stats.rows += rows
+        if before * 1000 < self.slow_ms <= sample[0] * 1000:
+            logger.warning("Slow query (%.1f ms%s): %s", sample[0] * 1000, "" if done else " and still fetching",
+                           stats.sql)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, conn=None):
+        """One dict per statement, most total time first.
+
+        With ``conn``, each statement's query plan is looked up (once) and
+        full table scans are flagged.
+        """
+        with self._lock:
+            snapshot = [(stats, stats.count, stats.total, stats.rows, stats.steps,
+                         sorted(sample[0] for sample in stats.samples)) for stats in self._stats.values()]
+        report = []
+        for stats, count, total, rows, steps, times in snapshot:
+            if conn is not None and stats.plan is None:
+                stats.plan = explain_statement(conn, stats.sql, stats.params)
+            p95 = times[max(0, math.ceil(len(times) * 0.95) - 1)] if times else 0.0
+            report.append({
+                "sql": stats.sql,
+                "count": count,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / count, 3) if count else 0.0,
+                "p95_ms": round(p95 * 1000, 3),
+                "rows": rows,
+                "vm_steps": steps * PROGRESS_STEPS,
+                "full_scan": is_full_scan(stats.plan or []),
+                "plan": stats.plan,
+            })
+        report.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return report
+
+    def dump(self, file, conn=None):
+        """Write report() to a text file object as JSON."""
+        json.dump({"slow_ms": self.slow_ms, "statements": self.report(conn)}, file, indent=2)
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that times each execution, and the fetches after it, into the connection's profiler."""
+
+    _stats = None
+    _sample = None
+
+    def execute(self, sql, parameters=()):
+        profiler = self.connection.profiler
+        self._stats = profiler.statement(sql, parameters)
+        self._sample = profiler.begin(self._stats)
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            profiler.add(self._stats, self._sample, time.perf_counter() - start, done=self.description is None)
+
+    def executemany(self, sql, seq_of_parameters):
+        # The first parameter set is kept for EXPLAIN QUERY PLAN.
+        parameters = iter(seq_of_parameters)
+        first = next(parameters, None)
+        if first is not None:
+            parameters = itertools.chain([first], parameters)
+        profiler = self.connection.profiler
+        self._stats = profiler.statement(sql, first)
+        self._sample = profiler.begin(self._stats)
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, parameters)
+        finally:
+            profiler.add(self._stats, self._sample, time.perf_counter() - start)
+
+    def _fetched(self, start, rows, done):
+        if self._stats is not None:
+            self.connection.profiler.add(self._stats, self._sample, time.perf_counter() - start, rows, done)
+
+    def fetchone(self):
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        size = self.arraysize if size is None else size
+        rows = super().fetchmany(size)
+        self._fetched(start, len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, len(rows), True)
+        return rows
+
+    def __next__(self):
+        self.connection.running = self._stats
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(start, 0, True)
+            raise
+        self._fetched(start, 1, False)
+        return row
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose statements are recorded by ``profiler`` (see ConnectionPool._open).
+
+    ``running`` is the statement the progress handler charges VM steps to;
+    with several cursors open at once the attribution is approximate.
+    """
+
+    profiler = None
+    running = None
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def count_steps(self):
+        if self.running is not None:
+            self.running.steps += 1
+        return 0
+
+
+class ConnectionPool:
+    """Thread-affine pool of long-lived SQLite connections.
+
+    Every thread gets exactly one connection, opened lazily on first use and
+    kept until ``close_all()``. Connections are never shared between threads,
+    so the usual sqlite3 threading rules still hold.
+    """
+
+    def __init__(self, path=DB_NAME, profile=DEFAULT_PROFILE, profiler=None):
+        if profile not in STORAGE_PROFILES:
+            raise ValueError(f"Unknown storage profile: {profile!r}")
+        self.path = path
+        self.profile = profile
+        self.profiler = profiler
+        self.pragmas = STORAGE_PROFILES[profile]
+        self.read_only = profile in READ_ONLY_PROFILES
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def _open(self):
+        logger.debug("Opening pooled SQLite connection: %s (%s)", self.path, self.profile)
+        # check_same_thread=False only so close_all() can run from the GUI
+        # thread; each connection is still used by a single thread.
+        factory = sqlite3.Connection if self.profiler is None else ProfiledConnection
+        if self.read_only:
+            uri = "file:" + os.path.abspath(self.path).replace("?", "%3f") + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=factory)
+        else:
+            conn = sqlite3.connect(self.path, check_same_thread=False, factory=factory)
+        if self.profiler is not None:
+            conn.profiler = self.profiler
+            conn.set_progress_handler(conn.count_steps, PROGRESS_STEPS)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def acquire(self):
+        """Return the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.depth == 0 and getattr(conn, "profiler", None) is not self.profiler:
+            # Profiling was switched on or off: reopen, outside any transaction.
+            self.release()
+            conn = None
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                stale = self._connections.pop(threading.get_ident(), None)
+                self._connections[threading.get_ident()] = conn
+            if stale is not None:
+                stale.close()
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Yield the thread's connection; commit on success, roll back on error.
+
+        Nested blocks share the outer transaction: only the outermost block
+        commits or rolls back.
+        """
+        conn = self.acquire()
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            if self._local.depth == 1:
+                conn.rollback()
+            raise
+        else:
+            if self._local.depth == 1:
+                conn.commit()
+        finally:
+            self._local.depth -= 1
+
+    def release(self):
+        """Close the calling thread's connection (e.g. when a worker exits)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        with self._lock:
+            self._connections.pop(threading.get_ident(), None)
+        self._local.conn = None
+        conn.close()
+
+    def close_all(self):
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        logger.debug("Closed %d pooled connection(s).", len(connections))
+
+
+_pool = ConnectionPool(DB_NAME)
+
+
+def configure(path=None, profile=None):
+    """Point the shared pool at another database file and/or storage profile.
+
+    Open connections are closed; new ones are opened lazily on next use.
+    """
+    global _pool
+    _pool.close_all()
+    _pool = ConnectionPool(path or _pool.path, profile or _pool.profile, _pool.profiler)
+    return _pool
+
+
+def get_pool():
+    return _pool
+
+
+def start_profiling(slow_ms=SLOW_QUERY_MS):
+    """Record every statement on pooled connections from their next use; returns the QueryProfiler."""
+    if _pool.profiler is None:
+        _pool.profiler = QueryProfiler(slow_ms)
+    return _pool.profiler
+
+
+def stop_profiling():
+    """Stop recording; returns the profiler, with what it collected, or None."""
+    profiler, _pool.profiler = _pool.profiler, None
+    return profiler
+
+
+def get_profiler():
+    return _pool.profiler
+
+
+def db_connection():
+    """Context manager over the calling thread's pooled connection."""
+    return _pool.connection()
+
+
+def close_all_connections():
+    _pool.close_all()
+
+
 def get_db_connection(parent_widget=None):
+    """Open a standalone connection that the caller must close.
+
+    Prefer ``db_connection()``; this is kept for scripts and tests that
+    manage the connection lifetime themselves.
+    """
     try:
-        logger.debug(f"Connecting to SQLite database: {DB_NAME}")
-        conn = sqlite3.connect(DB_NAME)
+        logger.debug("Connecting to SQLite database: %s", _pool.path)
+        conn = sqlite3.connect(_pool.path)
         return conn
     except sqlite3.Error as e:
-        logger.error(f"Connection failed: {e}")
+        logger.error("Connection failed: %s", e)
         return None
 
+TABLES = {
+    "author": """CREATE TABLE IF NOT EXISTS author (
+        idauthor INTEGER PRIMARY KEY AUTOINCREMENT,
+        author_name TEXT
+    )""",
+    "category": """CREATE TABLE IF NOT EXISTS category (
+        idcategory INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_name TEXT
+    )""",
+    "publisher": """CREATE TABLE IF NOT EXISTS publisher (
+        idpublisher INTEGER PRIMARY KEY AUTOINCREMENT,
+        publisher_name TEXT
+    )""",
+    "book": """CREATE TABLE IF NOT EXISTS book (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_name TEXT,
+        book_description TEXT,
+        book_code TEXT,
+        category_id INTEGER REFERENCES category(idcategory),
+        author_id INTEGER REFERENCES author(idauthor),
+        publisher_id INTEGER REFERENCES publisher(idpublisher),
+        book_price INTEGER
+    )""",
+    "client": """CREATE TABLE IF NOT EXISTS client (
+        idclient INTEGER PRIMARY KEY AUTOINCREMENT,
+        clientName TEXT,
+        clientEmail TEXT,
+        clientNid TEXT
+    )""",
+    "dayoperations": """CREATE TABLE IF NOT EXISTS dayoperations (
+        iddayoperations INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_id INTEGER REFERENCES book(id),
+        type TEXT,
+        days INTEGER,
+        fromDate TEXT,
+        toDate TEXT,
+        client_id INTEGER REFERENCES client(idclient),
+        status TEXT NOT NULL DEFAULT 'out' CHECK (status IN ('out', 'returned')),
+        returnDate TEXT
+    )""",
+    "users": """CREATE TABLE IF NOT EXISTS users (
+        id_users INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT,
+        useremail TEXT,
+        userspassword TEXT
+    )""",
+}
+
+# Primary key of each data table; rows are edited and deleted by it only.
+PRIMARY_KEYS = {
+    "book": "id",
+    "client": "idclient",
+    "users": "id_users",
+    "dayoperations": "iddayoperations",
+}
+
+# Reference tables: table -> (primary key, name column).
+LOOKUP_TABLES = {
+    "category": ("idcategory", "category_name"),
+    "author": ("idauthor", "author_name"),
+    "publisher": ("idpublisher", "publisher_name"),
+}
+
+# Reference table -> the book column pointing at it.
+BOOK_REFERENCES = {
+    "category": "category_id",
+    "author": "author_id",
+    "publisher": "publisher_id",
+}
+
+# Natural keys the application looks rows up by.
+UNIQUE_INDEXES = [
+    ("idx_users_username", "users", "username"),
+    ("idx_book_code", "book", "book_code"),
+    ("idx_client_nid", "client", "clientNid"),
+    ("idx_category_name", "category", "category_name"),
+    ("idx_author_name", "author", "author_name"),
+    ("idx_publisher_name", "publisher", "publisher_name"),
+]
+
+# Non-unique lookups: the notebook app searched books by name, and every
+# foreign key is indexed so joins, renames and merges never scan.
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_book_name ON book(book_name)",
+    "CREATE INDEX IF NOT EXISTS idx_client_name ON client(clientName)",
+    "CREATE INDEX IF NOT EXISTS idx_book_category ON book(category_id)",
+    "CREATE INDEX IF NOT EXISTS idx_book_author ON book(author_id)",
+    "CREATE INDEX IF NOT EXISTS idx_book_publisher ON book(publisher_id)",
+    "CREATE INDEX IF NOT EXISTS idx_dayoperations_book ON dayoperations(book_id)",
+    "CREATE INDEX IF NOT EXISTS idx_dayoperations_client ON dayoperations(client_id)",
+]
+
+# What the tabs display: name -> (key column, SELECT). The key is selected
+# first so views can page by it; names are resolved through primary-key joins.
+LISTINGS = {
+    "book": ("b.id", """SELECT b.id, b.book_code, b.book_name, b.book_description, c.category_name, a.author_name,
+            av.copies - av.on_loan
+        FROM book b
+        LEFT JOIN category c ON c.idcategory = b.category_id
+        LEFT JOIN author a ON a.idauthor = b.author_id
+        LEFT JOIN book_availability av ON av.book_id = b.id"""),
+    "client": ("idclient", "SELECT idclient, clientNid, clientName, clientEmail FROM client"),
+    "users": ("id_users", "SELECT id_users, id_users, username, useremail FROM users"),
+    "dayoperations": ("d.iddayoperations", """SELECT d.iddayoperations, b.book_name, c.clientName, d.type, d.fromDate, d.toDate,
+            d.status
+        FROM dayoperations d
+        LEFT JOIN book b ON b.id = d.book_id
+        LEFT JOIN client c ON c.idclient = d.client_id"""),
+}
+# Reference tables, with how many books use each entry (one index count per row).
+LISTINGS.update({
+    table: (key, f"SELECT {key}, {key}, {column}, "
+                 f"(SELECT COUNT(*) FROM book WHERE {BOOK_REFERENCES[table]} = {key}) FROM {table}")
+    for table, (key, column) in LOOKUP_TABLES.items()
+})
+
+
+def fetch_page(conn, listing, after_key=0, limit=-1):
+    """Rows of ``listing`` with key > ``after_key``, in key order (keyset paging).
+
+    Seeking on the primary key keeps every page as cheap as the first,
+    unlike OFFSET which re-walks all skipped rows. ``limit=-1`` means all.
+    """
+    key, select = LISTINGS[listing]
+    return conn.execute(f"{select} WHERE {key} > ? ORDER BY {key} LIMIT ?", (after_key, limit)).fetchall()
+
+
+def fetch_row(conn, listing, key):
+    """The single row of ``listing`` with this key, as fetch_page() returns it, or None."""
+    key_column, select = LISTINGS[listing]
+    return conn.execute(f"{select} WHERE {key_column} = ?", (key,)).fetchone()
+
+
+def iter_page(conn, listing, after_key=0, limit=-1, chunk_size=200):
+    """Like fetch_page(), but yields the rows in lists of ``chunk_size``."""
+    key, select = LISTINGS[listing]
+    cur = conn.execute(f"{select} WHERE {key} > ? ORDER BY {key} LIMIT ?", (after_key, limit))
+    total = 0
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            break
+        total += len(rows)
+        yield rows
+    logger.debug("Read %d rows of %s after key %s", total, listing, after_key)
+
+
+# Exports keep the column layout of the original text-column tables.
+EXPORT_QUERIES = {
+    "book": """SELECT b.id, b.book_name, b.book_description, b.book_code,
+            c.category_name AS book_category, a.author_name AS book_author,
+            p.publisher_name AS book_publisher, b.book_price
+        FROM book b
+        LEFT JOIN category c ON c.idcategory = b.category_id
+        LEFT JOIN author a ON a.idauthor = b.author_id
+        LEFT JOIN publisher p ON p.idpublisher = b.publisher_id""",
+    "dayoperations": """SELECT d.iddayoperations, b.book_name AS bookname, d.type, d.days,
+            d.fromDate, d.toDate, c.clientName
+        FROM dayoperations d
+        LEFT JOIN book b ON b.id = d.book_id
+        LEFT JOIN client c ON c.idclient = d.client_id""",
+}
+
+
+def export_query(table):
+    return EXPORT_QUERIES.get(table, f"SELECT * FROM {table}")
+
+
+def _create_unique_index(cursor, name, table, columns):
+    """Create a unique index, degrading to a plain one if old data has duplicates.
+
+    Databases written before these constraints existed may already contain
+    duplicate keys; refusing to start over that would lock the clerk out, so
+    the lookup still gets indexed and the duplicates are reported instead.
+    """
+    try:
+        cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+    except sqlite3.IntegrityError:
+        logger.warning("Duplicate values in %s.%s; creating non-unique index %s.", table, columns, name)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+
+
+def _create_indexes(cursor):
+    for name, table, columns in UNIQUE_INDEXES:
+        _create_unique_index(cursor, name, table, columns)
+    for index_sql in INDEXES:
+        cursor.execute(index_sql)
+
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _rebuild_table(conn, table, select_sql):
+    """Swap ``table`` for its current definition in TABLES, filled by ``select_sql``.
+
+    ``select_sql`` reads from ``_legacy``, the renamed old table.
+    """
+    conn.execute(f"ALTER TABLE {table} RENAME TO _legacy")
+    conn.execute(TABLES[table])
+    conn.execute(f"INSERT INTO {table} {select_sql}")
+    conn.execute("DROP TABLE _legacy")
+
+
+def normalise_schema(conn):
+    """Migrate the text-column layout to integer foreign keys.
+
+    ``book.book_category/book_author/book_publisher`` become ids into the
+    reference tables and ``dayoperations.bookname/clientName`` become ids into
+    ``book``/``client``. Names with no matching row are added to the referenced
+    table rather than dropped. Runs inside ``migrate()``'s transaction.
+    """
+    legacy_book = "book_category" in _columns(conn, "book")
+    legacy_operations = "bookname" in _columns(conn, "dayoperations")
+    if legacy_book:
+        for table, legacy_column in (("category", "book_category"),
+                                     ("author", "book_author"),
+                                     ("publisher", "book_publisher")):
+            key, column = LOOKUP_TABLES[table]
+            conn.execute(f"""INSERT INTO {table}({column})
+                SELECT DISTINCT {legacy_column} FROM book
+                WHERE {legacy_column} <> ''
+                  AND {legacy_column} NOT IN (SELECT {column} FROM {table} WHERE {column} IS NOT NULL)""")
+            _create_unique_index(conn, f"idx_{column}", table, column)
+    if legacy_operations:
+        conn.execute("""INSERT INTO book(book_name)
+            SELECT DISTINCT bookname FROM dayoperations
+            WHERE bookname <> '' AND bookname NOT IN (SELECT book_name FROM book WHERE book_name IS NOT NULL)""")
+        conn.execute("""INSERT INTO client(clientName)
+            SELECT DISTINCT clientName FROM dayoperations
+            WHERE clientName <> '' AND clientName NOT IN (SELECT clientName FROM client WHERE clientName IS NOT NULL)""")
+    if legacy_book:
+        _rebuild_table(conn, "book", """(id, book_name, book_description, book_code,
+                category_id, author_id, publisher_id, book_price)
+            SELECT b.id, b.book_name, b.book_description, b.book_code,
+                (SELECT MIN(idcategory) FROM category WHERE category_name = b.book_category),
+                (SELECT MIN(idauthor) FROM author WHERE author_name = b.book_author),
+                (SELECT MIN(idpublisher) FROM publisher WHERE publisher_name = b.book_publisher),
+                b.book_price
+            FROM _legacy b""")
+    if legacy_operations:
+        # Name -> id resolution below needs these before the copy.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_book_name ON book(book_name)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_client_name ON client(clientName)")
+        _rebuild_table(conn, "dayoperations", """(iddayoperations, book_id, type, days,
+                fromDate, toDate, client_id)
+            SELECT d.iddayoperations,
+                (SELECT MIN(id) FROM book WHERE book_name = d.bookname),
+                d.type, d.days, d.fromDate, d.toDate,
+                (SELECT MIN(idclient) FROM client WHERE clientName = d.clientName)
+            FROM _legacy d""")
+
+
+def _create_tables(conn):
+    for table_sql in TABLES.values():
+        conn.execute(table_sql)
+
+
+def _create_default_user(conn):
+    if conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is None:
+        logger.info("Creating default user...")
+        conn.execute("INSERT INTO users (username, useremail, userspassword) VALUES ('admin', 'admin@example.com', ?)",
+                     (hash_password('admin'),))
+
+
+# Only the indexed columns fire it, so moving books to another category or
+# publisher (merge_lookups()) does not rewrite their search rows.
+BOOK_FTS_UPDATE = """CREATE TRIGGER IF NOT EXISTS book_fts_update
+    AFTER UPDATE OF book_name, book_description, book_code, author_id ON book BEGIN
+        UPDATE book_fts SET book_name = new.book_name, book_description = new.book_description,
+            book_code = new.book_code,
+            author_name = (SELECT author_name FROM author WHERE idauthor = new.author_id)
+        WHERE rowid = new.id;
+    END"""
+
+# Full-text search. The FTS tables keep their own copy of the searchable
+# text (rowid = book.id / client.idclient) and are kept in sync by triggers,
+# so every write path - dialogs, imports, renames - is covered.
+SEARCH_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS book_fts USING fts5(
+        book_name, book_description, book_code, author_name,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS client_fts USING fts5(
+        clientName, clientEmail, clientNid,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')""",
+    # Vocabulary views, used to find near-miss terms for typo tolerance.
+    "CREATE VIRTUAL TABLE IF NOT EXISTS book_fts_vocab USING fts5vocab(book_fts, 'row')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS client_fts_vocab USING fts5vocab(client_fts, 'row')",
+    """CREATE TRIGGER IF NOT EXISTS book_fts_insert AFTER INSERT ON book BEGIN
+        INSERT INTO book_fts(rowid, book_name, book_description, book_code, author_name)
+        VALUES (new.id, new.book_name, new.book_description, new.book_code,
+                (SELECT author_name FROM author WHERE idauthor = new.author_id));
+    END""",
+    BOOK_FTS_UPDATE,
+    """CREATE TRIGGER IF NOT EXISTS book_fts_delete AFTER DELETE ON book BEGIN
+        DELETE FROM book_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS author_fts_rename AFTER UPDATE OF author_name ON author BEGIN
+        UPDATE book_fts SET author_name = new.author_name
+        WHERE rowid IN (SELECT id FROM book WHERE author_id = new.idauthor);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_insert AFTER INSERT ON client BEGIN
+        INSERT INTO client_fts(rowid, clientName, clientEmail, clientNid)
+        VALUES (new.idclient, new.clientName, new.clientEmail, new.clientNid);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_update AFTER UPDATE ON client BEGIN
+        UPDATE client_fts SET clientName = new.clientName, clientEmail = new.clientEmail,
+            clientNid = new.clientNid
+        WHERE rowid = new.idclient;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_delete AFTER DELETE ON client BEGIN
+        DELETE FROM client_fts WHERE rowid = old.idclient;
+    END""",
+]
+
+
+def _create_search_index(conn):
+    for statement in SEARCH_SCHEMA:
+        conn.execute(statement)
+    conn.execute("DELETE FROM book_fts")
+    conn.execute("""INSERT INTO book_fts(rowid, book_name, book_description, book_code, author_name)
+        SELECT b.id, b.book_name, b.book_description, b.book_code, a.author_name
+        FROM book b LEFT JOIN author a ON a.idauthor = b.author_id""")
+    conn.execute("DELETE FROM client_fts")
+    conn.execute("""INSERT INTO client_fts(rowid, clientName, clientEmail, clientNid)
+        SELECT idclient, clientName, clientEmail, clientNid FROM client""")
+
+
+def _create_lookup_versions(conn):
+    """Count writes to each lookup table, so cached name lists know when they are stale.
+
+    Triggers see every writer: this process, other connections and the
+    command-line tools alike. A case-insensitive index per table lets
+    lookup_names() read the names in (ASCII) case-insensitive order.
+    """
+    conn.execute("""CREATE TABLE IF NOT EXISTS lookup_version (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID""")
+    for table in LOOKUP_TABLES:
+        conn.execute("INSERT OR IGNORE INTO lookup_version(table_name) VALUES (?)", (table,))
+        column = LOOKUP_TABLES[table][1]
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{column}_nocase ON {table}({column} COLLATE NOCASE)")
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN
+                UPDATE lookup_version SET version = version + 1 WHERE table_name = '{table}';
+            END""")
+
+
+def _narrow_book_search_trigger(conn):
+    conn.execute("DROP TRIGGER IF EXISTS book_fts_update")
+    conn.execute(BOOK_FTS_UPDATE)
+
+
+# Loans by status and due date (overdue today), by client and by book (what
+# is out, and with whom). The leading columns still serve the foreign keys,
+# so they replace the single-column dayoperations indexes.
+CIRCULATION_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_dayoperations_status_due ON dayoperations(status, toDate)",
+    "CREATE INDEX IF NOT EXISTS idx_dayoperations_client_status ON dayoperations(client_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_dayoperations_book_status ON dayoperations(book_id, status)",
+]
+
+
+def _add_loan_status(conn):
+    """Track each loan's status and return date; store dates as ISO 'YYYY-MM-DD'."""
+    columns = _columns(conn, "dayoperations")
+    if "status" not in columns:
+        conn.execute("ALTER TABLE dayoperations ADD COLUMN status TEXT NOT NULL DEFAULT 'out' "
+                     "CHECK (status IN ('out', 'returned'))")
+    if "returnDate" not in columns:
+        conn.execute("ALTER TABLE dayoperations ADD COLUMN returnDate TEXT")
+    # '2019-06-01 00:00:00' -> '2019-06-01'; text date() cannot read is left as it is
+    for column in ("fromDate", "toDate"):
+        conn.execute(f"""UPDATE dayoperations SET {column} = date({column})
+            WHERE date({column}) IS NOT NULL AND date({column}) <> {column}""")
+    # The notebook app logged a return as a separate 'retrieve' row for the same book and client
+    conn.execute("""UPDATE dayoperations AS d SET status = 'returned',
+            returnDate = (SELECT MIN(r.fromDate) FROM dayoperations r
+                          WHERE r.type = 'retrieve' AND r.book_id = d.book_id
+                            AND r.client_id = d.client_id AND r.fromDate >= d.fromDate)
+        WHERE d.type = 'rent' AND EXISTS (
+            SELECT 1 FROM dayoperations r
+            WHERE r.type = 'retrieve' AND r.book_id = d.book_id
+              AND r.client_id = d.client_id AND r.fromDate >= d.fromDate)""")
+    conn.execute("UPDATE dayoperations SET status = 'returned' WHERE type IS NOT 'rent'")
+    conn.execute("DROP INDEX IF EXISTS idx_dayoperations_book")
+    conn.execute("DROP INDEX IF EXISTS idx_dayoperations_client")
+    for index_sql in CIRCULATION_INDEXES:
+        conn.execute(index_sql)
+
+
+# Copies of each book and how many are out, kept current by triggers on
+# every write to book and dayoperations, so listings show availability with
+# one primary-key join instead of counting loans.
+AVAILABILITY_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS book_availability (
+        book_id INTEGER PRIMARY KEY REFERENCES book(id) ON DELETE CASCADE,
+        copies INTEGER NOT NULL DEFAULT 1 CHECK (copies >= 0),
+        on_loan INTEGER NOT NULL DEFAULT 0 CHECK (on_loan >= 0)
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS book_availability_insert AFTER INSERT ON book BEGIN
+        INSERT OR IGNORE INTO book_availability(book_id) VALUES (new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS loan_availability_insert AFTER INSERT ON dayoperations
+    WHEN new.status = 'out' BEGIN
+        UPDATE book_availability SET on_loan = on_loan + 1 WHERE book_id = new.book_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS loan_availability_update AFTER UPDATE OF status, book_id ON dayoperations
+    WHEN old.status IS NOT new.status OR old.book_id IS NOT new.book_id BEGIN
+        UPDATE book_availability SET on_loan = on_loan - 1 WHERE old.status = 'out' AND book_id = old.book_id;
+        UPDATE book_availability SET on_loan = on_loan + 1 WHERE new.status = 'out' AND book_id = new.book_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS loan_availability_delete AFTER DELETE ON dayoperations
+    WHEN old.status = 'out' BEGIN
+        UPDATE book_availability SET on_loan = on_loan - 1 WHERE book_id = old.book_id;
+    END""",
+]
+
+
+def check_availability(conn):
+    """Books whose stored loan count disagrees with the loan history.
+
+    Returns ``[(book_id, stored, actual), ...]``; stored is None when the
+    book has no availability row. Reads the whole history once.
+    """
+    return conn.execute("""SELECT b.id, av.on_loan, COALESCE(loans.n, 0)
+        FROM book b
+        LEFT JOIN book_availability av ON av.book_id = b.id
+        LEFT JOIN (SELECT book_id, COUNT(*) AS n FROM dayoperations WHERE status = 'out' GROUP BY book_id) loans
+            ON loans.book_id = b.id
+        WHERE av.on_loan IS NOT COALESCE(loans.n, 0)""").fetchall()
+
+
+def rebuild_availability(conn):
+    """Recount every book's loans from the history; copies are kept.
+
+    Returns the number of availability rows added or corrected.
+    """
+    added = conn.execute("INSERT OR IGNORE INTO book_availability(book_id) SELECT id FROM book").rowcount
+    wrong = check_availability(conn)
+    conn.executemany("UPDATE book_availability SET on_loan = ? WHERE book_id = ?",
+                     ((actual, book_id) for book_id, _, actual in wrong))
+    return added + len(wrong)
+
+
+def _create_availability(conn):
+    for statement in AVAILABILITY_SCHEMA:
+        conn.execute(statement)
+    rebuild_availability(conn)
+
+
+# Ordered schema migrations: (user_version after it runs, description, step).
+# Never edit a released step; append a new one instead. Databases created
+# before versioning report user_version 0, so every step must also cope with
+# a schema that is partly there already.
+MIGRATIONS = [
+    (1, "create base tables", _create_tables),
+    (2, "normalise reference columns to foreign keys", normalise_schema),
+    (3, "index natural keys and foreign keys", _create_indexes),
+    (4, "create default admin user", _create_default_user),
+    (5, "full-text search index for books and clients", _create_search_index),
+    (6, "version counters and sorted name indexes for lookup tables", _create_lookup_versions),
+    (7, "update book search rows only when searchable columns change", _narrow_book_search_trigger),
+    (8, "loan status, ISO dates and circulation indexes", _add_loan_status),
+    (9, "book availability counters", _create_availability),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Apply pending migrations in a single transaction.
+
+    When the schema is current this is one ``PRAGMA user_version`` read.
+    Returns ``[(version, description, milliseconds), ...]`` for the steps
+    that ran.
+    """
+    current = schema_version(conn)
+    if current == SCHEMA_VERSION:
+        return []
+    if current > SCHEMA_VERSION:
+        raise sqlite3.DatabaseError(
+            f"Database schema version {current} is newer than this application ({SCHEMA_VERSION}).")
+
+    if conn.in_transaction:
+        conn.commit()
+    # Table rebuilds must not trip FK enforcement half-way; the result is
+    # verified with foreign_key_check before committing instead. These
+    # pragmas are no-ops inside a transaction, hence before BEGIN.
+    conn.execute("PRAGMA foreign_keys = OFF")
+    # Keep references in other tables pointing at a rebuilt table, not at
+    # its renamed _legacy copy.
+    conn.execute("PRAGMA legacy_alter_table = ON")
+    report = []
+    try:
+        conn.execute("BEGIN")
+        for version, description, step in MIGRATIONS:
+            if version <= current:
+                continue
+            start = time.perf_counter()
+            step(conn)
+            report.append((version, description, (time.perf_counter() - start) * 1000))
+            logger.info("Migration %d (%s) took %.1f ms.", *report[-1])
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise sqlite3.IntegrityError(f"Foreign key violations after migration: {violations[:5]}")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA legacy_alter_table = OFF")
+        conn.execute("PRAGMA foreign_keys = ON")
+    return report
+
+
+def lookup_id(conn, table, name):
+    """Return the id of ``name`` in a reference table, inserting it if new."""
+    if not name:
+        return None
+    key, column = LOOKUP_TABLES[table]
+    row = conn.execute(f"SELECT {key} FROM {table} WHERE {column} = ?", (name,)).fetchone()
+    if row:
+        return row[0]
+    return conn.execute(f"INSERT INTO {table}({column}) VALUES (?)", (name,)).lastrowid
+
+
+# (database file, lookup table) -> (lookup_version, sorted names)
+_lookup_cache = {}
+
+
+def lookup_names(conn, table):
+    """All names in a lookup table, sorted case-insensitively, as a tuple.
+
+    The tuple is cached per database and only re-read after the table's
+    lookup_version has moved, so a dialog can ask for 50k authors on every
+    open for the cost of one primary-key read.
+    """
+    _, column = LOOKUP_TABLES[table]
+    # Keyed by the file conn has open, which need not be the pool's database.
+    # In-memory databases have no file and are not cached.
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    key = (path, table)
+    # Read the version first: a write landing in between makes the cached
+    # names newer than their version, which only costs one extra reload.
+    version = conn.execute("SELECT version FROM lookup_version WHERE table_name = ?", (table,)).fetchone()[0]
+    cached = _lookup_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    # NOCASE only folds ASCII, while the completer's binary search expects
+    # Qt's full case-insensitive order, so the index order (already right
+    # for ASCII names, which makes this sort nearly linear) is refined here.
+    names = tuple(sorted((name for (name,) in conn.execute(
+        f"SELECT {column} FROM {table} ORDER BY {column} COLLATE NOCASE")), key=str.casefold))
+    if path:
+        _lookup_cache[key] = (version, names)
+    return names
+
+
+def add_lookup_names(conn, table, names):
+    """Add the new ``names`` to a lookup table in one statement; returns how many were added.
+
+    Names are stripped; blanks, repeats and names already present are skipped.
+    """
+    _, column = LOOKUP_TABLES[table]
+    names = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+    return conn.execute(f"""INSERT INTO {table}({column})
+        SELECT value FROM json_each(?)
+        WHERE value NOT IN (SELECT {column} FROM {table} WHERE {column} IS NOT NULL)""",
+                        (json.dumps(names),)).rowcount
+
+
+def rename_lookup(conn, table, key_value, name):
+    """Rename one entry of a lookup table.
+
+    Books hold the entry's id, so this is a single-row UPDATE however many
+    books use it; the search index follows through its trigger. Raises
+    ValueError if the name is blank or taken by another entry.
+    """
+    key, column = LOOKUP_TABLES[table]
+    name = name.strip()
+    if not name:
+        raise ValueError("A name is required.")
+    row = conn.execute(f"SELECT {key} FROM {table} WHERE {column} = ?", (name,)).fetchone()
+    if row is not None and row[0] != key_value:
+        raise ValueError(f"'{name}' already exists; merge the two entries instead.")
+    conn.execute(f"UPDATE {table} SET {column} = ? WHERE {key} = ?", (name, key_value))
+
+
+def merge_lookups(conn, table, target, sources):
+    """Point every book using one of ``sources`` at ``target``, then delete the sources.
+
+    One UPDATE over the book foreign-key index and one DELETE; the caller's
+    transaction makes the pair atomic. Returns the number of books moved.
+    """
+    key, _ = LOOKUP_TABLES[table]
+    reference = BOOK_REFERENCES[table]
+    sources = json.dumps([source for source in sources if source != target])
+    moved = conn.execute(f"UPDATE book SET {reference} = ? WHERE {reference} IN (SELECT value FROM json_each(?))",
+                         (target, sources)).rowcount
+    conn.execute(f"DELETE FROM {table} WHERE {key} IN (SELECT value FROM json_each(?))", (sources,))
+    return moved
+
+
+def add_book(conn, data):
+    """Insert a book given display names for its reference columns; returns its id."""
+    cur = conn.execute('''
+        INSERT INTO book(book_name, book_description, book_code, category_id, author_id, publisher_id, book_price)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (data['name'], data['description'], data['code'],
+          lookup_id(conn, "category", data['category']),
+          lookup_id(conn, "author", data['author']),
+          lookup_id(conn, "publisher", data['publisher']),
+          data['price']))
+    if data.get('copies', 1) != 1:
+        # The insert trigger has just added the row with one copy
+        conn.execute("UPDATE book_availability SET copies = ? WHERE book_id = ?", (data['copies'], cur.lastrowid))
+    return cur.lastrowid
+
+
+def add_client(conn, data):
+    """Insert a client; returns its id."""
+    return conn.execute("INSERT INTO client(clientName, clientEmail, clientNid) VALUES(?, ?, ?)",
+                        (data['name'], data['email'], data['nid'])).lastrowid
+
+
+def add_user(conn, data):
+    """Insert a user, hashing the password; returns its id."""
+    return conn.execute("INSERT INTO users(username, useremail, userspassword) VALUES(?, ?, ?)",
+                        (data['username'], data['email'], hash_password(data['password']))).lastrowid
+
+
+def get_book(conn, book_id):
+    """A book as the dict BookDialog takes for editing, or None."""
+    row = conn.execute("""SELECT b.book_name, b.book_description, b.book_code,
+            c.category_name, a.author_name, p.publisher_name, b.book_price, av.copies
+        FROM book b
+        LEFT JOIN category c ON c.idcategory = b.category_id
+        LEFT JOIN author a ON a.idauthor = b.author_id
+        LEFT JOIN publisher p ON p.idpublisher = b.publisher_id
+        LEFT JOIN book_availability av ON av.book_id = b.id
+        WHERE b.id = ?""", (book_id,)).fetchone()
+    if row is None:
+        return None
+    name, description, code, category, author, publisher, price, copies = row
+    return {'name': name or '', 'description': description or '', 'code': code or '',
+            'category': category or '', 'author': author or '', 'publisher': publisher or '',
+            'price': price or 0, 'copies': 1 if copies is None else copies}
+
+
+def get_client(conn, client_id):
+    """A client as the dict ClientDialog takes for editing, or None."""
+    row = conn.execute("SELECT clientName, clientEmail, clientNid FROM client WHERE idclient = ?",
+                       (client_id,)).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('name', 'email', 'nid'), (value or '' for value in row)))
+
+
+def get_user(conn, user_id):
+    """A user as the dict UserDialog takes for editing (no password), or None."""
+    row = conn.execute("SELECT username, useremail FROM users WHERE id_users = ?", (user_id,)).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('username', 'email'), (value or '' for value in row)))
+
+
+def update_book(conn, book_id, data):
+    """Overwrite one book, found by primary key, from BookDialog data.
+
+    ValueError if ``copies`` is below the number of copies on loan.
+    """
+    conn.execute('''
+        UPDATE book SET book_name = ?, book_description = ?, book_code = ?,
+            category_id = ?, author_id = ?, publisher_id = ?, book_price = ?
+        WHERE id = ?
+    ''', (data['name'], data['description'], data['code'],
+          lookup_id(conn, "category", data['category']),
+          lookup_id(conn, "author", data['author']),
+          lookup_id(conn, "publisher", data['publisher']),
+          data['price'], book_id))
+    if 'copies' in data:
+        on_loan = conn.execute("SELECT on_loan FROM book_availability WHERE book_id = ?", (book_id,)).fetchone()
+        if on_loan is not None and data['copies'] < on_loan[0]:
+            raise ValueError(f"{on_loan[0]} copies are on loan; the book cannot have fewer than that.")
+        conn.execute("UPDATE book_availability SET copies = ? WHERE book_id = ?", (data['copies'], book_id))
+
+
+def update_client(conn, client_id, data):
+    """Overwrite one client, found by primary key."""
+    conn.execute("UPDATE client SET clientName = ?, clientEmail = ?, clientNid = ? WHERE idclient = ?",
+                 (data['name'], data['email'], data['nid'], client_id))
+
+
+def update_user(conn, user_id, data):
+    """Overwrite one user, found by primary key; a blank password keeps the current one."""
+    conn.execute("UPDATE users SET username = ?, useremail = ? WHERE id_users = ?",
+                 (data['username'], data['email'], user_id))
+    if data.get('password'):
+        conn.execute("UPDATE users SET userspassword = ? WHERE id_users = ?",
+                     (hash_password(data['password']), user_id))
+
+
+def delete_rows(conn, table, keys):
+    """Delete rows of a data table by primary key in one statement; returns how many went.
+
+    Raises sqlite3.IntegrityError, deleting nothing, if another table still
+    references one of them (a book or client with day operations).
+    """
+    key = PRIMARY_KEYS[table]
+    return conn.execute(f"DELETE FROM {table} WHERE {key} IN (SELECT value FROM json_each(?))",
+                        (json.dumps(list(keys)),)).rowcount
+
+
 def setup_database_schema(parent_widget=None):
-    logger.info("Setting up database schema...")
-    db = get_db_connection(parent_widget)
-    if not db:
-        logger.error("Could not get DB connection for schema setup.")
-        return False
-        
     try:
-        cursor = db.cursor()
-        
-        # SQLite uses INTEGER PRIMARY KEY AUTOINCREMENT
-        tables = [
-             """CREATE TABLE IF NOT EXISTS author (
-                idauthor INTEGER PRIMARY KEY AUTOINCREMENT,
-                author_name TEXT
-            )""",
-            """CREATE TABLE IF NOT EXISTS category (
-                idcategory INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_name TEXT
-            )""",
-            """CREATE TABLE IF NOT EXISTS publisher (
-                idpublisher INTEGER PRIMARY KEY AUTOINCREMENT,
-                publisher_name TEXT
-            )""",
-            """CREATE TABLE IF NOT EXISTS book (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                book_name TEXT,
-                book_description TEXT,
-                book_code TEXT,
-                book_category TEXT,
-                book_author TEXT,
-                book_publisher TEXT,
-                book_price INTEGER
-            )""",
-            """CREATE TABLE IF NOT EXISTS client (
-                idclient INTEGER PRIMARY KEY AUTOINCREMENT,
-                clientName TEXT,
-                clientEmail TEXT,
-                clientNid TEXT
-            )""",
-             """CREATE TABLE IF NOT EXISTS dayoperations (
-                iddayoperations INTEGER PRIMARY KEY AUTOINCREMENT,
-                bookname TEXT,
-                type TEXT,
-                days INTEGER,
-                fromDate TEXT,
-                toDate TEXT,
-                clientName TEXT
-            )""",
-            """CREATE TABLE IF NOT EXISTS users (
-                id_users INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT,
-                useremail TEXT,
-                userspassword TEXT
-            )"""
-        ]
-        
-        for table_sql in tables:
-            cursor.execute(table_sql)
-            
-        # Check and create default user
-        cursor.execute("SELECT * FROM users")
-        if not cursor.fetchall():
-            logger.info("Creating default user...")
-            cursor.execute("INSERT INTO users (username, useremail, userspassword) VALUES ('admin', 'admin@example.com', 'admin')")
-            db.commit()
-            
-        db.close()
-        logger.info("Database schema setup successful.")
+        with db_connection() as db:
+            report = migrate(db)
+        if report:
+            logger.info("Database schema migrated to version %d in %.1f ms.",
+                        SCHEMA_VERSION, sum(ms for _, _, ms in report))
+        else:
+            logger.info("Database schema is current (version %d).", SCHEMA_VERSION)
         return True
     except sqlite3.Error as e:
-        logger.error(f"Database schema setup error: {e}")
+        logger.error("Database schema setup error: %s", e)
         print(f"Error setting up database: {e}")
         return False
@@ -1,9 +1,10 @@
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QTextEdit, QComboBox, QPushButton, 
-                             QFormLayout, QMessageBox, QDoubleSpinBox)
-from PyQt5.QtCore import Qt
+                             QLineEdit, QTextEdit, QPushButton, 
+                             QFormLayout, QMessageBox, QDoubleSpinBox, QSpinBox, QCompleter)
+from PyQt5.QtCore import Qt, QStringListModel
 from PyQt5.QtGui import QFont
+from .validation import MAX_PRICE, validate_book, validate_client, validate_operation
 
 class BaseDialog(QDialog):
     def __init__(self, title, parent=None):
@@ -55,8 +56,25 @@ class BaseDialog(QDialog):
         btn_layout.addWidget(save_btn)
         self.layout.addLayout(btn_layout)
 
+def lookup_input(model, placeholder):
+    """Line edit that completes from a QStringListModel of names.
+
+    The model is shared and already sorted, so nothing is copied when the
+    dialog opens and the completer finds matches by binary search as the
+    user types. New names are allowed; saving adds them to the lookup table.
+    """
+    edit = QLineEdit()
+    edit.setPlaceholderText(placeholder)
+    completer = QCompleter(model if model is not None else QStringListModel(), edit)
+    completer.setCaseSensitivity(Qt.CaseInsensitive)
+    completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+    completer.setMaxVisibleItems(12)
+    edit.setCompleter(completer)
+    return edit
+
 class BookDialog(BaseDialog):
-    def __init__(self, parent=None, categories=[], authors=[], publishers=[], book_data=None):
+    def __init__(self, parent=None, categories=None, authors=None, publishers=None, book_data=None):
+        """``categories``, ``authors`` and ``publishers`` are QStringListModels of names."""
         title = "Edit Book" if book_data else "Add New Book"
         super().__init__(title, parent)
         self.categories = categories
@@ -68,14 +86,14 @@ class BookDialog(BaseDialog):
     def setup_ui(self):
         self.title_input = QLineEdit()
         self.code_input = QLineEdit()
-        self.category_input = QComboBox()
-        self.category_input.addItems(self.categories)
-        self.author_input = QComboBox()
-        self.author_input.addItems(self.authors)
-        self.publisher_input = QComboBox()
-        self.publisher_input.addItems(self.publishers)
+        self.category_input = lookup_input(self.categories, "Type to search categories")
+        self.author_input = lookup_input(self.authors, "Type to search authors")
+        self.publisher_input = lookup_input(self.publishers, "Type to search publishers")
         self.price_input = QDoubleSpinBox()
-        self.price_input.setMaximum(100000)
+        self.price_input.setMaximum(MAX_PRICE)
+        self.copies_input = QSpinBox()
+        self.copies_input.setRange(0, 999)
+        self.copies_input.setValue(1)
         self.desc_input = QTextEdit()
         self.desc_input.setMaximumHeight(100)
 
@@ -85,6 +103,7 @@ class BookDialog(BaseDialog):
         self.form_layout.addRow("Author:", self.author_input)
         self.form_layout.addRow("Publisher:", self.publisher_input)
         self.form_layout.addRow("Price:", self.price_input)
+        self.form_layout.addRow("Copies:", self.copies_input)
         self.form_layout.addRow("Description:", self.desc_input)
 
         if self.book_data:
@@ -92,23 +111,18 @@ class BookDialog(BaseDialog):
             self.title_input.setText(self.book_data.get('name', ''))
             self.code_input.setText(self.book_data.get('code', ''))
             self.price_input.setValue(float(self.book_data.get('price', 0)))
+            self.copies_input.setValue(int(self.book_data.get('copies', 1)))
             self.desc_input.setText(self.book_data.get('description', ''))
-            
-            # Set combos
-            index = self.category_input.findText(self.book_data.get('category', ''))
-            if index >= 0: self.category_input.setCurrentIndex(index)
-            
-            index = self.author_input.findText(self.book_data.get('author', ''))
-            if index >= 0: self.author_input.setCurrentIndex(index)
-            
-            index = self.publisher_input.findText(self.book_data.get('publisher', ''))
-            if index >= 0: self.publisher_input.setCurrentIndex(index)
+            self.category_input.setText(self.book_data.get('category', ''))
+            self.author_input.setText(self.book_data.get('author', ''))
+            self.publisher_input.setText(self.book_data.get('publisher', ''))
 
         self.add_buttons(self.validate_and_accept)
 
     def validate_and_accept(self):
-        if not self.title_input.text() or not self.code_input.text():
-            QMessageBox.warning(self, "Validation Error", "Title and Code are required.")
+        error = validate_book(self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validation Error", error)
             return
         self.accept()
 
@@ -116,10 +130,11 @@ class BookDialog(BaseDialog):
         return {
             'name': self.title_input.text(),
             'code': self.code_input.text(),
-            'category': self.category_input.currentText(),
-            'author': self.author_input.currentText(),
-            'publisher': self.publisher_input.currentText(),
+            'category': self.category_input.text().strip(),
+            'author': self.author_input.text().strip(),
+            'publisher': self.publisher_input.text().strip(),
             'price': self.price_input.value(),
+            'copies': self.copies_input.value(),
             'description': self.desc_input.toPlainText()
         }
 
@@ -198,8 +213,9 @@ class ClientDialog(BaseDialog):
         self.add_buttons(self.validate_and_accept)
         
     def validate_and_accept(self):
-        if not self.name_input.text() or not self.nid_input.text():
-            QMessageBox.warning(self, "Validation Error", "Name and ID are required.")
+        error = validate_client(self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validation Error", error)
             return
         self.accept()
         
@@ -209,3 +225,54 @@ class ClientDialog(BaseDialog):
             'email': self.email_input.text(),
             'nid': self.nid_input.text()
         }
+
+class NamesDialog(BaseDialog):
+    """Several reference names at once, one per line"""
+    def __init__(self, kind, parent=None):
+        super().__init__(f"Add {kind}", parent)
+        self.names_input = QTextEdit()
+        self.names_input.setPlaceholderText("One name per line")
+        self.names_input.setAcceptRichText(False)
+        self.form_layout.addRow("Names:", self.names_input)
+        self.add_buttons(self.validate_and_accept)
+
+    def validate_and_accept(self):
+        if not self.get_data():
+            QMessageBox.warning(self, "Validation Error", "Enter at least one name.")
+            return
+        self.accept()
+
+    def get_data(self):
+        return [line.strip() for line in self.names_input.toPlainText().splitlines() if line.strip()]
+
+class OperationDialog(BaseDialog):
+    """Lend a book: the book and client are picked by their codes"""
+    def __init__(self, parent=None, loan_days=14):
+        super().__init__("Lend Book", parent)
+        self.code_input = QLineEdit()
+        self.code_input.setPlaceholderText("Book code")
+        self.nid_input = QLineEdit()
+        self.nid_input.setPlaceholderText("Client national ID")
+        self.days_input = QSpinBox()
+        self.days_input.setRange(1, 365)
+        self.days_input.setValue(loan_days)
+        self.days_input.setSuffix(" days")
+
+        self.form_layout.addRow("Book Code:", self.code_input)
+        self.form_layout.addRow("Client ID:", self.nid_input)
+        self.form_layout.addRow("Loan Period:", self.days_input)
+        self.add_buttons(self.validate_and_accept)
+
+    def validate_and_accept(self):
+        error = validate_operation(self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validation Error", error)
+            return
+        self.accept()
+
+    def get_data(self):
+        return {
+            'code': self.code_input.text().strip(),
+            'nid': self.nid_input.text().strip(),
+            'days': self.days_input.value()
+        }
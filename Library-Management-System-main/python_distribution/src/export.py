@@ -0,0 +1,189 @@
+"""
+Streaming table exports.
+
+Rows are read from the cursor a chunk at a time and written straight to
+disk, so memory use stays flat however large the table is. Each output
+format is a writer registered with @exporter.
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+
+from xlsxwriter import Workbook
+
+from .database import export_query
+
+logger = logging.getLogger(__name__)
+
+# Rows per fetchmany() call; also how often progress is reported.
+CHUNK_SIZE = 2000
+
+# Text columns holding ISO dates; they are exported as real Excel dates.
+DATE_COLUMNS = {"fromDate", "toDate"}
+DATE_FORMAT = "yyyy-mm-dd"
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+# Day zero of Excel's serial date numbers (valid from March 1900 on).
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# Default file name per table, as the export buttons have always used.
+DEFAULT_FILENAMES = {
+    "book": "allBooks",
+    "client": "allClients",
+    "dayoperations": "day_operations",
+}
+
+# format name -> (file dialog label, file extension, writer)
+EXPORTERS = {}
+
+
+def exporter(name, label, extension):
+    """Register ``writer(filename, names, chunks)`` as the ``name`` format."""
+    def decorator(func):
+        EXPORTERS[name] = (label, extension, func)
+        return func
+    return decorator
+
+
+def format_for(filename):
+    """Format whose extension ``filename`` ends with, longest match first."""
+    matches = [name for name, (_, extension, _) in EXPORTERS.items() if filename.lower().endswith(extension)]
+    if not matches:
+        raise ValueError(f"Unknown export format for {filename!r}")
+    return max(matches, key=lambda name: len(EXPORTERS[name][1]))
+
+
+class ExportCancelled(Exception):
+    """The export was cancelled; its partial output file has been removed."""
+
+
+def count_rows(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def cell_writers(workbook, sheet, names):
+    """One ``write(row, col, value)`` function per column, picked once up front.
+
+    Integers and floats become numeric cells and date columns become date
+    cells, so they sort and sum in Excel. Anything that does not fit its
+    column falls back to text. NULLs are never passed in: skipping them
+    leaves the cell empty.
+    """
+    date_format = workbook.add_format({"num_format": DATE_FORMAT})
+    datetime_format = workbook.add_format({"num_format": DATETIME_FORMAT})
+    by_type = {int: sheet.write_number, float: sheet.write_number, str: sheet.write_string}
+    # Operation logs repeat the same few hundred dates, so each distinct
+    # text is parsed once and written as its Excel serial number.
+    dates = {}
+
+    def write_value(row, col, value):
+        writer = by_type.get(type(value))
+        if writer is None:
+            sheet.write_string(row, col, str(value))
+        else:
+            writer(row, col, value)
+
+    def write_date(row, col, value):
+        date = dates.get(value)
+        if date is None:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                date = (None, None)
+            else:
+                has_time = parsed.hour or parsed.minute or parsed.second
+                date = ((parsed - EXCEL_EPOCH) / timedelta(days=1),
+                        datetime_format if has_time else date_format)
+            dates[value] = date
+        serial, cell_format = date
+        if serial is None:
+            write_value(row, col, value)
+        else:
+            sheet.write_number(row, col, serial, cell_format)
+
+    return [write_date if name in DATE_COLUMNS else write_value for name in names]
+
+
+@exporter("xlsx", "Excel workbook (*.xlsx)", ".xlsx")
+def write_xlsx(filename, names, chunks):
+    """Typed cells through xlsxwriter's constant_memory mode.
+
+    That mode flushes each row to a temporary file once the next one
+    starts, so the writer never holds more than the current row.
+    """
+    workbook = Workbook(filename, {"constant_memory": True})
+    try:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, names)
+        writers = cell_writers(workbook, sheet, names)
+        row_idx = 0
+        for rows in chunks:
+            for row in rows:
+                row_idx += 1
+                for col, (write, item) in enumerate(zip(writers, row)):
+                    if item is not None:
+                        write(row_idx, col, item)
+    finally:
+        workbook.close()
+
+
+@exporter("csv", "CSV (*.csv)", ".csv")
+def write_csv(filename, names, chunks, opener=open):
+    with opener(filename, "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for rows in chunks:
+            writer.writerows(rows)
+
+
+@exporter("csv.gz", "Compressed CSV (*.csv.gz)", ".csv.gz")
+def write_csv_gz(filename, names, chunks):
+    # Level 6 is within a few percent of 9 on this data at twice the speed.
+    write_csv(filename, names, chunks, opener=lambda *args, **kwargs: gzip.open(*args, compresslevel=6, **kwargs))
+
+
+@exporter("jsonl", "JSON Lines (*.jsonl)", ".jsonl")
+def write_jsonl(filename, names, chunks):
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with open(filename, "w", encoding="utf-8") as f:
+        for rows in chunks:
+            f.writelines(encode(dict(zip(names, row))) + "\n" for row in rows)
+
+
+def export_table(conn, table, filename, fmt=None, progress=None, cancelled=None, chunk_size=CHUNK_SIZE):
+    """Write ``table`` to ``filename`` and return the number of data rows.
+
+    ``fmt`` defaults to the one matching the file extension. Rows are
+    handed to the writer one fetchmany() chunk at a time;
+    ``progress(rows_written)`` is called after every chunk, and the export
+    stops with ExportCancelled as soon as ``cancelled()`` returns True.
+    """
+    write = EXPORTERS[fmt or format_for(filename)][2]
+    cur = conn.execute(export_query(table))
+    names = [description[0] for description in cur.description]
+    written = 0
+
+    def chunks():
+        nonlocal written
+        while True:
+            if cancelled is not None and cancelled():
+                raise ExportCancelled(f"Export of {table} cancelled")
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+            written += len(rows)
+            if progress is not None:
+                progress(written)
+
+    try:
+        write(filename, names, chunks())
+    except BaseException:
+        if os.path.exists(filename):
+            os.remove(filename)
+        raise
+    logger.info("Exported %d rows of %s to %s", written, table, filename)
+    return written
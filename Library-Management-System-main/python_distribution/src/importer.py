@@ -0,0 +1,216 @@
+"""
+Bulk imports of books and clients from CSV or XLSX files.
+
+Columns are matched by header, using the names the exports write, so an
+exported file can be imported back unchanged. Rows are checked with the
+same rules as the Add dialogs and upserted on the natural key (book code,
+client national ID), one statement per batch.
+"""
+
+import csv
+import json
+import logging
+import os
+
+from .database import db_connection, lookup_id
+from .validation import validate_book, validate_client
+
+logger = logging.getLogger(__name__)
+
+# Rows per transaction; also how often progress is reported.
+BATCH_SIZE = 5000
+
+# table -> {file header: key of the dict passed to add_book()/add_client()}
+IMPORT_COLUMNS = {
+    "book": {
+        "book_code": "code",
+        "book_name": "name",
+        "book_description": "description",
+        "book_category": "category",
+        "book_author": "author",
+        "book_publisher": "publisher",
+        "book_price": "price",
+    },
+    "client": {
+        "clientName": "name",
+        "clientEmail": "email",
+        "clientNid": "nid",
+    },
+}
+
+# table -> (natural key column, {record key: table column}). Keys naming a
+# lookup table are stored as that table's id.
+UPSERT_COLUMNS = {
+    "book": ("book_code", {
+        "name": "book_name",
+        "description": "book_description",
+        "code": "book_code",
+        "category": "category_id",
+        "author": "author_id",
+        "publisher": "publisher_id",
+        "price": "book_price",
+    }),
+    "client": ("clientNid", {
+        "name": "clientName",
+        "email": "clientEmail",
+        "nid": "clientNid",
+    }),
+}
+
+VALIDATORS = {"book": validate_book, "client": validate_client}
+
+LOOKUP_KEYS = ("category", "author", "publisher")
+
+
+class ImportCancelled(Exception):
+    """The import was cancelled; batches already written are kept."""
+
+
+def read_csv(filename):
+    """Yield one dict per data row, keyed by the header row."""
+    with open(filename, newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def read_xlsx(filename):
+    """Yield one dict per non-empty row of the first sheet, keyed by the header row."""
+    # Imported here: openpyxl takes ~0.2 s to load and only imports need it.
+    from openpyxl import load_workbook
+
+    # read_only streams the sheet XML instead of building every cell object
+    workbook = load_workbook(filename, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = ["" if header is None else str(header) for header in next(rows, ())]
+        for row in rows:
+            if any(value is not None for value in row):
+                yield dict(zip(headers, row))
+    finally:
+        workbook.close()
+
+
+READERS = {".csv": read_csv, ".xlsx": read_xlsx}
+
+
+def _text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # numeric code cells can come back as 1.0
+    return str(value).strip()
+
+
+def _price(value):
+    if value is None or value == "":
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value  # rejected by validate_book()
+
+
+def to_record(table, row):
+    """Map a file row to the dialog's field names; only headers present are kept."""
+    record = {}
+    for header, key in IMPORT_COLUMNS[table].items():
+        if header in row:
+            record[key] = _price(row[header]) if key == "price" else _text(row[header])
+    return record
+
+
+def _has_unique_key(conn, table, column):
+    for _, name, unique, *_ in conn.execute(f"PRAGMA index_list({table})"):
+        if unique and [info[2] for info in conn.execute(f"PRAGMA index_info({name})")] == [column]:
+            return True
+    return False
+
+
+def upsert_sql(table, keys):
+    """Upsert of a whole batch, passed as one JSON array of rows.
+
+    One statement per batch rather than executemany(): every statement
+    ends by flushing FTS5's pending terms, so a row-at-a-time insert makes
+    the search triggers write one tiny index segment per row, which costs
+    three times the insert itself. Columns missing from the file are left
+    alone on existing rows, so a price list with just code, name and price
+    does not blank descriptions.
+    """
+    key_column, columns = UPSERT_COLUMNS[table]
+    names = [columns[key] for key in keys]
+    values = ", ".join(f"json_extract(value, '$[{i}]')" for i in range(len(names)))
+    updates = ", ".join(f"{name} = excluded.{name}" for name in names if name != key_column)
+    action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    # "WHERE true" is required: without it ON CONFLICT would parse as a join constraint
+    return (f"INSERT INTO {table}({', '.join(names)}) SELECT {values} FROM json_each(?) WHERE true "
+            f"ON CONFLICT({key_column}) {action}")
+
+
+def _write_batch(conn, sql, keys, records, lookup_ids):
+    rows = []
+    for record in records:
+        values = []
+        for key in keys:
+            value = record[key]
+            if key in lookup_ids:
+                # Names repeat across a catalogue; resolve each one once per import
+                ids = lookup_ids[key]
+                if value not in ids:
+                    ids[value] = lookup_id(conn, key, value)
+                value = ids[value]
+            values.append(value)
+        rows.append(values)
+    conn.execute(sql, (json.dumps(rows),))
+
+
+def import_file(table, filename, progress=None, cancelled=None, batch_size=BATCH_SIZE):
+    """Upsert every valid row of ``filename`` into ``table``.
+
+    Returns ``(imported, rejected)``: the number of rows written and a list
+    of ``(line, message)`` for rows that failed validation. Each batch is
+    its own transaction on the pooled connection, so an interrupted import
+    keeps the batches before it. ``progress(rows_read)`` is called after
+    every batch, and ImportCancelled is raised once ``cancelled()`` returns
+    True.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Cannot import {filename!r}: expected one of {', '.join(READERS)}")
+    key_column, columns = UPSERT_COLUMNS[table]
+    with db_connection() as conn:
+        if not _has_unique_key(conn, table, key_column):
+            raise ValueError(f"{table}.{key_column} has duplicate values; remove them before importing")
+
+    validate = VALIDATORS[table]
+    lookup_ids = {key: {} for key in LOOKUP_KEYS}
+    sql = keys = None
+    imported = 0
+    rejected = []
+    batch = []
+    line = 1
+    for line, row in enumerate(READERS[extension](filename), 2):
+        record = to_record(table, row)
+        if keys is None:
+            keys = [key for key in columns if key in record]
+            sql = upsert_sql(table, keys)
+        error = validate(record)
+        if error:
+            rejected.append((line, error))
+            continue
+        batch.append(record)
+        if len(batch) >= batch_size:
+            with db_connection() as conn:
+                _write_batch(conn, sql, keys, batch, lookup_ids)
+            imported += len(batch)
+            batch = []
+            if progress is not None:
+                progress(line - 1)
+            if cancelled is not None and cancelled():
+                raise ImportCancelled(f"Import into {table} cancelled after {imported} rows")
+    if batch:
+        with db_connection() as conn:
+            _write_batch(conn, sql, keys, batch, lookup_ids)
+        imported += len(batch)
+    if progress is not None:
+        progress(line - 1)
+    logger.info("Imported %d rows into %s from %s (%d rejected)", imported, table, filename, len(rejected))
+    return imported, rejected
@@ -1,55 +1,65 @@
-
-import sys
-import os
 import logging
-from PyQt5.QtWidgets import QMessageBox
-import sqlite3
-from .database import get_db_connection
+from .models import loader_pool
 from .ui_login import ModernLoginUI
+from .workers import LoginTask
 
 logger = logging.getLogger(__name__)
 
 class LoginCls(ModernLoginUI):
-    
+
     def __init__(self):
         super().__init__()
         logger.debug("Login window setup complete.")
-        
+
         self.loginBtn.clicked.connect(self.handleLogin)
         self.mainWindow = None # Will be set to Library instance
+        self.login_task = None
 
     def handleLogin(self):
+        if self.login_task is not None:
+            return
+        loginUsername = self.loginUsername.text()
+        loginUserPass = self.loginUserPass.text()
+
+        if not loginUsername or not loginUserPass:
+            self.loginError.setText('Please enter both username and password')
+            return
+
+        # The password check is slow by design; run it on the loader pool
+        # so this window keeps repainting meanwhile.
+        self.loginError.setText('')
+        self.set_waiting("SIGNING IN…")
+        self.login_task = LoginTask(loginUsername, loginUserPass)
+        self.login_task.signals.finished.connect(self.on_login_checked)
+        self.login_task.signals.failed.connect(self.on_login_failed)
+        loader_pool().start(self.login_task)
+
+    def set_waiting(self, text):
+        """Disable the login button, showing ``text`` on it."""
+        self.loginBtn.setEnabled(False)
+        self.loginBtn.setText(text)
+
+    def reset_login_button(self):
+        self.login_task = None
+        self.loginBtn.setEnabled(True)
+        self.loginBtn.setText("LOGIN")
+
+    def on_login_checked(self, user_id):
+        self.reset_login_button()
+        if user_id is None:
+            self.loginError.setText('❌ Username or password is invalid')
+            self.loginUserPass.clear()
+            return
         try:
-            self.db = get_db_connection(self)
-            if not self.db:
-                return # User cancelled or failed
-                
-            self.cur = self.db.cursor()
-            
-            loginUsername = self.loginUsername.text()
-            loginUserPass = self.loginUserPass.text()
-            
-            if not loginUsername or not loginUserPass:
-                self.loginError.setText('Please enter both username and password')
-                return
-            
-            sql = "SELECT * FROM users WHERE username=? AND userspassword=?"
-            self.cur.execute(sql, (loginUsername, loginUserPass))
-            data = self.cur.fetchone()
-            
-            if data:
-                # data is (id, username, email, password)
-                from .main import Library 
-                self.mainWindow = Library()
-                self.close()
-                self.mainWindow.show()
-            else:
-                self.loginError.setText('❌ Username or password is invalid')
-            self.db.close()
-            
-        except sqlite3.Error as e:
-            self.loginError.setText(f"Database Error: {e}")
+            from .main import Library
+            self.mainWindow = Library()
+            self.close()
+            self.mainWindow.show()
         except Exception as e:
             self.loginError.setText(f"Error: {e}")
             import traceback
             traceback.print_exc()
+
+    def on_login_failed(self, message):
+        self.reset_login_button()
+        self.loginError.setText(f"Database Error: {message}")
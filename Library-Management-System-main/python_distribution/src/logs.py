@@ -0,0 +1,185 @@
+"""
+Application logging.
+
+The root logger's only handler is a QueueHandler: a log call just puts the
+record on a queue, and a QueueListener thread writes it to a rotating
+debug.log and the console, so the GUI thread never waits on the disk.
+
+Levels are set per logger, from DEFAULT_LEVELS, then the BOOKHUB_LOG_LEVELS
+environment variable or ``run.py --log-level``, and at any time with
+set_levels(). A spec is a comma-separated list of ``logger=LEVEL``; a bare
+level sets the root logger:
+
+    BOOKHUB_LOG_LEVELS="INFO,src.database=DEBUG" python run.py
+
+Log calls pass their values as arguments (``logger.debug("Read %d rows",
+n)``), not f-strings: a disabled call then formats nothing, and
+RateLimitFilter can recognise repeats of the same message.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE = "debug.log"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3
+RATE_BURST = 20     # records of one message per second, see RateLimitFilter
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+ENV_VAR = "BOOKHUB_LOG_LEVELS"
+
+DEFAULT_LEVELS = {"": logging.INFO}
+
+_listener = None
+_queue_handler = None
+
+
+def parse_levels(spec):
+    """{logger name: level} from a ``"INFO,src.database=DEBUG"`` spec; ValueError if a level is unknown."""
+    levels = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, level = item.rpartition("=")
+        level = level.strip().upper()
+        if not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Unknown log level '{level}' in '{item}'.")
+        levels[name.strip()] = level
+    return levels
+
+
+def set_levels(levels):
+    """Set logger levels from a {name: level} dict or a spec string; '' is the root logger."""
+    if isinstance(levels, str):
+        levels = parse_levels(levels)
+    for name, level in levels.items():
+        logging.getLogger(name or None).setLevel(level)
+
+
+def configured_levels():
+    """{logger name: level name} for every logger with a level of its own."""
+    levels = {"": logging.getLevelName(logging.getLogger().level)}
+    for name, logger in sorted(logging.Logger.manager.loggerDict.items()):
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+class RateLimitFilter(logging.Filter):
+    """Passes at most ``burst`` records of one message per ``period`` seconds.
+
+    Records are grouped by logger and unformatted message, so a loop that
+    logs the same line thousands of times writes ``burst`` of them and a
+    count of the rest. Warnings and errors always pass.
+    """
+
+    def __init__(self, burst=20, period=1.0):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, str(record.msg))
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or record.created - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                self._prune(record.created)
+                self._windows[key] = [record.created, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar messages suppressed)"
+            record.args = None
+        return True
+
+    def _prune(self, now):
+        # Drop expired windows, so messages logged once do not pile up for the
+        # whole session; their suppressed counts are lost, as no record follows.
+        expired = [key for key, window in self._windows.items() if now - window[0] >= self.period]
+        for key in expired:
+            del self._windows[key]
+
+
+class DeferredQueueHandler(QueueHandler):
+    """A QueueHandler that leaves formatting to the listener thread.
+
+    QueueHandler.prepare() formats each record before queueing it, which
+    is most of the cost of a log call. Here the record is queued as is, so
+    log arguments must not be changed after the call (the app only logs
+    numbers, strings and exceptions).
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def start(filename=LOG_FILE, levels=None, console=True, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT,
+          burst=RATE_BURST):
+    """Route all logging through a queue to a rotating ``filename`` (and stdout); returns the listener.
+
+    ``levels`` (a dict or spec) is applied after DEFAULT_LEVELS and the
+    environment; ``burst=None`` turns rate limiting off. Calling start()
+    again replaces the previous setup.
+    """
+    global _listener, _queue_handler
+    stop()
+    formatter = logging.Formatter(FORMAT)
+    handlers = [RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count,
+                                    encoding="utf-8", delay=True)]
+    if console:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(records)
+    if burst is not None:
+        _queue_handler.addFilter(RateLimitFilter(burst))
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+
+    set_levels(DEFAULT_LEVELS)
+    try:
+        set_levels(os.environ.get(ENV_VAR, ""))
+    except ValueError as e:
+        # A typo in the environment must not stop the app from starting;
+        # nothing of the spec was applied, so DEFAULT_LEVELS stand.
+        logging.getLogger(__name__).warning("Ignoring %s=%r: %s", ENV_VAR, os.environ[ENV_VAR], e)
+    if levels:
+        set_levels(levels)
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop():
+    """Detach the queue, write out the records already on it and close the sinks."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler = None
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop)
@@ -3,47 +3,113 @@ import sys
 import os
 import datetime
 import logging
-from PyQt5.QtWidgets import QMainWindow, QTableWidgetItem, QMessageBox, QApplication, QHeaderView
+import time
+from PyQt5.QtCore import Qt, QTimer, QStringListModel
+from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QApplication, QProgressBar, QProgressDialog,
+                             QFileDialog, QInputDialog, QTableWidgetItem)
 import sqlite3
-from xlsxwriter import Workbook
-from .database import get_db_connection
+from .database import (db_connection, add_book, add_client, add_user, iter_page, fetch_row, lookup_names,
+                       add_lookup_names, rename_lookup, merge_lookups, get_book, get_client, get_user,
+                       update_book, update_client, update_user, delete_rows,
+                       start_profiling, stop_profiling, get_profiler)
+from .models import LazyTableModel, loader_pool
+from .export import DEFAULT_FILENAMES, EXPORTERS
+from .search import iter_search
+from .circulation import LOAN_DAYS, ids_for, borrow, return_loan, renew, iter_overdue, overdue_count, loan_books
+from .workers import ExportTask, ImportTask
 from .ui_main import ModernAppUI
-from .dialogs import BookDialog, ClientDialog, UserDialog
+from .dialogs import BookDialog, ClientDialog, UserDialog, NamesDialog, OperationDialog
 
 logger = logging.getLogger(__name__)
 
+# Column headers per listing; the listing's key column is not shown.
+LISTING_HEADERS = {
+    "book": ["Code", "Name", "Description", "Category", "Author", "Available"],
+    "client": ["ID", "Name", "Email"],
+    "users": ["ID", "Username", "Email"],
+    "dayoperations": ["Book", "Client", "Type", "From", "To", "Status"],
+    "author": ["ID", "Name", "Books"],
+    "category": ["ID", "Name", "Books"],
+    "publisher": ["ID", "Name", "Books"],
+}
+
+# Tab index -> listing shown on that tab, in tabWidget order.
+TAB_LISTINGS = {0: "dayoperations", 1: "book", 2: "users", 3: "client"}
+
+# The Settings tab shows one reference table at a time, in settings_kind order.
+SETTINGS_TAB = 4
+REFERENCE_LISTINGS = ["author", "category", "publisher"]
+
+# A loaded tab is queried again on activation once its data is this old (seconds).
+TAB_STALE_AFTER = 300
+
+# Quiet period after the last keystroke before the search query runs (ms).
+SEARCH_DEBOUNCE_MS = 300
+
 class Library(ModernAppUI):
     
     def __init__(self):
         super().__init__()
         logger.debug("Library window setup complete.")
         
+        self.setup_models()
+        self.setup_progress()
+        self.setup_search()
+        self.export_task = None
+        self.import_task = None
+        # Last QueryProfiler recorded from the Settings tab, kept after recording stops
+        self.profiler = None
+        
         # Connect Tab Buttons
         self.connect_signals()
         
-        # Initialize UI with data
+        # Only the visible tab is loaded; the others load on first activation
         try:
-             self.refresh_all_data()
+             self.ensure_loaded(self.tab_listing(self.tabWidget.currentIndex()))
         except Exception as e:
-            logger.error(f"Initialization error (non-fatal): {e}")
+            logger.error("Initialization error (non-fatal): %s", e)
 
     def connect_signals(self):
         """Connect all button signals to their slots"""
         # Books
         self.books_add_btn.clicked.connect(self.open_add_book_dialog)
         self.books_export_btn.clicked.connect(self.export_books)
+        self.books_import_btn.clicked.connect(self.import_books)
+        self.books_edit_btn.clicked.connect(self.edit_book)
+        self.books_delete_btn.clicked.connect(lambda: self.delete_selected("book", "books"))
+        self.books_table.doubleClicked.connect(lambda _index: self.edit_book())
         
         # Clients
         self.clients_add_btn.clicked.connect(self.open_add_client_dialog)
         self.clients_export_btn.clicked.connect(self.export_clients)
+        self.clients_import_btn.clicked.connect(self.import_clients)
+        self.clients_edit_btn.clicked.connect(self.edit_client)
+        self.clients_delete_btn.clicked.connect(lambda: self.delete_selected("client", "clients"))
+        self.clients_table.doubleClicked.connect(lambda _index: self.edit_client())
         
         # Users
         self.users_add_btn.clicked.connect(self.open_add_user_dialog)
+        self.users_edit_btn.clicked.connect(self.edit_user)
+        self.users_delete_btn.clicked.connect(lambda: self.delete_selected("users", "users"))
+        self.users_table.doubleClicked.connect(lambda _index: self.edit_user())
         # self.users_export_btn.clicked.connect(self.export_users) # If implemented
         
         # Day Operations
         self.day_ops_add_btn.clicked.connect(self.open_add_operation_dialog)
         self.day_ops_export_btn.clicked.connect(self.export_day_operations)
+        self.day_ops_return_btn.clicked.connect(self.return_selected_loans)
+        self.day_ops_renew_btn.clicked.connect(self.renew_selected_loans)
+        self.day_ops_overdue_btn.toggled.connect(self.show_overdue)
+        
+        # Reference data
+        self.settings_kind.currentIndexChanged.connect(self.show_reference)
+        self.settings_add_btn.clicked.connect(self.add_reference_names)
+        self.settings_rename_btn.clicked.connect(self.rename_reference)
+        self.settings_merge_btn.clicked.connect(self.merge_references)
+        self.profiler_record_btn.toggled.connect(self.toggle_profiling)
+        self.profiler_refresh_btn.clicked.connect(self.refresh_profiler)
+        self.profiler_reset_btn.clicked.connect(self.reset_profiler)
+        self.profiler_save_btn.clicked.connect(self.save_query_profile)
         
         # Sidebar Navigation
         self.dayOperationBtn.clicked.connect(lambda: self.tabWidget.setCurrentIndex(0))
@@ -51,55 +117,189 @@ class Library(ModernAppUI):
         self.userBtn.clicked.connect(lambda: self.tabWidget.setCurrentIndex(2))
         self.clientBtn.clicked.connect(lambda: self.tabWidget.setCurrentIndex(3))
         self.settingsBtn.clicked.connect(lambda: self.tabWidget.setCurrentIndex(4))
+        
+        # Load tabs on activation; sidebar buttons route through this too
+        self.tabWidget.currentChanged.connect(self.on_tab_changed)
+
+    def setup_models(self):
+        """Attach a lazily paged model to each data table."""
+        # Day Operations shows only loans past their due date while this is set
+        self.overdue_only = False
+        self.books_model = self.create_model("book", self.books_table)
+        self.clients_model = self.create_model("client", self.clients_table)
+        self.users_model = self.create_model("users", self.users_table)
+        self.day_ops_model = self.create_model("dayoperations", self.day_ops_table)
+        self.models = {"book": self.books_model, "client": self.clients_model,
+                       "users": self.users_model, "dayoperations": self.day_ops_model}
+        self.listing_views = {"book": self.books_table, "client": self.clients_table,
+                              "users": self.users_table, "dayoperations": self.day_ops_table}
+        # Reference tables share the Settings table view, which shows one at a time
+        for listing in REFERENCE_LISTINGS:
+            self.models[listing] = self.create_model(listing)
+        self.reference_listing = REFERENCE_LISTINGS[0]
+        self.settings_table.setModel(self.models[self.reference_listing])
+        # listing -> time.monotonic() of its last full load; absent = not loaded or stale
+        self.loaded_at = {}
+        # lookup table -> (names tuple shown, QStringListModel) for the book dialog
+        self.lookup_models = {}
+
+    def create_model(self, listing, table_view=None):
+        model = LazyTableModel(LISTING_HEADERS[listing], self.make_fetch(listing, ""), parent=self)
+        model.loadingChanged.connect(self.update_progress)
+        if table_view is not None:
+            table_view.setModel(model)
+        return model
+
+    def make_fetch(self, listing, text):
+        """Fetch function for a listing, filtered by the search text if any."""
+        overdue = listing == "dayoperations" and self.overdue_only
+
+        # Runs on a loader thread, which gets its own pooled connection.
+        def fetch(after_key, limit):
+            with db_connection() as conn:
+                if overdue:
+                    yield from iter_overdue(conn, after_key=after_key, limit=limit, text=text)
+                elif text:
+                    yield from iter_search(conn, listing, text, after_key, limit)
+                else:
+                    yield from iter_page(conn, listing, after_key, limit)
+        return fetch
+
+    def tab_listing(self, index):
+        """Listing shown on a tab; for Settings, the reference table picked there."""
+        if index == SETTINGS_TAB:
+            return self.reference_listing
+        return TAB_LISTINGS.get(index)
+
+    def tab_models(self):
+        """Tab index -> model, in tabWidget order."""
+        return {index: self.models[self.tab_listing(index)] for index in (*TAB_LISTINGS, SETTINGS_TAB)}
+
+    def ensure_loaded(self, listing):
+        """Load a listing on first use, or again once it is stale; otherwise keep the cached rows."""
+        model = self.models[listing]
+        loaded_at = self.loaded_at.get(listing)
+        if loaded_at is None or time.monotonic() - loaded_at > TAB_STALE_AFTER:
+            self.loaded_at[listing] = time.monotonic()
+            model.reload(self.make_fetch(listing, self.search_text))
+        elif model.rowCount() == 0 and model.canFetchMore():
+            # Resume a load that was cancelled before its first page arrived
+            model.fetchMore()
+
+    def invalidate(self, *listings):
+        """Mark listings stale: the visible one reloads now, the rest on next activation."""
+        for listing in listings:
+            self.loaded_at.pop(listing, None)
+        current = self.tab_listing(self.tabWidget.currentIndex())
+        if current in listings:
+            self.ensure_loaded(current)
+
+    def setup_progress(self):
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)  # busy indicator: row counts are unknown up front
+        self.load_progress.setMaximumWidth(160)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        self.statusBar().addPermanentWidget(self.load_progress)
+
+    def setup_search(self):
+        self.search_text = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        # Every keystroke restarts the timer, so only the final text is queried
+        self.search_box.textChanged.connect(lambda _text: self.search_timer.start())
+        self.search_box.returnPressed.connect(self.apply_search)
+
+    def apply_search(self):
+        self.search_timer.stop()
+        text = self.search_box.text().strip()
+        if text == self.search_text:
+            return
+        self.search_text = text
+        # Every tab is filtered; only the visible one is queried now
+        self.invalidate(*self.models)
+
+    def update_progress(self):
+        loading = [m for m in self.tab_models().values() if m.loading]
+        self.load_progress.setVisible(bool(loading))
+        if loading:
+            self.statusBar().showMessage(f'Loading {len(loading)} table(s)...')
+        elif self.statusBar().currentMessage().startswith('Loading'):
+            self.statusBar().clearMessage()
+
+    def on_tab_changed(self, index):
+        # Stop loading tables the user has navigated away from
+        for tab_index, model in self.tab_models().items():
+            if tab_index != index:
+                model.cancel()
+        listing = self.tab_listing(index)
+        if listing is not None:
+            self.ensure_loaded(listing)
+
+    def closeEvent(self, event):
+        for model in self.tab_models().values():
+            model.cancel()
+        for task in (self.export_task, self.import_task):
+            if task is not None:
+                task.cancel()
+        loader_pool().waitForDone(2000)
+        super().closeEvent(event)
 
     def refresh_all_data(self):
-        self.show_books()
-        self.show_clients()
-        self.show_users()
-        self.show_day_operations()
+        self.invalidate(*self.models)
 
     # ==========================
     # Books Management
     # ==========================
     def open_add_book_dialog(self):
-        # Fetch categories, authors, publishers for dropdowns
-        categories = self.fetch_single_column("category", "category_name")
-        authors = self.fetch_single_column("author", "author_name")
-        publishers = self.fetch_single_column("publisher", "publisher_name")
-        
-        dialog = BookDialog(self, categories, authors, publishers)
+        dialog = BookDialog(self, self.lookup_model("category"), self.lookup_model("author"),
+                            self.lookup_model("publisher"))
         if dialog.exec_():
             data = dialog.get_data()
             self.add_book_to_db(data)
 
     def add_book_to_db(self, data):
         try:
-            conn = get_db_connection(self)
-            if not conn: return
-            cur = conn.cursor()
-            cur.execute('''
-                INSERT INTO book(book_name, book_description, book_code, book_category, book_author, book_publisher, book_price) 
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (data['name'], data['description'], data['code'], data['category'], data['author'], data['publisher'], data['price']))
-            conn.commit()
-            conn.close()
+            with db_connection() as conn:
+                book_id = add_book(conn, data)
+            logger.debug("Added book %s", book_id)
             self.statusBar().showMessage('New book added successfully!')
-            self.show_books()
+            self.books_model.fetch_new()
+        except sqlite3.IntegrityError:
+            QMessageBox.warning(self, "Duplicate Book", f"A book with code '{data['code']}' already exists.")
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Could not add book: {e}")
 
-    def show_books(self):
+    def edit_book(self):
+        book_id = self.selected_key("book")
+        if book_id is None:
+            return
         try:
-            conn = get_db_connection(self)
-            if not conn: return
-            cur = conn.cursor()
-            cur.execute("SELECT book_code, book_name, book_description, book_category, book_author FROM book")
-            data = cur.fetchall()
-            
-            self.update_table(self.books_table, data, ["Code", "Name", "Description", "Category", "Author"])
-            conn.close()
+            with db_connection() as conn:
+                data = get_book(conn, book_id)
         except sqlite3.Error as e:
-            logger.error(f"Error fetching books: {e}")
+            QMessageBox.critical(self, "Database Error", f"Could not read book: {e}")
+            return
+        if data is None:
+            return
+        dialog = BookDialog(self, self.lookup_model("category"), self.lookup_model("author"),
+                            self.lookup_model("publisher"), book_data=data)
+        if dialog.exec_():
+            data = dialog.get_data()
+            try:
+                self.save_row("book", book_id, update_book, data)
+                self.statusBar().showMessage('Book updated successfully!')
+            except sqlite3.IntegrityError:
+                QMessageBox.warning(self, "Duplicate Book", f"A book with code '{data['code']}' already exists.")
+            except ValueError as e:
+                QMessageBox.warning(self, "Copies", str(e))
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Could not update book: {e}")
+
+    def show_books(self):
+        self.invalidate("book")
 
     # ==========================
     # Client Management
@@ -112,29 +312,41 @@ class Library(ModernAppUI):
             
     def add_client_to_db(self, data):
         try:
-            conn = get_db_connection(self)
-            if not conn: return
-            cur = conn.cursor()
-            cur.execute("INSERT INTO client(clientName, clientEmail, clientNid) VALUES(?, ?, ?)", 
-                       (data['name'], data['email'], data['nid']))
-            conn.commit()
-            conn.close()
+            with db_connection() as conn:
+                client_id = add_client(conn, data)
+            logger.debug("Added client %s", client_id)
             self.statusBar().showMessage('New client added successfully!')
-            self.show_clients()
+            self.clients_model.fetch_new()
+        except sqlite3.IntegrityError:
+             QMessageBox.warning(self, "Duplicate Client", f"A client with ID '{data['nid']}' already exists.")
         except sqlite3.Error as e:
              QMessageBox.critical(self, "Database Error", f"Could not add client: {e}")
 
-    def show_clients(self):
+    def edit_client(self):
+        client_id = self.selected_key("client")
+        if client_id is None:
+            return
         try:
-             conn = get_db_connection(self)
-             if not conn: return
-             cur = conn.cursor()
-             cur.execute("SELECT clientNid, clientName, clientEmail FROM client")
-             data = cur.fetchall()
-             self.update_table(self.clients_table, data, ["ID", "Name", "Email"])
-             conn.close()
+            with db_connection() as conn:
+                data = get_client(conn, client_id)
         except sqlite3.Error as e:
-             logger.error(f"Error fetching clients: {e}")
+            QMessageBox.critical(self, "Database Error", f"Could not read client: {e}")
+            return
+        if data is None:
+            return
+        dialog = ClientDialog(self, client_data=data)
+        if dialog.exec_():
+            data = dialog.get_data()
+            try:
+                self.save_row("client", client_id, update_client, data)
+                self.statusBar().showMessage('Client updated successfully!')
+            except sqlite3.IntegrityError:
+                QMessageBox.warning(self, "Duplicate Client", f"A client with ID '{data['nid']}' already exists.")
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Could not update client: {e}")
+
+    def show_clients(self):
+        self.invalidate("client")
 
     # ==========================
     # User Management
@@ -147,121 +359,435 @@ class Library(ModernAppUI):
             
     def add_user_to_db(self, data):
         try:
-            conn = get_db_connection(self)
-            if not conn: return
-            cur = conn.cursor()
-            # Note: In production, hash passwords!
-            cur.execute("INSERT INTO users(username, useremail, userspassword) VALUES(?, ?, ?)", 
-                       (data['username'], data['email'], data['password']))
-            conn.commit()
-            conn.close()
+            with db_connection() as conn:
+                user_id = add_user(conn, data)
+            logger.debug("Added user %s", user_id)
             self.statusBar().showMessage('New user added successfully!')
-            self.show_users()
+            self.users_model.fetch_new()
+        except sqlite3.IntegrityError:
+             QMessageBox.warning(self, "Duplicate User", f"The username '{data['username']}' is already taken.")
         except sqlite3.Error as e:
              QMessageBox.critical(self, "Database Error", f"Could not add user: {e}")
 
-    def show_users(self):
+    def edit_user(self):
+        user_id = self.selected_key("users")
+        if user_id is None:
+            return
         try:
-             conn = get_db_connection(self)
-             if not conn: return
-             cur = conn.cursor()
-             cur.execute("SELECT id_users, username, useremail FROM users")
-             data = cur.fetchall()
-             self.update_table(self.users_table, data, ["ID", "Username", "Email"])
-             conn.close()
+            with db_connection() as conn:
+                data = get_user(conn, user_id)
         except sqlite3.Error as e:
-             logger.error(f"Error fetching users: {e}")
+            QMessageBox.critical(self, "Database Error", f"Could not read user: {e}")
+            return
+        if data is None:
+            return
+        dialog = UserDialog(self, user_data=data)
+        if dialog.exec_():
+            data = dialog.get_data()
+            try:
+                self.save_row("users", user_id, update_user, data)
+                self.statusBar().showMessage('User updated successfully!')
+            except sqlite3.IntegrityError:
+                QMessageBox.warning(self, "Duplicate User", f"The username '{data['username']}' is already taken.")
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Could not update user: {e}")
+
+    def show_users(self):
+        self.invalidate("users")
 
     # ==========================
-    # Day Operations (TODO: Full Implementation)
+    # Day Operations
     # ==========================
     def open_add_operation_dialog(self):
-        QMessageBox.information(self, "Info", "Day Operation Dialog implementation pending refactor.")
-        
+        dialog = OperationDialog(self, LOAN_DAYS)
+        if dialog.exec_():
+            data = dialog.get_data()
+            self.lend_book(data)
+
+    def lend_book(self, data):
+        try:
+            with db_connection() as conn:
+                book_id, client_id = ids_for(conn, data['code'], data['nid'])
+                loan_id = borrow(conn, book_id, client_id, data['days'])
+                book_row = fetch_row(conn, "book", book_id)
+        except ValueError as e:
+            QMessageBox.warning(self, "Cannot Lend Book", str(e))
+            return
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not record the loan: {e}")
+            return
+        logger.debug("Recorded loan %s", loan_id)
+        self.statusBar().showMessage('Loan recorded successfully!')
+        self.day_ops_model.fetch_new()
+        # The trigger-maintained availability of the book has changed
+        self.books_model.update_row(book_row)
+
+    def return_selected_loans(self):
+        self._close_or_renew(return_loan, "returned")
+
+    def renew_selected_loans(self):
+        self._close_or_renew(lambda conn, key: renew(conn, key, LOAN_DAYS), "renewed")
+
+    def _close_or_renew(self, action, done):
+        keys = self.selected_keys("dayoperations")
+        if not keys:
+            QMessageBox.information(self, "Day Operations", "Select the loans first.")
+            return
+        changed = []
+        try:
+            # One transaction for the whole selection; rows already returned are skipped
+            with db_connection() as conn:
+                for key in keys:
+                    try:
+                        action(conn, key)
+                    except ValueError:
+                        continue
+                    changed.append(key)
+                rows = [fetch_row(conn, "dayoperations", key) for key in changed]
+                book_rows = [fetch_row(conn, "book", book_id) for book_id in loan_books(conn, changed)]
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not update the loans: {e}")
+            return
+        if self.overdue_only:
+            self.invalidate("dayoperations")
+        else:
+            for row in rows:
+                self.day_ops_model.update_row(row)
+        for row in book_rows:
+            if row is not None:
+                self.books_model.update_row(row)
+        skipped = len(keys) - len(changed)
+        self.statusBar().showMessage(f"{len(changed)} loans {done}" + (f", {skipped} not open" if skipped else ""))
+
+    def show_overdue(self, checked):
+        self.overdue_only = checked
+        if checked:
+            try:
+                with db_connection() as conn:
+                    count = overdue_count(conn)
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Could not count overdue loans: {e}")
+            else:
+                self.statusBar().showMessage(f"{count} loans overdue")
+        self.invalidate("dayoperations")
+
     def show_day_operations(self):
+        self.invalidate("dayoperations")
+
+    # ==========================
+    # Reference Data (Settings tab)
+    # ==========================
+    def show_reference(self, index):
+        self.models[self.reference_listing].cancel()
+        self.reference_listing = REFERENCE_LISTINGS[index]
+        self.settings_table.setModel(self.models[self.reference_listing])
+        self.ensure_loaded(self.reference_listing)
+
+    def selected_references(self):
+        """(key, name) of each selected Settings row, top to bottom."""
+        model = self.models[self.reference_listing]
+        rows = sorted(index.row() for index in self.settings_table.selectionModel().selectedRows())
+        return [(model.key(row), model.index(row, 1).data()) for row in rows]
+
+    def refresh_reference_rows(self, keys):
         try:
-             conn = get_db_connection(self)
-             if not conn: return
-             cur = conn.cursor()
-             cur.execute("SELECT bookname, clientName, type, fromDate, toDate FROM dayoperations")
-             data = cur.fetchall()
-             self.update_table(self.day_ops_table, data, ["Book", "Client", "Type", "From", "To"])
-             conn.close()
+            with db_connection() as conn:
+                rows = [fetch_row(conn, self.reference_listing, key) for key in keys]
         except sqlite3.Error as e:
-             logger.error(f"Error fetching operations: {e}")
+            # The write has committed; only the refreshed counts are missing
+            QMessageBox.critical(self, "Database Error", f"Could not refresh the changed entries: {e}")
+            return
+        for row in rows:
+            if row is not None:
+                self.models[self.reference_listing].update_row(row)
+
+    def add_reference_names(self):
+        kind = self.settings_kind.currentText()
+        dialog = NamesDialog(kind, self)
+        if not dialog.exec_():
+            return
+        try:
+            # One statement and one commit for the whole list
+            with db_connection() as conn:
+                added = add_lookup_names(conn, self.reference_listing, dialog.get_data())
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not add {kind.lower()}: {e}")
+            return
+        self.statusBar().showMessage(f'{added} new {kind.lower()} added')
+        self.models[self.reference_listing].fetch_new()
+
+    def rename_reference(self):
+        selected = self.selected_references()
+        if len(selected) != 1:
+            QMessageBox.information(self, "Rename", "Select one entry to rename.")
+            return
+        key, name = selected[0]
+        new_name, ok = QInputDialog.getText(self, "Rename", "New name:", text=name)
+        if not ok or new_name.strip() == name:
+            return
+        try:
+            with db_connection() as conn:
+                rename_lookup(conn, self.reference_listing, key, new_name)
+        except ValueError as e:
+            QMessageBox.warning(self, "Rename", str(e))
+            return
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not rename '{name}': {e}")
+            return
+        self.statusBar().showMessage(f"'{name}' renamed to '{new_name.strip()}'")
+        self.refresh_reference_rows([key])
+        # Books show the new name through their join; no book row was written
+        self.invalidate("book")
+
+    def merge_references(self):
+        selected = self.selected_references()
+        if len(selected) < 2:
+            QMessageBox.information(self, "Merge", "Select two or more entries to merge.")
+            return
+        names = [name for _, name in selected]
+        keep, ok = QInputDialog.getItem(self, "Merge", f"Merge {len(selected)} entries into:", names, 0, False)
+        if not ok:
+            return
+        target = selected[names.index(keep)][0]
+        try:
+            with db_connection() as conn:
+                moved = merge_lookups(conn, self.reference_listing, target, [key for key, _ in selected])
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not merge: {e}")
+            return
+        self.statusBar().showMessage(f"{len(selected) - 1} entries merged into '{keep}', {moved} books updated")
+        self.models[self.reference_listing].remove_rows([key for key, _ in selected if key != target])
+        self.refresh_reference_rows([target])
+        self.invalidate("book")
+
+    # ==========================
+    # Query Profiler (Settings tab)
+    # ==========================
+    def toggle_profiling(self, checked):
+        if checked:
+            self.profiler = start_profiling()
+            self.statusBar().showMessage("Recording queries")
+        else:
+            stop_profiling()
+            self.refresh_profiler()
+
+    def refresh_profiler(self):
+        profiler = get_profiler() or self.profiler
+        if profiler is None:
+            return
+        try:
+            with db_connection() as conn:
+                report = profiler.report(conn)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Query Profile", f"Could not read the query plans: {e}")
+            return
+        self.profiler_table.setRowCount(len(report))
+        for row, entry in enumerate(report):
+            values = (entry["sql"], entry["count"], f"{entry['total_ms']:.1f}", f"{entry['p95_ms']:.2f}",
+                      entry["rows"], "⚠ yes" if entry["full_scan"] else "")
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column == 0 and entry["plan"]:
+                    item.setToolTip("\n".join(entry["plan"]))
+                elif column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.profiler_table.setItem(row, column, item)
+        scans = sum(entry["full_scan"] for entry in report)
+        self.statusBar().showMessage(f"{len(report)} statements profiled, {scans} full table scans")
+
+    def reset_profiler(self):
+        profiler = get_profiler() or self.profiler
+        if profiler is not None:
+            profiler.reset()
+        self.profiler_table.setRowCount(0)
+
+    def save_query_profile(self):
+        profiler = get_profiler() or self.profiler
+        if profiler is None:
+            QMessageBox.information(self, "Query Profile", "Record some queries first.")
+            return
+        filename, _ = QFileDialog.getSaveFileName(self, "Save Query Profile", "queries.json", "JSON (*.json)")
+        if not filename:
+            return
+        try:
+            with db_connection() as conn, open(filename, "w", encoding="utf-8") as f:
+                profiler.dump(f, conn)
+        except (OSError, sqlite3.Error) as e:
+            QMessageBox.critical(self, "Query Profile", f"Could not save: {e}")
+            return
+        self.statusBar().showMessage(f"Query profile saved to {filename}")
 
     # ==========================
     # Helpers
     # ==========================
-    def fetch_single_column(self, table, column):
+    def selected_keys(self, listing):
+        """Primary keys of the selected rows of a listing's table, top to bottom."""
+        model = self.models[listing]
+        view = self.settings_table if listing in REFERENCE_LISTINGS else self.listing_views[listing]
+        return [model.key(row) for row in sorted(index.row() for index in view.selectionModel().selectedRows())]
+
+    def selected_key(self, listing):
+        """The key of the one selected row, or None after telling the user to pick one."""
+        keys = self.selected_keys(listing)
+        if len(keys) != 1:
+            QMessageBox.information(self, "Edit", "Select one row to edit.")
+            return None
+        return keys[0]
+
+    def save_row(self, listing, key, update, data):
+        """Run ``update(conn, key, data)`` and refresh just that row in the view."""
+        with db_connection() as conn:
+            update(conn, key, data)
+            row = fetch_row(conn, listing, key)
+        if row is not None:
+            self.models[listing].update_row(row)
+
+    def delete_selected(self, listing, noun):
+        keys = self.selected_keys(listing)
+        if not keys:
+            QMessageBox.information(self, "Delete", f"Select the {noun} to delete.")
+            return
+        answer = QMessageBox.question(self, "Delete", f"Delete {len(keys)} {noun}? This cannot be undone.",
+                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if answer != QMessageBox.Yes:
+            return
         try:
-            conn = get_db_connection(self)
-            if not conn: return []
-            cur = conn.cursor()
-            cur.execute(f"SELECT {column} FROM {table}")
-            data = [item[0] for item in cur.fetchall()]
-            conn.close()
-            return data
-        except sqlite3.Error:
-            return []
-
-    def update_table(self, table_widget, data, headers=None):
-        table_widget.setRowCount(0)
-        table_widget.setColumnCount(len(headers) if headers else 0)
-        if headers:
-            table_widget.setHorizontalHeaderLabels(headers)
-            table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        
-        if not data: return
-        
-        # If no headers provided, assume data length determines columns
-        if not headers and len(data) > 0:
-             table_widget.setColumnCount(len(data[0]))
-        
-        for row_idx, row_data in enumerate(data):
-            table_widget.insertRow(row_idx)
-            for col_idx, item in enumerate(row_data):
-                table_widget.setItem(row_idx, col_idx, QTableWidgetItem(str(item)))
+            # All or nothing: one statement in one transaction
+            with db_connection() as conn:
+                deleted = delete_rows(conn, listing, keys)
+        except sqlite3.IntegrityError:
+            QMessageBox.warning(self, "Delete", f"Some of these {noun} have day operations, so nothing was deleted.")
+            return
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not delete {noun}: {e}")
+            return
+        self.models[listing].remove_rows(keys)
+        self.statusBar().showMessage(f'{deleted} {noun} deleted')
+
+    def lookup_model(self, table):
+        """Shared model of a lookup table's names, refreshed only when the table has changed."""
+        try:
+            with db_connection() as conn:
+                names = lookup_names(conn, table)
+        except sqlite3.Error as e:
+            logger.error("Could not load %s names: %s", table, e)
+            names = ()
+        shown, model = self.lookup_models.get(table, (None, None))
+        if model is None:
+            model = QStringListModel(self)
+        if names is not shown:
+            # lookup_names() returns the same tuple until the table changes
+            model.setStringList(list(names))
+            self.lookup_models[table] = (names, model)
+        return model
 
     # ==========================
     # Exports
     # ==========================
     def export_books(self):
-        self._export_table("book", "allBooks.xlsx")
+        self._export_table("book")
         
     def export_clients(self):
-        self._export_table("client", "allClients.xlsx")
+        self._export_table("client")
         
     def export_day_operations(self):
-        self._export_table("dayoperations", "day_operations.xlsx")
+        self._export_table("dayoperations")
 
-    def _export_table(self, table_name, filename):
-        try:
-            conn = get_db_connection(self)
-            if not conn: return
-            cur = conn.cursor()
-            cur.execute(f"SELECT * FROM {table_name}")
-            data = cur.fetchall()
-            
-            # Get column names
-            names = [description[0] for description in cur.description]
-            
-            wb = Workbook(filename)
-            sheet = wb.add_worksheet()
-            
-            for col, name in enumerate(names):
-                sheet.write(0, col, name)
-                
-            for row_idx, row in enumerate(data):
-                for col_idx, item in enumerate(row):
-                    sheet.write(row_idx + 1, col_idx, str(item))
-                    
-            wb.close()
-            conn.close()
+    def _export_table(self, table_name):
+        if self.export_task is not None:
+            QMessageBox.information(self, "Export Running", "Please wait for the current export to finish.")
+            return
+        # One filter per registered format; the chosen filter decides the format
+        filters = {label: name for name, (label, _, _) in EXPORTERS.items()}
+        default = DEFAULT_FILENAMES[table_name] + EXPORTERS["xlsx"][1]
+        filename, selected = QFileDialog.getSaveFileName(self, "Export", default, ";;".join(filters))
+        if not filename:
+            return
+        fmt = filters.get(selected, "xlsx")
+        extension = EXPORTERS[fmt][1]
+        if not filename.lower().endswith(extension):
+            filename += extension
+
+        progress = QProgressDialog(f"Exporting to {filename}...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Export")
+        progress.setWindowModality(Qt.NonModal)
+        progress.setMinimumDuration(500)
+        progress.setAutoClose(False)
+
+        task = ExportTask(table_name, filename, fmt)
+        task.signals.started.connect(progress.setMaximum)
+        task.signals.progress.connect(progress.setValue)
+        task.signals.finished.connect(lambda rows, seconds: self._export_done(progress, filename, rows, seconds))
+        task.signals.failed.connect(lambda message: self._export_done(progress, filename, error=message))
+        task.signals.cancelled.connect(lambda: self._export_done(progress, filename, cancelled=True))
+        progress.canceled.connect(task.cancel)
+        self.export_task = task
+        loader_pool().start(task)
+
+    def _export_done(self, progress, filename, rows=0, seconds=0.0, error=None, cancelled=False):
+        self.export_task = None
+        progress.close()
+        if cancelled:
+            self.statusBar().showMessage('Export cancelled')
+        elif error is not None:
+            QMessageBox.critical(self, "Export Error", f"Failed to export: {error}")
+        else:
+            logger.info("Exported %d rows in %.1fs", rows, seconds)
             self.statusBar().showMessage(f'Data exported to {filename}')
-            QMessageBox.information(self, "Export Successful", f"Data exported to {filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export: {e}")
+            QMessageBox.information(self, "Export Successful", f"{rows} rows exported to {filename}")
+
+    # ==========================
+    # Imports
+    # ==========================
+    def import_books(self):
+        self._import_table("book")
+
+    def import_clients(self):
+        self._import_table("client")
+
+    def _import_table(self, table_name):
+        if self.import_task is not None:
+            QMessageBox.information(self, "Import Running", "Please wait for the current import to finish.")
+            return
+        filename, _ = QFileDialog.getOpenFileName(self, "Import", "", "Spreadsheets (*.xlsx *.csv)")
+        if not filename:
+            return
+
+        progress = QProgressDialog(f"Importing {os.path.basename(filename)}...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import")
+        progress.setWindowModality(Qt.NonModal)
+        progress.setMinimumDuration(500)
+        progress.setAutoClose(False)
+
+        task = ImportTask(table_name, filename)
+        task.signals.progress.connect(lambda rows: progress.setLabelText(f"Importing... {rows:,} rows read"))
+        task.signals.finished.connect(
+            lambda imported, rejected, seconds: self._import_done(progress, table_name, imported, rejected, seconds))
+        task.signals.failed.connect(lambda message: self._import_done(progress, table_name, error=message))
+        task.signals.cancelled.connect(lambda: self._import_done(progress, table_name, cancelled=True))
+        progress.canceled.connect(task.cancel)
+        self.import_task = task
+        loader_pool().start(task)
+
+    def _import_done(self, progress, table_name, imported=0, rejected=(), seconds=0.0, error=None, cancelled=False):
+        self.import_task = None
+        progress.close()
+        # Even a cancelled or failed import may have committed whole batches
+        self.invalidate(table_name)
+        if cancelled:
+            self.statusBar().showMessage('Import cancelled')
+            return
+        if error is not None:
+            QMessageBox.critical(self, "Import Error", f"Failed to import: {error}")
+            return
+        rate = imported / seconds if seconds else 0
+        message = f"{imported:,} rows imported ({rate:,.0f} rows/s)."
+        if rejected:
+            lines = "\n".join(f"Line {line}: {reason}" for line, reason in rejected[:10])
+            more = f"\n... and {len(rejected) - 10} more" if len(rejected) > 10 else ""
+            message += f"\n\n{len(rejected):,} rows skipped:\n{lines}{more}"
+        self.statusBar().showMessage(f'{imported:,} rows imported')
+        QMessageBox.information(self, "Import Finished", message)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
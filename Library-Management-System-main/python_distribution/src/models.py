@@ -0,0 +1,232 @@
+"""
+Lazy table models - rows are paged in from SQLite as the view scrolls
+"""
+
+import logging
+from bisect import bisect_left
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+
+logger = logging.getLogger(__name__)
+
+_loader_pool = None
+
+
+def loader_pool():
+    """Thread pool shared by all table loaders.
+
+    Threads never expire: each one owns a pooled SQLite connection, and
+    letting Qt recycle threads would strand those connections.
+    """
+    global _loader_pool
+    if _loader_pool is None:
+        _loader_pool = QThreadPool()
+        _loader_pool.setMaxThreadCount(4)
+        _loader_pool.setExpiryTimeout(-1)
+    return _loader_pool
+
+
+class LoaderSignals(QObject):
+    rows = pyqtSignal(int, object)      # generation, list of row tuples
+    finished = pyqtSignal(int, int)     # generation, total rows read
+    failed = pyqtSignal(int, str)       # generation, error message
+
+
+class PageLoader(QRunnable):
+    """Reads one page on a worker thread and streams it back in chunks.
+
+    ``fetch(after_key, limit)`` yields lists of rows; each list is emitted
+    as soon as it is read, so the view fills while the query is running.
+    """
+
+    def __init__(self, fetch, after_key, limit, generation):
+        super().__init__()
+        self.signals = LoaderSignals()
+        self._fetch = fetch
+        self._after_key = after_key
+        self._limit = limit
+        self._generation = generation
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        total = 0
+        try:
+            for chunk in self._fetch(self._after_key, self._limit):
+                if self._cancelled:
+                    return
+                total += len(chunk)
+                self.signals.rows.emit(self._generation, chunk)
+        except Exception as e:
+            logger.error("Background load failed: %s", e)
+            self.signals.failed.emit(self._generation, str(e))
+            return
+        if not self._cancelled:
+            self.signals.finished.emit(self._generation, total)
+
+
+class LazyTableModel(QAbstractTableModel):
+    """Read-only model that pages rows in through a fetch function.
+
+    ``fetch(after_key, limit)`` must yield lists of rows ordered by an
+    increasing key in column 0, all with key > ``after_key``, ``limit`` rows
+    at most. The key is kept for paging and lookups but not displayed. Qt
+    only calls fetchMore() when the view scrolls to the end of what is
+    loaded, so opening a tab costs one page no matter how large the table is.
+
+    Pages are read on ``loader_pool()`` unless ``threaded`` is False; a
+    cancelled page simply resumes from the last loaded key next time.
+    """
+
+    loadingChanged = pyqtSignal(bool)
+
+    threaded = True
+
+    def __init__(self, headers, fetch, page_size=256, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._fetch = fetch
+        self._page_size = page_size
+        self._rows = []
+        self._exhausted = False
+        self._loader = None
+        # Bumped on reload/cancel so chunks from an abandoned loader are dropped.
+        self._generation = 0
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column() + 1]
+        return "" if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and self._loader is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        after_key = self._rows[-1][0] if self._rows else 0
+        if not self.threaded:
+            total = 0
+            for chunk in self._fetch(after_key, self._page_size):
+                total += len(chunk)
+                self._append(chunk)
+            self._exhausted = total < self._page_size
+            return
+        self._loader = PageLoader(self._fetch, after_key, self._page_size, self._generation)
+        self._loader.signals.rows.connect(self._on_rows)
+        self._loader.signals.finished.connect(self._on_finished)
+        self._loader.signals.failed.connect(self._on_failed)
+        self.loadingChanged.emit(True)
+        loader_pool().start(self._loader)
+
+    # Loader callbacks (GUI thread)
+    def _append(self, rows):
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def _on_rows(self, generation, rows):
+        if generation == self._generation:
+            self._append(rows)
+
+    def _on_finished(self, generation, total):
+        if generation == self._generation:
+            self._exhausted = total < self._page_size
+            self._loader = None
+            self.loadingChanged.emit(False)
+
+    def _on_failed(self, generation, message):
+        if generation == self._generation:
+            # Stop paging; reload() is the way to retry.
+            self._exhausted = True
+            self._loader = None
+            self.loadingChanged.emit(False)
+
+    # Controller helpers
+    @property
+    def loading(self):
+        return self._loader is not None
+
+    def cancel(self):
+        """Abandon the page being loaded; rows already shown are kept."""
+        if self._loader is None:
+            return
+        self._loader.cancel()
+        self._loader = None
+        self._generation += 1
+        self.loadingChanged.emit(False)
+
+    def reload(self, fetch=None):
+        """Drop loaded rows and start paging again, optionally from a new source."""
+        self.cancel()
+        self._generation += 1
+        self.beginResetModel()
+        if fetch is not None:
+            self._fetch = fetch
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def fetch_new(self):
+        """Append rows added since the last loaded key (the watermark).
+
+        Keys only grow, so this reads just the new rows. If paging has not
+        reached the end yet there is nothing to do: new rows arrive with a
+        later page.
+        """
+        if self._exhausted:
+            self._exhausted = False
+            self.fetchMore()
+
+    def key(self, row):
+        return self._rows[row][0]
+
+    def _position(self, key):
+        """Index of the loaded row with ``key``, or None; a binary search, rows being in key order."""
+        # (key,) sorts before any row starting with key, and no further columns are compared
+        position = bisect_left(self._rows, (key,))
+        if position < len(self._rows) and self._rows[position][0] == key:
+            return position
+        return None
+
+    def update_row(self, row):
+        """Replace the loaded row with the same key as ``row``; returns False if it is not loaded."""
+        position = self._position(row[0])
+        if position is None:
+            return False
+        self._rows[position] = tuple(row)
+        self.dataChanged.emit(self.index(position, 0), self.index(position, len(self._headers) - 1))
+        return True
+
+    def remove_rows(self, keys):
+        """Drop the loaded rows with these keys, one removal per run of adjacent rows."""
+        positions = sorted({p for p in map(self._position, keys) if p is not None})
+        # Bottom run first, so the positions still to remove stay valid
+        end = len(positions)
+        while end:
+            start = end - 1
+            while start and positions[start - 1] == positions[start] - 1:
+                start -= 1
+            first, last = positions[start], positions[end - 1]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+            end = start
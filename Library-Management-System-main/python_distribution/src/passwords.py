@@ -0,0 +1,114 @@
+"""
+Password hashing and login checks.
+
+Passwords are stored as ``scrypt$n$r$p$salt$hash`` with a random salt per
+user; the work factor travels with each hash, so raising SCRYPT_N later only
+re-hashes a user's password the next time they sign in. Rows written before
+hashing hold the password itself and are upgraded the same way.
+
+Checking a password is deliberately slow (see ``python -m src.bench
+passwords``), so the login window runs authenticate() on a worker thread.
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# scrypt cost: N=2**14, r=8 uses 16 MiB and about 50 ms per check.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+HASH_BYTES = 32
+PREFIX = "scrypt"
+
+_dummy_hash = None
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _derive(password, salt, n, r, p):
+    return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * 1024 * 1024, dklen=HASH_BYTES)
+
+
+def hash_password(password, n=None, r=None, p=None):
+    """Salted scrypt hash of ``password``, as stored in users.userspassword.
+
+    The cost parameters default to the current SCRYPT_N/R/P.
+    """
+    n, r, p = n or SCRYPT_N, r or SCRYPT_R, p or SCRYPT_P
+    salt = os.urandom(SALT_BYTES)
+    return f"{PREFIX}${n}${r}${p}${_b64(salt)}${_b64(_derive(password, salt, n, r, p))}"
+
+
+def _parse(stored):
+    """(n, r, p, salt, hash) of a stored hash, or None for a plaintext row."""
+    parts = (stored or "").split("$")
+    if len(parts) != 6 or parts[0] != PREFIX:
+        return None
+    try:
+        return (int(parts[1]), int(parts[2]), int(parts[3]),
+                base64.b64decode(parts[4]), base64.b64decode(parts[5]))
+    except ValueError:
+        return None
+
+
+def is_hashed(stored):
+    return _parse(stored) is not None
+
+
+def needs_rehash(stored):
+    """True for plaintext rows and hashes made with another work factor."""
+    parsed = _parse(stored)
+    return parsed is None or parsed[:3] != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+def verify_password(password, stored):
+    """Check ``password`` against a stored hash in constant time.
+
+    A plaintext row is compared as is, but still pays for one hash so that
+    it takes as long as a hashed one.
+    """
+    parsed = _parse(stored)
+    if parsed is None:
+        hash_password(password)
+        return hmac.compare_digest(password.encode("utf-8"), (stored or "").encode("utf-8"))
+    n, r, p, salt, expected = parsed
+    return hmac.compare_digest(_derive(password, salt, n, r, p), expected)
+
+
+def dummy_hash():
+    """A hash of no one's password, checked for unknown usernames."""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = hash_password(_b64(os.urandom(SALT_BYTES)))
+    return _dummy_hash
+
+
+def authenticate(conn, username, password):
+    """Id of the user with these credentials, or None.
+
+    The user is found by the unique username index alone and the hash is
+    checked in Python, so an unknown name costs the same as a wrong
+    password. A plaintext or outdated hash is replaced on success.
+    """
+    row = conn.execute("SELECT id_users, userspassword FROM users WHERE username = ?", (username,)).fetchone()
+    if row is None:
+        verify_password(password, dummy_hash())
+        return None
+    user_id, stored = row
+    if not verify_password(password, stored):
+        return None
+    if needs_rehash(stored):
+        # Only if nobody changed the password while we were hashing.
+        conn.execute("UPDATE users SET userspassword = ? WHERE id_users = ? AND userspassword = ?",
+                     (hash_password(password), user_id, stored))
+        logger.info("Re-hashed the password of user %s", user_id)
+    return user_id
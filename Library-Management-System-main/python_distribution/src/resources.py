@@ -0,0 +1,41 @@
+"""
+Icons, loaded on first use.
+
+The images are compiled into src/res/icons.rcc by convert_qrc_to_py.py and
+registered with QResource by the startup task (or else on the first icon()
+call): Qt maps the file, so no image data is copied into Python and nothing
+is read at import. Without the .rcc (a source checkout that has not run the
+build step) icons are read from src/res/icons instead.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from PyQt5.QtCore import QResource
+from PyQt5.QtGui import QIcon
+
+logger = logging.getLogger(__name__)
+
+RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "res")
+RCC_FILE = os.path.join(RES_DIR, "icons.rcc")
+ICON_DIR = os.path.join(RES_DIR, "icons")
+
+_registered = None
+
+
+def register_resources():
+    """Register icons.rcc once; True if the ':/icons/...' paths are available."""
+    global _registered
+    if _registered is None:
+        _registered = os.path.exists(RCC_FILE) and QResource.registerResource(RCC_FILE)
+        if not _registered:
+            logger.warning("Could not register %s; reading icons from %s", RCC_FILE, ICON_DIR)
+    return _registered
+
+
+@lru_cache(maxsize=None)
+def icon(name):
+    """The QIcon for an image in icons.qrc, e.g. icon("book.png")."""
+    if register_resources():
+        return QIcon(f":/icons/{name}")
+    return QIcon(os.path.join(ICON_DIR, name))
@@ -0,0 +1,118 @@
+"""
+Server-side search over the tab listings.
+
+Books and clients are matched through the FTS5 tables created by migration 5,
+users with a plain LIKE (the table is small). Every word of the query is a
+prefix match, and words that match nothing are widened to indexed terms
+within a small edit distance, so "hary pottr" still finds "harry potter".
+"""
+
+import re
+
+from .database import LISTINGS
+
+# FTS tables whose vocabulary feeds the match expression of each listing.
+FTS_TABLES = {
+    "book": ("book_fts",),
+    "client": ("client_fts",),
+    "dayoperations": ("book_fts", "client_fts"),
+}
+
+# Extra WHERE clause per listing. Book and client push the key range and the
+# limit into the FTS query, so each page costs O(page) even when the query
+# matches most of the table.
+FILTERS = {
+    "book": "b.id IN (SELECT rowid FROM book_fts WHERE book_fts MATCH :match "
+            "AND rowid > :after ORDER BY rowid LIMIT :limit)",
+    "client": "idclient IN (SELECT rowid FROM client_fts WHERE client_fts MATCH :match "
+              "AND rowid > :after ORDER BY rowid LIMIT :limit)",
+    "dayoperations": "(d.book_id IN (SELECT rowid FROM book_fts WHERE book_fts MATCH :match) "
+                     "OR d.client_id IN (SELECT rowid FROM client_fts WHERE client_fts MATCH :match))",
+    "users": "(username LIKE :like ESCAPE '\\' OR useremail LIKE :like ESCAPE '\\')",
+    "category": "category_name LIKE :like ESCAPE '\\'",
+    "author": "author_name LIKE :like ESCAPE '\\'",
+    "publisher": "publisher_name LIKE :like ESCAPE '\\'",
+}
+
+# Words shorter than this are never fuzzed: too many near neighbours.
+MIN_FUZZY_LENGTH = 4
+MAX_FUZZY_TERMS = 8
+
+
+def tokenize(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance, or ``limit + 1`` as soon as it must exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _prefix_end(prefix):
+    """Smallest string greater than every string starting with ``prefix``."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def similar_terms(conn, fts_tables, word):
+    """Indexed terms close to ``word``; empty if ``word`` already prefix-matches."""
+    vocabs = [f"{table}_vocab" for table in fts_tables]
+    for vocab in vocabs:
+        if conn.execute(f"SELECT 1 FROM {vocab} WHERE term >= ? AND term < ? LIMIT 1",
+                        (word, _prefix_end(word))).fetchone():
+            return []
+    if len(word) < MIN_FUZZY_LENGTH:
+        return []
+    limit = 1 if len(word) < 7 else 2
+    candidates = {}
+    # Typos in the first letter are rare, so candidates share it. Requiring a
+    # letter after it keeps codes and numbers ("b0000042") out of the scan:
+    # there can be millions of those and they are never misspelt words.
+    for vocab in vocabs:
+        for (term,) in conn.execute(f"SELECT term FROM {vocab} WHERE term >= ? AND term < ?",
+                                    (word[0] + "a", word[0] + "{")):
+            distance = edit_distance(word, term, limit)
+            if distance <= limit:
+                candidates[term] = distance
+    return sorted(candidates, key=lambda term: (candidates[term], term))[:MAX_FUZZY_TERMS]
+
+
+def match_expression(conn, listing, text):
+    """FTS5 MATCH string for ``text``: every word must match, as a prefix or a near miss."""
+    parts = []
+    for word in tokenize(text):
+        alternatives = [f'"{word}"*'] + [f'"{term}"' for term in similar_terms(conn, FTS_TABLES[listing], word)]
+        parts.append(alternatives[0] if len(alternatives) == 1 else "(" + " OR ".join(alternatives) + ")")
+    return " AND ".join(parts)
+
+
+def iter_search(conn, listing, text, after_key=0, limit=-1, chunk_size=200):
+    """Rows of ``listing`` matching ``text``, paged by key like database.iter_page()."""
+    key, select = LISTINGS[listing]
+    params = {"after": after_key, "limit": limit}
+    if listing in FTS_TABLES:
+        params["match"] = match_expression(conn, listing, text)
+        if not params["match"]:
+            return
+    else:
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["like"] = f"%{escaped}%"
+    cur = conn.execute(f"{select} WHERE {key} > :after AND {FILTERS[listing]} ORDER BY {key} LIMIT :limit", params)
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+
+def search(conn, listing, text, after_key=0, limit=-1):
+    return [row for chunk in iter_search(conn, listing, text, after_key, limit) for row in chunk]
@@ -0,0 +1,52 @@
+"""
+Startup timeline.
+
+run.py shows the login window before anything it does not need: the schema
+check, the import of the main window and the icon registration run on the
+loader pool while the user types, and the full stylesheet and window icon
+are applied once they are done. Each of those stages is recorded here;
+``run.py --profile-startup`` prints them.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupTimeline:
+    """Start offset and duration of each startup stage, in ms from ``origin``."""
+
+    def __init__(self, origin=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.stages = []
+        self._lock = threading.Lock()
+
+    def add(self, name, start, end=None):
+        """Record a stage that ran from ``start`` to ``end`` (default now), perf_counter() seconds."""
+        end = time.perf_counter() if end is None else end
+        thread = "gui" if threading.current_thread() is threading.main_thread() else "background"
+        with self._lock:
+            self.stages.append((name, thread, (start - self.origin) * 1000, (end - start) * 1000))
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start)
+
+    def mark(self, name):
+        """Record an instant, such as the login window becoming usable."""
+        now = time.perf_counter()
+        self.add(name, now, now)
+
+    def report(self):
+        rows = [(name, thread, f"{start:.1f}", f"{ms:.1f}" if ms else "")
+                for name, thread, start, ms in sorted(self.stages, key=lambda stage: stage[2])]
+        headers = ("stage", "thread", "at ms", "took ms")
+        widths = [max(len(h), *(len(row[i]) for row in rows)) for i, h in enumerate(headers)]
+        lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths))]
+        lines.append("-" * len(lines[0]))
+        lines += ["  ".join(v.ljust(w) for v, w in zip(row, widths)) for row in rows]
+        return "\n".join(lines)
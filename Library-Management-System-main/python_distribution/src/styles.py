@@ -4,7 +4,9 @@ Modern stylesheet for the Library Management System
 Provides contemporary design with Dark Glassmorphism aesthetics
 """
 
-MODERN_STYLESHEET = """
+# The global colours: all the login window needs from the application
+# stylesheet, so it can be shown before the full one is applied.
+BASE_STYLESHEET = """
 /* Global Styling - Dark Theme */
 QMainWindow, QWidget {
     background-color: #1a1a2e;
@@ -15,7 +17,9 @@ QMainWindow, QWidget {
 QDialog {
     background-color: #1a1a2e;
 }
+"""
 
+MODERN_STYLESHEET = BASE_STYLESHEET + """
 /* Tab Widget */
 QTabWidget::pane {
     border: 1px solid #16213e;
@@ -112,7 +116,7 @@ QComboBox QAbstractItemView {
 
 
 /* Tables - Data Grid */
-QTableWidget {
+QTableView {
     background-color: #16213e;
     gridline-color: #0f3460;
     border: 1px solid #0f3460;
@@ -132,12 +136,12 @@ QHeaderView::section {
     font-size: 13px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 8px;
     border-bottom: 1px solid #0f3460;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #e94560;
     color: #ffffff;
 }
@@ -175,6 +179,16 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
 }
 """
 
+def apply_base_stylesheet(app):
+    """
+    Apply the style and global colours only, enough for the login window.
+    Args:
+        app: QApplication instance
+    """
+    app.setStyle('Fusion')
+    app.setStyleSheet(BASE_STYLESHEET)
+
+
 def apply_stylesheet(app):
     """
     Apply the modern stylesheet to the entire application.
@@ -19,6 +19,7 @@ class ModernLoginUI(QMainWindow):
     def initUI(self):
         """Initialize the login UI"""
         self.setWindowTitle("Bookhub - Library Management System")
+        # The window icon is set by run.py once startup has registered the resources
         self.setGeometry(100, 100, 500, 600)
         self.setMinimumSize(500, 600)
         self.setMaximumSize(600, 700)
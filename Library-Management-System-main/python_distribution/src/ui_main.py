@@ -4,12 +4,14 @@ Modern Application UI - Clean, stylish layout
 
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QTabWidget, QPushButton, QLabel, QFrame, QSplitter,
-                             QTableWidget, QTableWidgetItem, QLineEdit, QComboBox,
-                             QSpinBox, QMessageBox, QFileDialog, QDialog)
+                             QTableView, QHeaderView, QLineEdit, QComboBox,
+                             QSpinBox, QMessageBox, QFileDialog, QDialog, QTableWidget)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QFont, QIcon, QColor
 from PyQt5.QtSvg import QSvgWidget
 
+from .resources import icon
+
 
 class ModernAppUI(QMainWindow):
     """Modern, clean application interface"""
@@ -21,6 +23,7 @@ class ModernAppUI(QMainWindow):
     def initUI(self):
         """Initialize the main application UI"""
         self.setWindowTitle("Bookhub - Library Management System")
+        self.setWindowIcon(icon("book.png"))
         self.setGeometry(100, 100, 1400, 900)
         self.setMinimumSize(1200, 800)
         
@@ -156,10 +159,13 @@ class ModernAppUI(QMainWindow):
         
         # Create tab pages
         self.day_operations_tab = self.create_tab_content("Day Operations", "day_ops")
-        self.books_tab = self.create_tab_content("Books Management", "books")
-        self.users_tab = self.create_tab_content("User Management", "users")
-        self.clients_tab = self.create_tab_content("Client Management", "clients")
-        self.settings_tab = self.create_tab_content("Settings", "settings")
+        self.create_circulation_controls()
+        self.books_tab = self.create_tab_content("Books Management", "books", importable=True, editable=True)
+        self.users_tab = self.create_tab_content("User Management", "users", editable=True)
+        self.clients_tab = self.create_tab_content("Client Management", "clients", importable=True, editable=True)
+        self.settings_tab = self.create_tab_content("Reference Data", "settings")
+        self.create_reference_controls()
+        self.create_profiler_panel()
         
         self.tabWidget.addTab(self.day_operations_tab, "📅 Day Operations")
         self.tabWidget.addTab(self.books_tab, "📚 Books")
@@ -221,7 +227,7 @@ class ModernAppUI(QMainWindow):
         bar.setLayout(layout)
         return bar
     
-    def create_tab_content(self, title, name_prefix):
+    def create_tab_content(self, title, name_prefix, importable=False, editable=False):
         """Create a clean tab content area"""
         tab = QWidget()
         layout = QVBoxLayout()
@@ -297,18 +303,55 @@ class ModernAppUI(QMainWindow):
         header_layout.addWidget(tab_title)
         header_layout.addStretch()
         header_layout.addWidget(add_btn)
+        if editable:
+            edit_btn = QPushButton("✏️ Edit")
+            edit_btn.setObjectName(f"{name_prefix}_edit_btn")
+            edit_btn.setMinimumWidth(100)
+            edit_btn.setCursor(Qt.PointingHandCursor)
+            edit_btn.setStyleSheet(export_btn.styleSheet())
+            delete_btn = QPushButton("🗑️ Delete")
+            delete_btn.setObjectName(f"{name_prefix}_delete_btn")
+            delete_btn.setMinimumWidth(100)
+            delete_btn.setCursor(Qt.PointingHandCursor)
+            delete_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #e74c3c;
+                    color: #ffffff;
+                    border: none;
+                    border-radius: 6px;
+                    padding: 8px 16px;
+                    font-weight: 600;
+                    font-size: 12px;
+                }
+                QPushButton:hover {
+                    background-color: #ec7063;
+                }
+                QPushButton:pressed {
+                    background-color: #c0392b;
+                }
+            """)
+            header_layout.addWidget(edit_btn)
+            header_layout.addWidget(delete_btn)
+            setattr(self, f"{name_prefix}_edit_btn", edit_btn)
+            setattr(self, f"{name_prefix}_delete_btn", delete_btn)
+        if importable:
+            import_btn = QPushButton("📥 Import")
+            import_btn.setObjectName(f"{name_prefix}_import_btn")
+            import_btn.setMinimumWidth(100)
+            import_btn.setCursor(Qt.PointingHandCursor)
+            import_btn.setStyleSheet(export_btn.styleSheet())
+            header_layout.addWidget(import_btn)
+            setattr(self, f"{name_prefix}_import_btn", import_btn)
         header_layout.addWidget(export_btn)
         header.setLayout(header_layout)
         
         layout.addWidget(header)
         
         # Table area
-        table = QTableWidget()
+        table = QTableView()
         table.setObjectName(f"{name_prefix}_table")
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["ID", "Name", "Description", "Category", "Action"])
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 gridline-color: #ecf0f1;
                 border: 1px solid #ecf0f1;
@@ -323,14 +366,18 @@ class ModernAppUI(QMainWindow):
                 border: none;
                 font-weight: 600;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
         """)
         table.setAlternatingRowColors(True)
         table.verticalHeader().setVisible(False)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        table.setSelectionBehavior(QTableView.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights let the view skip measuring every loaded row.
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(32)
         
         layout.addWidget(table)
         tab.setLayout(layout)
@@ -339,9 +386,121 @@ class ModernAppUI(QMainWindow):
         setattr(self, f"{name_prefix}_add_btn", add_btn)
         setattr(self, f"{name_prefix}_export_btn", export_btn)
         setattr(self, f"{name_prefix}_table", table)
+        setattr(self, f"{name_prefix}_header", header_layout)
         
         return tab
     
+    def create_circulation_controls(self):
+        """Day Operations tab: return or renew the selected loans, or show only overdue ones"""
+        self.day_ops_return_btn = QPushButton("↩️ Return")
+        self.day_ops_renew_btn = QPushButton("🔁 Renew")
+        self.day_ops_overdue_btn = QPushButton("⏰ Overdue")
+        self.day_ops_overdue_btn.setCheckable(True)
+        for btn in (self.day_ops_return_btn, self.day_ops_renew_btn, self.day_ops_overdue_btn):
+            btn.setMinimumWidth(100)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setStyleSheet(self.day_ops_export_btn.styleSheet())
+        self.day_ops_overdue_btn.setStyleSheet(self.day_ops_export_btn.styleSheet() + """
+            QPushButton:checked {
+                background-color: #e67e22;
+            }
+        """)
+        
+        # Title, stretch, add, return, renew, overdue, export
+        header = self.day_ops_header
+        header.insertWidget(3, self.day_ops_return_btn)
+        header.insertWidget(4, self.day_ops_renew_btn)
+        header.insertWidget(5, self.day_ops_overdue_btn)
+        self.day_ops_add_btn.setText("➕ Lend Book")
+    
+    def create_reference_controls(self):
+        """Settings tab: pick a reference table, then rename or merge its entries"""
+        self.settings_kind = QComboBox()
+        self.settings_kind.addItems(["Authors", "Categories", "Publishers"])
+        self.settings_kind.setMinimumWidth(140)
+        self.settings_kind.setStyleSheet("""
+            QComboBox {
+                background-color: #f5f7fa;
+                color: #2c3e50;
+                border: 1px solid #ecf0f1;
+                border-radius: 6px;
+                padding: 6px 10px;
+                font-size: 12px;
+            }
+        """)
+        
+        self.settings_rename_btn = QPushButton("✏️ Rename")
+        self.settings_merge_btn = QPushButton("🔗 Merge")
+        for btn in (self.settings_rename_btn, self.settings_merge_btn):
+            btn.setMinimumWidth(100)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setStyleSheet(self.settings_export_btn.styleSheet())
+        
+        # Title, selector, stretch, rename, merge, add; reference data is not exported
+        header = self.settings_header
+        header.insertWidget(1, self.settings_kind)
+        header.insertWidget(3, self.settings_rename_btn)
+        header.insertWidget(4, self.settings_merge_btn)
+        self.settings_export_btn.hide()
+        self.settings_add_btn.setText("➕ Add Names")
+    
+    def create_profiler_panel(self):
+        """Settings tab: record the SQL statements the app runs and show their timings"""
+        panel = QFrame()
+        panel.setStyleSheet("""
+            QFrame {
+                background-color: #ffffff;
+                border: 1px solid #ecf0f1;
+                border-radius: 8px;
+            }
+        """)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 15, 20, 15)
+        
+        header = QHBoxLayout()
+        title = QLabel("Query Profiler")
+        title_font = QFont()
+        title_font.setPointSize(12)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        title.setStyleSheet("color: #2c3e50; border: none;")
+        
+        self.profiler_record_btn = QPushButton("⏺ Record")
+        self.profiler_record_btn.setCheckable(True)
+        self.profiler_refresh_btn = QPushButton("🔄 Refresh")
+        self.profiler_reset_btn = QPushButton("🧹 Reset")
+        self.profiler_save_btn = QPushButton("💾 Save JSON")
+        header.addWidget(title)
+        header.addStretch()
+        for btn in (self.profiler_record_btn, self.profiler_refresh_btn,
+                    self.profiler_reset_btn, self.profiler_save_btn):
+            btn.setMinimumWidth(100)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setStyleSheet(self.settings_export_btn.styleSheet())
+            header.addWidget(btn)
+        self.profiler_record_btn.setStyleSheet(self.settings_export_btn.styleSheet() + """
+            QPushButton:checked {
+                background-color: #e74c3c;
+            }
+        """)
+        
+        # Statement, count, total ms, p95 ms, rows, full scan; slowest first
+        self.profiler_table = QTableWidget(0, 6)
+        self.profiler_table.setHorizontalHeaderLabels(["Statement", "Count", "Total ms", "p95 ms", "Rows", "Full Scan"])
+        self.profiler_table.setStyleSheet(self.settings_table.styleSheet())
+        self.profiler_table.setAlternatingRowColors(True)
+        self.profiler_table.verticalHeader().setVisible(False)
+        self.profiler_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.profiler_table.setSelectionBehavior(QTableView.SelectRows)
+        self.profiler_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.profiler_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.profiler_table.setMinimumHeight(220)
+        
+        layout.addLayout(header)
+        layout.addWidget(self.profiler_table)
+        panel.setLayout(layout)
+        self.settings_tab.layout().addWidget(panel)
+    
     def setup_navigation(self):
         """Setup navigation button connections"""
         # These will be connected in the main.py file
@@ -0,0 +1,30 @@
+"""
+Field rules shared by the dialogs and the bulk importer.
+
+Each validator takes the dict a dialog's get_data() returns and gives back
+an error message, or None when the record can be saved.
+"""
+
+# Upper bound of the price spin box in BookDialog.
+MAX_PRICE = 100000
+
+
+def validate_book(data):
+    if not data.get('name') or not data.get('code'):
+        return "Title and Code are required."
+    price = data.get('price', 0)
+    if not isinstance(price, (int, float)) or not 0 <= price <= MAX_PRICE:
+        return f"Price must be a number between 0 and {MAX_PRICE}."
+    return None
+
+
+def validate_client(data):
+    if not data.get('name') or not data.get('nid'):
+        return "Name and ID are required."
+    return None
+
+
+def validate_operation(data):
+    if not data.get('code') or not data.get('nid'):
+        return "Book code and client ID are required."
+    return None
@@ -0,0 +1,163 @@
+"""
+Background tasks that run on the shared loader pool
+"""
+
+import importlib
+import logging
+import time
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from .database import db_connection, setup_database_schema
+from .passwords import authenticate
+from .resources import register_resources
+
+logger = logging.getLogger(__name__)
+
+
+class ExportSignals(QObject):
+    started = pyqtSignal(int)           # total rows to write
+    progress = pyqtSignal(int)          # rows written so far
+    finished = pyqtSignal(int, float)   # rows written, seconds taken
+    failed = pyqtSignal(str)            # error message
+    cancelled = pyqtSignal()
+
+
+class ExportTask(QRunnable):
+    """Exports one table to a file off the GUI thread.
+
+    The table stays readable and writable while this runs: in WAL mode the
+    export reads a snapshot and never blocks the clerk's inserts.
+    """
+
+    def __init__(self, table, filename, fmt=None):
+        super().__init__()
+        self.signals = ExportSignals()
+        self._table = table
+        self._filename = filename
+        self._format = fmt
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # Imported here, not at the top: run.py and the login window import
+        # this module before the first paint, and export loads xlsxwriter.
+        from .export import ExportCancelled, count_rows, export_table
+        start = time.perf_counter()
+        try:
+            with db_connection() as conn:
+                self.signals.started.emit(count_rows(conn, self._table))
+                written = export_table(conn, self._table, self._filename, self._format,
+                                       progress=self.signals.progress.emit,
+                                       cancelled=lambda: self._cancelled)
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            logger.error("Export of %s failed: %s", self._table, e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(written, time.perf_counter() - start)
+
+
+class ImportSignals(QObject):
+    progress = pyqtSignal(int)                  # rows read so far
+    finished = pyqtSignal(int, object, float)   # rows imported, rejected (line, message) list, seconds
+    failed = pyqtSignal(str)                    # error message
+    cancelled = pyqtSignal()
+
+
+class ImportTask(QRunnable):
+    """Imports a CSV or XLSX file into a table off the GUI thread."""
+
+    def __init__(self, table, filename):
+        super().__init__()
+        self.signals = ImportSignals()
+        self._table = table
+        self._filename = filename
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        from .importer import ImportCancelled, import_file
+        start = time.perf_counter()
+        try:
+            imported, rejected = import_file(self._table, self._filename,
+                                             progress=self.signals.progress.emit,
+                                             cancelled=lambda: self._cancelled)
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            logger.error("Import into %s failed: %s", self._table, e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(imported, rejected, time.perf_counter() - start)
+
+
+class LoginSignals(QObject):
+    finished = pyqtSignal(object)   # user id, or None for bad credentials
+    failed = pyqtSignal(str)        # error message
+
+
+class LoginTask(QRunnable):
+    """Checks a username and password off the GUI thread.
+
+    The password hash takes tens of milliseconds on purpose; run here, the
+    login window keeps painting while it is computed.
+    """
+
+    def __init__(self, username, password):
+        super().__init__()
+        self.signals = LoginSignals()
+        self._username = username
+        self._password = password
+
+    def run(self):
+        try:
+            with db_connection() as conn:
+                user_id = authenticate(conn, self._username, self._password)
+        except Exception as e:
+            logger.error("Login check failed: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(user_id)
+
+
+class StartupSignals(QObject):
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)        # error message
+
+
+class StartupTask(QRunnable):
+    """Runs the startup stages the login window does not need.
+
+    The schema check (a migration can take a while on a large database),
+    the import of the main window module and the icon resource registration
+    run here while the user types; each stage is recorded on ``timeline``.
+    """
+
+    def __init__(self, timeline):
+        super().__init__()
+        self.signals = StartupSignals()
+        self._timeline = timeline
+
+    def run(self):
+        try:
+            with self._timeline.stage("schema check"):
+                ready = setup_database_schema()
+            if not ready:
+                self.signals.failed.emit("The database could not be set up; see debug.log.")
+                return
+            with self._timeline.stage("import main window"):
+                importlib.import_module(".main", __package__)
+            with self._timeline.stage("register resources"):
+                register_resources()
+        except Exception as e:
+            logger.error("Startup failed: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit()
@@ -0,0 +1,34 @@
+"""
+Shared test fixtures.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src import database
+
+
+class TempDatabaseTestCase(unittest.TestCase):
+    """Points the shared connection pool at ``self.path``, a new file in a temporary directory.
+
+    The file is not created; subclasses migrate or seed it in their own
+    setUp() after calling this one. ``database`` is the module whose pool is
+    configured: test_backend.py imports it from src directly rather than as
+    src.database, which is a separate module object.
+    """
+
+    database = database
+    filename = 'test.db'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, self.filename)
+        self.database.configure(self.path)
+
+    def tearDown(self):
+        self.database.stop_profiling()
+        self.database.configure(self.database.DB_NAME)
+        self.tmp.cleanup()
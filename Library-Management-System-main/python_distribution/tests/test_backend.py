@@ -2,33 +2,33 @@
 import unittest
 import sqlite3
 import os
+import subprocess
 import sys
+import threading
 
 # Add src to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from database import setup_database_schema, get_db_connection, DB_NAME
+import database
+import passwords
+from database import setup_database_schema, get_db_connection, ConnectionPool
+from helpers import TempDatabaseTestCase
+
+
+class BackendTestCase(TempDatabaseTestCase):
+    # This file imports database from src directly, not as src.database
+    database = database
+
+
+class TestDatabase(BackendTestCase):
+    filename = 'library.db'
 
-class TestDatabase(unittest.TestCase):
     def setUp(self):
-        # Use an in-memory database for testing or a temporary file
-        self.test_db = 'test_library.db'
-        # Mocking or patching DB name in src/database.py would be ideal, but for now 
-        # we will just test the schema setup logic on a file.
-        # Actually, let's just use the real file logic but control the filename via import patching if possible,
-        # or just test the functions directly.
-        pass
+        # A temporary database, so the tracked library_management.db is never written
+        super().setUp()
+        self.assertTrue(setup_database_schema())
 
     def test_schema_creation(self):
         """Test that tables are created correctly."""
-        # We need to temporarily change the DB_NAME in database module strictly for this test?
-        # A better way is if get_db_connection accepted a db_name.
-        # But looking at src/database.py it hardcodes DB_NAME.
-        # Let's try to verify if tables exist after setup.
-        
-        # Ensure we are not deleting the real DB.
-        # Actually, let's skip modification of the real DB and just check if we can connect 
-        # and if the tables ARE there (assuming setup has run).
-        
         conn = get_db_connection()
         self.assertIsNotNone(conn, "Could not connect to database")
         cursor = conn.cursor()
@@ -65,7 +65,359 @@ class TestDatabase(unittest.TestCase):
         conn.commit()
         conn.close()
 
+class TestConnectionPool(BackendTestCase):
+    filename = 'pool.db'
+
+    def setUp(self):
+        super().setUp()
+        self.pool = ConnectionPool(self.path)
+
+    def tearDown(self):
+        self.pool.close_all()
+        super().tearDown()
+
+    def test_connection_is_reused_per_thread(self):
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(self.pool.acquire()))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], first)
+
+    def test_pragmas_applied_on_open(self):
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)
+
+    def test_storage_profiles(self):
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        kiosk = ConnectionPool(self.pool.path, "kiosk-readonly")
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                with kiosk.connection() as conn:
+                    conn.execute("INSERT INTO t VALUES (1)")
+        finally:
+            kiosk.close_all()
+        with self.assertRaises(ValueError):
+            ConnectionPool(self.pool.path, "no-such-profile")
+
+    def test_unknown_profile_in_environment_falls_back(self):
+        code = "import database; print(database.DEFAULT_PROFILE)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(database.__file__),
+                                env=dict(os.environ, BOOKHUB_DB_PROFILE='bogus'), capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'desktop')
+        self.assertIn("'bogus'", result.stderr)
+
+    def test_outer_block_owns_transaction(self):
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        with self.assertRaises(RuntimeError):
+            with self.pool.connection() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                with self.pool.connection() as inner:
+                    inner.execute("INSERT INTO t VALUES (2)")
+                raise RuntimeError("boom")
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+
+class TestSchemaIndexes(BackendTestCase):
+    filename = 'schema.db'
+
+    def test_natural_keys_are_unique(self):
+        self.assertTrue(setup_database_schema())
+        with database.db_connection() as conn:
+            conn.execute("INSERT INTO book(book_name, book_code) VALUES ('A', 'X1')")
+        with self.assertRaises(sqlite3.IntegrityError):
+            with database.db_connection() as conn:
+                conn.execute("INSERT INTO book(book_name, book_code) VALUES ('B', 'X1')")
+        with database.db_connection() as conn:
+            plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM users WHERE username=?", ('admin',)).fetchall()
+        self.assertIn("idx_users_username", plan[0][-1])
+
+    def test_existing_duplicates_get_plain_index(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE client (idclient INTEGER PRIMARY KEY AUTOINCREMENT, clientName TEXT, clientEmail TEXT, clientNid TEXT)")
+        conn.executemany("INSERT INTO client(clientName, clientNid) VALUES (?, ?)", [('a', '1'), ('b', '1')])
+        conn.commit()
+        conn.close()
+        self.assertTrue(setup_database_schema())
+        with database.db_connection() as conn:
+            unique = [row[2] for row in conn.execute("PRAGMA index_list(client)") if row[1] == 'idx_client_nid']
+        self.assertEqual(unique, [0])
+
+class TestNormalisedSchema(BackendTestCase):
+    filename = 'legacy.db'
+
+    def test_migrates_text_columns_to_foreign_keys(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE author (idauthor INTEGER PRIMARY KEY AUTOINCREMENT, author_name TEXT)")
+        conn.execute("CREATE TABLE book (id INTEGER PRIMARY KEY AUTOINCREMENT, book_name TEXT, book_description TEXT, book_code TEXT, "
+                     "book_category TEXT, book_author TEXT, book_publisher TEXT, book_price INTEGER)")
+        conn.execute("CREATE TABLE client (idclient INTEGER PRIMARY KEY AUTOINCREMENT, clientName TEXT, clientEmail TEXT, clientNid TEXT)")
+        conn.execute("CREATE TABLE dayoperations (iddayoperations INTEGER PRIMARY KEY AUTOINCREMENT, bookname TEXT, type TEXT, "
+                     "days INTEGER, fromDate TEXT, toDate TEXT, clientName TEXT)")
+        conn.execute("INSERT INTO author(author_name) VALUES ('rowling')")
+        conn.execute("INSERT INTO book VALUES (5, 'harry potter', '', '001', 'fantasy', 'rowling', '', 20)")
+        conn.execute("INSERT INTO client(clientName, clientNid) VALUES ('riju', '12345678')")
+        conn.execute("INSERT INTO dayoperations(bookname, type, days, fromDate, toDate, clientName) "
+                     "VALUES ('harry potter', 'rent', 4, '2019-06-01', '2019-06-05', 'riju'), "
+                     "('Macbeth', 'rent', 2, '2019-06-04', '2019-06-06', 'maxvox')")
+        conn.commit()
+        conn.close()
+
+        self.assertTrue(setup_database_schema())
+        with database.db_connection() as conn:
+            self.assertNotIn("book_category", database._columns(conn, "book"))
+            self.assertEqual(conn.execute("SELECT author_id, publisher_id FROM book WHERE id = 5").fetchone(), (1, None))
+            self.assertEqual(database.fetch_page(conn, "book"),
+                             [(5, '001', 'harry potter', '', 'fantasy', 'rowling', 0),
+                              (6, None, 'Macbeth', None, None, None, 0)])
+            self.assertEqual(database.fetch_page(conn, "dayoperations"),
+                             [(1, 'harry potter', 'riju', 'rent', '2019-06-01', '2019-06-05', 'out'),
+                              (2, 'Macbeth', 'maxvox', 'rent', '2019-06-04', '2019-06-06', 'out')])
+            self.assertEqual(database.fetch_page(conn, "dayoperations", after_key=1, limit=5)[0][1], 'Macbeth')
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+            self.assertEqual(database.schema_version(conn), database.SCHEMA_VERSION)
+            self.assertEqual(database.migrate(conn), [])
+
+    def test_add_book_resolves_reference_ids(self):
+        self.assertTrue(setup_database_schema())
+        data = {'name': 'Dune', 'description': '', 'code': 'D1', 'category': 'sci-fi',
+                'author': 'Herbert', 'publisher': '', 'price': 12}
+        with database.db_connection() as conn:
+            first = database.add_book(conn, data)
+            second = database.add_book(conn, dict(data, code='D2'))
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM author").fetchone()[0], 1)
+            rows = conn.execute("SELECT author_id, publisher_id FROM book WHERE id IN (?, ?)", (first, second)).fetchall()
+        self.assertEqual(rows, [(1, None), (1, None)])
+
+class TestMigrations(BackendTestCase):
+    filename = 'migrate.db'
+
+    def test_fresh_database_reaches_current_version(self):
+        with database.db_connection() as conn:
+            report = database.migrate(conn)
+            self.assertEqual([step[0] for step in report], [v for v, _, _ in database.MIGRATIONS])
+            self.assertEqual(conn.execute("SELECT username FROM users").fetchall(), [('admin',)])
+
+    def test_new_rows_are_fetched_past_the_watermark(self):
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            first = database.add_client(conn, {'name': 'max', 'email': '', 'nid': '1'})
+            watermark = database.fetch_page(conn, "client")[-1][0]
+            second = database.add_client(conn, {'name': 'riju', 'email': '', 'nid': '2'})
+            self.assertEqual(watermark, first)
+            self.assertEqual(database.fetch_page(conn, "client", watermark, 256), [(second, '2', 'riju', '')])
+            self.assertEqual([len(chunk) for chunk in database.iter_page(conn, "client", chunk_size=1)], [1, 1])
+
+    def test_failed_migration_rolls_back_everything(self):
+        def broken(conn):
+            raise sqlite3.OperationalError("boom")
+        original = database.MIGRATIONS
+        database.MIGRATIONS = original + [(database.SCHEMA_VERSION + 1, "broken", broken)]
+        try:
+            with database.db_connection() as conn:
+                with self.assertRaises(sqlite3.OperationalError):
+                    database.migrate(conn)
+                self.assertEqual(database.schema_version(conn), 0)
+                self.assertIsNone(conn.execute("SELECT name FROM sqlite_master WHERE name = 'book'").fetchone())
+        finally:
+            database.MIGRATIONS = original
+
+    def test_newer_schema_is_refused(self):
+        with database.db_connection() as conn:
+            conn.execute(f"PRAGMA user_version = {database.SCHEMA_VERSION + 1}")
+            with self.assertRaises(sqlite3.DatabaseError):
+                database.migrate(conn)
+
+class TestLookupCache(BackendTestCase):
+    filename = 'lookups.db'
+
+    def setUp(self):
+        super().setUp()
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            for name in ('rowling', 'Austen', 'herbert'):
+                database.lookup_id(conn, 'author', name)
+
+    def test_names_are_sorted_and_cached(self):
+        with database.db_connection() as conn:
+            names = database.lookup_names(conn, 'author')
+            self.assertEqual(names, ('Austen', 'herbert', 'rowling'))
+            self.assertIs(database.lookup_names(conn, 'author'), names)
+            self.assertEqual(database.lookup_names(conn, 'category'), ())
+
+    def test_non_ascii_names_sort_case_insensitively(self):
+        with database.db_connection() as conn:
+            for name in ('Émile', 'élise', 'Zola'):
+                database.lookup_id(conn, 'author', name)
+            names = database.lookup_names(conn, 'author')
+        self.assertEqual(list(names), sorted(names, key=str.casefold))
+        self.assertLess(names.index('élise'), names.index('Émile'))
+
+    def test_any_write_invalidates(self):
+        with database.db_connection() as conn:
+            database.lookup_names(conn, 'author')
+            database.lookup_id(conn, 'author', 'Tolkien')
+            self.assertIn('Tolkien', database.lookup_names(conn, 'author'))
+
+        def rename():
+            # Another connection, as the command-line tools would be
+            with database.db_connection() as conn:
+                conn.execute("UPDATE author SET author_name = 'J. K. Rowling' WHERE author_name = 'rowling'")
+        worker = threading.Thread(target=rename)
+        worker.start()
+        worker.join()
+        with database.db_connection() as conn:
+            self.assertEqual(database.lookup_names(conn, 'author'), ('Austen', 'herbert', 'J. K. Rowling', 'Tolkien'))
+    def test_cache_follows_the_connection_database(self):
+        with database.db_connection() as conn:
+            database.lookup_names(conn, 'author')
+        # A second database at the same lookup_version, opened outside the pool
+        other = sqlite3.connect(os.path.join(self.tmp.name, 'other.db'))
+        try:
+            database.migrate(other)
+            for name in ('Woolf', 'Eliot', 'Orwell'):
+                database.lookup_id(other, 'author', name)
+            self.assertEqual(database.lookup_names(other, 'author'), ('Eliot', 'Orwell', 'Woolf'))
+        finally:
+            other.close()
+
+
+class TestReferenceData(BackendTestCase):
+    filename = 'reference.db'
+
+    def setUp(self):
+        super().setUp()
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            for code, author in (('D1', 'Herbert'), ('D2', 'F. Herbert'), ('E1', 'Austen')):
+                database.add_book(conn, {'name': f'Book {code}', 'description': '', 'code': code,
+                                         'category': 'Fiction', 'author': author, 'publisher': '', 'price': 0})
+
+    def author_id(self, conn, name):
+        return conn.execute("SELECT idauthor FROM author WHERE author_name = ?", (name,)).fetchone()[0]
+
+    def test_batch_add_skips_blanks_and_existing_names(self):
+        with database.db_connection() as conn:
+            added = database.add_lookup_names(conn, 'author', [' Tolkien ', '', 'Austen', 'Tolkien', 'Le Guin'])
+            self.assertEqual(added, 2)
+            self.assertEqual(database.lookup_names(conn, 'author'),
+                             ('Austen', 'F. Herbert', 'Herbert', 'Le Guin', 'Tolkien'))
+            self.assertEqual(database.fetch_page(conn, 'author', 0, 1), [(1, 1, 'Herbert', 1)])
+
+    def test_rename_follows_into_books_and_search(self):
+        with database.db_connection() as conn:
+            austen = self.author_id(conn, 'Austen')
+            database.rename_lookup(conn, 'author', austen, 'Jane Austen')
+            self.assertEqual(conn.execute("SELECT book_code FROM book_fts WHERE book_fts MATCH 'jane'").fetchall(),
+                             [('E1',)])
+            with self.assertRaises(ValueError):
+                database.rename_lookup(conn, 'author', austen, 'Herbert')
+
+    def test_merge_moves_books_and_deletes_sources(self):
+        with database.db_connection() as conn:
+            target = self.author_id(conn, 'Herbert')
+            moved = database.merge_lookups(conn, 'author', target, [self.author_id(conn, 'F. Herbert'), target])
+            self.assertEqual(moved, 1)
+            self.assertEqual(database.lookup_names(conn, 'author'), ('Austen', 'Herbert'))
+            self.assertEqual(conn.execute("SELECT book_code FROM book_fts WHERE author_name MATCH 'herbert' "
+                                          "ORDER BY rowid").fetchall(), [('D1',), ('D2',)])
+            plan = conn.execute("EXPLAIN QUERY PLAN UPDATE book SET author_id = 1 "
+                                "WHERE author_id IN (SELECT value FROM json_each('[2]'))").fetchall()
+            self.assertIn('idx_book_author', ' '.join(row[-1] for row in plan))
+
+class TestEditing(BackendTestCase):
+    filename = 'editing.db'
+
+    def setUp(self):
+        super().setUp()
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            self.dune = database.add_book(conn, {'name': 'Dune', 'description': 'Desert planet', 'code': 'D1',
+                                                 'category': 'SF', 'author': 'Herbert', 'publisher': '', 'price': 12})
+            self.emma = database.add_book(conn, {'name': 'Dune', 'description': '', 'code': 'E1',
+                                                 'category': '', 'author': 'Austen', 'publisher': '', 'price': 8})
+            self.client = database.add_client(conn, {'name': 'Max', 'email': 'max@example.com', 'nid': 'N1'})
+
+    def test_update_touches_only_the_keyed_row(self):
+        with database.db_connection() as conn:
+            data = database.get_book(conn, self.emma)
+            self.assertEqual(data['author'], 'Austen')
+            database.update_book(conn, self.emma, dict(data, name='Emma', publisher='Penguin'))
+            self.assertEqual(database.fetch_row(conn, 'book', self.emma), (self.emma, 'E1', 'Emma', '', None, 'Austen', 1))
+            self.assertEqual(database.get_book(conn, self.dune)['name'], 'Dune')
+            self.assertEqual(conn.execute("SELECT rowid FROM book_fts WHERE book_fts MATCH 'emma'").fetchall(),
+                             [(self.emma,)])
+            with self.assertRaises(sqlite3.IntegrityError):
+                database.update_book(conn, self.emma, dict(data, code='D1'))
+
+    def test_user_password_kept_when_blank(self):
+        with database.db_connection() as conn:
+            user = database.add_user(conn, {'username': 'clerk', 'email': 'c@example.com', 'password': 'secret'})
+            database.update_user(conn, user, {'username': 'clerk2', 'email': 'c@example.com', 'password': ''})
+            username, stored = conn.execute("SELECT username, userspassword FROM users WHERE id_users = ?",
+                                            (user,)).fetchone()
+            self.assertEqual(username, 'clerk2')
+            self.assertTrue(passwords.verify_password('secret', stored))
+
+    def test_bulk_delete_is_all_or_nothing(self):
+        with database.db_connection() as conn:
+            conn.execute("INSERT INTO dayoperations(book_id, client_id, type) VALUES (?, ?, 'rent')",
+                         (self.dune, self.client))
+        with self.assertRaises(sqlite3.IntegrityError):
+            with database.db_connection() as conn:
+                database.delete_rows(conn, 'book', [self.emma, self.dune])
+        with database.db_connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM book").fetchone()[0], 2)
+            self.assertEqual(database.delete_rows(conn, 'book', [self.emma]), 1)
+            self.assertIsNone(database.get_book(conn, self.emma))
+
+class TestQueryProfiler(BackendTestCase):
+    filename = 'profiler.db'
+
+    def setUp(self):
+        super().setUp()
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            for code in ('D1', 'E1', 'F1'):
+                database.add_book(conn, {'name': code, 'description': '', 'code': code,
+                                         'category': '', 'author': '', 'publisher': '', 'price': 0})
+
+    def test_statements_are_counted_with_rows_and_plans(self):
+        profiler = database.start_profiling(slow_ms=10_000)
+        with database.db_connection() as conn:
+            self.assertIsInstance(conn, database.ProfiledConnection)
+            for _ in range(3):
+                rows = [row for chunk in database.iter_page(conn, 'book', 0, 2) for row in chunk]
+                self.assertEqual(len(rows), 2)
+            conn.execute("SELECT book_name  FROM book\n WHERE book_price > ?", (1,)).fetchall()
+            report = {entry['sql']: entry for entry in profiler.report(conn)}
+        page = report[' '.join(database.LISTINGS['book'][1].split()) + ' WHERE b.id > ? ORDER BY b.id LIMIT ?']
+        self.assertEqual((page['count'], page['rows'], page['full_scan']), (3, 6, False))
+        self.assertGreater(page['total_ms'], 0)
+        scan = report['SELECT book_name FROM book WHERE book_price > ?']
+        self.assertEqual((scan['count'], scan['rows'], scan['full_scan']), (1, 0, True))
+        self.assertEqual(scan['plan'], ['SCAN book'])
+
+    def test_connections_switch_back_when_profiling_stops(self):
+        database.start_profiling()
+        with database.db_connection() as conn:
+            conn.execute("SELECT 1").fetchone()
+        profiler = database.stop_profiling()
+        with database.db_connection() as conn:
+            self.assertNotIsInstance(conn, database.ProfiledConnection)
+            conn.execute("SELECT 2").fetchone()
+        self.assertIn('SELECT 1', [entry['sql'] for entry in profiler.report()])
+        self.assertNotIn('SELECT 2', [entry['sql'] for entry in profiler.report()])
+
+
 if __name__ == '__main__':
-    # Ensure schema is set up before running tests
-    setup_database_schema()
     unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import os
+import sqlite3
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src import database, circulation
+from helpers import TempDatabaseTestCase
+
+
+class TestCirculation(TempDatabaseTestCase):
+    filename = 'circulation.db'
+
+    def setUp(self):
+        super().setUp()
+        database.setup_database_schema()
+        with database.db_connection() as conn:
+            self.book = database.add_book(conn, {'name': 'Dune', 'description': '', 'code': 'D1',
+                                                 'category': '', 'author': '', 'publisher': '', 'price': 0})
+            self.client = database.add_client(conn, {'name': 'Max', 'email': '', 'nid': 'N1'})
+
+    def test_borrow_renew_return(self):
+        with database.db_connection() as conn:
+            self.assertEqual(circulation.ids_for(conn, 'D1', 'N1'), (self.book, self.client))
+            loan = circulation.borrow(conn, self.book, self.client, days=14, on='2024-02-20')
+            self.assertEqual(circulation.client_loans(conn, self.client), [(loan, 'Dune', '2024-03-05')])
+            with self.assertRaises(ValueError):
+                circulation.borrow(conn, self.book, self.client)
+            self.assertEqual(circulation.overdue_count(conn, on='2024-03-06'), 1)
+            self.assertEqual(circulation.renew(conn, loan, days=7), '2024-03-12')
+            self.assertEqual(circulation.overdue_count(conn, on='2024-03-06'), 0)
+            circulation.return_loan(conn, loan, on='2024-03-10')
+            self.assertIsNone(circulation.current_loan(conn, self.book))
+            self.assertEqual(database.fetch_row(conn, 'dayoperations', loan)[-1], 'returned')
+            with self.assertRaises(ValueError):
+                circulation.return_loan(conn, loan)
+            with self.assertRaises(ValueError):
+                circulation.ids_for(conn, 'D1', 'nobody')
+
+    def test_overdue_listing_pages_by_key(self):
+        with database.db_connection() as conn:
+            other = database.add_book(conn, {'name': 'Emma', 'description': '', 'code': 'E1',
+                                             'category': '', 'author': '', 'publisher': '', 'price': 0})
+            late = circulation.borrow(conn, self.book, self.client, days=7, on='2024-01-01')
+            circulation.borrow(conn, other, self.client, days=7, on='2024-01-05')
+            rows = [row for chunk in circulation.iter_overdue(conn, on='2024-01-10') for row in chunk]
+            self.assertEqual([row[0] for row in rows], [late])
+            searched = circulation.iter_overdue(conn, on='2024-01-10', text='emma')
+            self.assertEqual([row for chunk in searched for row in chunk], [])
+            searched = circulation.iter_overdue(conn, on='2024-01-10', text='dune')
+            self.assertEqual([row[0] for chunk in searched for row in chunk], [late])
+            plan = ' '.join(row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM dayoperations WHERE status = 'out' AND toDate < '2024-01-10'"))
+            self.assertIn('idx_dayoperations_status_due', plan)
+
+    def test_availability_follows_every_write(self):
+        with database.db_connection() as conn:
+            database.update_book(conn, self.book, dict(database.get_book(conn, self.book), copies=2))
+            first = circulation.borrow(conn, self.book, self.client)
+            second = circulation.borrow(conn, self.book, self.client)
+            self.assertEqual(circulation.available_copies(conn, self.book), 0)
+            with self.assertRaises(ValueError):
+                circulation.borrow(conn, self.book, self.client)
+            with self.assertRaises(ValueError):
+                database.update_book(conn, self.book, dict(database.get_book(conn, self.book), copies=1))
+            self.assertEqual(circulation.available_copies(conn, self.book), 0)
+            circulation.return_loan(conn, first)
+            self.assertEqual(database.fetch_row(conn, 'book', self.book)[-1], 1)
+            database.delete_rows(conn, 'dayoperations', [second])
+            self.assertEqual(circulation.available_copies(conn, self.book), 2)
+            self.assertEqual(database.check_availability(conn), [])
+            database.delete_rows(conn, 'dayoperations', [first])
+            database.delete_rows(conn, 'book', [self.book])
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM book_availability").fetchone()[0], 0)
+
+    def test_counters_are_rebuilt_from_history(self):
+        with database.db_connection() as conn:
+            circulation.borrow(conn, self.book, self.client)
+            conn.execute("UPDATE book_availability SET on_loan = 5")
+            self.assertEqual(database.check_availability(conn), [(self.book, 5, 1)])
+            self.assertEqual(database.rebuild_availability(conn), 1)
+            self.assertEqual(database.check_availability(conn), [])
+            self.assertEqual(circulation.available_copies(conn, self.book), 0)
+
+    def test_notebook_history_is_migrated(self):
+        path = os.path.join(self.tmp.name, 'notebook.db')
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE dayoperations (iddayoperations INTEGER PRIMARY KEY AUTOINCREMENT, bookname TEXT, "
+                     "type TEXT, days INTEGER, fromDate TEXT, toDate TEXT, clientName TEXT)")
+        conn.execute("INSERT INTO dayoperations(bookname, type, days, fromDate, toDate, clientName) VALUES "
+                     "('Dune', 'rent', 4, '2019-06-01 00:00:00', '2019-06-05 00:00:00', 'riju'), "
+                     "('Dune', 'retrieve', 0, '2019-06-04 00:00:00', '2019-06-04 00:00:00', 'riju'), "
+                     "('Emma', 'rent', 4, '2019-06-02 00:00:00', '2019-06-06 00:00:00', 'riju')")
+        conn.commit()
+        conn.close()
+        database.configure(path)
+        self.assertTrue(database.setup_database_schema())
+        with database.db_connection() as conn:
+            self.assertEqual(conn.execute("SELECT type, fromDate, toDate, status, returnDate FROM dayoperations "
+                                          "ORDER BY iddayoperations").fetchall(),
+                             [('rent', '2019-06-01', '2019-06-05', 'returned', '2019-06-04'),
+                              ('retrieve', '2019-06-04', '2019-06-04', 'returned', None),
+                              ('rent', '2019-06-02', '2019-06-06', 'out', None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import io
+import json
+import os
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(ROOT)
+from src import cli, database
+from helpers import TempDatabaseTestCase
+
+
+class TestCli(TempDatabaseTestCase):
+    filename = 'cli.db'
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = cli.main(['--db', self.path, *argv])
+        return status, out.getvalue()
+
+    def test_import_then_export_round_trip(self):
+        source = os.path.join(self.tmp.name, 'clients.csv')
+        with open(source, 'w', newline='') as f:
+            f.write('clientName,clientEmail,clientNid\nmax,max@example.com,1\nriju,,2\n')
+        self.assertEqual(self.run_cli('import', 'client', source)[0], 0)
+        target = os.path.join(self.tmp.name, 'clients.csv.gz')
+        status, out = self.run_cli('export', 'client', '-o', target)
+        self.assertEqual(status, 0)
+        self.assertIn('2 rows written', out)
+        status, out = self.run_cli('stats')
+        self.assertIn('schema version  %d' % database.SCHEMA_VERSION, out)
+        self.assertRegex(out, r'client\s+2\n')
+
+    def test_check_repairs_availability(self):
+        self.assertEqual(self.run_cli('stats')[0], 0)
+        with database.db_connection() as conn:
+            database.add_book(conn, {'name': 'Dune', 'description': '', 'code': 'D1',
+                                     'category': '', 'author': '', 'publisher': '', 'price': 0})
+            conn.execute("UPDATE book_availability SET on_loan = 3")
+        self.assertEqual(self.run_cli('check')[0], 1)
+        status, out = self.run_cli('check', '--repair')
+        self.assertEqual(status, 0)
+        self.assertIn('1 availability counters repaired', out)
+        self.assertEqual(self.run_cli('check')[0], 0)
+
+    def test_query_profile_is_written_as_json(self):
+        target = os.path.join(self.tmp.name, 'queries.json')
+        self.assertEqual(self.run_cli('--query-profile', target, 'stats')[0], 0)
+        with open(target) as f:
+            statements = json.load(f)['statements']
+        self.assertTrue(statements)
+        self.assertEqual(set(statements[0]), {'sql', 'count', 'total_ms', 'mean_ms', 'p95_ms', 'rows',
+                                              'vm_steps', 'full_scan', 'plan'})
+        self.assertIsNone(database.get_profiler())
+
+    def test_unwritable_query_profile_is_reported(self):
+        target = os.path.join(self.tmp.name, 'missing', 'queries.json')
+        err = io.StringIO()
+        with redirect_stderr(err):
+            status, _ = self.run_cli('--query-profile', target, 'stats')
+        self.assertEqual(status, 1)
+        self.assertIn('error:', err.getvalue())
+        self.assertIsNone(database.get_profiler())
+
+    def test_vacuum_reclaims_deleted_search_entries(self):
+        self.assertEqual(self.run_cli('stats')[0], 0)
+        with database.db_connection() as conn:
+            for i in range(2000):
+                database.add_client(conn, {'name': f'client {i}', 'email': f'c{i}@example.com', 'nid': str(i)})
+        with database.db_connection() as conn:
+            conn.execute("DELETE FROM client")
+        self.assertEqual(self.run_cli('vacuum')[0], 0)
+        with database.db_connection() as conn:
+            # Only the structure record is left once the segments are merged
+            self.assertLess(conn.execute("SELECT COUNT(*) FROM client_fts_data").fetchone()[0], 5)
+
+    def test_errors_are_reported_not_raised(self):
+        status, _ = self.run_cli('import', 'client', os.path.join(self.tmp.name, 'missing.csv'))
+        self.assertEqual(status, 1)
+
+    def test_gui_toolkit_is_never_imported(self):
+        code = ("import sys; from src import cli; status = cli.main(['--db', sys.argv[1], 'vacuum']); "
+                "sys.exit(status or any(name.startswith('PyQt5') for name in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code, self.path], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
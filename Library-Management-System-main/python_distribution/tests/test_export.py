@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+import csv
+import gzip
+import json
+from datetime import datetime
+
+from openpyxl import load_workbook
+
+# export.py is imported through the package (it uses relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src import database, export
+from helpers import TempDatabaseTestCase
+
+
+class TestExport(TempDatabaseTestCase):
+    filename = 'export.db'
+
+    def setUp(self):
+        super().setUp()
+        self.output = os.path.join(self.tmp.name, 'out.xlsx')
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            for i in range(5):
+                database.add_client(conn, {'name': f'client {i}', 'email': '', 'nid': str(i)})
+
+    def test_rows_are_streamed_in_chunks(self):
+        reported = []
+        with database.db_connection() as conn:
+            written = export.export_table(conn, "client", self.output, progress=reported.append, chunk_size=2)
+        self.assertEqual(written, 5)
+        self.assertEqual(reported, [2, 4, 5])
+        rows = list(load_workbook(self.output, read_only=True).active.iter_rows(values_only=True))
+        self.assertEqual(rows[0], ('idclient', 'clientName', 'clientEmail', 'clientNid'))
+        self.assertEqual(rows[1][:2], (1, 'client 0'))
+        self.assertEqual(len(rows), 6)
+
+    def test_cancel_removes_partial_file(self):
+        reported = []
+        with database.db_connection() as conn:
+            with self.assertRaises(export.ExportCancelled):
+                export.export_table(conn, "client", self.output, progress=reported.append,
+                                   cancelled=lambda: bool(reported), chunk_size=2)
+        self.assertEqual(reported, [2])
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_cells_keep_their_types(self):
+        with database.db_connection() as conn:
+            book = database.add_book(conn, {'name': 'Dune', 'description': None, 'code': 'D1',
+                                            'category': '', 'author': '', 'publisher': '', 'price': 12})
+            conn.execute("INSERT INTO dayoperations(book_id, type, days, fromDate, toDate, client_id) "
+                         "VALUES (?, 'rent', 7, '2024-01-31', '2024-02-07 18:30:00', 1)", (book,))
+            conn.execute("INSERT INTO dayoperations(book_id, type, days, fromDate, toDate, client_id) "
+                         "VALUES (?, 'rent', 7, 'soon', NULL, 1)", (book,))
+            export.export_table(conn, "dayoperations", self.output)
+        rows = list(load_workbook(self.output, read_only=True).active.iter_rows(values_only=True))
+        self.assertEqual(rows[1], (1, 'Dune', 'rent', 7, datetime(2024, 1, 31), datetime(2024, 2, 7, 18, 30), 'client 0'))
+        self.assertEqual(rows[2][4:6], ('soon', None))
+
+    def test_format_follows_extension(self):
+        self.assertEqual(export.format_for('a.CSV'), 'csv')
+        self.assertEqual(export.format_for('a.csv.gz'), 'csv.gz')
+        with self.assertRaises(ValueError):
+            export.format_for('a.txt')
+
+    def test_text_formats(self):
+        with database.db_connection() as conn:
+            for name in ('csv', 'csv.gz', 'jsonl'):
+                filename = os.path.join(self.tmp.name, 'out.' + name)
+                self.assertEqual(export.export_table(conn, "client", filename), 5)
+        with open(os.path.join(self.tmp.name, 'out.csv'), newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[:2], [['idclient', 'clientName', 'clientEmail', 'clientNid'], ['1', 'client 0', '', '0']])
+        with gzip.open(os.path.join(self.tmp.name, 'out.csv.gz'), 'rt', newline='') as f:
+            self.assertEqual(list(csv.reader(f)), rows)
+        with open(os.path.join(self.tmp.name, 'out.jsonl')) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0], {'idclient': 1, 'clientName': 'client 0', 'clientEmail': '', 'clientNid': '0'})
+        self.assertEqual(len(records), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(ROOT)
+from src import database, export, importer
+from src.validation import validate_book
+from helpers import TempDatabaseTestCase
+
+
+class TestImport(TempDatabaseTestCase):
+    filename = 'import.db'
+
+    def setUp(self):
+        super().setUp()
+        database.setup_database_schema()
+
+    def write_csv(self, text):
+        path = os.path.join(self.tmp.name, 'books.csv')
+        with open(path, 'w', newline='') as f:
+            f.write(text)
+        return path
+
+    def books(self):
+        with database.db_connection() as conn:
+            return conn.execute("""SELECT b.book_code, b.book_name, b.book_description, a.author_name, b.book_price
+                FROM book b LEFT JOIN author a ON a.idauthor = b.author_id ORDER BY b.book_code""").fetchall()
+
+    def test_shipped_exports_import(self):
+        imported, rejected = importer.import_file('book', os.path.join(ROOT, 'allBooks.xlsx'))
+        self.assertEqual(rejected, [])
+        self.assertEqual(imported, len(self.books()))
+        self.assertEqual(self.books()[0], ('001', 'harry potter', None, 'riju', 20.0))
+        imported, rejected = importer.import_file('client', os.path.join(ROOT, 'allClients.xlsx'))
+        self.assertEqual(rejected, [])
+        with database.db_connection() as conn:
+            self.assertEqual(conn.execute("SELECT clientName, clientNid FROM client WHERE idclient = 1").fetchone(),
+                             ('max', 'max123456789'))
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM client").fetchone()[0], imported)
+
+    def test_export_round_trips(self):
+        importer.import_file('book', self.write_csv(
+            'book_code,book_name,book_description,book_author,book_price\nD1,Dune,Desert planet,Herbert,12.5\n'))
+        exported = os.path.join(self.tmp.name, 'out.xlsx')
+        with database.db_connection() as conn:
+            export.export_table(conn, 'book', exported)
+            conn.execute("DELETE FROM book")
+        self.assertEqual(importer.import_file('book', exported), (1, []))
+        self.assertEqual(self.books(), [('D1', 'Dune', 'Desert planet', 'Herbert', 12.5)])
+
+    def test_upsert_keeps_columns_missing_from_the_file(self):
+        importer.import_file('book', self.write_csv(
+            'book_code,book_name,book_description,book_author\nD1,Dune,Desert planet,Herbert\n'))
+        importer.import_file('book', self.write_csv('book_code,book_name,book_price\nD1,Dune (2nd ed.),15\nD2,Emma,8\n'))
+        self.assertEqual(self.books(), [('D1', 'Dune (2nd ed.)', 'Desert planet', 'Herbert', 15.0),
+                                        ('D2', 'Emma', None, None, 8.0)])
+        with database.db_connection() as conn:
+            self.assertEqual(conn.execute("SELECT rowid FROM book_fts WHERE book_fts MATCH 'edition OR 2nd'").fetchall(),
+                             [(1,)])
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        imported, rejected = importer.import_file('book', self.write_csv(
+            'book_code,book_name,book_price\nD1,Dune,12\n,No code,1\nD3,Bad price,abc\n'))
+        self.assertEqual(imported, 1)
+        self.assertEqual([line for line, _ in rejected], [3, 4])
+        self.assertEqual(rejected[0][1], validate_book({'name': 'No code', 'code': ''}))
+
+    def test_cancel_keeps_finished_batches(self):
+        rows = ''.join(f'B{i},Book {i}\n' for i in range(5))
+        path = self.write_csv('book_code,book_name\n' + rows)
+        with self.assertRaises(importer.ImportCancelled):
+            importer.import_file('book', path, cancelled=lambda: True, batch_size=2)
+        self.assertEqual(len(self.books()), 2)
+
+    def test_unknown_file_type_is_refused(self):
+        with self.assertRaises(ValueError):
+            importer.import_file('book', os.path.join(self.tmp.name, 'books.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src import logs
+
+
+class TestLogs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = logging.getLogger()
+        self.saved = self.root.handlers[:], self.root.level
+        self.filename = os.path.join(self.tmp.name, 'app.log')
+
+    def tearDown(self):
+        logs.stop()
+        self.root.handlers[:], level = self.saved
+        self.root.setLevel(level)
+        for name in ('src.database', 'src.models'):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        self.tmp.cleanup()
+
+    def read_log(self):
+        logs.stop()
+        with open(self.filename, encoding='utf-8') as f:
+            return f.read()
+
+    def test_parse_levels(self):
+        self.assertEqual(logs.parse_levels('info, src.database=debug'), {'': 'INFO', 'src.database': 'DEBUG'})
+        with self.assertRaises(ValueError):
+            logs.parse_levels('src.models=LOUD')
+
+    def test_levels_are_per_logger_and_change_at_runtime(self):
+        logs.start(self.filename, levels='WARNING,src.database=DEBUG', console=False)
+        logging.getLogger('src.database').debug('Read %d rows', 5)
+        logging.getLogger('src.models').info('hidden')
+        logs.set_levels({'src.models': 'INFO'})
+        self.assertEqual(logs.configured_levels()['src.models'], 'INFO')
+        logging.getLogger('src.models').info('shown %s', 'now')
+        text = self.read_log()
+        self.assertIn('src.database - DEBUG - Read 5 rows', text)
+        self.assertNotIn('hidden', text)
+        self.assertIn('shown now', text)
+
+    def test_repeats_are_rate_limited(self):
+        logs.start(self.filename, levels='DEBUG', console=False, burst=3)
+        log = logging.getLogger('src.models')
+        for i in range(10):
+            log.debug('Page %d', i)
+        log.warning('still %s', 'written')
+        lines = self.read_log().splitlines()
+        self.assertEqual([line.split(' - ')[-1] for line in lines], ['Page 0', 'Page 1', 'Page 2', 'still written'])
+
+    def test_bad_environment_levels_fall_back_to_defaults(self):
+        os.environ[logs.ENV_VAR] = 'src.models=LOUD'
+        try:
+            logs.start(self.filename, console=False)
+        finally:
+            del os.environ[logs.ENV_VAR]
+        self.assertEqual(self.root.level, logging.INFO)
+        self.assertIn("'src.models=LOUD'", self.read_log())
+
+    def test_expired_rate_windows_are_dropped(self):
+        limit = logs.RateLimitFilter(burst=1, period=1.0)
+        for i, created in enumerate((0.0, 0.5, 2.0)):
+            record = logging.LogRecord('src.models', logging.DEBUG, __file__, 1, f'Message {i}', None, None)
+            record.created = created
+            limit.filter(record)
+        self.assertEqual(len(limit._windows), 1)
+
+    def test_file_rotates(self):
+        logs.start(self.filename, levels='INFO', console=False, max_bytes=500, backup_count=2, burst=None)
+        for i in range(50):
+            logging.getLogger('src.database').info('Line %d of a long enough message', i)
+        logs.stop()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['app.log', 'app.log.1', 'app.log.2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
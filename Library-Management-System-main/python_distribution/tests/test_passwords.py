@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src import database, passwords
+from helpers import TempDatabaseTestCase
+
+
+class TestPasswords(TempDatabaseTestCase):
+    filename = 'passwords.db'
+
+    def setUp(self):
+        super().setUp()
+        database.setup_database_schema()
+
+    def stored(self, conn, username):
+        return conn.execute("SELECT userspassword FROM users WHERE username = ?", (username,)).fetchone()[0]
+
+    def test_hashes_are_salted(self):
+        first, second = passwords.hash_password('secret'), passwords.hash_password('secret')
+        self.assertNotEqual(first, second)
+        self.assertTrue(passwords.verify_password('secret', first))
+        self.assertFalse(passwords.verify_password('Secret', first))
+        self.assertFalse(passwords.needs_rehash(first))
+
+    def test_default_admin_and_new_users_are_hashed(self):
+        with database.db_connection() as conn:
+            clerk = database.add_user(conn, {'username': 'clerk', 'email': '', 'password': 'pw'})
+            self.assertTrue(passwords.is_hashed(self.stored(conn, 'admin')))
+            self.assertTrue(passwords.is_hashed(self.stored(conn, 'clerk')))
+            self.assertEqual(passwords.authenticate(conn, 'clerk', 'pw'), clerk)
+            self.assertIsNone(passwords.authenticate(conn, 'clerk', 'wrong'))
+            self.assertIsNone(passwords.authenticate(conn, 'nobody', 'pw'))
+
+    def test_plaintext_row_is_rehashed_on_first_login(self):
+        with database.db_connection() as conn:
+            conn.execute("INSERT INTO users (username, useremail, userspassword) VALUES ('riju', '', 'letmein')")
+            self.assertIsNone(passwords.authenticate(conn, 'riju', 'letme'))
+            self.assertEqual(self.stored(conn, 'riju'), 'letmein')
+            self.assertIsNotNone(passwords.authenticate(conn, 'riju', 'letmein'))
+            self.assertTrue(passwords.verify_password('letmein', self.stored(conn, 'riju')))
+            self.assertIsNotNone(passwords.authenticate(conn, 'riju', 'letmein'))
+
+    def test_old_work_factor_is_upgraded(self):
+        with database.db_connection() as conn:
+            conn.execute("UPDATE users SET userspassword = ? WHERE username = 'admin'",
+                         (passwords.hash_password('admin', n=2 ** 10),))
+            self.assertIsNotNone(passwords.authenticate(conn, 'admin', 'admin'))
+            self.assertFalse(passwords.needs_rehash(self.stored(conn, 'admin')))
+
+
+if __name__ == '__main__':
+    unittest.main()
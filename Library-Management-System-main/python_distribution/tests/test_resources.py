@@ -0,0 +1,39 @@
+import unittest
+import os
+import struct
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(ROOT)
+import convert_qrc_to_py
+
+
+class TestIconResources(unittest.TestCase):
+    def test_checked_in_rcc_matches_the_qrc(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rebuilt = os.path.join(tmp, 'icons.rcc')
+            convert_qrc_to_py.write_rcc(convert_qrc_to_py.read_qrc(convert_qrc_to_py.DEFAULT_QRC), rebuilt)
+            with open(rebuilt, 'rb') as a, open(convert_qrc_to_py.DEFAULT_RCC, 'rb') as b:
+                self.assertEqual(a.read(), b.read(), "run convert_qrc_to_py.py after changing icons")
+
+    def test_names_are_stored_with_qt_hashes_in_sorted_order(self):
+        with open(convert_qrc_to_py.DEFAULT_RCC, 'rb') as f:
+            rcc = f.read()
+        magic, version, tree, data, names = struct.unpack('>4sIIII', rcc[:20])
+        self.assertEqual((magic, version), (b'qres', 2))
+        # Root (one child, at node 1), then 'icons' with its six files from node 2.
+        self.assertEqual(struct.unpack('>IHII', rcc[tree:tree + 14])[1:], (2, 1, 1))
+        self.assertEqual(struct.unpack('>IHII', rcc[tree + 22:tree + 36])[1:], (2, 6, 2))
+        hashes = []
+        for node in range(2, 8):
+            name_offset = struct.unpack('>I', rcc[tree + 22 * node:tree + 22 * node + 4])[0]
+            length, stored = struct.unpack('>HI', rcc[names + name_offset:names + name_offset + 6])
+            name = rcc[names + name_offset + 6:names + name_offset + 6 + 2 * length].decode('utf-16-be')
+            self.assertEqual(stored, convert_qrc_to_py.qt_hash(name))
+            hashes.append(stored)
+        self.assertEqual(hashes, sorted(hashes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+
+# search.py is imported through the package (it uses relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src import database, search
+from helpers import TempDatabaseTestCase
+
+
+class TestSearch(TempDatabaseTestCase):
+    filename = 'search.db'
+
+    def setUp(self):
+        super().setUp()
+        with database.db_connection() as conn:
+            database.migrate(conn)
+            self.potter = database.add_book(conn, {'name': 'Harry Potter', 'description': 'Wizards at school', 'code': 'HP1',
+                                                   'category': 'Fantasy', 'author': 'Rowling', 'publisher': '', 'price': 10})
+            self.dune = database.add_book(conn, {'name': 'Dune', 'description': 'Desert planet', 'code': 'DN1',
+                                                 'category': 'SciFi', 'author': 'Herbert', 'publisher': '', 'price': 12})
+            self.client = database.add_client(conn, {'name': 'Max Müller', 'email': 'max@example.com', 'nid': '42'})
+            conn.execute("INSERT INTO dayoperations(book_id, type, days, fromDate, toDate, client_id) VALUES (?, 'rent', 7, '', '', ?)",
+                         (self.dune, self.client))
+
+    def ids(self, listing, text, **kwargs):
+        with database.db_connection() as conn:
+            return [row[0] for row in search.search(conn, listing, text, **kwargs)]
+
+    def test_words_match_as_prefixes(self):
+        self.assertEqual(self.ids("book", "harr pot"), [self.potter])
+        self.assertEqual(self.ids("book", "rowling"), [self.potter])
+        self.assertEqual(self.ids("book", "potter dune"), [])
+        self.assertEqual(self.ids("client", "muller"), [self.client])
+
+    def test_typos_are_tolerated(self):
+        self.assertEqual(self.ids("book", "hary pottr"), [self.potter])
+        self.assertEqual(self.ids("book", "desrt"), [self.dune])
+        self.assertEqual(search.edit_distance("mistery", "mystery", 1), 1)
+        self.assertEqual(search.edit_distance("abc", "xyz", 1), 2)
+
+    def test_index_follows_writes(self):
+        with database.db_connection() as conn:
+            conn.execute("UPDATE book SET book_name = 'Dune Messiah' WHERE id = ?", (self.dune,))
+            conn.execute("UPDATE author SET author_name = 'Frank Herbert' WHERE author_name = 'Herbert'")
+            conn.execute("DELETE FROM book WHERE id = ?", (self.potter,))
+        self.assertEqual(self.ids("book", "messiah frank"), [self.dune])
+        self.assertEqual(self.ids("book", "wizards"), [])
+
+    def test_paging_and_other_listings(self):
+        self.assertEqual(self.ids("book", "dn1"), [self.dune])
+        self.assertEqual(self.ids("book", "dn1", after_key=self.dune), [])
+        self.assertEqual(self.ids("dayoperations", "desert"), [1])
+        self.assertEqual(self.ids("users", "adm"), [1])
+        self.assertEqual(self.ids("users", "%"), [])
+        self.assertEqual(self.ids("book", "  "), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.startup import StartupTimeline
+
+
+class TestStartupTimeline(unittest.TestCase):
+    def test_stages_are_reported_in_start_order(self):
+        timeline = StartupTimeline(origin=10.0)
+        timeline.add("imports", 10.0, 10.25)
+        worker = threading.Thread(target=timeline.add, args=("schema check", 10.5, 10.52))
+        worker.start()
+        worker.join()
+        timeline.add("login window", 10.3, 10.4)
+        timeline.mark("login enabled")
+        self.assertEqual([stage[:2] for stage in timeline.stages[:3]],
+                         [("imports", "gui"), ("schema check", "background"), ("login window", "gui")])
+        lines = timeline.report().splitlines()
+        self.assertEqual([line.split()[0] for line in lines[2:5]], ["imports", "login", "schema"])
+        self.assertIn("250.0", lines[2])
+        self.assertTrue(lines[-1].startswith("login enabled"))
+
+
+if __name__ == '__main__':
+    unittest.main()